@@ -0,0 +1,4 @@
+"""Benchmarks for Blueprints.
+
+Every module in this package can be run as a script, for example ``python -m benchmarks.formula_construction``.
+"""
@@ -0,0 +1,70 @@
+"""Benchmark of drawing many reinforced cross-sections to files.
+
+Compares creating a pyplot figure per cross-section with :meth:`RectangularReinforcedCrossSection.plot` and saving it with drawing
+all cross-sections on a single reused Agg figure with :func:`draw_cross_sections`, into PNG files and into a multi-page PDF file.
+Run with ``python -m benchmarks.batch_drawing``.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from matplotlib import pyplot as plt
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.batch import draw_cross_sections
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+N_SECTIONS = 60
+DPI = 60
+
+
+def cross_sections() -> dict[str, RectangularReinforcedCrossSection]:
+    """Return cross-sections of a beam schedule by name."""
+    steel = ReinforcementSteelMaterial()
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+    sections = {}
+    for i in range(N_SECTIONS):
+        cs = RectangularReinforcedCrossSection(width=250 + 50 * (i % 6), height=400 + 100 * (i % 5), concrete_material=concrete)
+        cs.add_stirrup_along_edges(diameter=8, distance=150, material=steel)
+        cs.add_longitudinal_reinforcement_by_quantity(n=2 + i % 5, diameter=(16, 20, 25)[i % 3], material=steel, edge="lower")
+        cs.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=steel, edge="upper")
+        sections[f"B{i + 1}"] = cs
+    return sections
+
+
+def plot_one_by_one(sections: dict[str, RectangularReinforcedCrossSection], directory: Path) -> None:
+    """The former way, a new pyplot figure per cross-section."""
+    for title, cs in sections.items():
+        figure = cs.plot(title=title)
+        figure.savefig(directory / f"{title}.png", dpi=DPI)
+        plt.close(figure)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    sections = cross_sections()
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        plot_one_by_one(sections, Path(directory) / "")
+        one_by_one = time.perf_counter() - start
+        print(f"{N_SECTIONS} PNG files, pyplot figure per section {one_by_one:6.2f} s")  # noqa: T201
+
+        start = time.perf_counter()
+        draw_cross_sections(sections, Path(directory) / "batch", dpi=DPI)
+        seconds = time.perf_counter() - start
+        print(f"{N_SECTIONS} PNG files, reused Agg figure         {seconds:6.2f} s  ({one_by_one / seconds:.1f}x)")  # noqa: T201
+
+        start = time.perf_counter()
+        draw_cross_sections(sections, Path(directory) / "schedule.pdf")
+        print(f"{N_SECTIONS}-page PDF file, reused Agg figure     {time.perf_counter() - start:6.2f} s")  # noqa: T201
+
+        for workers in (1, 4):
+            start = time.perf_counter()
+            draw_cross_sections(sections, Path(directory) / f"workers-{workers}", dpi=DPI, max_workers=workers)
+            print(f"{N_SECTIONS} PNG files, {workers} worker(s)              {time.perf_counter() - start:6.2f} s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
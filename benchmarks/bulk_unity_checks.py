@@ -0,0 +1,54 @@
+"""Benchmark of the unity checks of the internal forces of many load combinations, read from a CSV export.
+
+Compares evaluating a formula row by row with the streaming bulk unity checks.
+Run with ``python -m benchmarks.bulk_unity_checks``.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from blueprints.checks.unity_checks.bulk_unity_checks import FormulaCheck, bulk_unity_checks
+from blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_2 import Form6Dot2UtilizationRatio
+
+ELEMENTS = 2000
+COMBINATIONS = 500
+ROW_BY_ROW = 20000
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    rng = np.random.default_rng(0)
+    rows = ELEMENTS * COMBINATIONS
+    forces = pd.DataFrame(
+        {
+            "element": np.repeat(np.arange(ELEMENTS), COMBINATIONS),
+            "combination": np.tile(np.arange(COMBINATIONS), ELEMENTS),
+            "N": rng.uniform(-500, 500, rows),
+            "My": rng.uniform(-100, 100, rows),
+            "Mz": rng.uniform(-50, 50, rows),
+        }
+    )
+    resistances = {element: {"n_rd": 2000.0, "m_y_rd": 300.0 + element % 10, "m_z_rd": 150.0} for element in range(ELEMENTS)}
+    check = FormulaCheck("N-My-Mz", Form6Dot2UtilizationRatio, loads={"n_ed": "N", "m_y_ed": "My", "m_z_ed": "Mz"}, elements=resistances)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "forces.csv"
+        forces.to_csv(source, index=False)
+
+        start = time.perf_counter()
+        for row in pd.read_csv(source, nrows=ROW_BY_ROW).itertuples():
+            float(Form6Dot2UtilizationRatio(n_ed=abs(row.N), m_y_ed=abs(row.My), m_z_ed=abs(row.Mz), **resistances[row.element]))
+        seconds = (time.perf_counter() - start) * rows / ROW_BY_ROW
+        print(f"{rows} rows, row by row  {seconds:8.2f} s  {rows / seconds:12.0f} rows/s (extrapolated from {ROW_BY_ROW} rows)")  # noqa: T201
+
+        report = bulk_unity_checks(source, [check], output=Path(directory) / "results.csv", min_unity_check=0.5)
+        print(f"{rows} rows, bulk        {report.seconds:8.2f} s  {report.rows_per_second:12.0f} rows/s")  # noqa: T201
+        print(f"governing unity check    {report.governing['unity_check'].max():.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark of the memory use and construction speed of formula objects.
+
+Compares the slotted formula objects (regular and trusted construction) with the former ``__dict__`` based formula objects.
+Run with ``python -m benchmarks.formula_construction``.
+"""
+
+import timeit
+import tracemalloc
+from abc import ABC
+from collections.abc import Callable
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+
+N_INSTANCES = 100_000
+
+
+class DictFormula(float, ABC):
+    """Former implementation of the Formula base class, storing the attributes in an instance ``__dict__``."""
+
+    def __new__(cls, *args, **kwargs) -> "DictFormula":
+        """Method for creating a new instance of the class."""
+        instance = float.__new__(cls, cls._evaluate(*args, **kwargs))  # type: ignore[attr-defined]
+        instance._initialized = False  # noqa: SLF001
+        return instance
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Method for initializing a new instance of the class."""
+        super().__init__(*args, **kwargs)
+        self._initialized = True
+
+    def __setattr__(self, name: str, value: float) -> None:
+        """Prevent modifications after initialization."""
+        if getattr(self, "_initialized", False) and name in self.__dict__:
+            raise AttributeError(f"Attribute '{name}' of '{type(self).__name__}' object is read-only.")
+        super().__setattr__(name, value)
+
+
+class DictForm8Dot3RequiredAnchorageLength(DictFormula):
+    """Formula 8.3 on top of the former Formula base class."""
+
+    def __init__(self, diameter: float, sigma_sd: float, f_bd: float) -> None:
+        """Formula 8.3 on top of the former Formula base class."""
+        super().__init__()
+        self.diameter = diameter
+        self.sigma_sd = sigma_sd
+        self.f_bd = f_bd
+
+    @staticmethod
+    def _evaluate(diameter: float, sigma_sd: float, f_bd: float) -> float:
+        """Evaluates the formula, for more information see the __init__ method."""
+        return Form8Dot3RequiredAnchorageLength._evaluate(diameter=diameter, sigma_sd=sigma_sd, f_bd=f_bd)  # noqa: SLF001
+
+
+def construct(factory: Callable[..., float]) -> list[float]:
+    """Construct N_INSTANCES formula objects with varying input values."""
+    return [factory(diameter=8 + i % 32, sigma_sd=435, f_bd=2.7) for i in range(N_INSTANCES)]
+
+
+def measure(factory: Callable[..., float]) -> tuple[float, float]:
+    """Measure the construction time in microseconds and the memory in bytes per formula object."""
+    seconds = min(timeit.repeat(lambda: construct(factory), number=1, repeat=5))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = construct(factory)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(instances) == N_INSTANCES
+    return seconds / N_INSTANCES * 1e6, (after - before) / N_INSTANCES
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    factories: dict[str, Callable[..., float]] = {
+        "dict based (former)": DictForm8Dot3RequiredAnchorageLength,
+        "slotted": Form8Dot3RequiredAnchorageLength,
+        "slotted, trusted": Form8Dot3RequiredAnchorageLength.trusted,
+    }
+    print(f"Construction of {N_INSTANCES} Form8Dot3RequiredAnchorageLength objects")  # noqa: T201
+    for name, factory in factories.items():
+        microseconds, size = measure(factory)
+        print(f"{name:<22}{microseconds:8.2f} µs/object{size:10.0f} bytes/object")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark of the import time of the Blueprints packages used by headless (batch) workers.
+
+Every package is imported in a fresh interpreter with ``python -X importtime``, importing all of its modules except the plotters.
+The cumulative import time and the heaviest third-party packages are reported, so regressions such as an eager import of
+matplotlib stand out. Run with ``python -m benchmarks.import_time``.
+"""
+
+import importlib
+import pkgutil
+import re
+import subprocess
+import sys
+
+PACKAGES = ["blueprints.structural_sections", "blueprints.checks", "blueprints.materials"]
+THIRD_PARTY = ["matplotlib", "numpy", "pandas", "plotly", "shapely"]
+REPEAT = 5
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def modules(package: str) -> list[str]:
+    """All modules of a package, except the plotters which are imported on first use only."""
+    path = importlib.import_module(package).__path__
+    return [package] + [module.name for module in pkgutil.walk_packages(path, f"{package}.") if ".plotters" not in module.name]
+
+
+def import_times(package: str) -> tuple[int, dict[str, int]]:
+    """Total import time and the import time of the imported third-party packages in microseconds, importing all modules of a package."""
+    code = "\n".join(f"import {module}" for module in modules(package))
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True).stderr
+    total, third_party = 0, {}
+    for _, cumulative, indent, name in IMPORTTIME_LINE.findall(stderr):
+        if len(indent) == 1:  # top-level import
+            total += int(cumulative)
+        if name in THIRD_PARTY:
+            third_party[name] = int(cumulative)
+    return total, third_party
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for package in PACKAGES:
+        total, third_party = min((import_times(package) for _ in range(REPEAT)), key=lambda run: run[0])
+        imported = ", ".join(f"{name} {time / 1e3:.0f} ms" for name, time in third_party.items()) or "no third-party packages"
+        print(f"{package:<34}{total / 1e3:8.1f} ms   {imported}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of the generation and the unity checks of an N-M interaction diagram.
+
+Compares integrating the stresses of one strain plane at a time and checking one load at a time with point-in-polygon tests
+against the vectorized sweep of all strain planes and the ray-based unity checks of all loads at once.
+Run with ``python -m benchmarks.interaction_diagram``.
+"""
+
+import time
+
+import numpy as np
+import shapely
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.unit_conversion import N_TO_KN, NMM_TO_KNM
+
+LOADS = 100000
+PER_LOAD = 2000
+
+
+def beam() -> RectangularReinforcedCrossSection:
+    """A beam with reinforcement at the upper and lower side."""
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    cs = RectangularReinforcedCrossSection(width=300, height=600, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=4, diameter=25, material=steel, edge="lower")
+    cs.add_longitudinal_reinforcement_by_quantity(n=2, diameter=16, material=steel, edge="upper")
+    return cs
+
+
+def diagram_per_plane(cs: RectangularReinforcedCrossSection) -> InteractionDiagram:
+    """Interaction diagram, integrating the stresses of one strain plane at a time."""
+    fiber_section = FiberSection.from_cross_section(cs, n_x=1, n_y=100)
+    positive = fiber_section.ultimate_strain_planes(angle=np.pi / 2)
+    negative = fiber_section.ultimate_strain_planes(angle=-np.pi / 2)
+    planes = zip(*(np.concatenate([a, b[::-1]]) for a, b in zip(positive, negative)))
+    forces = np.array([[float(force) for force in fiber_section.forces(*plane)] for plane in planes])
+    return InteractionDiagram(n=forces[:, 0] * N_TO_KN, m=forces[:, 1] * NMM_TO_KNM)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    cs = beam()
+
+    start = time.perf_counter()
+    per_plane = diagram_per_plane(cs)
+    print(f"diagram, per strain plane   {(time.perf_counter() - start) * 1e3:8.1f} ms")  # noqa: T201
+    start = time.perf_counter()
+    diagram = InteractionDiagram.from_cross_section(cs)
+    print(f"diagram, vectorized         {(time.perf_counter() - start) * 1e3:8.1f} ms")  # noqa: T201
+    print(f"same vertices               {np.allclose(per_plane.n, diagram.n) and np.allclose(per_plane.m, diagram.m)}")  # noqa: T201
+
+    rng = np.random.default_rng(0)
+    n, m = rng.uniform(-1000, 4000, LOADS), rng.uniform(-500, 500, LOADS)
+    polygon = shapely.Polygon(np.column_stack([diagram.n, diagram.m]))
+    start = time.perf_counter()
+    for n_i, m_i in zip(n[:PER_LOAD], m[:PER_LOAD]):
+        polygon.contains(shapely.Point(n_i, m_i))
+    seconds = (time.perf_counter() - start) * LOADS / PER_LOAD
+    print(f"{LOADS} loads, per load     {seconds * 1e3:8.1f} ms (extrapolated from {PER_LOAD} loads)")  # noqa: T201
+    start = time.perf_counter()
+    unity_checks = diagram.unity_check(n, m)
+    print(f"{LOADS} loads, vectorized   {(time.perf_counter() - start) * 1e3:8.1f} ms  max UC = {unity_checks.max():.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
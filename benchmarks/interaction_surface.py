@@ -0,0 +1,52 @@
+"""Benchmark of the unity checks of many load combinations against the N-Mx-My interaction surface of a column.
+
+Compares testing the ray of every load against all triangles of the surface with looking up the triangles in the direction
+of the load.
+Run with ``python -m benchmarks.interaction_surface``.
+"""
+
+import time
+
+import numpy as np
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_surface import InteractionSurface, _ray_distances
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+LOADS = 100000
+ALL_TRIANGLES = 2000
+
+
+def column() -> RectangularReinforcedCrossSection:
+    """A column with reinforcement on all edges."""
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    cs = RectangularReinforcedCrossSection(width=400, height=600, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_stirrup_along_edges(diameter=10, distance=150, material=steel)
+    for edge, n in [("upper", 4), ("lower", 4), ("left", 3), ("right", 3)]:
+        cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=20, material=steel, edge=edge)  # type: ignore[arg-type]
+    return cs
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    start = time.perf_counter()
+    surface = InteractionSurface.from_cross_section(column())
+    print(f"surface of {len(surface.triangles)} triangles  {(time.perf_counter() - start) * 1e3:8.1f} ms")  # noqa: T201
+
+    rng = np.random.default_rng(0)
+    n, m_x, m_y = rng.uniform(-1500, 6000, LOADS), rng.uniform(-500, 500, LOADS), rng.uniform(-400, 400, LOADS)
+    directions = np.column_stack([n, m_x, m_y])[:ALL_TRIANGLES, np.newaxis] / surface._scale  # noqa: SLF001
+    start = time.perf_counter()
+    all_triangles = 1 / np.concatenate([_ray_distances(part, surface._corners).min(axis=1) for part in np.array_split(directions, 20)])  # noqa: SLF001
+    seconds = (time.perf_counter() - start) * LOADS / ALL_TRIANGLES
+    print(f"{LOADS} loads, all triangles  {seconds * 1e3:8.1f} ms (extrapolated from {ALL_TRIANGLES} loads)")  # noqa: T201
+
+    start = time.perf_counter()
+    unity_checks = surface.unity_check(n, m_x, m_y)
+    print(f"{LOADS} loads, lookup         {(time.perf_counter() - start) * 1e3:8.1f} ms  max UC = {unity_checks.max():.2f}")  # noqa: T201
+    print(f"same unity checks          {np.allclose(all_triangles, unity_checks[:ALL_TRIANGLES])}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
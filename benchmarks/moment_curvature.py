@@ -0,0 +1,62 @@
+"""Benchmark of the moment-curvature diagrams of a column for several levels of the normal force.
+
+Compares solving the equilibrium of one normal force and curvature at a time with solving all normal forces and curvatures
+at once.
+Run with ``python -m benchmarks.moment_curvature``.
+"""
+
+import time
+
+import numpy as np
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.moment_curvature import MomentCurvatureDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.unit_conversion import KN_TO_N, NMM_TO_KNM
+
+NORMAL_FORCES = np.linspace(-500.0, 3000.0, 20)
+STEPS = 100
+
+
+def column() -> RectangularReinforcedCrossSection:
+    """A column with reinforcement at the upper and lower side."""
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    cs = RectangularReinforcedCrossSection(width=400, height=600, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=steel, edge="lower")
+    cs.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=steel, edge="upper")
+    return cs
+
+
+def moments_per_step(cs: RectangularReinforcedCrossSection, curvature: np.ndarray) -> np.ndarray:
+    """Moments of the diagrams, solving the equilibrium of one normal force and curvature at a time."""
+    fiber_section = FiberSection.from_cross_section(cs)
+    moments = np.full((NORMAL_FORCES.size, curvature.size), np.nan)
+    for i, normal_force in enumerate(NORMAL_FORCES):
+        for j, kappa in enumerate(curvature):
+            eps_0 = fiber_section.equilibrium_strain(normal_force * KN_TO_N, kappa)
+            if fiber_section.within_strain_limits(eps_0, kappa):
+                moments[i, j] = fiber_section.forces(eps_0, kappa)[1] * NMM_TO_KNM
+    return moments
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    cs = column()
+    print(f"{NORMAL_FORCES.size} normal forces x {STEPS} curvatures")  # noqa: T201
+
+    start = time.perf_counter()
+    diagram = MomentCurvatureDiagram.from_cross_section(cs, normal_force=NORMAL_FORCES, n_steps=STEPS)
+    batched = time.perf_counter() - start
+    start = time.perf_counter()
+    moments = moments_per_step(cs, diagram.curvature)
+    per_step = time.perf_counter() - start
+
+    print(f"per step      {per_step * 1e3:8.1f} ms")  # noqa: T201
+    print(f"batched       {batched * 1e3:8.1f} ms")  # noqa: T201
+    print(f"same moments  {np.allclose(moments, diagram.moment, equal_nan=True, atol=1e-6)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark of the number of formula evaluations of the nominal concrete cover calculation.
+
+Compares the memoized sub-calculations of :class:`NominalConcreteCover` with the former behaviour, in which every call of a
+sub-calculation rebuilt the whole chain of formulas and tables.
+Also compares :func:`nominal_concrete_cover_table` with creating a :class:`NominalConcreteCover` per row of a cover table.
+Run with ``python -m benchmarks.nominal_concrete_cover``.
+"""
+
+import functools
+import itertools
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from blueprints.checks.nominal_concrete_cover.constants.constants_nen_en_1992_1_1_c2_2011 import NominalConcreteCoverConstants2011C2
+from blueprints.checks.nominal_concrete_cover.definitions import AbrasionClass, CastingSurface
+from blueprints.checks.nominal_concrete_cover.nominal_concrete_cover import NominalConcreteCover
+from blueprints.checks.nominal_concrete_cover.nominal_concrete_cover_table import nominal_concrete_cover_table
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_1 import Form4Dot1NominalConcreteCover
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_2 import Form4Dot2MinimumConcreteCover
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2 import Table4Dot2MinimumCoverWithRegardToBond
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
+from blueprints.codes.formula import Formula
+
+FORMULAS: list[type[Formula]] = [
+    Form4Dot1NominalConcreteCover,
+    Form4Dot2MinimumConcreteCover,
+    Table4Dot2MinimumCoverWithRegardToBond,
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+]
+
+
+class FormerNominalConcreteCover(NominalConcreteCover):
+    """Nominal concrete cover without memoization of the sub-calculations."""
+
+    exposure_classes = NominalConcreteCover.exposure_classes.__wrapped__  # type: ignore[attr-defined]
+    c_min_b = NominalConcreteCover.c_min_b.__wrapped__  # type: ignore[attr-defined]
+    c_min_dur = NominalConcreteCover.c_min_dur.__wrapped__  # type: ignore[attr-defined]
+    c_min = NominalConcreteCover.c_min.__wrapped__  # type: ignore[attr-defined]
+    c_min_total = NominalConcreteCover.c_min_total.__wrapped__  # type: ignore[attr-defined]
+    c_nom = NominalConcreteCover.c_nom.__wrapped__  # type: ignore[attr-defined]
+    minimum_cover_with_regard_to_casting_surface = NominalConcreteCover.minimum_cover_with_regard_to_casting_surface.__wrapped__  # type: ignore[attr-defined]
+    value = NominalConcreteCover.value.__wrapped__  # type: ignore[attr-defined]
+
+
+@contextmanager
+def count_evaluations() -> Iterator[Counter]:
+    """Count the evaluations of the formulas of the nominal concrete cover calculation."""
+    counter: Counter = Counter()
+    originals = {formula: formula.__dict__["_evaluate"] for formula in FORMULAS}
+
+    def counting(formula: type[Formula], evaluate: Callable) -> staticmethod:
+        @functools.wraps(evaluate)
+        def wrapper(*args, **kwargs) -> float:
+            counter[formula.__name__] += 1
+            return evaluate(*args, **kwargs)
+
+        return staticmethod(wrapper)
+
+    for formula, original in originals.items():
+        formula._evaluate = counting(formula, original.__func__)  # type: ignore[method-assign]  # noqa: SLF001
+    try:
+        yield counter
+    finally:
+        for formula, original in originals.items():
+            formula._evaluate = original  # type: ignore[method-assign]  # noqa: SLF001
+
+
+def records() -> list[dict]:
+    """Parameters of 5000 elements, combining a handful of different diameters, exposure and structural classes."""
+    grid = itertools.product([10, 12, 16, 20, 25], ["XC1", "XC3", "XC4"], ["NA", "XD1", "XD3"], [3, 4, 5, 6])
+    combinations = [
+        {"reinforcement_diameter": diameter, "carbonation": carbonation, "chloride": chloride, "structural_class": structural_class}
+        for diameter, carbonation, chloride, structural_class in grid
+    ]
+    return [combinations[i % len(combinations)] for i in range(5000)]
+
+
+def table_grid() -> dict[str, list]:
+    """Parameter grid of a cover table for a whole project."""
+    return {
+        "reinforcement_diameter": [8, 10, 12, 16, 20, 25, 32],
+        "nominal_max_aggregate_size": [16, 32, 40],
+        "structural_class": [3, 4, 5, 6],
+        "carbonation": ["XC1", "XC2", "XC3", "XC4"],
+        "chloride": ["NA", "XD1", "XD2", "XD3"],
+        "chloride_seawater": ["NA", "XS1"],
+        "casting_surface": list(CastingSurface),
+        "abrasion_class": list(AbrasionClass),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    shared = {"nominal_max_aggregate_size": 32, "constants": NominalConcreteCoverConstants2011C2()}
+    element = records()[-1] | shared
+
+    print("Formula evaluations for value() and latex() of one element")  # noqa: T201
+    for cls in (FormerNominalConcreteCover, NominalConcreteCover):
+        with count_evaluations() as counter:
+            cover = cls(**element)
+            cover.value()
+            cover.latex()
+        print(f"{cls.__name__:<30}{counter.total():6d}  {dict(counter)}")  # noqa: T201
+
+    print(f"\nFormula evaluations for value() of {len(records())} elements")  # noqa: T201
+    for name, create in (
+        ("former", lambda: [FormerNominalConcreteCover(**record, **shared) for record in records()]),
+        ("memoized", lambda: [NominalConcreteCover(**record, **shared) for record in records()]),
+        ("from_records", lambda: NominalConcreteCover.from_records(records(), **shared)),
+    ):
+        with count_evaluations() as counter:
+            start = time.perf_counter()
+            values = [cover.value() for cover in create()]
+            seconds = time.perf_counter() - start
+        assert len(values) == len(records())
+        print(f"{name:<30}{counter.total():6d}  {seconds * 1e3:8.1f} ms")  # noqa: T201
+
+    grid = table_grid()
+    constants = shared["constants"]
+    rows = [dict(zip(grid, combination)) for combination in itertools.product(*grid.values())]
+    print(f"\nCover table of {len(rows)} rows")  # noqa: T201
+    for name, create_table in (
+        ("from_records", lambda: [cover.value() for cover in NominalConcreteCover.from_records(rows, constants=constants)]),
+        ("nominal_concrete_cover_table", lambda: nominal_concrete_cover_table(constants, **grid)),
+    ):
+        with count_evaluations() as counter:
+            start = time.perf_counter()
+            create_table()
+            seconds = time.perf_counter() - start
+        print(f"{name:<30}{counter.total():6d}  {seconds * 1e3:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
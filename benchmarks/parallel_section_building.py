@@ -0,0 +1,65 @@
+"""Benchmark of building many reinforced cross-sections concurrently in threads and in processes.
+
+Reports the throughput of building cross-sections (with stirrups, whose IDs come from a shared thread-safe counter) for a
+growing number of threads and processes, and the cost of the lock of the ID counter.
+Run with ``python -m benchmarks.parallel_section_building``.
+"""
+
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.utils.id_counter import IdCounter
+
+SECTIONS = 2000
+BATCH = 50
+IDS = 1_000_000
+
+
+def build_sections(width: float) -> float:
+    """Build a batch of cross-sections and return their total reinforcement weight."""
+    steel = ReinforcementSteelMaterial()
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+    weight = 0.0
+    for _ in range(BATCH):
+        cs = RectangularReinforcedCrossSection(width=width, height=600, concrete_material=concrete)
+        cs.add_stirrup_along_edges(diameter=10, distance=150, material=steel)
+        for edge in ("upper", "lower"):
+            cs.add_longitudinal_reinforcement_by_quantity(n=4, diameter=20, material=steel, edge=edge)  # type: ignore[arg-type]
+        weight += cs.reinforcement_weight
+    return weight
+
+
+def run(executor: Executor | None) -> float:
+    """Build all cross-sections, in the current thread without an executor, and return the sections per second."""
+    widths = [300.0 + 10 * (i % 20) for i in range(SECTIONS // BATCH)]
+    start = time.perf_counter()
+    if executor is None:
+        list(map(build_sections, widths))
+    else:
+        with executor:
+            list(executor.map(build_sections, widths))
+    return SECTIONS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print(f"{os.cpu_count()} CPUs, {SECTIONS} cross-sections")  # noqa: T201
+    print(f"sequential          {run(None):10.0f} sections/s")  # noqa: T201
+    for workers in (1, 2, 4, 8):
+        print(f"{workers} threads           {run(ThreadPoolExecutor(max_workers=workers)):10.0f} sections/s")  # noqa: T201
+    for workers in (1, 2, 4):
+        print(f"{workers} processes         {run(ProcessPoolExecutor(max_workers=workers)):10.0f} sections/s (including start-up)")  # noqa: T201
+
+    ids = IdCounter()
+    start = time.perf_counter()
+    for _ in range(IDS):
+        ids.next()
+    print(f"ID counter          {(time.perf_counter() - start) / IDS * 1e9:10.0f} ns per ID")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
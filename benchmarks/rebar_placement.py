@@ -0,0 +1,78 @@
+"""Benchmark of the placement of the rebars of reinforcement configurations along their reference lines.
+
+Compares interpolating every bar on the line and creating a :class:`Rebar` per bar with placing all bars of a configuration in a
+single vectorized interpolation into a :class:`RebarSet`, for single configurations and for the rebuild of a cross-section in an
+optimization sweep.
+Run with ``python -m benchmarks.rebar_placement``.
+"""
+
+import time
+
+import numpy as np
+from shapely import LineString
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByDistance,
+    ReinforcementByQuantity,
+)
+
+REPEATS = 2000
+SWEEP = 500
+
+
+def rebars_one_by_one(configuration: ReinforcementByQuantity, line: LineString) -> list[Rebar]:
+    """The former placement, interpolating and creating a rebar per bar."""
+    rebars = []
+    for index in range(configuration.n):
+        point = line.interpolate(index * line.length / (configuration.n - 1))
+        rebars.append(Rebar(diameter=configuration.diameter, x=point.x, y=point.y, material=ReinforcementSteelMaterial()))
+    return rebars
+
+
+def rebuild(n: int, diameter: float) -> RebarSet:
+    """Rebuild a cross-section with a layout of the sweep and resolve its rebars."""
+    steel = ReinforcementSteelMaterial()
+    cs = RectangularReinforcedCrossSection(width=1000, height=800, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_stirrup_along_edges(diameter=10, distance=150, material=steel)
+    cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=diameter, material=steel, edge="lower")
+    cs.add_longitudinal_reinforcement_by_quantity(n=6, diameter=16, material=steel, edge="upper")
+    cs.add_longitudinal_reinforcement_by_distance(center_to_center=150, diameter=12, material=steel, edge="left")
+    cs.add_longitudinal_reinforcement_by_distance(center_to_center=150, diameter=12, material=steel, edge="right")
+    return cs.rebar_set
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    line = LineString([(-450, -350), (450, -350)])
+    for n in (4, 12, 40):
+        configuration = ReinforcementByQuantity(diameter=16, material=ReinforcementSteelMaterial(), n=n)
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            former = RebarSet.from_rebars(rebars_one_by_one(configuration, line))
+        one_by_one = (time.perf_counter() - start) / REPEATS * 1e6
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            vectorized = configuration.to_rebar_set(line)
+        seconds = (time.perf_counter() - start) / REPEATS * 1e6
+        same = np.allclose(former.x, vectorized.x) and np.allclose(former.y, vectorized.y)
+        print(f"{n:3d} bars  one by one {one_by_one:8.1f} µs  vectorized {seconds:8.1f} µs  same rebars {same}")  # noqa: T201
+
+    by_distance = ReinforcementByDistance(diameter=12, center_to_center=100, material=ReinforcementSteelMaterial())
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        by_distance.to_rebar_set(line)
+    print(f"⌀12-100 over 900 mm, vectorized {(time.perf_counter() - start) / REPEATS * 1e6:8.1f} µs")  # noqa: T201
+
+    start = time.perf_counter()
+    for i in range(SWEEP):
+        rebuild(n=2 + i % 12, diameter=(12.0, 16.0, 20.0, 25.0)[i % 4])
+    print(f"{SWEEP} cross-section rebuilds     {(time.perf_counter() - start) * 1e3:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
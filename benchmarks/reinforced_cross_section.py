@@ -0,0 +1,141 @@
+"""Benchmark of repeated reads of the reinforcement properties of a reinforced cross-section.
+
+Compares the cached layout of the longitudinal rebars with the former behaviour, in which every read of a reinforcement
+property resolved the reference lines, created the rebars and checked every rebar against the cross-section with shapely.
+Also compares, for a section with many bars, the vectorized properties and containment check of a :class:`RebarSet` with
+summing over and checking every :class:`Rebar` object.
+Run with ``python -m benchmarks.reinforced_cross_section``.
+"""
+
+import functools
+import math
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+READS = 100
+N_BARS = 10000
+
+
+class FormerRectangularReinforcedCrossSection(RectangularReinforcedCrossSection):
+    """Rectangular reinforced cross-section that resolves the layout of the rebars on every read."""
+
+    @property
+    def rebar_set(self) -> RebarSet:
+        """Resolve the layout of all longitudinal rebars."""
+        return self._resolve_rebar_set()
+
+
+@contextmanager
+def count_shapely_calls() -> Iterator[Counter]:
+    """Count the shapely containment checks of the geometries, per geometry and per vectorized predicate."""
+    counter: Counter = Counter()
+    originals = {
+        (owner, name): getattr(owner, name) for owner, name in [(BaseGeometry, "contains"), (BaseGeometry, "within"), (shapely, "intersects_xy")]
+    }
+
+    def counting(name: str, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs) -> bool:
+            counter[name] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for (owner, name), method in originals.items():
+        setattr(owner, name, counting(name, method))
+    try:
+        yield counter
+    finally:
+        for (owner, name), method in originals.items():
+            setattr(owner, name, method)
+
+
+def cross_section(cls: type[RectangularReinforcedCrossSection]) -> RectangularReinforcedCrossSection:
+    """A beam with reinforcement on all edges, stirrups and a few single rebars."""
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    cs = cls(width=1000, height=800, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C35_45))
+    cs.add_stirrup_along_edges(diameter=10, distance=150, material=steel)
+    for edge, n in [("upper", 10), ("lower", 12), ("left", 6), ("right", 6)]:
+        cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=16, material=steel, edge=edge)  # type: ignore[arg-type]
+    for x in [-200, 0, 200]:
+        cs.add_longitudinal_rebar(Rebar(diameter=12, x=x, y=0, material=steel))
+    return cs
+
+
+def read_properties(cs: RectangularReinforcedCrossSection) -> None:
+    """Read the reinforcement properties of the cross-section."""
+    for _ in range(READS):
+        _ = cs.longitudinal_rebars
+        _ = cs.reinforcement_weight
+        _ = cs.reinforcement_area_longitudinal_bars
+        _ = cs.get_present_steel_materials()
+
+
+def many_bars_properties(rebars: list[Rebar]) -> tuple[float, float, float]:
+    """Area, weight and moment of inertia of the rebars, summed over the rebar objects."""
+    area = sum(rebar.area for rebar in rebars)
+    weight = sum(rebar.weight_per_meter for rebar in rebars)
+    inertia = sum(rebar.area * rebar.y**2 + math.pi * rebar.diameter**4 / 64 for rebar in rebars)
+    return area, weight, inertia
+
+
+def many_bars_properties_vectorized(rebar_set: RebarSet) -> tuple[float, float, float]:
+    """Area, weight and moment of inertia of the rebars, calculated on the rebar set."""
+    return rebar_set.area, rebar_set.weight_per_meter, rebar_set.moments_of_inertia()[0]
+
+
+def many_bars_inside(geometry: shapely.Polygon, rebars: list[Rebar]) -> bool:
+    """Check that the rebars are inside the geometry, one rebar at a time."""
+    return all(geometry.contains(rebar.geometry) for rebar in rebars)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print(f"{READS} reads of the reinforcement properties of a cross-section")  # noqa: T201
+    for name, cls in [("not cached", FormerRectangularReinforcedCrossSection), ("cached", RectangularReinforcedCrossSection)]:
+        cs = cross_section(cls)
+        with count_shapely_calls() as counter:
+            start = time.perf_counter()
+            read_properties(cs)
+            seconds = time.perf_counter() - start
+        print(f"{name:<12}{sum(counter.values()):8} shapely calls{seconds * 1e3:10.1f} ms")  # noqa: T201
+
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    rebars = [Rebar(diameter=12, x=(i % 100) * 50.0, y=(i // 100) * 50.0, material=steel) for i in range(N_BARS)]
+    rebar_set = RebarSet.from_rebars(rebars)
+    print(f"Area, weight and moment of inertia of {N_BARS} bars")  # noqa: T201
+    for name, calculate in [("rebars", lambda: many_bars_properties(rebars)), ("rebar set", lambda: many_bars_properties_vectorized(rebar_set))]:
+        start = time.perf_counter()
+        calculate()
+        seconds = time.perf_counter() - start
+        print(f"{name:<12}{seconds * 1e3:10.2f} ms")  # noqa: T201
+
+    wall = shapely.box(-100.0, -100.0, 5050.0, 5050.0)
+    print(f"Containment check of {N_BARS} bars")  # noqa: T201
+    # new rebar objects, of which the geometry (a buffered point) is created by the check as before it was cached
+    new_rebars = [Rebar(diameter=rebar.diameter, x=rebar.x, y=rebar.y, material=steel) for rebar in rebars]
+    checks: list[tuple[str, Callable[[], bool]]] = [
+        ("rebars", lambda: many_bars_inside(wall, new_rebars)),
+        ("rebar set", lambda: bool(rebar_set.within(wall).all())),
+    ]
+    for name, check in checks:
+        with count_shapely_calls() as counter:
+            start = time.perf_counter()
+            assert check()
+            seconds = time.perf_counter() - start
+        print(f"{name:<12}{sum(counter.values()):8} shapely calls{seconds * 1e3:10.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of the selection of the lightest longitudinal reinforcement of the lower edge of many beams.
+
+Compares building and checking every candidate layout as a cross-section with the pruning of the candidates by the reinforcement
+layout optimizer, and the checks of the moment resistance in the current process with those in a process pool (which only pays
+off with several CPU cores).
+Run with ``python -m benchmarks.reinforcement_optimizer``.
+"""
+
+import time
+from functools import partial
+
+import numpy as np
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n import (
+    Form9Dot1nMinimumTensileReinforcementBeam,
+)
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_optimizer import ReinforcementLayoutOptimizer
+
+BEAMS = 200
+ONE_BY_ONE = 5
+CHECKED_BEAMS = 24
+
+
+def beam(width: float, height: float) -> RectangularReinforcedCrossSection:
+    """A beam with stirrups and without longitudinal reinforcement."""
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+    cs = RectangularReinforcedCrossSection(width=width, height=height, concrete_material=concrete)
+    cs.add_stirrup_along_edges(diameter=8, distance=150, material=ReinforcementSteelMaterial())
+    return cs
+
+
+def lightest_one_by_one(cs: RectangularReinforcedCrossSection, optimizer: ReinforcementLayoutOptimizer, required_area: float) -> float:
+    """Build every candidate layout as a cross-section and return the area of the lightest feasible one."""
+    best = np.inf
+    for diameter in optimizer.diameters:
+        for n in range(2, optimizer.max_bars + 1):
+            reinforced = beam(cs.width, cs.height)
+            reinforced.add_longitudinal_reinforcement_by_quantity(n=n, diameter=diameter, material=optimizer.material, edge="lower")
+            rebars = reinforced.rebar_set
+            depth = cs.height / 2 - rebars.y.min()
+            minimum_area = Form9Dot1nMinimumTensileReinforcementBeam(f_ctm=cs.concrete_material.f_ctm, f_yk=500, b_t=cs.width, d=depth)
+            clear_spacing = np.diff(np.sort(rebars.x)).min() - diameter
+            if rebars.area >= max(minimum_area, required_area) and clear_spacing >= max(diameter, 21, 20):
+                best = min(best, rebars.area)
+    return best
+
+
+def resists_moment(cross_section: RectangularReinforcedCrossSection, m_ed: float) -> bool:
+    """Check whether a cross-section resists a positive moment in pure bending."""
+    return bool(InteractionDiagram.from_cross_section(cross_section, n_planes=100, n_layers=50).contains(0.0, m_ed))
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    rng = np.random.default_rng(0)
+    sizes = [(300, 500), (300, 600), (400, 800), (250, 450)]
+    cross_sections = {f"B{i}": beam(*sizes[i % len(sizes)]) for i in range(BEAMS)}
+    required_area = {key: float(rng.choice([800.0, 1200.0, 1600.0, 2000.0])) for key in cross_sections}
+    optimizer = ReinforcementLayoutOptimizer()
+
+    start = time.perf_counter()
+    one_by_one = [lightest_one_by_one(cross_sections[key], optimizer, required_area[key]) for key in list(cross_sections)[:ONE_BY_ONE]]
+    seconds = (time.perf_counter() - start) * BEAMS / ONE_BY_ONE
+    candidates = len(optimizer.diameters) * (optimizer.max_bars - 1)
+    print(f"{BEAMS} beams x {candidates} candidates, one by one  {seconds:8.2f} s (extrapolated from {ONE_BY_ONE} beams)")  # noqa: T201
+
+    start = time.perf_counter()
+    layouts = optimizer.optimize(cross_sections, required_area=required_area)
+    print(f"{BEAMS} beams x {candidates} candidates, optimizer   {time.perf_counter() - start:8.3f} s")  # noqa: T201
+    optimized = [layout.area for layout in list(layouts.values())[:ONE_BY_ONE] if layout is not None]
+    print(f"same lightest layouts                    {np.allclose(one_by_one, optimized)}")  # noqa: T201
+
+    checked = dict(list(cross_sections.items())[:CHECKED_BEAMS])
+    check = {key: partial(resists_moment, m_ed=float(rng.uniform(100, 300))) for key in checked}
+    for max_workers in (1, 4):
+        start = time.perf_counter()
+        optimizer.optimize(checked, check=check, max_workers=max_workers)
+        print(f"{CHECKED_BEAMS} beams with moment check, {max_workers:2d} workers {time.perf_counter() - start:8.2f} s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of the section properties used by the nominal stiffness of a slender column (formula 5.21).
+
+Compares the cached analytic section properties of a reinforced cross-section with recalculating the second moments of area of
+the concrete and the reinforcement for every evaluation of the formula.
+Run with ``python -m benchmarks.section_properties``.
+"""
+
+import math
+import time
+from collections.abc import Callable
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_21 import Form5Dot21NominalStiffness
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+EVALUATIONS = 10000
+
+
+def column() -> RectangularReinforcedCrossSection:
+    """A column with reinforcement on all edges."""
+    steel = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+    cs = RectangularReinforcedCrossSection(width=400, height=600, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_stirrup_along_edges(diameter=10, distance=150, material=steel)
+    for edge, n in [("upper", 4), ("lower", 4), ("left", 3), ("right", 3)]:
+        cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=20, material=steel, edge=edge)  # type: ignore[arg-type]
+    return cs
+
+
+def stiffness_recalculated(cs: RectangularReinforcedCrossSection) -> float:
+    """Nominal stiffness, recalculating the second moments of area from the polygon and rebar objects."""
+    geometry = cs.cross_section.geometry
+    min_y, max_y = geometry.bounds[1], geometry.bounds[3]
+    centroid_y = geometry.centroid.y
+    i_c = geometry.area * (max_y - min_y) ** 2 / 12
+    i_s = sum(rebar.area * (rebar.y - centroid_y) ** 2 + math.pi * rebar.diameter**4 / 64 for rebar in cs.longitudinal_rebars)
+    return Form5Dot21NominalStiffness(k_c=0.3, e_cd=cs.concrete_material.e_cm / 1.2, i_c=i_c, k_s=1.0, e_s=200000.0, i_s=i_s)
+
+
+def stiffness_cached(cs: RectangularReinforcedCrossSection) -> float:
+    """Nominal stiffness, using the cached section properties of the cross-section."""
+    gross = cs.gross_section_properties
+    i_s = cs.rebar_set.moments_of_inertia(x=gross.centroid_x, y=gross.centroid_y)[0]
+    return Form5Dot21NominalStiffness(k_c=0.3, e_cd=cs.concrete_material.e_cm / 1.2, i_c=gross.i_xx, k_s=1.0, e_s=200000.0, i_s=i_s)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    cs = column()
+    print(f"{EVALUATIONS} evaluations of the nominal stiffness of a column")  # noqa: T201
+    benchmarks: list[tuple[str, Callable[[RectangularReinforcedCrossSection], float]]] = [
+        ("recalculated", stiffness_recalculated),
+        ("cached", stiffness_cached),
+    ]
+    for name, stiffness in benchmarks:
+        start = time.perf_counter()
+        results = [stiffness(cs) for _ in range(EVALUATIONS)]
+        seconds = time.perf_counter() - start
+        print(f"{name:<14}{seconds * 1e3:8.1f} ms  EI = {results[0]:.4e} Nmm²")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
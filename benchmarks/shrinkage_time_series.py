@@ -0,0 +1,74 @@
+"""Benchmark of the shrinkage of the elements of a project over time.
+
+Compares :func:`shrinkage_time_series` with the chain of scalar formulas 3.8 to 3.13 evaluated per element and per age.
+Run with ``python -m benchmarks.shrinkage_time_series``.
+"""
+
+import time
+
+import numpy as np
+
+from blueprints.checks.shrinkage.shrinkage_time_series import shrinkage_time_series
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8 import Form3Dot8TotalShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9 import Form3Dot9DryingShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10 import (
+    Form3Dot10CoefficientAgeConcreteDryingShrinkage,
+    SubForm3Dot10FictionalCrossSection,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11 import Form3Dot11AutogeneShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+from blueprints.materials.concrete import CementClass
+
+N_ELEMENTS = 200
+N_AGES = 500
+
+
+def elements(rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Return the properties of random elements, from slabs to columns."""
+    width, height = rng.uniform(200, 1000, N_ELEMENTS), rng.uniform(200, 1000, N_ELEMENTS)
+    return {
+        "t_s": rng.integers(1, 14, N_ELEMENTS).astype(float),
+        "a_c": width * height,
+        "u": 2 * (width + height),
+        "f_ck": rng.choice([20, 30, 40, 50], N_ELEMENTS).astype(float),
+        "relative_humidity": rng.uniform(50, 90, N_ELEMENTS),
+    }
+
+
+def scalar(t: np.ndarray, properties: dict[str, np.ndarray], k_h: np.ndarray, epsilon_cd_0: np.ndarray) -> np.ndarray:
+    """Return the total shrinkage of the chain of scalar formulas, with kh and εcd,0 of the vectorized calculation."""
+    total = np.empty((N_ELEMENTS, len(t)))
+    for element in range(N_ELEMENTS):
+        t_s, a_c, u, f_ck, _ = (float(values[element]) for values in properties.values())
+        h_0 = SubForm3Dot10FictionalCrossSection(a_c=a_c, u=u)
+        epsilon_ca_inf = Form3Dot12AutogeneShrinkageInfinity(f_ck=f_ck)
+        for i, age in enumerate(t.tolist()):
+            beta_ds = Form3Dot10CoefficientAgeConcreteDryingShrinkage(t=age, t_s=t_s, h_0=h_0) if age > t_s else 0.0
+            drying = Form3Dot9DryingShrinkage(beta_ds_tt_s=beta_ds, k_h=float(k_h[element]), epsilon_cd_0=float(epsilon_cd_0[element]))
+            autogenous = Form3Dot11AutogeneShrinkage(beta_as_t=Form3Dot13CoefficientTimeAutogeneShrinkage(t=age), epsilon_ca_inf=epsilon_ca_inf)
+            total[element, i] = Form3Dot8TotalShrinkage(epsilon_cd=drying, epsilon_ca=autogenous)
+    return total
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    properties = elements(np.random.default_rng(seed=1992))
+    t = np.geomspace(1, 36500, N_AGES)
+
+    start = time.perf_counter()
+    series = shrinkage_time_series(t=t, cement_class=CementClass.N, **properties)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    total = scalar(t, properties, series.k_h[:, 0], series.epsilon_cd_0[:, 0])
+    formulas = time.perf_counter() - start
+
+    print(f"{N_ELEMENTS} elements at {N_AGES} ages ({series.total.size} values)")  # noqa: T201
+    print(f"  scalar formulas        {formulas * 1e3:9.1f} ms")  # noqa: T201
+    print(f"  shrinkage_time_series  {vectorized * 1e3:9.1f} ms  ({formulas / vectorized:.0f}x)")  # noqa: T201
+    print(f"  largest relative difference {np.abs(series.total / total - 1).max():.1e}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
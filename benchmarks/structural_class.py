@@ -0,0 +1,72 @@
+"""Benchmark of the calculation of the structural classes (table 4.3) of the elements of a building.
+
+Compares the memoized calculation with lazily built explanations with calculating the structural class and its explanation
+for every element.
+Run with ``python -m benchmarks.structural_class``.
+"""
+
+import itertools
+import time
+from collections.abc import Callable
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_3 import (
+    ConcreteStructuralClassCalculator,
+    Table4Dot3ConcreteStructuralClass,
+)
+from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBase
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+
+
+class FormerConcreteStructuralClassCalculator(ConcreteStructuralClassCalculator):
+    """Structural class calculator without memoization."""
+
+    def cache_key(self) -> None:
+        """Disable the memoization."""
+
+
+class FormerConcreteStructuralClass(ConcreteStructuralClassBase):
+    """Structural class of which the explanation is built on construction."""
+
+    def __new__(cls, *args, **kwargs) -> "FormerConcreteStructuralClass":
+        """Calculate the structural class and its explanation."""
+        structural_class = super().__new__(cls, FormerConcreteStructuralClassCalculator, *args, **kwargs)
+        _ = structural_class.explanation
+        return structural_class
+
+
+def records() -> list[dict]:
+    """Inputs of 10000 elements, combining a few dozen unique combinations of inputs."""
+    materials = [ConcreteMaterial(ConcreteStrengthClass(grade)) for grade in ["C30/37", "C35/45", "C45/55"]]
+    grid = itertools.product([["XC1"], ["XC3", "XD1"], ["XC4", "XS1", "XF1"]], [50, 100], materials, [False, True], [False, True])
+    combinations = [
+        {
+            "exposure_classes": exposure_classes,
+            "design_working_life": design_working_life,
+            "concrete_material": material,
+            "plate_geometry": plate_geometry,
+            "quality_control": quality_control,
+        }
+        for exposure_classes, design_working_life, material, plate_geometry, quality_control in grid
+    ]
+    return [combinations[i % len(combinations)] for i in range(10000)]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    elements = records()
+    benchmarks: list[tuple[str, Callable[[], list]]] = [
+        ("not memoized", lambda: [FormerConcreteStructuralClass(**element) for element in elements]),
+        ("memoized", lambda: [Table4Dot3ConcreteStructuralClass(**element) for element in elements]),
+        ("from_records", lambda: Table4Dot3ConcreteStructuralClass.from_records(elements)),
+    ]
+    print(f"Structural classes of {len(elements)} elements")  # noqa: T201
+    for name, calculate in benchmarks:
+        start = time.perf_counter()
+        structural_classes = calculate()
+        seconds = time.perf_counter() - start
+        assert len(structural_classes) == len(elements)
+        print(f"{name:<14}{seconds * 1e3:8.1f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
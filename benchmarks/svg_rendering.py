@@ -0,0 +1,65 @@
+"""Benchmark of drawing a reinforced cross-section for a web front end.
+
+Compares the matplotlib plot saved as SVG with the SVG markup written directly by :class:`RectangularCrossSectionSvgRenderer`,
+including the import of the packages in a fresh interpreter.
+Run with ``python -m benchmarks.svg_rendering``.
+"""
+
+import io
+import subprocess
+import sys
+import time
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.svg import RectangularCrossSectionSvgRenderer
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+REPEATS = 1000
+PLOTS = 20
+
+
+def cross_section() -> RectangularReinforcedCrossSection:
+    """Return a reinforced beam section."""
+    steel = ReinforcementSteelMaterial()
+    cs = RectangularReinforcedCrossSection(width=400, height=600, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_stirrup_along_edges(diameter=8, distance=150, material=steel)
+    cs.add_longitudinal_reinforcement_by_quantity(n=5, diameter=20, material=steel, edge="lower")
+    cs.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=steel, edge="upper")
+    cs.add_longitudinal_reinforcement_by_distance(center_to_center=150, diameter=10, material=steel, edge="left")
+    return cs
+
+
+def import_time(module: str) -> float:
+    """Return the time of importing a module in a fresh interpreter [s]."""
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    cs = cross_section()
+    renderer = RectangularCrossSectionSvgRenderer(cs)
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        renderer.render(title="B1")
+    direct = (time.perf_counter() - start) / REPEATS * 1e3
+
+    from matplotlib import pyplot as plt
+
+    start = time.perf_counter()
+    for _ in range(PLOTS):
+        figure = cs.plot(title="B1")
+        figure.savefig(io.StringIO(), format="svg")
+        plt.close(figure)
+    matplotlib = (time.perf_counter() - start) / PLOTS * 1e3
+
+    print(f"matplotlib plot saved as SVG {matplotlib:8.2f} ms per section")  # noqa: T201
+    print(f"direct SVG markup            {direct:8.3f} ms per section  ({matplotlib / direct:.0f}x)")  # noqa: T201
+    print(f"import matplotlib.pyplot     {import_time('matplotlib.pyplot') * 1e3:8.0f} ms")  # noqa: T201
+    svg_module = "blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.svg"
+    print(f"import SVG renderer          {import_time(svg_module) * 1e3:8.0f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of the discretization of reinforced T-, I- and hollow sections and the integration of their interaction surfaces.
+
+Compares a grid of fibers clipped to the shape with the Gauss points of a cached triangulation of the concrete: the time to
+discretize a cross-section (first and repeated), the number of integration points, the time of the interaction surface and its
+largest deviation from a reference surface of a fine triangulation.
+Run with ``python -m benchmarks.triangulated_sections``.
+"""
+
+import time
+
+import numpy as np
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_surface import InteractionSurface
+from blueprints.structural_sections.cross_section_shapes import PolygonCrossSection
+
+REPEATS = 20
+N_ANGLES = 36
+N_PLANES = 60
+
+
+def sections() -> dict[str, ReinforcedCrossSection]:
+    """Return a T-, an I- and a hollow section with reinforcement in their corners."""
+    shapes = {
+        "T": PolygonCrossSection.t_shape(width_flange=800, thickness_flange=150, width_web=300, height=600),
+        "I": PolygonCrossSection.i_shape(width=400, height=800, thickness_flanges=120, thickness_web=150),
+        "hollow": PolygonCrossSection.hollow_rectangle(width=600, height=800, thickness=150),
+    }
+    result = {}
+    for name, shape in shapes.items():
+        cs = ReinforcedCrossSection(cross_section=shape, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+        min_x, min_y, max_x, max_y = shape.geometry.bounds
+        for x, y in [(-100, min_y + 50), (100, min_y + 50), (min_x + 60, max_y - 50), (max_x - 60, max_y - 50)]:
+            cs.add_longitudinal_rebar(Rebar(diameter=20, x=x, y=y, material=ReinforcementSteelMaterial()))
+        result[name] = cs
+    return result
+
+
+def timed(function: object, repeats: int = 1) -> tuple[float, object]:
+    """Return the mean time of calling a function [ms] and its result."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = function()  # type: ignore[operator]
+    return (time.perf_counter() - start) / repeats * 1e3, result
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for name, cs in sections().items():
+        fine = FiberSection.from_triangulation(cs, n_subdivisions=32, degree=5)
+        reference = InteractionSurface.from_fiber_section(fine, n_angles=N_ANGLES, n_planes=N_PLANES)
+        # loads just inside the reference surface, except on the axis of the normal force, where the surface has a degenerate apex
+        loads = reference.vertices[np.hypot(reference.vertices[:, 1], reference.vertices[:, 2]) > 1.0] * 0.999
+        discretizations = {
+            "grid 30x30": lambda cs=cs: FiberSection.from_cross_section(cs, n_x=30, n_y=30),
+            "grid 60x60": lambda cs=cs: FiberSection.from_cross_section(cs, n_x=60, n_y=60),
+            "triangulated, 8 subdivisions, degree 2": lambda cs=cs: FiberSection.from_triangulation(cs, n_subdivisions=8, degree=2),
+            "triangulated, 8 subdivisions, degree 5": lambda cs=cs: FiberSection.from_triangulation(cs, n_subdivisions=8, degree=5),
+            "triangulated, 16 subdivisions, degree 5 (default)": lambda cs=cs: FiberSection.from_triangulation(cs),
+        }
+        print(f"{name}-section")  # noqa: T201
+        for label, discretize in discretizations.items():
+            first, _ = timed(discretize)
+            repeated, fiber_section = timed(discretize, REPEATS)
+            surface_time, surface = timed(
+                lambda fiber_section=fiber_section: InteractionSurface.from_fiber_section(fiber_section, n_angles=N_ANGLES, n_planes=N_PLANES)
+            )
+            deviation = np.abs(surface.unity_check(*loads.T) - reference.unity_check(*loads.T)).max()  # type: ignore[attr-defined]
+            points = fiber_section.concrete_area.size  # type: ignore[attr-defined]
+            print(  # noqa: T201
+                f"  {label:50s} {points:5d} points  discretize {first:6.2f} ms (repeated {repeated:6.2f} ms)  "
+                f"surface {surface_time:7.1f} ms  largest deviation of the unity check {deviation:.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
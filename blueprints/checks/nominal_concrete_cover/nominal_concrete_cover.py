@@ -1,7 +1,10 @@
 """Calculation of nominal concrete cover from NEN-EN 1992-1-1: Chapter 4 - Durability and cover to reinforcement."""
 
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
-from typing import Literal
+from functools import wraps
+from operator import attrgetter
+from typing import Any, Literal, TypeVar
 
 from blueprints.checks.nominal_concrete_cover.constants.base import (
     NominalConcreteCoverConstantsBase as ConstantsBase,
@@ -25,6 +28,52 @@ from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBa
 from blueprints.codes.latex_formula import latex_max_curly_brackets
 from blueprints.type_alias import MM
 
+T = TypeVar("T")
+
+_EXPOSURE = ("carbonation", "chloride", "chloride_seawater")
+_C_MIN_DUR = (*_EXPOSURE, "structural_class")
+_C_MIN = ("reinforcement_diameter", "nominal_max_aggregate_size", *_C_MIN_DUR, "delta_c_dur_gamma", "delta_c_dur_st", "delta_c_dur_add")
+_C_MIN_TOTAL = (*_C_MIN, "uneven_surface", "abrasion_class")
+
+
+def _memoized(*depends_on: str) -> Callable[[Callable[["NominalConcreteCover"], T]], Callable[["NominalConcreteCover"], T]]:
+    """Memoize a sub-calculation of the nominal concrete cover.
+
+    The result is stored per instance by the name of the sub-calculation. Instances created by
+    :meth:`NominalConcreteCover.from_records` additionally share a cache, keyed by the name of the sub-calculation and the
+    values (and their types) of the fields it depends on, so identical sub-results are reused between those instances.
+
+    Parameters
+    ----------
+    *depends_on: str
+        The names of the fields the sub-calculation depends on, the constants excluded.
+    """
+    get_dependencies = attrgetter(*depends_on)
+
+    def decorator(method: Callable[["NominalConcreteCover"], T]) -> Callable[["NominalConcreteCover"], T]:
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self: "NominalConcreteCover") -> T:
+            sub_results = self._sub_results
+            if name in sub_results:
+                return sub_results[name]
+            shared = self._shared_sub_results
+            if shared is None:
+                result = method(self)
+            else:
+                dependencies = get_dependencies(self) if len(depends_on) > 1 else (get_dependencies(self),)
+                key = (name, *((type(value), value) for value in dependencies))
+                if key not in shared:
+                    shared[key] = method(self)
+                result = shared[key]
+            sub_results[name] = result
+            return result
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass(frozen=True)
 class NominalConcreteCover:
@@ -69,6 +118,11 @@ class NominalConcreteCover:
     abrasion_class: AbrasionClass
         The abrasion class of the concrete surface according to art. 4.4.1.2 (13).
         The default value is "Not applicable".
+
+    Notes
+    -----
+    The instance is immutable, so the sub-calculations (exposure classes, :math:`c_{min,b}`, :math:`c_{min,dur}`, :math:`c_{min}`,
+    :math:`c_{nom}`, ...) are evaluated once and reused by :meth:`value` and :meth:`latex`.
     """
 
     label = "Nominal concrete cover according to art. 4.4.1"
@@ -87,6 +141,8 @@ class NominalConcreteCover:
     casting_surface: CastingSurface = field(default=CastingSurface.PERMANENTLY_EXPOSED)
     uneven_surface: bool = field(default=False)
     abrasion_class: AbrasionClass = field(default=AbrasionClass.NA)
+    _sub_results: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _shared_sub_results: dict[tuple, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Check the input parameters for validity."""
@@ -106,18 +162,47 @@ class NominalConcreteCover:
         if isinstance(self.chloride_seawater, str):
             object.__setattr__(self, "chloride_seawater", ChlorideSeawater[self.chloride_seawater.upper()])
 
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]], **shared: Any) -> list["NominalConcreteCover"]:  # noqa: ANN401
+        """Create the nominal concrete covers of many elements at once.
+
+        Elements with the same constants share their sub-results, so identical sub-calculations (for example the minimum cover
+        with regard to durability of all elements with the same exposure and structural class) are evaluated only once.
+
+        Parameters
+        ----------
+        records: Iterable[Mapping[str, Any]]
+            The parameters of every element, see the parameters of :class:`NominalConcreteCover`.
+        **shared: Any
+            Parameters that are the same for all elements, for example the constants. Parameters in the records take precedence.
+
+        Returns
+        -------
+        list[NominalConcreteCover]
+            The nominal concrete cover of every element, in the order of the records.
+        """
+        covers = [cls(**(shared | dict(record))) for record in records]
+        shared_sub_results: dict[int, dict[tuple, Any]] = {}
+        for cover in covers:
+            object.__setattr__(cover, "_shared_sub_results", shared_sub_results.setdefault(id(cover.constants), {}))
+        return covers
+
+    @_memoized(*_EXPOSURE)
     def exposure_classes(self) -> Table4Dot1ExposureClasses:
         """Exposure classes according to table 4.1 from NEN-EN 1992-1-1."""
         return Table4Dot1ExposureClasses(self.carbonation, self.chloride, self.chloride_seawater, FreezeThaw.NA, Chemical.NA)  # type: ignore[arg-type]
 
+    @_memoized("reinforcement_diameter", "nominal_max_aggregate_size")
     def c_min_b(self) -> Table4Dot2MinimumCoverWithRegardToBond:
         """Minimum concrete cover with regard to bond according to table 4.2 from NEN-EN 1992-1-1."""
         return Table4Dot2MinimumCoverWithRegardToBond(self.reinforcement_diameter, self.nominal_max_aggregate_size > 32)
 
+    @_memoized(*_C_MIN_DUR)
     def c_min_dur(self) -> Table4Dot4nMinimumCoverDurabilityReinforcementSteel:
         """Minimum concrete cover with regard to durability according to table 4.4N from NEN-EN 1992-1-1."""
         return Table4Dot4nMinimumCoverDurabilityReinforcementSteel(self.exposure_classes(), self.structural_class)  # type: ignore[arg-type]
 
+    @_memoized(*_C_MIN)
     def c_min(self) -> Form4Dot2MinimumConcreteCover:
         """Minimum concrete cover according to formula 4.2 from NEN-EN 1992-1-1."""
         return Form4Dot2MinimumConcreteCover(
@@ -136,6 +221,7 @@ class NominalConcreteCover:
         """Calculate the increase of the concrete cover for abrasion class according to art. 4.4.1.2 (13)."""
         return self.constants.COVER_INCREASE_FOR_ABRASION_CLASS[self.abrasion_class]
 
+    @_memoized(*_C_MIN_TOTAL)
     def c_min_total(self) -> MM:
         """Total minimum concrete cover according to art. 4.4.1.2 (11) and (13) from NEN-EN 1992-1-1."""
         c_min = self.c_min()
@@ -145,14 +231,17 @@ class NominalConcreteCover:
         c_min += self.cover_increase_for_abrasion_class()  # type: ignore[assignment]
         return c_min
 
+    @_memoized(*_C_MIN_TOTAL)
     def c_nom(self) -> Form4Dot1NominalConcreteCover:
         """Nominal concrete cover according to art. 4.4.1 from NEN-EN 1992-1-1."""
         return Form4Dot1NominalConcreteCover(c_min=self.c_min_total(), delta_c_dev=self.constants.DEFAULT_DELTA_C_DEV)
 
+    @_memoized(*_C_MIN_DUR, "casting_surface")
     def minimum_cover_with_regard_to_casting_surface(self) -> MM:
         """Calculate the minimum cover with regard to casting surface according to art. 4.4.1.3 (4) from NEN-EN 1992-1-1."""
         return self.constants.minimum_cover_with_regard_to_casting_surface(self.c_min_dur(), self.casting_surface)
 
+    @_memoized(*_C_MIN_TOTAL, "casting_surface")
     def value(self) -> MM:
         """Get the value of the nominal concrete cover."""
         return max(
@@ -0,0 +1,181 @@
+"""Batch calculation of nominal concrete cover tables from NEN-EN 1992-1-1: Chapter 4 - Durability and cover to reinforcement."""
+
+from collections.abc import Iterable
+from dataclasses import MISSING, fields
+from typing import TYPE_CHECKING, Any
+
+from blueprints.checks.nominal_concrete_cover.constants.base import (
+    NominalConcreteCoverConstantsBase as ConstantsBase,
+)
+from blueprints.checks.nominal_concrete_cover.nominal_concrete_cover import NominalConcreteCover
+from blueprints.codes.eurocode.exposure_classes import EXPOSURE_CLASS_BITS, EXPOSURE_CLASS_FIELDS
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_1 import Form4Dot1NominalConcreteCover
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_2 import Form4Dot2MinimumConcreteCover
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chloride,
+    ChlorideSeawater,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2 import Table4Dot2MinimumCoverWithRegardToBond
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+    exposure_class_rows,
+    validate_structural_class,
+)
+from blueprints.codes.formula import Formula
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    import pandas as pd
+
+PARAMETERS = [field.name for field in fields(NominalConcreteCover) if field.init and field.name != "constants"]
+EXPOSURE_CLASSES = {"carbonation": Carbonation, "chloride": Chloride, "chloride_seawater": ChlorideSeawater}
+
+
+def _unique_rows(*columns: "np.ndarray") -> tuple["np.ndarray", "np.ndarray"]:
+    """Find the unique rows of the given (numeric) columns.
+
+    Parameters
+    ----------
+    *columns: np.ndarray
+        The columns, all of the same length.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The index of the first occurrence of every unique row, and for every row the position of its unique row in the former.
+    """
+    import numpy as np
+
+    _, index, inverse = np.unique(np.column_stack(columns), axis=0, return_index=True, return_inverse=True)
+    return index, inverse.ravel()
+
+
+def _evaluate_unique(formula: type[Formula], **columns: "np.ndarray") -> "np.ndarray":
+    """Evaluate a formula in batch, for the unique combinations of the given (numeric) input columns only.
+
+    Parameters
+    ----------
+    formula: type[Formula]
+        The formula to evaluate.
+    **columns: np.ndarray
+        The input values of the formula, by parameter name. All columns have the same length.
+
+    Returns
+    -------
+    np.ndarray
+        The result of the formula for every row of the input columns.
+    """
+    index, inverse = _unique_rows(*columns.values())
+    return formula.batch(**{name: column[index] for name, column in columns.items()})[inverse]
+
+
+def nominal_concrete_cover_table(constants: ConstantsBase, **grid: Iterable[Any] | Any) -> "pd.DataFrame":  # noqa: ANN401
+    """Calculate the nominal concrete cover for every combination of the given parameters.
+
+    The results equal those of :class:`NominalConcreteCover`, but the tables and formulas are evaluated in batch. Table 4.4N is
+    looked up by array indexing, and identical sub-calculations are evaluated only once.
+
+    Examples
+    --------
+    >>> nominal_concrete_cover_table(
+    ...     NominalConcreteCoverConstants2011C2(),
+    ...     reinforcement_diameter=[8, 10, 12, 16, 20, 25, 32],
+    ...     nominal_max_aggregate_size=[16, 32],
+    ...     structural_class=[3, 4, 5, 6],
+    ...     carbonation=["XC1", "XC2", "XC3", "XC4"],
+    ...     chloride=["NA", "XD1", "XD2", "XD3"],
+    ...     casting_surface=list(CastingSurface),
+    ... )
+
+    Parameters
+    ----------
+    constants: ConstantsBase
+        The constants for the calculation of the nominal concrete cover.
+    **grid: Iterable[Any] | Any
+        The values of the parameters of :class:`NominalConcreteCover` (except the constants), by parameter name. A single value
+        (a string or a non-iterable) is the same for all rows. The parameters reinforcement_diameter, nominal_max_aggregate_size
+        and structural_class are required, the other parameters default to the defaults of :class:`NominalConcreteCover`.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per combination of the parameters, with a column per parameter and the columns c_min_b, c_min_dur, c_min,
+        c_nom and value [:math:`mm`].
+
+    Raises
+    ------
+    ValueError
+        If an unknown parameter is given or a required parameter is missing.
+    """
+    # NumPy and pandas are imported here, so that importing the checks does not import them
+    import numpy as np
+    import pandas as pd
+
+    if unknown := set(grid) - set(PARAMETERS):
+        raise ValueError(f"Unknown parameter(s) for the nominal concrete cover: {', '.join(sorted(unknown))}.")
+    values: dict[str, list[Any]] = {}
+    for field in fields(NominalConcreteCover):
+        if field.name not in PARAMETERS:
+            continue
+        if field.name in grid:
+            value = grid[field.name]
+            values[field.name] = [value] if isinstance(value, str) or not isinstance(value, Iterable) else list(value)
+        elif field.default is not MISSING:
+            values[field.name] = [field.default]
+        elif field.default_factory is not MISSING:
+            values[field.name] = [field.default_factory()]
+        else:
+            raise ValueError(f"Missing required parameter for the nominal concrete cover: {field.name}.")
+    for name, exposure in EXPOSURE_CLASSES.items():
+        values[name] = [exposure[value.upper()] if isinstance(value, str) else value for value in values[name]]
+
+    # every row of the table is a combination of options, stored as the index (code) of the option of every parameter
+    codes = dict(zip(values, np.indices([len(options) for options in values.values()]).reshape(len(values), -1)))
+    table = pd.DataFrame({name: pd.Series(options).to_numpy()[codes[name]] for name, options in values.items()})
+    diameter = table["reinforcement_diameter"].to_numpy(dtype=float)
+    aggregate_size_greater_than_32_mm = table["nominal_max_aggregate_size"].to_numpy(dtype=float) > 32
+
+    table["c_min_b"] = _evaluate_unique(
+        Table4Dot2MinimumCoverWithRegardToBond,
+        diameter=diameter,
+        nominal_max_aggregate_size_greater_than_32_mm=aggregate_size_greater_than_32_mm,
+    )
+
+    # table 4.4N is looked up by array indexing, with the exposure class rows determined from the codes of the exposure classes
+    exposure_codes = sum(
+        np.array([exposure.severity for exposure in values[name]])[codes[name]] << (EXPOSURE_CLASS_FIELDS.index(name) * EXPOSURE_CLASS_BITS)
+        for name in EXPOSURE_CLASSES
+    )
+    for structural_class in values["structural_class"]:
+        validate_structural_class(structural_class)
+    structural_classes = np.array([int(structural_class) for structural_class in values["structural_class"]])
+    c_min_dur = Table4Dot4nMinimumCoverDurabilityReinforcementSteel.lookup(
+        exposure_class_rows(exposure_codes), structural_classes[codes["structural_class"]]
+    )
+    table["c_min_dur"] = c_min_dur
+
+    table["c_min"] = _evaluate_unique(
+        Form4Dot2MinimumConcreteCover,
+        c_min_b=table["c_min_b"].to_numpy(),
+        c_min_dur=c_min_dur,
+        delta_c_dur_gamma=table["delta_c_dur_gamma"].to_numpy(dtype=float),
+        delta_c_dur_st=table["delta_c_dur_st"].to_numpy(dtype=float),
+        delta_c_dur_add=table["delta_c_dur_add"].to_numpy(dtype=float),
+    )
+
+    # increases of the minimum cover according to art. 4.4.1.2 (11) and (13)
+    uneven_surface_increase = np.array([constants.COVER_INCREASE_FOR_UNEVEN_SURFACE * uneven for uneven in values["uneven_surface"]], dtype=float)
+    abrasion_class_increase = np.array([constants.COVER_INCREASE_FOR_ABRASION_CLASS[abrasion] for abrasion in values["abrasion_class"]], dtype=float)
+    c_min_total = table["c_min"].to_numpy() + uneven_surface_increase[codes["uneven_surface"]] + abrasion_class_increase[codes["abrasion_class"]]
+    table["c_nom"] = Form4Dot1NominalConcreteCover.batch(c_min=c_min_total, delta_c_dev=constants.DEFAULT_DELTA_C_DEV)
+
+    # minimum cover with regard to the casting surface according to art. 4.4.1.3 (4)
+    index, inverse = _unique_rows(c_min_dur, codes["casting_surface"])
+    casting_surface_covers = np.array(
+        [constants.minimum_cover_with_regard_to_casting_surface(c_min_dur[i], values["casting_surface"][codes["casting_surface"][i]]) for i in index],
+        dtype=float,
+    )
+    table["value"] = np.maximum(table["c_nom"].to_numpy(), casting_surface_covers[inverse])
+
+    return table
@@ -0,0 +1 @@
+"""Shrinkage of concrete elements over time according to NEN-EN 1992-1-1."""
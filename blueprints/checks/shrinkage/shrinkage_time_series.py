@@ -0,0 +1,178 @@
+"""Vectorized shrinkage of concrete elements over time according to art. 3.1.4 (6) and Annex B.2 from NEN-EN 1992-1-1+C2:2011.
+
+The drying, autogenous and total shrinkage of formulas 3.8 to 3.13 are evaluated for many elements at many ages in a single pass
+with NumPy, with results equal to those of the scalar formulas.
+
+Examples
+--------
+>>> series = shrinkage_time_series(
+...     t=np.geomspace(1, 36500, 400),
+...     t_s=7,
+...     a_c=np.array([300 * 500, 400 * 400, 1000 * 250]),
+...     u=np.array([1600, 1600, 2500]),
+...     f_ck=30,
+...     relative_humidity=70,
+...     cement_class=CementClass.N,
+... )
+>>> series.total.shape
+(3, 400)
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from blueprints.materials.concrete import CementClass
+from blueprints.type_alias import DAYS, MM, MM2, MPA, PERCENTAGE
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+
+ALPHA_DS: dict[CementClass, tuple[float, float]] = {
+    CementClass.S: (3, 0.13),
+    CementClass.N: (4, 0.12),
+    CementClass.R: (6, 0.11),
+}
+"""[alpha_ds1, alpha_ds2] Coefficients of the nominal drying shrinkage per class of cement, according to Annex B.2 (B.11) [-]."""
+
+TABLE_3_3_H_0: tuple[float, ...] = (100, 200, 300, 500)
+"""[h0] Fictional thicknesses of table 3.3 [mm]."""
+
+TABLE_3_3_K_H: tuple[float, ...] = (1.0, 0.85, 0.75, 0.70)
+"""[kh] Coefficients of the fictional thicknesses of table 3.3 [-]."""
+
+
+@dataclass(frozen=True)
+class ShrinkageTimeSeries:
+    """Shrinkage of concrete elements at the considered ages, see :func:`shrinkage_time_series`.
+
+    All arrays have the broadcast shape of the elements followed by the shape of the ages, except the properties of the elements
+    (h_0, k_h, epsilon_cd_0 and epsilon_ca_inf), which have the shape of the elements followed by a single age.
+
+    Parameters
+    ----------
+    t: np.ndarray
+        [t] Age of the concrete at the considered moments [days].
+    h_0: np.ndarray
+        [h0] Fictional thickness of the cross-section [mm].
+    k_h: np.ndarray
+        [kh] Coefficient depending on the fictional thickness following table 3.3 [-].
+    epsilon_cd_0: np.ndarray
+        [εcd,0] Nominal unobstructed drying shrinkage following Annex B.2 (B.11) [-].
+    epsilon_ca_inf: np.ndarray
+        [εca(∞)] Autogene shrinkage at infinity, formula 3.12 [-].
+    drying: np.ndarray
+        [εcd(t)] Drying shrinkage, formula 3.9 [-]. Zero up to the start of the drying shrinkage.
+    autogenous: np.ndarray
+        [εca(t)] Autogene shrinkage, formula 3.11 [-].
+    total: np.ndarray
+        [εcs(t)] Total shrinkage, formula 3.8 [-].
+    """
+
+    t: "np.ndarray"
+    h_0: "np.ndarray"
+    k_h: "np.ndarray"
+    epsilon_cd_0: "np.ndarray"
+    epsilon_ca_inf: "np.ndarray"
+    drying: "np.ndarray"
+    autogenous: "np.ndarray"
+    total: "np.ndarray"
+
+
+def shrinkage_time_series(
+    t: "ArrayLike",
+    t_s: "DAYS | ArrayLike",
+    a_c: "MM2 | ArrayLike",
+    u: "MM | ArrayLike",
+    f_ck: "MPA | ArrayLike",
+    relative_humidity: "PERCENTAGE | ArrayLike",
+    cement_class: CementClass | Sequence[CementClass] = CementClass.N,
+) -> ShrinkageTimeSeries:
+    """Calculate the drying, autogenous and total shrinkage of concrete elements at the given ages in one vectorized pass.
+
+    The properties of the elements (t_s, a_c, u, f_ck, relative_humidity and cement_class) are broadcast against each other to the
+    shape of the elements. The ages t have one more, last, dimension: a 1-D array of ages is used for all elements, an array with
+    the shape of the elements followed by the ages gives every element its own ages. The results equal those of the formulas
+    3.8 to 3.13 (:class:`Form3Dot8TotalShrinkage` and so on), with the nominal drying shrinkage following Annex B.2 and the
+    coefficient kh interpolated in table 3.3.
+
+    Parameters
+    ----------
+    t: ArrayLike
+        [t] Age of the concrete at the considered moments [days].
+    t_s: DAYS | ArrayLike
+        [ts] Age of the concrete at the start of the drying shrinkage, the end of curing [days].
+    a_c: MM2 | ArrayLike
+        [Ac] Area of the cross-section of the concrete [mm²].
+    u: MM | ArrayLike
+        [u] Circumference of the part of the cross-section that is subjected to drying [mm].
+    f_ck: MPA | ArrayLike
+        [fck] Characteristic compressive cylinder strength of the concrete at 28 days [MPa].
+    relative_humidity: PERCENTAGE | ArrayLike
+        [RH] Relative humidity of the ambient environment [%].
+    cement_class: CementClass | Sequence[CementClass]
+        Class of the cement, one for all elements or one per element, for example the cement class of a
+        :class:`ConcreteMaterial`. Default is CementClass.N.
+
+    Returns
+    -------
+    ShrinkageTimeSeries
+        The shrinkage of the elements at the given ages.
+
+    Raises
+    ------
+    ValueError
+        If an age is negative, a_c or u is not positive, f_ck is negative or the relative humidity is not between 0 and 100%.
+    """
+    # numpy is imported here, so that importing the checks does not import numpy
+    import numpy as np
+
+    alpha_ds = ALPHA_DS[cement_class] if isinstance(cement_class, CementClass) else np.array([ALPHA_DS[cement] for cement in cement_class]).T
+    # the properties of the elements get a last dimension of a single age, to broadcast against the ages
+    t_s, a_c, u, f_ck, relative_humidity, alpha_ds_1, alpha_ds_2 = (
+        np.asarray(value, dtype=float)[..., np.newaxis] for value in np.broadcast_arrays(t_s, a_c, u, f_ck, relative_humidity, *alpha_ds)
+    )
+    t = np.asarray(t, dtype=float)
+
+    if np.any(t < 0):
+        raise ValueError("Invalid t: t cannot be negative")
+    if np.any(t_s < 0):
+        raise ValueError("Invalid t_s: t_s cannot be negative")
+    if np.any(a_c <= 0):
+        raise ValueError("Invalid a_c: a_c cannot be negative or zero")
+    if np.any(u <= 0):
+        raise ValueError("Invalid u: u cannot be negative or zero")
+    if np.any(f_ck < 0):
+        raise ValueError("Invalid f_ck: f_ck cannot be negative")
+    if np.any((relative_humidity < 0) | (relative_humidity > 100)):
+        raise ValueError("Invalid relative_humidity: relative_humidity has to be between 0 and 100%")
+
+    # sub-formula 3.10, table 3.3 and Annex B.2 (B.11 and B.12) with f_cm = f_ck + 8, f_cm0 = 10 MPa and RH0 = 100%
+    h_0 = 2 * a_c / u
+    k_h = np.interp(h_0, TABLE_3_3_H_0, TABLE_3_3_K_H)
+    beta_rh = 1.55 * (1 - (relative_humidity / 100) ** 3)
+    epsilon_cd_0 = 0.85 * ((220 + 110 * alpha_ds_1) * np.exp(-alpha_ds_2 * (f_ck + 8) / 10)) * 10**-6 * beta_rh
+
+    # formulas 3.10 and 3.9, without drying shrinkage up to the start of the drying shrinkage
+    duration = np.maximum(t - t_s, 0)
+    beta_ds = duration / (duration + 0.04 * np.sqrt(h_0**3))
+    drying = beta_ds * k_h * epsilon_cd_0
+
+    # formulas 3.13, 3.12 and 3.11
+    epsilon_ca_inf = 2.5 * (f_ck - 10) * 10**-6
+    autogenous = (1 - np.exp(-0.2 * t**0.5)) * epsilon_ca_inf
+
+    # formula 3.8
+    total = drying + autogenous
+    return ShrinkageTimeSeries(
+        t=np.broadcast_to(t, total.shape),
+        h_0=h_0,
+        k_h=k_h,
+        epsilon_cd_0=epsilon_cd_0,
+        epsilon_ca_inf=epsilon_ca_inf,
+        drying=np.broadcast_to(drying, total.shape),
+        autogenous=np.broadcast_to(autogenous, total.shape),
+        total=total,
+    )
@@ -0,0 +1 @@
+"""Bulk unity checks of the internal forces of load combinations."""
@@ -0,0 +1,447 @@
+"""Streaming unity checks of the internal forces of many load combinations, for example from the export of a finite element model.
+
+The rows of the export (an element, a load combination and its internal forces) are read in chunks. Every chunk is checked
+vectorized, and the governing unity check of every element is kept up to date, so the memory use does not grow with the number
+of rows.
+
+Examples
+--------
+>>> tension = FormulaCheck.from_sections(
+...     "tension",
+...     Form6Dot5UnityCheckTensileStrength,
+...     loads={"n_ed": "N"},
+...     sections={"B1": brace, "B2": brace},
+...     parameters=lambda section: {"n_t_rd": section.area * 355 / 1000},
+... )
+>>> bending = InteractionCheck("N-M", elements={"C1": InteractionDiagram.from_cross_section(column)}, loads=("N", "M"))
+>>> report = bulk_unity_checks("forces.csv", [tension, bending], output="unity_checks.csv")
+>>> report.governing, report.rows_per_second
+"""
+
+import time
+import warnings
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from blueprints.codes.formula import Formula
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    import pandas as pd
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+def _element_positions(index: "pd.Index", elements: "np.ndarray") -> "np.ndarray":
+    """The position of the element of every row in the checked elements, -1 for the rows of elements that are not checked.
+
+    Elements that are not found as they are, are matched by their text: the integer elements read from a CSV file match the
+    elements of a check keyed by strings, and the other way around. Every distinct element of the rows is looked up once.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.Index(elements).factorize()
+    positions = index.get_indexer(uniques)
+    missing = positions < 0
+    text = index.astype(str)
+    if missing.any() and text.is_unique:
+        positions[missing] = text.get_indexer(uniques[missing].astype(str))
+    # rows without an element have the code -1, which takes the appended -1
+    return np.append(positions, -1)[codes]
+
+
+class UnityCheck(Protocol):
+    """A unity check of the rows of a chunk of internal forces."""
+
+    name: str
+
+    @property
+    def columns(self) -> list[str]:
+        """The columns of the internal forces used by the check."""
+
+    def unity_checks(self, elements: "np.ndarray", forces: "pd.DataFrame") -> "np.ndarray":
+        """The unity checks of the rows, NaN for the rows of elements that are not checked."""
+
+
+@dataclass(frozen=True)
+class FormulaCheck:
+    """Unity check of a formula, with the internal forces from the rows and the other parameters from the section of the element.
+
+    Parameters
+    ----------
+    name : str
+        Name of the check, for example "tension".
+    formula : type[Formula]
+        The formula that calculates the unity check, for example :class:`Form6Dot5UnityCheckTensileStrength`.
+    loads : Mapping[str, str]
+        The columns of the internal forces, by parameter of the formula. For example ``{"n_ed": "N"}``.
+    elements : Mapping[Hashable, Mapping[str, float]]
+        The other parameters of the formula (the resistances of the section and material), by element.
+    absolute : bool
+        Whether the magnitudes of the internal forces are checked, as the formulas do not accept negative forces. Default is True.
+    """
+
+    name: str
+    formula: type[Formula]
+    loads: Mapping[str, str]
+    elements: Mapping[Hashable, Mapping[str, float]]
+    absolute: bool = True
+
+    @classmethod
+    def from_sections(
+        cls,
+        name: str,
+        formula: type[Formula],
+        loads: Mapping[str, str],
+        sections: Mapping[Hashable, T],
+        parameters: Callable[[T], Mapping[str, float]],
+        absolute: bool = True,
+    ) -> "FormulaCheck":
+        """Create a check from the sections (and materials) of the elements.
+
+        Parameters
+        ----------
+        name : str
+            Name of the check.
+        formula : type[Formula]
+            The formula that calculates the unity check.
+        loads : Mapping[str, str]
+            The columns of the internal forces, by parameter of the formula.
+        sections : Mapping[Hashable, T]
+            The section of every element, for example a tuple of a profile and a material.
+        parameters : Callable[[T], Mapping[str, float]]
+            Calculates the other parameters of the formula from a section. It is called once for every distinct section object.
+        absolute : bool
+            Whether the magnitudes of the internal forces are checked. Default is True.
+
+        Returns
+        -------
+        FormulaCheck
+            The check of all elements.
+        """
+        by_section: dict[int, Mapping[str, float]] = {}
+        elements = {}
+        for element, section in sections.items():
+            if id(section) not in by_section:
+                by_section[id(section)] = parameters(section)
+            elements[element] = by_section[id(section)]
+        return cls(name=name, formula=formula, loads=loads, elements=elements, absolute=absolute)
+
+    @property
+    def columns(self) -> list[str]:
+        """The columns of the internal forces used by the check."""
+        return list(self.loads.values())
+
+    @cached_property
+    def _parameters(self) -> tuple["pd.Index", dict[str, "np.ndarray"]]:
+        """The checked elements and, by parameter, the value of every element."""
+        import numpy as np
+        import pandas as pd
+
+        names = sorted({name for parameters in self.elements.values() for name in parameters})
+        values = {name: np.array([parameters.get(name, np.nan) for parameters in self.elements.values()], dtype=float) for name in names}
+        return pd.Index(list(self.elements)), values
+
+    def unity_checks(self, elements: "np.ndarray", forces: "pd.DataFrame") -> "np.ndarray":
+        """The unity checks of the rows, NaN for the rows of elements that are not checked.
+
+        Parameters
+        ----------
+        elements : np.ndarray
+            The element of every row.
+        forces : pd.DataFrame
+            The internal forces of every row.
+
+        Returns
+        -------
+        np.ndarray
+            The unity checks of the rows [-].
+        """
+        import numpy as np
+
+        index, values = self._parameters
+        positions = _element_positions(index, elements)
+        checked = positions >= 0
+        loads = {name: forces[column].to_numpy(dtype=float)[checked] for name, column in self.loads.items()}
+        if self.absolute:
+            loads = {name: np.abs(load) for name, load in loads.items()}
+        unity_checks = np.full(len(elements), np.nan)
+        if checked.any():
+            parameters = {name: value[positions[checked]] for name, value in values.items()}
+            unity_checks[checked] = self.formula.batch(**(parameters | loads))
+        return unity_checks
+
+
+@dataclass(frozen=True)
+class InteractionCheck:
+    """Unity check of the internal forces against the interaction diagram or surface of the cross-section of the element.
+
+    Parameters
+    ----------
+    name : str
+        Name of the check, for example "N-M".
+    elements : Mapping[Hashable, Any]
+        The :class:`InteractionDiagram` or :class:`InteractionSurface` of every element. Elements with the same cross-section
+        may share a diagram.
+    loads : Sequence[str]
+        The columns of the normal force and the moment(s), in the order of the parameters of ``unity_check`` of the diagrams.
+    compression_positive : bool
+        Whether the normal forces (the first column) are positive in compression, as in the diagrams. Default is False: tension is
+        positive in the export and the normal forces are negated.
+    """
+
+    name: str
+    elements: Mapping[Hashable, Any]
+    loads: Sequence[str] = ("N", "M")
+    compression_positive: bool = False
+
+    @property
+    def columns(self) -> list[str]:
+        """The columns of the internal forces used by the check."""
+        return list(self.loads)
+
+    def unity_checks(self, elements: "np.ndarray", forces: "pd.DataFrame") -> "np.ndarray":
+        """The unity checks of the rows, NaN for the rows of elements that are not checked.
+
+        The rows of all elements that share a diagram are checked at once.
+
+        Parameters
+        ----------
+        elements : np.ndarray
+            The element of every row.
+        forces : pd.DataFrame
+            The internal forces of every row.
+
+        Returns
+        -------
+        np.ndarray
+            The unity checks of the rows [-].
+        """
+        import numpy as np
+
+        loads = [forces[column].to_numpy(dtype=float) for column in self.loads]
+        if not self.compression_positive:
+            loads[0] = -loads[0]
+        index, codes, diagrams = self._diagrams
+        positions = _element_positions(index, elements)
+        rows_diagram = np.where(positions >= 0, codes[positions], -1)
+
+        unity_checks = np.full(len(elements), np.nan)
+        order = np.argsort(rows_diagram, kind="stable")
+        bounds = np.searchsorted(rows_diagram[order], np.arange(len(diagrams) + 1))
+        for code, diagram in enumerate(diagrams):
+            rows = order[bounds[code] : bounds[code + 1]]
+            if rows.size:
+                unity_checks[rows] = diagram.unity_check(*(load[rows] for load in loads))
+        return unity_checks
+
+    @cached_property
+    def _diagrams(self) -> tuple["pd.Index", "np.ndarray", list[Any]]:
+        """The checked elements, the index of the diagram of every element and the distinct diagrams."""
+        import numpy as np
+        import pandas as pd
+
+        codes: dict[int, int] = {}
+        diagrams: list[Any] = []
+        for diagram in self.elements.values():
+            if id(diagram) not in codes:
+                codes[id(diagram)] = len(diagrams)
+                diagrams.append(diagram)
+        element_codes = np.array([codes[id(diagram)] for diagram in self.elements.values()], dtype=int)
+        return pd.Index(list(self.elements)), element_codes, diagrams
+
+
+@dataclass(frozen=True)
+class BulkUnityCheckReport:
+    """The governing unity checks of the elements and the throughput of a bulk unity check.
+
+    Parameters
+    ----------
+    governing : pd.DataFrame
+        The governing unity check of every element and check, with the columns element, check, combination and unity_check.
+    rows : int
+        Number of rows checked.
+    seconds : float
+        Duration of reading, checking and writing all rows [s].
+    """
+
+    governing: "pd.DataFrame" = field(repr=False)
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """The throughput of the bulk unity check [rows/s]."""
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+
+def read_chunks(
+    source: "str | Path | Iterable[pd.DataFrame]", columns: list[str] | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator["pd.DataFrame"]:
+    """Read the rows of a CSV or Parquet file in chunks.
+
+    Parameters
+    ----------
+    source : str | Path | Iterable[pd.DataFrame]
+        A CSV file, a Parquet file (requires pyarrow) or chunks that have been read already.
+    columns : list[str] | None
+        The columns to read. Default is all columns.
+    chunk_size : int
+        Maximum number of rows of a chunk. Default is 500000.
+
+    Yields
+    ------
+    pd.DataFrame
+        The chunks of rows.
+
+    Raises
+    ------
+    ValueError
+        If the file is neither a CSV nor a Parquet file.
+    ImportError
+        If a Parquet file is read without pyarrow installed.
+    """
+    import pandas as pd
+
+    if not isinstance(source, str | Path):
+        for chunk in source:
+            yield chunk if columns is None else chunk[columns]
+        return
+    suffix = Path(source).suffix.lower()
+    if suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Reading Parquet files requires pyarrow, install it with 'pip install pyarrow'.") from error
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    elif suffix == ".csv":
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunk_size)
+    else:
+        raise ValueError(f"Unsupported file type '{suffix}', use a .csv or .parquet file.")
+
+
+class _ResultWriter:
+    """Appends the unity checks of every chunk to a CSV or Parquet file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        if self.path.suffix.lower() not in (".csv", ".parquet"):
+            raise ValueError(f"Unsupported file type '{self.path.suffix}', use a .csv or .parquet file.")
+        self._parquet_writer: Any = None
+        self._header = True
+
+    def write(self, chunk: "pd.DataFrame") -> None:
+        """Append a chunk of results."""
+        if self.path.suffix.lower() == ".csv":
+            chunk.to_csv(self.path, mode="w" if self._header else "a", header=self._header, index=False)
+            self._header = False
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+        self._parquet_writer.write_table(table)
+
+    def close(self) -> None:
+        """Finish the file."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def bulk_unity_checks(
+    source: "str | Path | Iterable[pd.DataFrame]",
+    checks: Sequence[UnityCheck],
+    output: str | Path | None = None,
+    element_column: str = "element",
+    combination_column: str = "combination",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_unity_check: float = 0.0,
+    progress: Callable[[int, float], None] | None = None,
+) -> BulkUnityCheckReport:
+    """Check the internal forces of all rows of an export, chunk by chunk.
+
+    Parameters
+    ----------
+    source : str | Path | Iterable[pd.DataFrame]
+        A CSV or Parquet file with a row per element and load combination, or chunks of such rows, see :func:`read_chunks`.
+    checks : Sequence[UnityCheck]
+        The checks, for example :class:`FormulaCheck` and :class:`InteractionCheck`. Every check covers its own elements.
+    output : str | Path | None
+        A CSV or Parquet file to which the unity checks of the rows are written chunk by chunk, with the columns element,
+        combination, a column per check and the governing unity_check of the row. Default is no file.
+    element_column : str
+        The column of the elements. Default is "element".
+    combination_column : str
+        The column of the load combinations. Default is "combination".
+    chunk_size : int
+        Maximum number of rows read at once. Default is 500000.
+    min_unity_check : float
+        Only rows with a governing unity check of at least this value are written to the output. Default is 0, all rows.
+    progress : Callable[[int, float], None] | None
+        Called after every chunk with the number of rows checked so far and the seconds elapsed.
+
+    Returns
+    -------
+    BulkUnityCheckReport
+        The governing unity check of every element and check, and the throughput.
+
+    Warns
+    -----
+    UserWarning
+        If the source has elements that no check covers, for example because they are named differently in the checks.
+    """
+    import numpy as np
+    import pandas as pd
+
+    columns = list(dict.fromkeys([element_column, combination_column, *(column for check in checks for column in check.columns)]))
+    writer = _ResultWriter(output) if output is not None else None
+    governing: pd.DataFrame | None = None
+    unchecked: set[Hashable] = set()
+    rows = 0
+    start = time.perf_counter()
+    try:
+        for chunk in read_chunks(source, columns=columns, chunk_size=chunk_size):
+            elements = chunk[element_column].to_numpy()
+            results = pd.DataFrame({"element": elements, "combination": chunk[combination_column].to_numpy()})
+            for check in checks:
+                results[check.name] = check.unity_checks(elements, chunk)
+            unchecked.update(pd.unique(elements[results[[check.name for check in checks]].isna().all(axis=1).to_numpy()]))
+
+            # the governing row of every element and check in this chunk, merged with those of the previous chunks
+            long = results.melt(id_vars=["element", "combination"], var_name="check", value_name="unity_check").dropna(subset=["unity_check"])
+            candidates = long.loc[long.groupby(["element", "check"], sort=False)["unity_check"].idxmax()]
+            if governing is not None:
+                candidates = pd.concat([governing, candidates], ignore_index=True)
+                candidates = candidates.loc[candidates.groupby(["element", "check"], sort=False)["unity_check"].idxmax()]
+            governing = candidates.reset_index(drop=True)
+
+            if writer is not None:
+                results["unity_check"] = results[[check.name for check in checks]].max(axis=1)
+                writer.write(results[results["unity_check"].to_numpy() >= min_unity_check] if min_unity_check > 0 else results)
+            rows += len(chunk)
+            if progress is not None:
+                progress(rows, time.perf_counter() - start)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if unchecked:
+        examples = ", ".join(repr(element) for element in sorted(unchecked, key=str)[:5])
+        warnings.warn(
+            f"{len(unchecked)} element(s) of the source are not covered by any check, for example {examples}. "
+            "Their rows are not checked; compare the elements of the source with those of the checks.",
+            stacklevel=2,
+        )
+    if governing is None:
+        governing = pd.DataFrame({"element": [], "combination": [], "check": [], "unity_check": np.array([], dtype=float)})
+    governing = governing[["element", "check", "combination", "unity_check"]].sort_values(["element", "check"], ignore_index=True)
+    return BulkUnityCheckReport(governing=governing, rows=rows, seconds=time.perf_counter() - start)
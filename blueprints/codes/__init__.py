@@ -1 +1,5 @@
 """Codes package."""
+
+from blueprints.codes.formula_registry import FormulaRegistry, formula_registry
+
+__all__ = ["FormulaRegistry", "formula_registry"]
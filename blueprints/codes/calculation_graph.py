@@ -0,0 +1,207 @@
+"""Module for the calculation graph, chaining formulas into a directed acyclic graph of named nodes."""
+
+import inspect
+from collections import ChainMap
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from blueprints.codes.formula import Formula
+
+
+@dataclass(frozen=True)
+class FormulaNode:
+    """Node of a calculation graph, wrapping a Formula class.
+
+    Parameters
+    ----------
+    formula: type[Formula]
+        The formula class evaluated by the node.
+    sources: Mapping[str, str]
+        The name of the node or input that feeds each parameter of the formula. Parameters of the formula that are not
+        wired explicitly are fed by the node or input with the same name as the parameter, or by the default value of the
+        parameter when the graph has no such node or input.
+    """
+
+    formula: type[Formula]
+    sources: Mapping[str, str]
+    defaults: Mapping[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Check the wiring against the parameters of the formula."""
+        parameters = inspect.signature(self.formula._evaluate).parameters  # noqa: SLF001
+        if unknown := set(self.sources) - set(parameters):
+            raise ValueError(f"{self.formula.__name__} has no parameter(s): {', '.join(sorted(unknown))}.")
+        sources = {parameter: self.sources.get(parameter, parameter) for parameter in parameters}
+        defaults = {name: parameter.default for name, parameter in parameters.items() if parameter.default is not inspect.Parameter.empty}
+        object.__setattr__(self, "sources", sources)
+        object.__setattr__(self, "defaults", defaults)
+
+    def arguments(self, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Collect the arguments of the formula from the values of the nodes and inputs of the graph.
+
+        Parameters
+        ----------
+        values: Mapping[str, Any]
+            The values of the nodes and inputs of the graph, by name.
+
+        Returns
+        -------
+        dict[str, Any]
+            The arguments of the formula, by parameter name.
+
+        Raises
+        ------
+        KeyError
+            If a parameter without a default value is not fed by any of the values.
+        """
+        arguments = {}
+        for parameter, source in self.sources.items():
+            if source in values:
+                arguments[parameter] = values[source]
+            elif parameter in self.defaults:
+                arguments[parameter] = self.defaults[parameter]
+            else:
+                raise KeyError(f"No input or formula node named {source!r} to feed parameter {parameter!r} of {self.formula.__name__}.")
+        return arguments
+
+
+class CalculationGraph:
+    """Directed acyclic graph of named formula nodes and inputs.
+
+    Every node is evaluated at most once, its result is reused by all downstream nodes. Changing an input (or replacing a node)
+    invalidates only the nodes downstream of it, so re-evaluating the graph recomputes only those nodes.
+
+    Examples
+    --------
+    >>> graph = CalculationGraph()
+    >>> graph.set_inputs(bond_quality="good", diameter=12, f_ctd=1.2, sigma_sd=435)
+    >>> graph.add_node("eta_1", SubForm8Dot2CoefficientQualityOfBond)
+    >>> graph.add_node("eta_2", SubForm8Dot2CoefficientBarDiameter)
+    >>> graph.add_node("f_bd", Form8Dot2UltimateBondStress)
+    >>> graph.add_node("l_b_rqd", Form8Dot3RequiredAnchorageLength)
+    >>> graph["l_b_rqd"]
+    483.33333333333337
+    >>> graph.set_inputs(sigma_sd=400)  # only l_b_rqd is recomputed
+    >>> graph["l_b_rqd"]
+    444.44444444444446
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty calculation graph."""
+        self._inputs: dict[str, Any] = {}
+        self._nodes: dict[str, FormulaNode] = {}
+        self._results: dict[str, Formula] = {}
+        self._dependents: dict[str, set[str]] = {}
+
+    @property
+    def inputs(self) -> dict[str, Any]:
+        """The inputs of the graph, by name."""
+        return dict(self._inputs)
+
+    @property
+    def nodes(self) -> dict[str, FormulaNode]:
+        """The formula nodes of the graph, by name."""
+        return dict(self._nodes)
+
+    def set_inputs(self, **values: Any) -> None:  # noqa: ANN401
+        """Add or change inputs of the graph and invalidate the nodes downstream of them.
+
+        Parameters
+        ----------
+        **values: Any
+            The values of the inputs, by name.
+
+        Raises
+        ------
+        ValueError
+            If the name of an input is already used by a formula node.
+        """
+        if clashes := self._nodes.keys() & values.keys():
+            raise ValueError(f"Name(s) already used by a formula node: {', '.join(sorted(clashes))}.")
+        self._inputs.update(values)
+        self._invalidate(values)
+
+    def add_node(self, name: str, formula: type[Formula], **sources: str) -> None:
+        """Add a formula node to the graph, or replace the node with the same name.
+
+        Parameters
+        ----------
+        name: str
+            The name of the node, used to wire it to downstream nodes.
+        formula: type[Formula]
+            The formula class evaluated by the node. Only parameters that can be passed by keyword are supported.
+        **sources: str
+            The name of the node or input that feeds a parameter of the formula, by parameter name. Parameters that are not given
+            here are fed by the node or input with the same name as the parameter.
+
+        Raises
+        ------
+        ValueError
+            If the name is already used by an input, or if a source is given for an unknown parameter.
+        """
+        if name in self._inputs:
+            raise ValueError(f"Name already used by an input: {name}.")
+        node = FormulaNode(formula=formula, sources=sources)
+        if name in self._nodes:
+            for source in self._nodes[name].sources.values():
+                self._dependents[source].discard(name)
+        for source in node.sources.values():
+            self._dependents.setdefault(source, set()).add(name)
+        self._nodes[name] = node
+        self._invalidate([name])
+
+    def evaluate(self, names: Iterable[str] | None = None) -> dict[str, Formula]:
+        """Evaluate the given nodes (all nodes by default), reusing the results that are still valid.
+
+        Parameters
+        ----------
+        names: Iterable[str] | None
+            The names of the nodes to evaluate. All nodes of the graph are evaluated if None.
+
+        Returns
+        -------
+        dict[str, Formula]
+            The results of the nodes, by name.
+        """
+        return {name: self[name] for name in (self._nodes if names is None else names)}
+
+    def __getitem__(self, name: str) -> Any:  # noqa: ANN401
+        """The value of an input or the (evaluated) result of a formula node.
+
+        Raises
+        ------
+        KeyError
+            If the graph has no input or node with the given name.
+        ValueError
+            If the node depends on itself.
+        """
+        if name in self._inputs:
+            return self._inputs[name]
+        if name not in self._nodes:
+            raise KeyError(f"No input or formula node named {name!r} in the calculation graph.")
+        if name not in self._results:
+            self._evaluate_node(name, path=())
+        return self._results[name]
+
+    def _evaluate_node(self, name: str, path: tuple[str, ...]) -> None:
+        """Evaluate a node after evaluating the (invalidated) nodes upstream of it."""
+        if name in path:
+            raise ValueError(f"Cycle in the calculation graph: {' -> '.join((*path, name))}.")
+        node = self._nodes[name]
+        for source in node.sources.values():
+            if source in self._nodes and source not in self._results:
+                self._evaluate_node(source, path=(*path, name))
+        self._results[name] = node.formula.trusted(**node.arguments(ChainMap(self._results, self._inputs)))
+
+    def _invalidate(self, names: Iterable[str]) -> None:
+        """Remove the results of the nodes downstream of the given nodes or inputs (and of the given nodes themselves)."""
+        stale = list(names)
+        seen = set(stale)
+        while stale:
+            name = stale.pop()
+            self._results.pop(name, None)
+            for downstream in self._dependents.get(name, ()):
+                if downstream not in seen:
+                    seen.add(downstream)
+                    stale.append(downstream)
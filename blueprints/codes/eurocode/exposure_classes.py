@@ -5,15 +5,25 @@ according to Table 4.1 from NEN-EN 1992-1-1: Chapter 4 - Durability and cover to
 import re
 from abc import abstractmethod
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import total_ordering
-from typing import Self, TypeVar
+from typing import TYPE_CHECKING, Self, TypeVar, get_type_hints
 
 from blueprints.utils.abc_enum_meta import ABCEnumMeta
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike
+
 T = TypeVar("T", bound="Exposure")
 
+"""The exposure classes of a combination of exposure classes, in the order of their bits in the code of the combination."""
+EXPOSURE_CLASS_FIELDS = ("carbonation", "chloride", "chloride_seawater", "freeze", "chemical")
+"""Number of bits of the severity of each exposure class in the code of a combination of exposure classes."""
+EXPOSURE_CLASS_BITS = 3
+_EXPOSURE_CLASS_MASK = (1 << EXPOSURE_CLASS_BITS) - 1
+
 
 @total_ordering
 class Exposure(Enum, metaclass=ABCEnumMeta):
@@ -21,8 +31,25 @@ class Exposure(Enum, metaclass=ABCEnumMeta):
 
     This class handles the ordering/comparison operations, that's why it is decorated with total_ordering (As recommended by PEP8).
     On top of that, it handles a couple of methods which will be used by its subclasses.
+    The severity of every exposure classification is determined once, when the enum member is created.
     """
 
+    _value_: str
+    severity: int
+    _exposure_hash: int
+
+    def __init__(self, value: str) -> None:
+        """Precompute the severity ordinal and the hash of the exposure classification.
+
+        Parameters
+        ----------
+        value : str
+            The value of the exposure classification, for example "XC2". The severity is the last digit of the value,
+            or 0 if the exposure classification is "Not applicable".
+        """
+        self.severity = int(value[-1]) if value != "Not applicable" else 0
+        self._exposure_hash = hash((type(self).__name__, self._name_))
+
     def __eq__(self, other: object) -> bool:
         """Definition of '==' operator for the comparison of the severity of the exposure classifications.
 
@@ -45,9 +72,17 @@ class Exposure(Enum, metaclass=ABCEnumMeta):
         """
         if not isinstance(other, self.__class__):
             raise TypeError("Only the same exposure class types can be compared with each other!")
-        _self_severity = int(self.value[-1]) if self.value != "Not applicable" else 0
-        _other_severity = int(other.value[-1]) if other.value != "Not applicable" else 0
-        return _self_severity == _other_severity
+        return self.severity == other.severity
+
+    def __hash__(self) -> int:
+        """Hash of the exposure classification, consistent with the '==' operator within an exposure class type.
+
+        Returns
+        -------
+        int
+            The hash of the type and name of the exposure classification.
+        """
+        return self._exposure_hash
 
     def __gt__(self, other: Self) -> bool:
         """Definition of '>' operator for the comparison of the severity of the exposure classifications.
@@ -70,11 +105,33 @@ class Exposure(Enum, metaclass=ABCEnumMeta):
             True if the first argument is more severe than the second argument.
         """
         if isinstance(other, self.__class__):
-            _self_severity = int(self.value[-1]) if self.value != "Not applicable" else 0
-            _other_severity = int(other.value[-1]) if other.value != "Not applicable" else 0
-            return _self_severity > _other_severity
+            return self.severity > other.severity
         raise TypeError("Only the same exposure class types can be compared with each other!")
 
+    @classmethod
+    def from_severity(cls: type[T], severity: int) -> T:
+        """Return the exposure classification with the given severity ordinal.
+
+        Parameters
+        ----------
+        severity : int
+            The severity ordinal of the exposure classification, 0 if not applicable.
+
+        Returns
+        -------
+        Exposure
+            the exposure classification
+
+        Raises
+        ------
+        ValueError
+            If there is no exposure classification with the given severity.
+        """
+        for member in cls:
+            if member.severity == severity:
+                return member
+        raise ValueError(f"No {cls.__name__} with severity {severity}.")
+
     @classmethod
     def options(cls: type[T]) -> list[str]:
         """Return all the possible options within a subclass.
@@ -149,6 +206,10 @@ class ExposureClassesBase:
     """Parent class which serves as a container for the Exposure classes.
 
     Exposure classes related to environmental conditions in accordance with EN 206-1
+
+    A combination of exposure classes is encoded in the integer :attr:`code`: the severity ordinals of the exposure classes
+    (see :data:`EXPOSURE_CLASS_FIELDS`) in consecutive fields of :data:`EXPOSURE_CLASS_BITS` bits. The code is used for
+    hashing and comparing combinations, and for vectorized operations on the exposure classes of many elements.
     """
 
     carbonation: CarbonationBase
@@ -156,6 +217,74 @@ class ExposureClassesBase:
     chloride_seawater: ChlorideSeawaterBase
     freeze: FreezeThawBase
     chemical: ChemicalBase
+    _code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the code of the combination of exposure classes."""
+        code = 0
+        for shift, exposure_class in enumerate(self):
+            code |= exposure_class.severity << (shift * EXPOSURE_CLASS_BITS)
+        object.__setattr__(self, "_code", code)
+
+    @property
+    def code(self) -> int:
+        """The integer code of the combination of exposure classes.
+
+        Returns
+        -------
+        int
+            The severity ordinals of the exposure classes, in consecutive fields of :data:`EXPOSURE_CLASS_BITS` bits.
+        """
+        return self._code
+
+    @classmethod
+    def from_code(cls, code: int) -> Self:
+        """Create an instance from the integer code of a combination of exposure classes.
+
+        Parameters
+        ----------
+        code : int
+            The code of the combination of exposure classes, see :attr:`code`.
+
+        Returns
+        -------
+        Self
+            instance created from the code
+        """
+        exposure_classes = get_type_hints(cls)
+        return cls(
+            **{
+                name: exposure_classes[name].from_severity((int(code) >> (shift * EXPOSURE_CLASS_BITS)) & _EXPOSURE_CLASS_MASK)
+                for shift, name in enumerate(EXPOSURE_CLASS_FIELDS)
+            }
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Two combinations of exposure classes of the same type are equal if their codes are equal.
+
+        Parameters
+        ----------
+        other : object
+            The object to compare with.
+
+        Returns
+        -------
+        bool
+            True if both combinations have the same exposure classes.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._code == other._code  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        """Hash of the combination of exposure classes, consistent with the '==' operator.
+
+        Returns
+        -------
+        int
+            The hash of the code of the combination of exposure classes.
+        """
+        return hash(self._code)
 
     @property
     def no_risk(self) -> bool:
@@ -168,7 +297,7 @@ class ExposureClassesBase:
         bool
             True if all exposure classes are 'Not applicable'
         """
-        return all(exposure_class.value == "Not applicable" for exposure_class in self.__dict__.values())
+        return self._code == 0
 
     def __str__(self) -> str:
         """String representation of the ExposureClasses object.
@@ -178,7 +307,7 @@ class ExposureClassesBase:
         str
             String representation of the ExposureClasses object
         """
-        return "X0" if self.no_risk else ", ".join(enum.value for enum in self.__dict__.values() if enum.value != "Not applicable")
+        return "X0" if self.no_risk else ", ".join(enum.value for enum in self if enum.value != "Not applicable")
 
     def __iter__(self) -> Iterator[Exposure]:
         """Iterator for the ExposureClasses object.
@@ -188,4 +317,56 @@ class ExposureClassesBase:
         Iterable[Exposure]
             Iterator for the ExposureClasses object
         """
-        return iter(self.__dict__.values())
+        return iter((self.carbonation, self.chloride, self.chloride_seawater, self.freeze, self.chemical))
+
+
+def exposure_severities(codes: "ArrayLike") -> "np.ndarray":
+    """Decode the severity ordinals of the exposure classes of many combinations of exposure classes at once.
+
+    Parameters
+    ----------
+    codes : ArrayLike
+        The codes of the combinations of exposure classes, see :attr:`ExposureClassesBase.code`.
+
+    Returns
+    -------
+    np.ndarray
+        The severity ordinals, with a last axis of the exposure classes in the order of :data:`EXPOSURE_CLASS_FIELDS`.
+    """
+    import numpy as np
+
+    shifts = np.arange(len(EXPOSURE_CLASS_FIELDS)) * EXPOSURE_CLASS_BITS
+    return (np.asarray(codes, dtype=np.int64)[..., np.newaxis] >> shifts) & _EXPOSURE_CLASS_MASK
+
+
+def most_severe_exposure(codes: "ArrayLike", axis: int | None = None) -> "np.ndarray":
+    """Combine the most severe exposure classes of many combinations of exposure classes.
+
+    For each type of exposure class (carbonation, chloride, ...), the most severe exposure class of the combinations is
+    taken, for example the exposure classes of the faces of an element or of all elements in a group.
+
+    Examples
+    --------
+    >>> codes = [Table4Dot1ExposureClasses.from_exposure_list(exposures).code for exposures in (["XC1", "XD2"], ["XC3"])]
+    >>> Table4Dot1ExposureClasses.from_code(most_severe_exposure(codes))
+    Table4Dot1ExposureClasses(carbonation=<Carbonation.XC3: 'XC3'>, chloride=<Chloride.XD2: 'XD2'>, ...)
+
+    Parameters
+    ----------
+    codes : ArrayLike
+        The codes of the combinations of exposure classes, see :attr:`ExposureClassesBase.code`.
+    axis : int | None
+        The axis along which the combinations are reduced. All combinations are reduced if None.
+
+    Returns
+    -------
+    np.ndarray
+        The codes of the most severe combinations of exposure classes.
+    """
+    import numpy as np
+
+    severities = exposure_severities(codes)
+    # the last axis of the severities holds the types of exposure classes, it is not reduced
+    most_severe = severities.reshape(-1, severities.shape[-1]).max(axis=0) if axis is None else severities.max(axis=axis if axis >= 0 else axis - 1)
+    shifts = np.arange(len(EXPOSURE_CLASS_FIELDS)) * EXPOSURE_CLASS_BITS
+    return (most_severe << shifts).sum(axis=-1)
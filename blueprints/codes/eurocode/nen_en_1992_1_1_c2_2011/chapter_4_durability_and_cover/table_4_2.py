@@ -42,7 +42,9 @@ class Table4Dot2MinimumCoverWithRegardToBond(Formula):
     ) -> MM:
         """For more detailed documentation see the class docstring."""
         raise_if_less_or_equal_to_zero(diameter=diameter)
-        if not isinstance(nominal_max_aggregate_size_greater_than_32_mm, bool):
+        # boolean arrays are accepted as well, for the batch evaluation of this table
+        is_boolean_array = getattr(getattr(nominal_max_aggregate_size_greater_than_32_mm, "dtype", None), "kind", None) == "b"
+        if not (isinstance(nominal_max_aggregate_size_greater_than_32_mm, bool) or is_boolean_array):
             raise TypeError("The parameter 'nominal_max_aggregate_size_greater_than_32_mm' must be a boolean.")
         return diameter + 5 * nominal_max_aggregate_size_greater_than_32_mm
 
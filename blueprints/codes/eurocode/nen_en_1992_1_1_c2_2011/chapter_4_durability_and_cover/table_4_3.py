@@ -2,8 +2,9 @@
 according to Table 4.3 from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement.
 """
 
-from collections.abc import Sequence
-from typing import Self
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Self
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
@@ -20,6 +21,21 @@ from blueprints.type_alias import YEARS
 DESIGN_WORKING_LIFE_DEFAULT = 50
 DESIGN_WORKING_LIFE_100 = 100
 
+"""Concrete grades that reduce the structural class, with the exposure classes for which they are decisive."""
+DECISIVE_EXPOSURE_CLASSES = {
+    ConcreteStrengthClass("C45/55"): frozenset({Chloride.XD3.value, ChlorideSeawater.XS2.value, ChlorideSeawater.XS3.value}),
+    ConcreteStrengthClass("C40/50"): frozenset({Carbonation.XC4.value, Chloride.XD1.value, Chloride.XD2.value, ChlorideSeawater.XS1.value}),
+    ConcreteStrengthClass("C35/45"): frozenset({Carbonation.XC2.value, Carbonation.XC3.value}),
+    ConcreteStrengthClass("C30/37"): frozenset({Carbonation.XC1.value}),
+}
+_F_CK = {concrete_grade: ConcreteMaterial(concrete_grade).f_ck for concrete_grade in DECISIVE_EXPOSURE_CLASSES}
+
+
+@lru_cache(maxsize=1024)
+def _exposure_classes_from_list(exposure_classes: tuple[str, ...]) -> Table4Dot1ExposureClasses:
+    """Parse a list of exposure classes once, the (immutable) result is shared by all elements with the same list."""
+    return Table4Dot1ExposureClasses.from_exposure_list(exposure_classes)
+
 
 class ConcreteStructuralClassCalculator(AbstractConcreteStructuralClassCalculator):
     """Implementation of the structural class calculator of the concrete element.
@@ -56,9 +72,21 @@ class ConcreteStructuralClassCalculator(AbstractConcreteStructuralClassCalculato
             True if the quality control of the concrete element is ensured, False otherwise
         """
         if not isinstance(exposure_classes, Table4Dot1ExposureClasses):
-            exposure_classes = Table4Dot1ExposureClasses.from_exposure_list(exposure_classes)
+            exposure_classes = _exposure_classes_from_list(tuple(exposure_classes))
         super().__init__(exposure_classes, design_working_life, concrete_material, plate_geometry, quality_control)
 
+    def cache_key(self) -> Hashable:
+        """Key of the inputs that determine the structural class: the code of the exposure classes, whether the design working
+        life is at least 100 years, the f_ck of the concrete, the plate geometry and the quality control.
+        """
+        return (
+            self.exposure_classes.code,
+            self.design_working_life >= DESIGN_WORKING_LIFE_100,
+            self.concrete_material.f_ck,
+            self.plate_geometry,
+            self.quality_control,
+        )
+
     def _structural_class_delta_design_working_life(self) -> None:
         """Calculates the addition to the structural class based on the design working life.
 
@@ -98,24 +126,19 @@ class ConcreteStructuralClassCalculator(AbstractConcreteStructuralClassCalculato
         In accordance with:
         NNEN-EN 1992-1-1+C2:2011 Concrete - General
         """
-        decisive_exposure_classes = {
-            ConcreteStrengthClass("C45/55"): {Chloride.XD3.value, ChlorideSeawater.XS2.value, ChlorideSeawater.XS3.value},
-            ConcreteStrengthClass("C40/50"): {Carbonation.XC4.value, Chloride.XD1.value, Chloride.XD2.value, ChlorideSeawater.XS1.value},
-            ConcreteStrengthClass("C35/45"): {Carbonation.XC2.value, Carbonation.XC3.value},
-            ConcreteStrengthClass("C30/37"): {Carbonation.XC1.value},
-        }
         exposure_classes = {exposure_class.value for exposure_class in self.exposure_classes}
+        f_ck = self.concrete_material.f_ck
 
-        for concrete_grade, decisive_exposure_class in decisive_exposure_classes.items():
-            if decisive_exposure_class.intersection(exposure_classes):
+        for concrete_grade, decisive_exposure_class in DECISIVE_EXPOSURE_CLASSES.items():
+            if not decisive_exposure_class.isdisjoint(exposure_classes):
                 return (
                     self.update_structural_class(0, "no reduction with respect to concrete grade")
-                    if self.concrete_material.f_ck < ConcreteMaterial(concrete_grade).f_ck
+                    if f_ck < _F_CK[concrete_grade]
                     else self.update_structural_class(-1, f"concrete grade >= {concrete_grade.value}")
                 )
         return (
             self.update_structural_class(0, "no reduction with respect to concrete grade")
-            if self.concrete_material.f_ck < ConcreteMaterial(ConcreteStrengthClass("C30/37")).f_ck
+            if f_ck < _F_CK[ConcreteStrengthClass("C30/37")]
             else self.update_structural_class(-1, "concrete grade >= C30/37")
         )
 
@@ -166,3 +189,31 @@ class Table4Dot3ConcreteStructuralClass(ConcreteStructuralClassBase):
         quality_control : bool
             True if the quality control of the concrete element is ensured, False otherwise
         """
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]], **shared: Any) -> list[Self]:  # noqa: ANN401
+        """Calculate the structural classes of many elements at once.
+
+        The calculation is done once per unique combination of inputs (see :meth:`ConcreteStructuralClassCalculator.cache_key`),
+        and the explanations are only built when they are requested.
+
+        Examples
+        --------
+        >>> records = [{"exposure_classes": ["XC3", "XD1"], "plate_geometry": True}, {"exposure_classes": ["XC1"], "plate_geometry": False}]
+        >>> material = ConcreteMaterial(ConcreteStrengthClass("C30/37"))
+        >>> Table4Dot3ConcreteStructuralClass.from_records(records, design_working_life=50, concrete_material=material, quality_control=False)
+        [3, 3]
+
+        Parameters
+        ----------
+        records: Iterable[Mapping[str, Any]]
+            The inputs of every element, see the parameters of :class:`Table4Dot3ConcreteStructuralClass`.
+        **shared: Any
+            Inputs that are the same for all elements, for example the design working life. Inputs in the records take precedence.
+
+        Returns
+        -------
+        list[Table4Dot3ConcreteStructuralClass]
+            The structural class of every element, in the order of the records.
+        """
+        return [cls(**(shared | dict(record))) for record in records]
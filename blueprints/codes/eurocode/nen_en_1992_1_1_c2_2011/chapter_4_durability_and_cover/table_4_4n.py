@@ -1,12 +1,143 @@
 """Table 4.4N from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
 
-from blueprints.codes.eurocode.exposure_classes import ExposureClassesBase
+from functools import cache
+from typing import TYPE_CHECKING
+
+from blueprints.codes.eurocode.exposure_classes import EXPOSURE_CLASS_FIELDS, ExposureClassesBase, exposure_severities
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
 from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBase
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import MM
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# The rows of the tables 4.4N and 4.5N, by the decisive exposure class(es) of the row
+EXPOSURE_CLASS_ROWS = ("X0", "XC1", "XC2/XC3", "XC4", "XD1/XS1", "XD2/XS2/XD3/XS3")
+# The row by the severity of the corrosion induced by carbonation (NA, XC1 - XC4) and by chlorides (NA, XD1/XS1 - XD3/XS3)
+_CARBONATION_ROWS = (0, 1, 2, 2, 3)
+_CHLORIDE_ROWS = (0, 4, 5, 5)
+
+# Minimum cover with regard to durability [mm] for reinforcement steel, by exposure class row and structural class (S1 - S6)
+MINIMUM_COVER_DURABILITY_REINFORCEMENT_STEEL = (
+    (10, 10, 10, 10, 15, 20),
+    (10, 10, 10, 15, 20, 25),
+    (10, 15, 20, 25, 30, 35),
+    (15, 20, 25, 30, 35, 40),
+    (20, 25, 30, 35, 40, 45),
+    (25, 30, 35, 40, 45, 50),
+)
+
+
+def exposure_class_row(exposure_classes: ExposureClassesBase) -> int:
+    """The row of the tables 4.4N and 4.5N for the given exposure classes, see :data:`EXPOSURE_CLASS_ROWS`.
+
+    The row is determined by the most severe of the corrosion induced by carbonation, by chlorides and by chlorides from sea water.
+
+    Parameters
+    ----------
+    exposure_classes: ExposureClassesBase
+        The exposure classes of the concrete.
+
+    Returns
+    -------
+    int
+        The index of the row in the tables 4.4N and 4.5N.
+    """
+    return max(
+        _CARBONATION_ROWS[exposure_classes.carbonation.severity],
+        _CHLORIDE_ROWS[exposure_classes.chloride.severity],
+        _CHLORIDE_ROWS[exposure_classes.chloride_seawater.severity],
+    )
+
+
+def exposure_class_rows(codes: "ArrayLike") -> "np.ndarray":
+    """The rows of the tables 4.4N and 4.5N for many combinations of exposure classes at once, see :func:`exposure_class_row`.
+
+    Parameters
+    ----------
+    codes: ArrayLike
+        The codes of the combinations of exposure classes, see :attr:`ExposureClassesBase.code`.
+
+    Returns
+    -------
+    np.ndarray
+        The indices of the rows in the tables 4.4N and 4.5N.
+    """
+    import numpy as np
+
+    severities = exposure_severities(codes)
+    carbonation, chloride, chloride_seawater = (
+        severities[..., EXPOSURE_CLASS_FIELDS.index(name)] for name in ("carbonation", "chloride", "chloride_seawater")
+    )
+    chloride_rows = np.array(_CHLORIDE_ROWS)
+    return np.maximum.reduce([np.array(_CARBONATION_ROWS)[carbonation], chloride_rows[chloride], chloride_rows[chloride_seawater]])
+
+
+def validate_structural_class(structural_class: int) -> None:
+    """Check that the structural class is an integer between 1 and 6 (S1 - S6).
+
+    Raises
+    ------
+    TypeError
+        If the structural class is not (a subclass of) an integer.
+    ValueError
+        If the structural class is not between 1 and 6.
+    """
+    if not isinstance(structural_class, int):
+        raise TypeError(f"Structural class must be (a subclass of) an integer, not {type(structural_class)}.")
+    if structural_class < 1 or structural_class > 6:
+        raise ValueError("Structural class must be between 1 and 6.")
+
+
+@cache
+def _as_array(table: tuple[tuple[int, ...], ...]) -> "np.ndarray":
+    """The table as (read-only) NumPy array, created once per table."""
+    import numpy as np
+
+    array = np.array(table, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+def lookup_minimum_cover(table: tuple[tuple[int, ...], ...], exposure_class_rows: "ArrayLike", structural_classes: "ArrayLike") -> "np.ndarray":
+    """Look up the minimum covers of many elements at once in table 4.4N or 4.5N.
+
+    Parameters
+    ----------
+    table: tuple[tuple[int, ...], ...]
+        The minimum covers [:math:`mm`], by exposure class row and structural class.
+    exposure_class_rows: ArrayLike
+        The exposure class rows of the elements, see :func:`exposure_class_row`.
+    structural_classes: ArrayLike
+        The structural classes of the elements (1 - 6).
+
+    Returns
+    -------
+    np.ndarray
+        The minimum covers [:math:`mm`], with the broadcast shape of the given rows and structural classes.
+
+    Raises
+    ------
+    TypeError
+        If the exposure class rows or the structural classes are not integers.
+    ValueError
+        If an exposure class row or structural class is out of range.
+    """
+    import numpy as np
+
+    array = _as_array(table)
+    rows, classes = np.broadcast_arrays(np.asarray(exposure_class_rows), np.asarray(structural_classes))
+    if not (np.issubdtype(rows.dtype, np.integer) and np.issubdtype(classes.dtype, np.integer)):
+        raise TypeError(f"Exposure class rows and structural classes must be integers, not {rows.dtype} and {classes.dtype}.")
+    if rows.size and (rows.min() < 0 or rows.max() >= array.shape[0]):
+        raise ValueError(f"Exposure class rows must be between 0 and {array.shape[0] - 1}.")
+    if classes.size and (classes.min() < 1 or classes.max() > array.shape[1]):
+        raise ValueError(f"Structural class must be between 1 and {array.shape[1]}.")
+    return array[rows, classes - 1]
+
 
 class Table4Dot4nMinimumCoverDurabilityReinforcementSteel(Formula):
     """Class representing the table 4.4N
@@ -43,29 +174,31 @@ class Table4Dot4nMinimumCoverDurabilityReinforcementSteel(Formula):
         structural_class: ConcreteStructuralClassBase,
     ) -> MM:
         """For more detailed documentation see the class docstring."""
-        if not isinstance(structural_class, int):
-            raise TypeError(f"Structural class must be (a subclass of) an integer, not {type(structural_class)}.")
-
-        if structural_class < 1 or structural_class > 6:
-            raise ValueError("Structural class must be between 1 and 6.")
-
-        if exposure_classes.chloride.value in [
-            "XD3",
-            "XD2",
-        ] or exposure_classes.chloride_seawater.value in ["XS2", "XS3"]:
-            calculated_cover = 20 + structural_class * 5
-        elif exposure_classes.chloride.value == "XD1" or exposure_classes.chloride_seawater.value == "XS1":
-            calculated_cover = 15 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC4":
-            calculated_cover = 10 + structural_class * 5
-        elif exposure_classes.carbonation.value in ["XC2", "XC3"]:
-            calculated_cover = 5 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC1":
-            calculated_cover = max(10, ((structural_class - 1) * 5))
-        else:
-            calculated_cover = max(10, ((structural_class - 2) * 5))
-
-        return calculated_cover
+        validate_structural_class(structural_class)
+        return MINIMUM_COVER_DURABILITY_REINFORCEMENT_STEEL[exposure_class_row(exposure_classes)][structural_class - 1]
+
+    @classmethod
+    def lookup(cls, exposure_class_rows: "ArrayLike", structural_classes: "ArrayLike") -> "np.ndarray":
+        """Look up the minimum cover with regard to durability [:math:`mm`] of many elements at once, by array indexing.
+
+        Examples
+        --------
+        >>> rows = exposure_class_rows([exposure_classes.code for exposure_classes in elements])
+        >>> Table4Dot4nMinimumCoverDurabilityReinforcementSteel.lookup(rows, structural_classes=4)
+
+        Parameters
+        ----------
+        exposure_class_rows: ArrayLike
+            The rows of table 4.4N of the elements, see :func:`exposure_class_row` and :func:`exposure_class_rows`.
+        structural_classes: ArrayLike
+            The structural classes of the elements (1 - 6).
+
+        Returns
+        -------
+        np.ndarray
+            The minimum covers with regard to durability [:math:`mm`].
+        """
+        return lookup_minimum_cover(MINIMUM_COVER_DURABILITY_REINFORCEMENT_STEEL, exposure_class_rows, structural_classes)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for table 4.4N."""
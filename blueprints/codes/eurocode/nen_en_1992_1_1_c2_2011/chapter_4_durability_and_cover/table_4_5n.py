@@ -1,12 +1,33 @@
 """Table 4.5N from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement."""
 
+from typing import TYPE_CHECKING
+
 from blueprints.codes.eurocode.exposure_classes import ExposureClassesBase
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011 import NEN_EN_1992_1_1_C2_2011
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    exposure_class_row,
+    lookup_minimum_cover,
+    validate_structural_class,
+)
 from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBase
 from blueprints.codes.formula import Formula
 from blueprints.codes.latex_formula import LatexFormula
 from blueprints.type_alias import MM
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# Minimum cover with regard to durability [mm] for prestressing steel, by exposure class row (see table 4.4N) and structural class (S1 - S6)
+MINIMUM_COVER_DURABILITY_PRESTRESSING_STEEL = (
+    (10, 10, 10, 10, 15, 20),
+    (15, 15, 15, 20, 25, 30),
+    (15, 20, 25, 30, 35, 40),
+    (20, 25, 30, 35, 40, 45),
+    (25, 30, 35, 40, 45, 50),
+    (30, 35, 40, 45, 50, 55),
+)
+
 
 class Table4Dot5nMinimumCoverDurabilityPrestressingSteel(Formula):
     """Class representing the table 4.5N
@@ -43,26 +64,26 @@ class Table4Dot5nMinimumCoverDurabilityPrestressingSteel(Formula):
         structural_class: ConcreteStructuralClassBase,
     ) -> MM:
         """For more detailed documentation see the class docstring."""
-        if not isinstance(structural_class, int):
-            raise TypeError(f"Structural class must be (a subclass of) an integer, not {type(structural_class)}.")
+        validate_structural_class(structural_class)
+        return MINIMUM_COVER_DURABILITY_PRESTRESSING_STEEL[exposure_class_row(exposure_classes)][structural_class - 1]
 
-        if exposure_classes.chloride.value in [
-            "XD3",
-            "XD2",
-        ] or exposure_classes.chloride_seawater.value in ["XS2", "XS3"]:
-            calculated_cover = 25 + structural_class * 5
-        elif exposure_classes.chloride.value == "XD1" or exposure_classes.chloride_seawater.value == "XS1":
-            calculated_cover = 20 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC4":
-            calculated_cover = 15 + structural_class * 5
-        elif exposure_classes.carbonation.value in ["XC2", "XC3"]:
-            calculated_cover = 10 + structural_class * 5
-        elif exposure_classes.carbonation.value == "XC1":
-            calculated_cover = max(15, (structural_class * 5))
-        else:
-            calculated_cover = max(10, ((structural_class - 2) * 5))
+    @classmethod
+    def lookup(cls, exposure_class_rows: "ArrayLike", structural_classes: "ArrayLike") -> "np.ndarray":
+        """Look up the minimum cover with regard to durability [:math:`mm`] of many elements at once, by array indexing.
 
-        return calculated_cover
+        Parameters
+        ----------
+        exposure_class_rows: ArrayLike
+            The rows of table 4.5N of the elements, see :func:`exposure_class_row` and :func:`exposure_class_rows`.
+        structural_classes: ArrayLike
+            The structural classes of the elements (1 - 6).
+
+        Returns
+        -------
+        np.ndarray
+            The minimum covers with regard to durability [:math:`mm`].
+        """
+        return lookup_minimum_cover(MINIMUM_COVER_DURABILITY_PRESTRESSING_STEEL, exposure_class_rows, structural_classes)
 
     def latex(self) -> LatexFormula:
         """Returns LatexFormula object for table 4.5N."""
@@ -3,12 +3,42 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable
 from typing import Any, Self
 
 from blueprints.codes.eurocode.exposure_classes import ExposureClassesBase as ExposureClasses
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.type_alias import YEARS
 
+"""Maximum number of memoized structural class calculations, see :meth:`AbstractConcreteStructuralClassCalculator.cache_key`."""
+STRUCTURAL_CLASS_CACHE_SIZE = 4096
+
+_ATTRIBUTES_AFFECTING_CALCULATION = frozenset({"exposure_classes", "design_working_life", "concrete_material", "plate_geometry", "quality_control"})
+_structural_class_cache: dict[tuple[type, Hashable], tuple[int, tuple[tuple[int, str], ...]]] = {}
+
+
+def format_explanation(default_explanation: str, updates: Iterable[tuple[int, str]]) -> str:
+    """Build the explanation of a structural class from the updates of the structural class.
+
+    Parameters
+    ----------
+    default_explanation: str
+        The explanation of the default structural class, for example "Default structural class (S4)".
+    updates: Iterable[tuple[int, str]]
+        The delta and the explanation of every update of the structural class.
+
+    Returns
+    -------
+    str
+        The explanation of the structural class, for example "Default structural class (S4) + 2 classes (100 years)".
+    """
+    explanation = default_explanation
+    for delta, reason in updates:
+        unit_suffix = "classes" if abs(delta) > 1 else "class"
+        operator_symbol = "+" if delta >= 0 else "-"
+        explanation = f"{explanation} {operator_symbol} {abs(delta)} {unit_suffix} ({reason})"
+    return explanation
+
 
 class ConcreteStructuralClassBase(int):
     """Base class for the Structural class of the concrete element.
@@ -19,6 +49,9 @@ class ConcreteStructuralClassBase(int):
     NEN-EN 1992-1-1 Concrete - General
     """
 
+    _explanation: str
+    _explanation_parts: tuple[str, tuple[tuple[int, str], ...]]
+
     def __new__(
         cls,
         concrete_structural_class_calculator: type[AbstractConcreteStructuralClassCalculator],
@@ -52,7 +85,8 @@ class ConcreteStructuralClassBase(int):
         calculator_instance.calculate_structural_class()
         structural_class = calculator_instance.structural_class
         new_instance = super().__new__(cls, structural_class)
-        new_instance.explanation = calculator_instance.explanation
+        # the explanation is only built when it is requested
+        new_instance._explanation_parts = (calculator_instance.DEFAULT_EXPLANATION, tuple(calculator_instance.updates))  # noqa: SLF001
         return new_instance
 
     @property
@@ -64,6 +98,8 @@ class ConcreteStructuralClassBase(int):
         str
             The explanation of the structural class
         """
+        if not hasattr(self, "_explanation"):
+            self._explanation = format_explanation(*self._explanation_parts)
         return self._explanation
 
     @explanation.setter
@@ -80,7 +116,7 @@ class ConcreteStructuralClassBase(int):
         AttributeError
             If the explanation is already set
         """
-        if not hasattr(self, "_explanation"):
+        if not hasattr(self, "_explanation") and not hasattr(self, "_explanation_parts"):
             self._explanation = explanation
         else:
             raise AttributeError(f"Attribute 'explanation' of {self.__class__} object is read-only and cannot be modified after initialization.")
@@ -143,7 +179,7 @@ class AbstractConcreteStructuralClassCalculator(ABC):
         self.quality_control = quality_control
         self._calculated = False
         self._structural_class = self.DEFAULT_STRUCTURAL_CLASS
-        self._explanation = self.DEFAULT_EXPLANATION
+        self._updates: list[tuple[int, str]] = []
 
     def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
         """Setter for the attributes of the class.
@@ -157,8 +193,8 @@ class AbstractConcreteStructuralClassCalculator(ABC):
         value: Any
             The value of the attribute
         """
-        attributes_affecting_calculation = {"exposure_classes", "design_working_life", "concrete_material", "plate_geometry", "quality_control"}
-        if name in attributes_affecting_calculation and getattr(self, name, None) != value:
+        # only a calculated structural class can become outdated, so the (costly) comparison is skipped before the calculation
+        if name in _ATTRIBUTES_AFFECTING_CALCULATION and self.__dict__.get("_calculated") and getattr(self, name, None) != value:
             self._calculated = False
         super().__setattr__(name, value)
 
@@ -197,6 +233,37 @@ class AbstractConcreteStructuralClassCalculator(ABC):
             raise ValueError("The structural class has not been calculated yet.")
         return self._explanation
 
+    @property
+    def _explanation(self) -> str:
+        """The explanation of the structural class, built from the updates of the structural class."""
+        return format_explanation(self.DEFAULT_EXPLANATION, self._updates)
+
+    @property
+    def updates(self) -> list[tuple[int, str]]:
+        """Property which returns the delta and the explanation of every update of the structural class.
+
+        Returns
+        -------
+        list[tuple[int, str]]
+            the updates of the structural class
+        """
+        if not self._calculated:
+            raise ValueError("The structural class has not been calculated yet.")
+        return list(self._updates)
+
+    def cache_key(self) -> Hashable | None:
+        """Key of the inputs that determine the structural class, used to memoize the calculation.
+
+        Calculators with the same type and cache key share the result of their calculation. Implementations can return
+        None (the default) to disable the memoization.
+
+        Returns
+        -------
+        Hashable | None
+            the cache key of the calculation
+        """
+        return None
+
     def update_structural_class(self, delta: int, explanation: str) -> None:
         """Method to update the structural class with the given delta and explanation.
 
@@ -214,21 +281,33 @@ class AbstractConcreteStructuralClassCalculator(ABC):
         """
         if not isinstance(delta, int):
             raise TypeError(f"unsupported delta type(s) for the update operation: '{type(delta)}'")
-        unit_suffix = "classes" if abs(delta) > 1 else "class"
-        operator_symbol = "+" if delta >= 0 else "-"
         self._structural_class += delta
-        self._explanation = f"{self._explanation} {operator_symbol} {abs(delta)} {unit_suffix} ({explanation})"
+        self._updates.append((delta, explanation))
 
     def calculate_structural_class(
         self,
     ) -> None:
-        """Method to execute the calculation of the structural class."""
-        if not self._calculated:
+        """Method to execute the calculation of the structural class.
+
+        The result is memoized per type of calculator and :meth:`cache_key`, so calculators with the same inputs share it.
+        """
+        if self._calculated:
+            return
+        key = self.cache_key()
+        cached = None if key is None else _structural_class_cache.get((type(self), key))
+        if cached is not None:
+            self._structural_class, updates = cached
+            self._updates = list(updates)
+        else:
+            self._structural_class = self.DEFAULT_STRUCTURAL_CLASS
+            self._updates = []
             self._structural_class_delta_design_working_life()
             self._structural_class_delta_concrete_grade()
             self._structural_class_delta_plate_geometry()
             self._structural_class_delta_quality_control()
-            self._calculated = True
+            if key is not None and len(_structural_class_cache) < STRUCTURAL_CLASS_CACHE_SIZE:
+                _structural_class_cache[type(self), key] = (self._structural_class, tuple(self._updates))
+        self._calculated = True
 
     @abstractmethod
     def _structural_class_delta_design_working_life(self) -> None:
@@ -1,22 +1,47 @@
 """Module for the abstract base class Formula."""
 
-from abc import ABC, abstractmethod
+import inspect
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Self
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.typing import ArrayLike
 
-class Formula(float, ABC):
+_UNSET = object()
+
+
+class FormulaMeta(ABCMeta):
+    """Custom metaclass for Formula.
+
+    Derives compact ``__slots__`` from the parameters of ``_evaluate``, so formula instances do not carry a ``__dict__``.
+    Classes that declare ``__slots__`` themselves are left untouched. The default values of the parameters are stored
+    in ``_evaluate_defaults`` for the fast construction path of ``Formula.trusted``.
+    """
+
+    def __new__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs) -> "FormulaMeta":
+        """Create a new formula class with slots for the parameters of ``_evaluate``."""
+        evaluate = namespace.get("_evaluate")
+        if evaluate is not None:
+            parameters = inspect.signature(evaluate.__func__ if isinstance(evaluate, staticmethod) else evaluate).parameters
+            namespace["_evaluate_defaults"] = {name: p.default for name, p in parameters.items() if p.default is not inspect.Parameter.empty}
+            if "__slots__" not in namespace:
+                slotted = {slot for base in bases for klass in base.__mro__ for slot in getattr(klass, "__slots__", ())}
+                namespace["__slots__"] = tuple(name for name in parameters if name not in slotted)
+        return super().__new__(cls, name, bases, namespace, **kwargs)
+
+
+class Formula(float, ABC, metaclass=FormulaMeta):
     """Abstract base class for formulas used in the codes."""
 
+    __slots__ = ()
+    _evaluate_defaults: dict[str, Any]
+
     def __new__(cls, *args, **kwargs) -> "Formula":
         """Method for creating a new instance of the class."""
         result = cls._evaluate(*args, **kwargs)
-        instance = float.__new__(cls, result)
-        instance._initialized = False  # noqa: SLF001
-        return instance
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Method for initializing a new instance of the class."""
-        super().__init__(*args, **kwargs)
-        self._initialized = True
+        return float.__new__(cls, result)
 
     def __setattr__(self, name: str, value: str | float) -> None:
         """Override the __setattr__ method to prevent modifications after initialization.
@@ -28,10 +53,96 @@ class Formula(float, ABC):
         value : str | float
             The value to be assigned to the attribute.
         """
-        if getattr(self, "_initialized", False) and name in self.__dict__:
+        if getattr(self, name, _UNSET) is not _UNSET:
             raise AttributeError(f"Attribute '{name}' of '{type(self).__name__}' object is read-only and cannot be modified after initialization.")
         super().__setattr__(name, value)
 
+    @classmethod
+    def trusted(cls, **kwargs) -> Self:
+        """Create an instance from keyword arguments that are known to be complete and valid for ``_evaluate``.
+
+        This fast construction path evaluates the formula once and fills the attributes directly, skipping ``__init__`` and the
+        read-only guard of ``__setattr__``. It is meant for generated or batch code that builds large numbers of formula objects.
+        Parameters with a default value in ``_evaluate`` may be omitted.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            The parameters of ``_evaluate``, passed by name.
+
+        Returns
+        -------
+        Self
+            The formula instance, equal to ``cls(**kwargs)``.
+
+        Examples
+        --------
+        >>> from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+        ...     Form8Dot3RequiredAnchorageLength,
+        ... )
+        >>> Form8Dot3RequiredAnchorageLength.trusted(diameter=12, sigma_sd=435, f_bd=2.7)
+        483.3333333333333
+        """
+        arguments = cls._evaluate_defaults | kwargs
+        instance = float.__new__(cls, cls._evaluate(**arguments))
+        for name, value in arguments.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+    @classmethod
+    def batch(cls, data: "Mapping[str, ArrayLike] | None" = None, /, **kwargs: "ArrayLike") -> "np.ndarray":
+        """Evaluate the formula for many sets of input values at once.
+
+        The inputs are broadcast against each other following the NumPy broadcasting rules and passed as arrays to the
+        :meth:`_evaluate` method of the formula. Formulas of which the logic cannot handle arrays (for example because
+        of scalar-only branching) are evaluated element by element instead, which gives the same result as the regular
+        (scalar) construction of the formula.
+
+        Examples
+        --------
+        >>> Form8Dot3RequiredAnchorageLength.batch(diameter=np.array([12, 16, 20]), sigma_sd=435, f_bd=2.7)
+        array([483.33333333, 644.44444444, 805.55555556])
+        >>> Form8Dot3RequiredAnchorageLength.batch(dataframe)  # columns named after the parameters of the formula
+
+        Parameters
+        ----------
+        data : Mapping[str, ArrayLike] | None
+            Mapping or DataFrame of which the keys/columns named after the parameters of the formula are used as input.
+            Other keys/columns are ignored.
+        **kwargs : ArrayLike
+            Input values for the parameters of the formula, these take precedence over the values given in data.
+            Parameters with a default value in the formula can be omitted.
+
+        Returns
+        -------
+        np.ndarray
+            The results of the formula, with the broadcast shape of the given inputs.
+        """
+        # numpy is imported here, so that importing a formula does not import numpy when only scalars are evaluated
+        import numpy as np
+
+        signature = inspect.signature(cls._evaluate)
+        columns = {name: data[name] for name in signature.parameters if name in data} if data is not None else {}
+        bound_arguments = signature.bind(**(columns | kwargs))
+        bound_arguments.apply_defaults()
+
+        names = list(bound_arguments.arguments)
+        arrays = np.broadcast_arrays(*(np.asarray(value) for value in bound_arguments.arguments.values()))
+        shape = arrays[0].shape if arrays else ()
+
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                result = np.asarray(cls._evaluate(**dict(zip(names, arrays))), dtype=float)
+            if result.shape == shape:
+                return result
+        except (ValueError, TypeError, AttributeError, FloatingPointError):
+            pass
+
+        # fall back to the scalar evaluation of each set of input values, as the logic of the formula does not support arrays
+        rows = zip(*(array.ravel().tolist() for array in arrays))
+        results = (cls._evaluate(**dict(zip(names, row))) for row in rows)
+        return np.fromiter(results, dtype=float, count=int(np.prod(shape))).reshape(shape)
+
     @property
     @abstractmethod
     def label(self) -> str:
@@ -0,0 +1,767 @@
+"""Index of the formulas in Blueprints: the module, source document and label of every formula, by class name.
+
+This module is generated by :func:`blueprints.codes.formula_registry.write_formula_index`, do not edit it by hand.
+"""
+
+FORMULA_INDEX: dict[str, tuple[str, str, str]] = {
+    "Form1Dot0Dot1EquivalentPilePointCenterline": (
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_1_general_rules.formula_1_0_1",
+        "NEN 9997-1-C2:2017",
+        "1.0.1",
+    ),
+    "Form2Dot1aDesignValueLoad": (
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_a",
+        "NEN 9997-1-C2:2017",
+        "2.1a",
+    ),
+    "Form2Dot1bRepresentativeValue": (
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_1_b",
+        "NEN 9997-1-C2:2017",
+        "2.1b",
+    ),
+    "Form2Dot2DesignValueGeotechnicalParameter": (
+        "blueprints.codes.eurocode.nen_9997_1_c2_2017.chapter_2_basic_of_geotechnical_design.formula_2_2",
+        "NEN 9997-1-C2:2017",
+        "2.2",
+    ),
+    "Form3Dot1EstimationConcreteCompressiveStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.1",
+    ),
+    "Form3Dot10CoefficientAgeConcreteDryingShrinkage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.10",
+    ),
+    "SubForm3Dot10FictionalCrossSection": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.10",
+    ),
+    "Form3Dot11AutogeneShrinkage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.11",
+    ),
+    "Form3Dot12AutogeneShrinkageInfinity": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.12",
+    ),
+    "Form3Dot13CoefficientTimeAutogeneShrinkage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.13",
+    ),
+    "Form3Dot14StressStrainForShortTermLoading": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+    ),
+    "SubForm3Dot14Eta": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+    ),
+    "SubForm3Dot14K": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.14",
+    ),
+    "Form3Dot15DesignValueCompressiveStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_15",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.15",
+    ),
+    "Form3Dot16DesignValueTensileStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.16",
+    ),
+    "Form3Dot17CompressiveStressConcrete": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_17",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.17",
+    ),
+    "Form3Dot18CompressiveStressConcrete": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_18",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.18",
+    ),
+    "Form3Dot19And20EffectivePressureZoneHeight": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_19_20",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.19 - 3.20",
+    ),
+    "Form3Dot2CoefficientDependentOfConcreteAge": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.2",
+    ),
+    "SubForm3Dot2CoefficientTypeOfCementS": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.2",
+    ),
+    "Form3Dot21And22EffectiveStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_21_22",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.21 - 3.22",
+    ),
+    "Form3Dot23FlexuralTensileStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_23",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.23",
+    ),
+    "Form3Dot24And25IncreasedCharacteristicCompressiveStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_24_25",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.24 - 3.25",
+    ),
+    "Form3Dot26IncreasedStrainAtMaxStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_26",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.26",
+    ),
+    "Form3Dot27IncreasedStrainLimitValue": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_27",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.27",
+    ),
+    "Form3Dot28RatioLossOfPreStressClass1": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_28",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.28",
+    ),
+    "Form3Dot29RatioLossOfPreStressClass2": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_29",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.29",
+    ),
+    "Form3Dot3AxialTensileStrengthFromTensileSplittingStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_3",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.3",
+    ),
+    "Form3Dot30RatioLossOfPreStressClass3": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_30",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.30",
+    ),
+    "Form3Dot4DevelopmentTensileStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.4",
+    ),
+    "SubForm3Dot4CoefficientAgeConcreteAlpha": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_4",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.4",
+    ),
+    "Form3Dot5ApproximationVarianceElasticModulusOverTime": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_5",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.5",
+    ),
+    "Form3Dot6CreepDeformationOfConcrete": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_6",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.6",
+    ),
+    "Form3Dot7NonLinearCreepCoefficient": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_7",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.7",
+    ),
+    "Form3Dot8TotalShrinkage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.8",
+    ),
+    "Form3Dot9DryingShrinkage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.9",
+    ),
+    "SubForm3Dot282930Mu": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.sub_formula_3_28_29_30",
+        "NEN-EN 1992-1-1+C2:2011",
+        "3.28 - 3.29 - 3.30",
+    ),
+    "Form4Dot1NominalConcreteCover": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.1",
+    ),
+    "Form4Dot2MinimumConcreteCover": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.formula_4_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.2",
+    ),
+    "Table4Dot2MinimumCoverWithRegardToBond": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.2",
+    ),
+    "Table4Dot4nMinimumCoverDurabilityReinforcementSteel": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.4N",
+    ),
+    "Table4Dot5nMinimumCoverDurabilityPrestressingSteel": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_5n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "4.5N",
+    ),
+    "Form5Dot1Imperfections": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+    ),
+    "SubForm5Dot1ReductionFactorLengthOrHeight": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+    ),
+    "SubForm5Dot1ReductionFactorNumberOfMembers": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.1",
+    ),
+    "Form5Dot11nShearSlendernessCorrectionFactor": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_11n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.11N",
+    ),
+    "Form5Dot12nRatioDistancePointZeroAndMaxMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_12n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.12N",
+    ),
+    "Form5Dot14SlendernessRatio": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.14",
+    ),
+    "Form5Dot15EffectiveLengthBraced": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_15",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.15",
+    ),
+    "Form5Dot16EffectiveLengthUnbraced": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.16",
+    ),
+    "Form5Dot17EffectiveLengthBucklingLoad": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_17",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.17",
+    ),
+    "Form5Dot19EffectiveCreepCoefficient": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_19",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.19",
+    ),
+    "Form5Dot2Eccentricity": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.2",
+    ),
+    "Form5Dot20DesignModulusElasticity": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_20",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.20",
+    ),
+    "Form5Dot21NominalStiffness": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_21",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.21",
+    ),
+    "Form5Dot22FactorKs": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_22",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.22",
+    ),
+    "Form5Dot22FactorKc": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_22",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.22",
+    ),
+    "Form5Dot23FactorConcreteStrengthClass": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_23",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.23",
+    ),
+    "Form5Dot24AxialForceCorrectionFactor": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_24",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.24",
+    ),
+    "Form5Dot25AxialForceCorrectionFactor": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_25",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.25",
+    ),
+    "Form5Dot26FactorKs": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_26",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.26",
+    ),
+    "Form5Dot26FactorKc": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_26",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.26",
+    ),
+    "Form5Dot27EffectiveDesignModulusElasticity": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_27",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.27",
+    ),
+    "Form5Dot28TotalDesignMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_28",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.28",
+    ),
+    "Form5Dot29BetaFactor": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_29",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.29",
+    ),
+    "Form5Dot30TotalDesignMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_30",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.30",
+    ),
+    "Form5Dot31DesignMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_31",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.31",
+    ),
+    "Form5Dot32EquivalentFirstOrderEndMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_32",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.32",
+    ),
+    "Form5Dot33NominalSecondOrderMoment": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_33",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.33",
+    ),
+    "Form5Dot34Curvature": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_34",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.34",
+    ),
+    "Form5Dot35EffectiveDepth": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_35",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.35",
+    ),
+    "Form5Dot36RelativeAxialForce": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_36",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.36",
+    ),
+    "Form5Dot37CreepFactor": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_37",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.37",
+    ),
+    "Form5Dot38aCheckRelativeSlendernessRatio": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_38a",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.38a",
+    ),
+    "Form5Dot38bCheckRelativeEccentricityRatio": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_38b",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.38b",
+    ),
+    "Form5Dot39SimplifiedCriterionBiaxialBending": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_39",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.39",
+    ),
+    "Form5Dot3aTransverseForceUnbracedMembers": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3a",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.3a",
+    ),
+    "Form5Dot3bTransverseForceBracedMembers": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_3b",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.3b",
+    ),
+    "Form5Dot4TransverseForceEffectBracingSystem": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_4",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.4",
+    ),
+    "Form5Dot40aCheckLateralInstability": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_40a",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.40a",
+    ),
+    "Form5Dot40bCheckLateralInstability": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_40b",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.40b",
+    ),
+    "Form5Dot5TransverseForceEffectFloorDiaphragm": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_5",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.5",
+    ),
+    "Form5Dot6TransverseForceEffectRoofDiaphragm": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_6",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.6",
+    ),
+    "Form5Dot7EffectiveFlangeWidth": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7",
+    ),
+    "Form5Dot7abFlangeEffectiveFlangeWidth": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_7ab",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.7a, 5.7b",
+    ),
+    "Form5Dot8EffectiveSpan": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_8",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.8",
+    ),
+    "Form5Dot9DesignSupportMomentReduction": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_9",
+        "NEN-EN 1992-1-1+C2:2011",
+        "5.9",
+    ),
+    "Form6Dot1DesignShearStrength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.1",
+    ),
+    "Form6Dot71CriteriaBasedOnStressRangeLHS": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71",
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.71 (LHS)",
+    ),
+    "Form6Dot71CriteriaBasedOnStressRangeRHS": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_71",
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.71 (RHS)",
+    ),
+    "Form6Dot76DesignFatigueStrengthConcrete": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_6_ultimate_limit_state.formula_6_76",
+        "NEN-EN 1992-1-1+C2:2011",
+        "6.76",
+    ),
+    "Form7Dot3CoefficientKc": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_7_serviceability_limit_state.formula_7_3",
+        "NEN-EN 1992-1-1+C2:2011",
+        "7.3",
+    ),
+    "Form8Dot1RequiredMinimumMandrelDiameter": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_1",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.1",
+    ),
+    "Form8Dot10DesignLapLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.10",
+    ),
+    "SubForm8Dot10Alpha6": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_10",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8",
+    ),
+    "Form8Dot11MinimumDesignLapLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_11",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.11",
+    ),
+    "Form8Dot12AdditionalShearReinforcement": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_12",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.12",
+    ),
+    "Form8Dot13AdditionalShearReinforcement": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_13",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.13",
+    ),
+    "Form8Dot14EquivalentDiameterBundledBars": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.14",
+    ),
+    "Form8Dot15PrestressTransferStress": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+    ),
+    "SubForm8Dot15EtaP1": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+    ),
+    "SubForm8Dot15TensileStrengthAtRelease": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_15",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.15",
+    ),
+    "Form8Dot16BasicTransmissionLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+    ),
+    "SubForm8Dot16Alpha1": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+    ),
+    "SubForm8Dot16Alpha2": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.16",
+    ),
+    "Form8Dot17DesignValueTransmissionLength1": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_17",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.17",
+    ),
+    "Form8Dot18DesignValueTransmissionLength2": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_18",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.18",
+    ),
+    "Form8Dot19DispersionLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_19",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.19",
+    ),
+    "Form8Dot2UltimateBondStress": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+    ),
+    "SubForm8Dot2CoefficientQualityOfBond": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+    ),
+    "SubForm8Dot2CoefficientBarDiameter": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.2",
+    ),
+    "Form8Dot20BondStrengthAnchorageULS": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_20",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.20",
+    ),
+    "Form8Dot21AnchorageLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_21",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.21",
+    ),
+    "Form8Dot3RequiredAnchorageLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.3",
+    ),
+    "Form8Dot4DesignAnchorageLength": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.4",
+    ),
+    "Form8Dot5ProductAlphas235": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_5",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.5",
+    ),
+    "Form8Dot6MinimumTensionAnchorage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_6",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.6",
+    ),
+    "Form8Dot7MinimumCompressionAnchorage": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_7",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.7",
+    ),
+    "Form8Dot8nAnchorageCapacityWeldedTransverseBar": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+    ),
+    "SubForm8Dot8nDesignLengthOfTransverseBar": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+    ),
+    "SubForm8Dot8nConcreteStress": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+    ),
+    "SubForm8Dot8nFunctionY": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+    ),
+    "SubForm8Dot8nFunctionX": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.8N",
+    ),
+    "Form8Dot9AnchorageCapacityWeldedTransverseBarSmallDiameter": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_9",
+        "NEN-EN 1992-1-1+C2:2011",
+        "8.9",
+    ),
+    "Form9Dot10MaximumSpacingBentUpBars": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_10",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.10",
+    ),
+    "Form9Dot12nMinimumLongitudinalReinforcementColumns": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_12n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.12N",
+    ),
+    "Form9Dot13TensileForceToBeAnchored": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_13",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.13",
+    ),
+    "Form9Dot14SplittingForceColumnOnRock": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_14",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.14",
+    ),
+    "Form9Dot16MinimumForceOnInternalBeamLine": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_16",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.16",
+    ),
+    "Form9Dot1nMinimumTensileReinforcementBeam": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.1N",
+    ),
+    "Form9Dot2ShiftInMomentDiagram": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_2",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.2",
+    ),
+    "Form9Dot3ShiftInMomentDiagram": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_3",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.3",
+    ),
+    "Form9Dot4ShearReinforcementRatio": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_4",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.4",
+    ),
+    "Form9Dot5nMinimumShearReinforcementRatio": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_5n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.5N",
+    ),
+    "Form9Dot6nMaximumDistanceShearReinforcement": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_6n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.6N",
+    ),
+    "Form9Dot7nMaximumDistanceBentUpBars": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_7n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.7N",
+    ),
+    "Form9Dot8nMaximumTransverseDistanceLegsSeriesShearLinks": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_8n",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.8N",
+    ),
+    "Form9Dot9MaximumSpacingSeriesOfLinks": (
+        "blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_9",
+        "NEN-EN 1992-1-1+C2:2011",
+        "9.9",
+    ),
+    "Form2Dot2CharacteristicValueResistance": (
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_2_basic_of_design.formula_2_2",
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "2.2",
+    ),
+    "Form6Dot2UtilizationRatio": (
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_2",
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "6.2",
+    ),
+    "Form6Dot5UnityCheckTensileStrength": (
+        "blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_5",
+        "NEN-EN 1993-1-1+C2+A1:2016",
+        "6.5",
+    ),
+    "FormADot1DamageDuringDesignLife": (
+        "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_1",
+        "NEN-EN 1993-1-9+C2:2012",
+        "A.1",
+    ),
+    "FormADot2CriteriaBasedOnDamageAccumulation": (
+        "blueprints.codes.eurocode.nen_en_1993_1_9_c2_2012.annex_a_determination_of_fatigue_load_parameters_and_verification_formats.formula_a_2",
+        "NEN-EN 1993-1-9+C2:2012",
+        "A.2",
+    ),
+    "Form5Dot10ReductionFactorShearArea": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_10",
+        "NEN-EN 1993-5:2008",
+        "5.10",
+    ),
+    "Form5Dot12ElasticCriticalLoad": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_12",
+        "NEN-EN 1993-5:2008",
+        "5.12",
+    ),
+    "Form5Dot2DesignMomentResistanceClass1Or2": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_2",
+        "NEN-EN 1993-5:2008",
+        "5.2",
+    ),
+    "Form5Dot3DesignMomentResistanceClass3": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_3",
+        "NEN-EN 1993-5:2008",
+        "5.3",
+    ),
+    "Form5Dot5PlasticShearResistance": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_5",
+        "NEN-EN 1993-5:2008",
+        "5.5",
+    ),
+    "Form5Dot6ProjectedShearArea": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_6",
+        "NEN-EN 1993-5:2008",
+        "5.6",
+    ),
+    "Form5Dot7ShearBucklingResistance": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_7",
+        "NEN-EN 1993-5:2008",
+        "5.7",
+    ),
+    "Form5Dot8RelativeWebSlenderness": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_8",
+        "NEN-EN 1993-5:2008",
+        "5.8",
+    ),
+    "Form5Dot9ReducedBendingMomentResistance": (
+        "blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_9",
+        "NEN-EN 1993-5:2008",
+        "5.9",
+    ),
+}
@@ -0,0 +1,162 @@
+"""Lazy registry of the formulas in Blueprints, looked up by class name or by source document and label.
+
+The registry is built from the checked-in index in :mod:`blueprints.codes.formula_index`, so a lookup only imports the module
+of the requested formula. After adding, renaming or moving a formula, regenerate the index with::
+
+    python -c "from blueprints.codes.formula_registry import write_formula_index; write_formula_index()"
+"""
+
+import importlib
+import inspect
+import pkgutil
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import blueprints.codes
+from blueprints.codes.formula_index import FORMULA_INDEX
+
+if TYPE_CHECKING:  # pragma: no cover
+    from blueprints.codes.formula import Formula
+
+FORMULA_INDEX_PATH = Path(__file__).with_name("formula_index.py")
+
+
+class FormulaRegistry(Mapping[str, type["Formula"]]):
+    """Read-only mapping of formula class names to formula classes, importing the formula modules on first access.
+
+    Parameters
+    ----------
+    index: Mapping[str, tuple[str, str, str]]
+        The module, source document and label of every formula, by class name.
+
+    Examples
+    --------
+    >>> formula_registry["Form8Dot4DesignAnchorageLength"]
+    <class 'blueprints.codes.eurocode...formula_8_4.Form8Dot4DesignAnchorageLength'>
+    >>> formula_registry.by_label("NEN-EN 1992-1-1+C2:2011", "8.2")
+    (<class '...Form8Dot2UltimateBondStress'>, <class '...SubForm8Dot2CoefficientQualityOfBond'>, ...)
+    """
+
+    def __init__(self, index: Mapping[str, tuple[str, str, str]]) -> None:
+        """Initialize the registry from an index, without importing any formula module."""
+        self._index = dict(index)
+        self._labels: dict[tuple[str, str], list[str]] = {}
+        for name, (_, source_document, label) in self._index.items():
+            self._labels.setdefault((source_document, label), []).append(name)
+        self._formulas: dict[str, type[Formula]] = {}
+
+    def __getitem__(self, name: str) -> type["Formula"]:
+        """The formula class with the given class name.
+
+        Raises
+        ------
+        KeyError
+            If no formula with the given class name is registered.
+        """
+        if name not in self._formulas:
+            if name not in self._index:
+                raise KeyError(f"No formula named {name!r} in the formula registry.")
+            module, _, _ = self._index[name]
+            self._formulas[name] = getattr(importlib.import_module(module), name)
+        return self._formulas[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the class names of the registered formulas."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """The number of registered formulas."""
+        return len(self._index)
+
+    def by_label(self, source_document: str, label: str) -> tuple[type["Formula"], ...]:
+        """The formula classes with the given source document and label, for example ("NEN-EN 1992-1-1+C2:2011", "8.4").
+
+        A formula and its sub-formulas share their label, they are returned in the order in which they are defined.
+
+        Parameters
+        ----------
+        source_document: str
+            The source document of the formula, for example "NEN-EN 1992-1-1+C2:2011".
+        label: str
+            The label of the formula in the source document, for example "8.4".
+
+        Returns
+        -------
+        tuple[type[Formula], ...]
+            The formula classes.
+
+        Raises
+        ------
+        KeyError
+            If no formula with the given source document and label is registered.
+        """
+        if (source_document, label) not in self._labels:
+            raise KeyError(f"No formula {label!r} of {source_document!r} in the formula registry.")
+        return tuple(self[name] for name in self._labels[source_document, label])
+
+    def source_documents(self) -> list[str]:
+        """The source documents of the registered formulas."""
+        return sorted({source_document for source_document, _ in self._labels})
+
+
+def build_formula_index() -> dict[str, tuple[str, str, str]]:
+    """Build the index of all formulas by importing every module of :mod:`blueprints.codes`.
+
+    Returns
+    -------
+    dict[str, tuple[str, str, str]]
+        The module, source document and label of every concrete formula class, by class name.
+
+    Raises
+    ------
+    ValueError
+        If formula classes of the same name are defined in different modules, as the registry looks them up by class name.
+    """
+    from blueprints.codes.formula import Formula
+
+    index: dict[str, tuple[str, str, str]] = {}
+    for module_info in sorted(pkgutil.walk_packages(blueprints.codes.__path__, "blueprints.codes."), key=lambda module_info: module_info.name):
+        module = importlib.import_module(module_info.name)
+        for name, formula in vars(module).items():
+            defined_here = inspect.isclass(formula) and formula.__module__ == module.__name__
+            if defined_here and issubclass(formula, Formula) and not inspect.isabstract(formula):
+                if name in index:
+                    raise ValueError(f"The formula {name} is defined in both {index[name][0]} and {module.__name__}, formula names must be unique.")
+                index[name] = (module.__name__, str(formula.source_document), str(formula.label))
+    return index
+
+
+def render_formula_index(index: Mapping[str, tuple[str, str, str]]) -> str:
+    """Render the source code of the formula index module.
+
+    Parameters
+    ----------
+    index: Mapping[str, tuple[str, str, str]]
+        The module, source document and label of every formula, by class name.
+
+    Returns
+    -------
+    str
+        The source code of the formula index module.
+    """
+    lines = [
+        '"""Index of the formulas in Blueprints: the module, source document and label of every formula, by class name.',
+        "",
+        "This module is generated by :func:`blueprints.codes.formula_registry.write_formula_index`, do not edit it by hand.",
+        '"""',
+        "",
+        "FORMULA_INDEX: dict[str, tuple[str, str, str]] = {",
+    ]
+    for name, (module, source_document, label) in index.items():
+        lines.extend([f'    "{name}": (', f'        "{module}",', f'        "{source_document}",', f'        "{label}",', "    ),"])
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def write_formula_index() -> None:
+    """Regenerate the checked-in formula index module from the formulas in :mod:`blueprints.codes`."""
+    FORMULA_INDEX_PATH.write_text(render_formula_index(build_formula_index()), encoding="utf-8")
+
+
+formula_registry = FormulaRegistry(FORMULA_INDEX)
@@ -8,6 +8,7 @@ from shapely import Point
 from blueprints.geometry.operations import CoordinateSystemOptions, calculate_rotation_angle
 from blueprints.type_alias import DEG
 from blueprints.unit_conversion import RAD_TO_DEG
+from blueprints.utils.id_counter import IdCounter
 
 
 class Line:
@@ -19,16 +20,21 @@ class Line:
         Starting point
     end_point : Point
         End point
+
+    Attributes
+    ----------
+    id : int
+        Unique ID of the line, also when lines are created concurrently in threads or processes.
     """
 
-    id: int = 0
+    _ids = IdCounter()
 
     def __init__(self, start_point: Point, end_point: Point) -> None:
         """Initialize the line."""
         self._start_point = start_point
         self._end_point = end_point
         self._validate_points()
-        Line.id += 1
+        self.id = Line._ids.next()
 
     @property
     def start_point(self) -> Point:
@@ -0,0 +1,552 @@
+"""Fiber discretization of reinforced concrete cross-sections, integrating the stresses of many strain planes at once.
+
+Strains and stresses are positive in compression. The strain of a plane at a point (x, y) of the cross-section is
+:math:`ε = ε_0 + κ_x (y - y_c) + κ_y (x - x_c)`, with :math:`(x_c, y_c)` the centroid of the concrete cross-section. The moment
+:math:`M_x` is positive for compression at the upper side, the moment :math:`M_y` for compression at the right side.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+import shapely
+from shapely import Polygon
+
+from blueprints.materials.concrete import ConcreteMaterial, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.type_alias import DIMENSIONLESS, MM, MPA, RAD
+
+# strains of the materials are given in per mille
+PER_MILLE_TO_STRAIN = 1e-3
+
+# default partial factor of reinforcement steel for the ultimate limit state, NEN-EN 1992-1-1 table 2.1N
+STEEL_MATERIAL_FACTOR = 1.15
+
+# ratio of the design strain limit and the characteristic strain at maximum load of reinforcement steel, NEN-EN 1992-1-1 art. 3.2.7 (2)
+EPS_UD_FACTOR = 0.9
+
+
+def _triangle_points(a: float) -> np.ndarray:
+    """The three points of a triangle with the barycentric coordinates (1 - 2a, a, a) and their permutations."""
+    return np.array([[1 - 2 * a, a, a], [a, 1 - 2 * a, a], [a, a, 1 - 2 * a]])
+
+
+# Gauss points of a triangle in barycentric coordinates and their weights (summing to 1), by the polynomial degree they integrate
+# exactly: the centroid, the three-point rule and the seven-point rule of Radon (Dunavant's rule of degree 5)
+_SQRT_15 = np.sqrt(15.0)
+TRIANGLE_GAUSS_RULES: dict[int, tuple[np.ndarray, np.ndarray]] = {
+    1: (np.full((1, 3), 1 / 3), np.ones(1)),
+    2: (_triangle_points(1 / 6), np.full(3, 1 / 3)),
+    5: (
+        np.vstack([np.full((1, 3), 1 / 3), _triangle_points((6 - _SQRT_15) / 21), _triangle_points((6 + _SQRT_15) / 21)]),
+        np.concatenate([[9 / 40], np.full(3, (155 - _SQRT_15) / 1200), np.full(3, (155 + _SQRT_15) / 1200)]),
+    ),
+}
+
+_CONCRETE_DIAGRAMS = (DiagramType.BILINEAR, DiagramType.PARABOLIC)
+_STEEL_DIAGRAMS = (ReinforcementDiagramType.BILINEAR_INCLINED, ReinforcementDiagramType.BILINEAR_NOT_INCLINED)
+
+
+def parabola_rectangle_stress(strain: np.ndarray, f_cd: MPA, eps_c2: DIMENSIONLESS, n: DIMENSIONLESS) -> np.ndarray:
+    """Stress of concrete according to the parabola-rectangle diagram, NEN-EN 1992-1-1 formulas 3.17 and 3.18.
+
+    Parameters
+    ----------
+    strain : np.ndarray
+        Strains, positive in compression [-].
+    f_cd : MPA
+        [:math:`f_{cd}`] Design compressive strength of the concrete [MPa].
+    eps_c2 : DIMENSIONLESS
+        [:math:`ε_{c2}`] Strain at reaching the maximum strength [-].
+    n : DIMENSIONLESS
+        [:math:`n`] Exponent of the parabola [-].
+
+    Returns
+    -------
+    np.ndarray
+        Stresses, positive in compression and zero in tension [MPa].
+    """
+    relative_strain = np.clip(strain / eps_c2, 0.0, 1.0)
+    return f_cd * (1.0 - (1.0 - relative_strain) ** n)
+
+
+def bilinear_concrete_stress(strain: np.ndarray, f_cd: MPA, eps_c3: DIMENSIONLESS) -> np.ndarray:
+    """Stress of concrete according to the bi-linear diagram of NEN-EN 1992-1-1 figure 3.4.
+
+    Parameters
+    ----------
+    strain : np.ndarray
+        Strains, positive in compression [-].
+    f_cd : MPA
+        [:math:`f_{cd}`] Design compressive strength of the concrete [MPa].
+    eps_c3 : DIMENSIONLESS
+        [:math:`ε_{c3}`] Strain at reaching the maximum strength [-].
+
+    Returns
+    -------
+    np.ndarray
+        Stresses, positive in compression and zero in tension [MPa].
+    """
+    return f_cd * np.clip(strain / eps_c3, 0.0, 1.0)
+
+
+def bilinear_steel_stress(strain: np.ndarray, e_s: np.ndarray | MPA, f_yd: np.ndarray | MPA, hardening: np.ndarray | MPA = 0.0) -> np.ndarray:
+    """Stress of reinforcement steel according to the bi-linear diagram of NEN-EN 1992-1-1 figure 3.8.
+
+    Parameters
+    ----------
+    strain : np.ndarray
+        Strains, positive in compression [-].
+    e_s : np.ndarray | MPA
+        [:math:`E_s`] Modulus of elasticity of the steel [MPa].
+    f_yd : np.ndarray | MPA
+        [:math:`f_{yd}`] Design yield strength of the steel [MPa].
+    hardening : np.ndarray | MPA
+        Slope of the inclined top branch, zero for the horizontal top branch [MPa].
+
+    Returns
+    -------
+    np.ndarray
+        Stresses, positive in compression [MPa].
+    """
+    elastic = e_s * strain
+    plastic = np.sign(strain) * (f_yd + hardening * (np.abs(strain) - f_yd / e_s))
+    return np.where(np.abs(elastic) <= f_yd, elastic, plastic)
+
+
+def triangulate(geometry: Polygon, n_subdivisions: int = 1) -> np.ndarray:
+    """Triangulate a polygon, possibly with holes, by a constrained Delaunay triangulation.
+
+    The triangulation of a geometry is cached, so that the analyses of cross-sections of the same shape triangulate it only once.
+
+    Parameters
+    ----------
+    geometry : Polygon
+        The polygon.
+    n_subdivisions : int
+        Number of parts into which every edge of the triangles of the triangulation is divided, which divides every triangle into
+        ``n_subdivisions ** 2`` similar triangles. Default is 1.
+
+    Returns
+    -------
+    np.ndarray
+        The vertices of the triangles, of shape (number of triangles, 3, 2), counter-clockwise. The array is read-only.
+    """
+    if n_subdivisions < 1:
+        msg = f"The number of subdivisions must be at least 1, got {n_subdivisions}."
+        raise ValueError(msg)
+    return _triangulate(shapely.to_wkb(geometry), n_subdivisions)
+
+
+@lru_cache(maxsize=64)
+def _triangulate(wkb: bytes, n_subdivisions: int) -> np.ndarray:
+    """Triangulate the polygon of a well-known binary, see :func:`triangulate`."""
+    triangles = shapely.get_parts(shapely.constrained_delaunay_triangles(shapely.from_wkb(wkb)))
+    vertices = shapely.get_coordinates(shapely.get_exterior_ring(triangles)).reshape(-1, 4, 2)[:, :3]
+    # orient counter-clockwise, so that the areas of the triangles are positive
+    edges = vertices[:, 1:] - vertices[:, :1]
+    clockwise = edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0] < 0
+    vertices[clockwise] = vertices[clockwise][:, ::-1]
+
+    # the vertices of the similar triangles of the subdivision, as coefficients (s, t) of the edges from the first vertex
+    i, j = (index.ravel() for index in np.indices((n_subdivisions, n_subdivisions)))
+    upward, downward = i + j < n_subdivisions, i + j < n_subdivisions - 1
+    corners = (
+        np.concatenate(
+            [
+                np.stack([np.column_stack([i, j]), np.column_stack([i + 1, j]), np.column_stack([i, j + 1])], axis=1)[upward],
+                np.stack([np.column_stack([i + 1, j]), np.column_stack([i + 1, j + 1]), np.column_stack([i, j + 1])], axis=1)[downward],
+            ]
+        )
+        / n_subdivisions
+    )
+    origin, edges = vertices[:, np.newaxis, np.newaxis, 0], vertices[:, 1:] - vertices[:, :1]
+    subdivided = (origin + np.einsum("skc,tcd->tskd", corners, edges)).reshape(-1, 3, 2)
+    subdivided.setflags(write=False)
+    return subdivided
+
+
+@dataclass(frozen=True, eq=False)
+class FiberSection:
+    """Reinforced concrete cross-section discretized into concrete fibers and bars, for the ultimate limit state.
+
+    The concrete follows the parabola-rectangle or the bi-linear diagram and the reinforcement the bi-linear diagram of its
+    material. The area of every bar replaces the concrete at its position. The concrete is either a grid of fibers, see
+    :meth:`from_cross_section`, or the Gauss points of a triangulation of the concrete, see :meth:`from_triangulation`; a Gauss
+    point is a fiber with its weight as area.
+
+    Parameters
+    ----------
+    concrete_x : np.ndarray
+        x-coordinates of the centroids of the concrete fibers [mm].
+    concrete_y : np.ndarray
+        y-coordinates of the centroids of the concrete fibers [mm].
+    concrete_area : np.ndarray
+        Areas of the concrete fibers [mm²].
+    outline : np.ndarray
+        Vertices (x, y) of the outline of the concrete cross-section, defining its outer fibers [mm].
+    rebar_set : RebarSet
+        The longitudinal rebars of the cross-section.
+    concrete_material : ConcreteMaterial
+        Material properties of the concrete.
+    centroid : tuple[MM, MM]
+        Centroid of the concrete cross-section, the reference point of the strain planes and moments [mm].
+    steel_material_factor : DIMENSIONLESS
+        [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+    """
+
+    concrete_x: np.ndarray
+    concrete_y: np.ndarray
+    concrete_area: np.ndarray
+    outline: np.ndarray
+    rebar_set: RebarSet
+    concrete_material: ConcreteMaterial
+    centroid: tuple[MM, MM]
+    steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR
+    _steel: dict[str, np.ndarray] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Gather the properties of the steel of every bar."""
+        if self.concrete_material.diagram_type not in _CONCRETE_DIAGRAMS:
+            supported = ", ".join(diagram.value for diagram in _CONCRETE_DIAGRAMS)
+            msg = f"Only the parabola-rectangle and bi-linear stress-strain diagrams of concrete are supported: {supported}."
+            raise ValueError(msg)
+        materials = self.rebar_set.materials
+        if any(material.diagram_type not in _STEEL_DIAGRAMS for material in materials):
+            supported = ", ".join(diagram.value for diagram in _STEEL_DIAGRAMS)
+            msg = f"Only the bi-linear stress-strain diagrams of reinforcement steel are supported: {supported}."
+            raise ValueError(msg)
+        e_s = np.array([material.e_s for material in materials], dtype=float)
+        f_yd = np.array([material.f_yk / self.steel_material_factor for material in materials], dtype=float)
+        eps_ud = np.array([EPS_UD_FACTOR * material.eps_uk * PER_MILLE_TO_STRAIN for material in materials], dtype=float)
+        # the inclined top branch reaches k * f_yd at the characteristic strain at maximum load, NEN-EN 1992-1-1 figure 3.8
+        eps_uk = eps_ud / EPS_UD_FACTOR
+        inclined = np.array([material.diagram_type == ReinforcementDiagramType.BILINEAR_INCLINED for material in materials], dtype=bool)
+        k = np.array([material.ductility_factor_k for material in materials], dtype=float)
+        hardening = np.where(inclined, (k - 1.0) * f_yd / (eps_uk - f_yd / np.where(e_s > 0, e_s, 1.0)), 0.0)
+        index = self.rebar_set.material_index
+        object.__setattr__(self, "_steel", {"e_s": e_s[index], "f_yd": f_yd[index], "eps_ud": eps_ud[index], "hardening": hardening[index]})
+
+    @classmethod
+    def from_cross_section(
+        cls,
+        cross_section: ReinforcedCrossSection,
+        n_x: int = 1,
+        n_y: int = 100,
+        steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR,
+    ) -> "FiberSection":
+        """Discretize a reinforced cross-section into a grid of concrete fibers.
+
+        Parameters
+        ----------
+        cross_section : ReinforcedCrossSection
+            The reinforced cross-section.
+        n_x : int
+            Number of fibers over the width of the cross-section. Default is 1, which is exact for bending about the x-axis.
+        n_y : int
+            Number of fibers over the height of the cross-section. Default is 100.
+        steel_material_factor : DIMENSIONLESS
+            [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+
+        Returns
+        -------
+        FiberSection
+            The fiber section.
+        """
+        geometry = cross_section.cross_section.geometry
+        min_x, min_y, max_x, max_y = geometry.bounds
+        x_edges = np.linspace(min_x, max_x, n_x + 1)
+        y_edges = np.linspace(min_y, max_y, n_y + 1)
+        x0, y0 = np.meshgrid(x_edges[:-1], y_edges[:-1])
+        x1, y1 = np.meshgrid(x_edges[1:], y_edges[1:])
+        fibers = shapely.intersection(geometry, shapely.box(x0.ravel(), y0.ravel(), x1.ravel(), y1.ravel()))
+        areas = shapely.area(fibers)
+        fibers, areas = fibers[areas > 0], areas[areas > 0]
+        centroids = shapely.get_coordinates(shapely.centroid(fibers))
+        gross = cross_section.gross_section_properties
+        return cls(
+            concrete_x=centroids[:, 0],
+            concrete_y=centroids[:, 1],
+            concrete_area=areas,
+            outline=np.asarray(geometry.exterior.coords, dtype=float),
+            rebar_set=cross_section.rebar_set,
+            concrete_material=cross_section.concrete_material,
+            centroid=(gross.centroid_x, gross.centroid_y),
+            steel_material_factor=steel_material_factor,
+        )
+
+    @classmethod
+    def from_triangulation(
+        cls,
+        cross_section: ReinforcedCrossSection,
+        n_subdivisions: int = 16,
+        degree: int = 5,
+        steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR,
+    ) -> "FiberSection":
+        """Discretize a reinforced cross-section of any polygonal shape into the Gauss points of a triangulation of the concrete.
+
+        The concrete is triangulated once per shape, see :func:`triangulate`, and integrated by a Gauss rule on every triangle.
+        A Gauss rule integrates polynomials of at most its degree over a triangle exactly, for example the section properties or
+        linear elastic stresses. The stresses of an ultimate strain plane are not a polynomial: the stress-strain diagrams have
+        kinks, at the neutral axis and at the start of the plastic branch, that cross the triangles, and their error only decreases
+        by subdividing the triangles. The defaults are chosen for the coarsest triangulation, a rectangle of two triangles: the
+        forces of its ultimate strain planes and the unity checks of its interaction diagram deviate less than 1 % from those of
+        a fine grid of fibers. The triangulations of other shapes have more, smaller triangles.
+
+        Parameters
+        ----------
+        cross_section : ReinforcedCrossSection
+            The reinforced cross-section, for example with a :class:`PolygonCrossSection` as T-, L-, I- or hollow section.
+        n_subdivisions : int
+            Number of parts into which every edge of the triangles of the triangulation is divided. Default is 16.
+        degree : int
+            Polynomial degree of the Gauss rule, 1 (the centroid), 2 (three points) or 5 (seven points). Default is 5.
+        steel_material_factor : DIMENSIONLESS
+            [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+
+        Returns
+        -------
+        FiberSection
+            The fiber section, with a fiber for every Gauss point.
+
+        Raises
+        ------
+        ValueError
+            If there is no Gauss rule of the degree.
+        """
+        if degree not in TRIANGLE_GAUSS_RULES:
+            msg = f"Gauss rules of triangles are available for the degrees {', '.join(map(str, TRIANGLE_GAUSS_RULES))}, got {degree}."
+            raise ValueError(msg)
+        geometry = cross_section.cross_section.geometry
+        triangles = triangulate(geometry, n_subdivisions)
+        barycentric, weights = TRIANGLE_GAUSS_RULES[degree]
+        points = np.einsum("gv,tvd->tgd", barycentric, triangles).reshape(-1, 2)
+        edges = triangles[:, 1:] - triangles[:, :1]
+        areas = 0.5 * (edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0])
+        gross = cross_section.gross_section_properties
+        return cls(
+            concrete_x=points[:, 0],
+            concrete_y=points[:, 1],
+            concrete_area=np.outer(areas, weights).ravel(),
+            outline=np.asarray(geometry.exterior.coords, dtype=float),
+            rebar_set=cross_section.rebar_set,
+            concrete_material=cross_section.concrete_material,
+            centroid=(gross.centroid_x, gross.centroid_y),
+            steel_material_factor=steel_material_factor,
+        )
+
+    @property
+    def concrete_strains(self) -> tuple[DIMENSIONLESS, DIMENSIONLESS]:
+        """The strain at reaching the maximum strength and the ultimate strain of the stress-strain diagram of the concrete [-].
+
+        Returns
+        -------
+        tuple[DIMENSIONLESS, DIMENSIONLESS]
+            :math:`(ε_{c2}, ε_{cu2})` for the parabola-rectangle diagram, :math:`(ε_{c3}, ε_{cu3})` for the bi-linear diagram.
+        """
+        material = self.concrete_material
+        if material.diagram_type == DiagramType.PARABOLIC:
+            return material.eps_c2 * PER_MILLE_TO_STRAIN, material.eps_cu2 * PER_MILLE_TO_STRAIN
+        return material.eps_c3 * PER_MILLE_TO_STRAIN, material.eps_cu3 * PER_MILLE_TO_STRAIN
+
+    @property
+    def steel_strain_limit(self) -> np.ndarray:
+        """[:math:`ε_{ud}`] Design limit of the tensile strain of every bar, :math:`0.9 ε_{uk}` of its material [-]."""
+        return self._steel["eps_ud"]
+
+    def concrete_stress(self, strain: np.ndarray) -> np.ndarray:
+        """Stress of the concrete for the given strains [MPa], see :func:`parabola_rectangle_stress` and :func:`bilinear_concrete_stress`."""
+        material = self.concrete_material
+        if material.diagram_type == DiagramType.PARABOLIC:
+            return parabola_rectangle_stress(strain, material.f_cd, material.eps_c2 * PER_MILLE_TO_STRAIN, material.n_factor)
+        return bilinear_concrete_stress(strain, material.f_cd, material.eps_c3 * PER_MILLE_TO_STRAIN)
+
+    def steel_stress(self, strain: np.ndarray) -> np.ndarray:
+        """Stress of the bars for the given strains of all bars (in the last axis) [MPa], see :func:`bilinear_steel_stress`."""
+        return bilinear_steel_stress(strain, self._steel["e_s"], self._steel["f_yd"], self._steel["hardening"])
+
+    def forces(
+        self, eps_0: np.ndarray | float, kappa_x: np.ndarray | float, kappa_y: np.ndarray | float = 0.0
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Integrate the stresses over all fibers and bars, for many strain planes at once.
+
+        Parameters
+        ----------
+        eps_0 : np.ndarray | float
+            Strains at the centroid of the cross-section [-].
+        kappa_x : np.ndarray | float
+            Curvatures about the x-axis [1/mm].
+        kappa_y : np.ndarray | float
+            Curvatures about the y-axis [1/mm]. Default is 0.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The normal force [N] (positive in compression) and the moments about the x- and y-axis [Nmm] of every strain plane.
+        """
+        eps_0, kappa_x, kappa_y = (np.asarray(value, dtype=float)[..., np.newaxis] for value in np.broadcast_arrays(eps_0, kappa_x, kappa_y))
+        x_c, y_c = self.centroid
+        concrete_dx, concrete_dy = self.concrete_x - x_c, self.concrete_y - y_c
+        bars_dx, bars_dy = self.rebar_set.x - x_c, self.rebar_set.y - y_c
+
+        concrete_forces = self.concrete_stress(eps_0 + kappa_x * concrete_dy + kappa_y * concrete_dx) * self.concrete_area
+        bars_strain = eps_0 + kappa_x * bars_dy + kappa_y * bars_dx
+        bars_forces = (self.steel_stress(bars_strain) - self.concrete_stress(bars_strain)) * self.rebar_set.areas
+
+        n = concrete_forces.sum(axis=-1) + bars_forces.sum(axis=-1)
+        m_x = concrete_forces @ concrete_dy + bars_forces @ bars_dy
+        m_y = concrete_forces @ concrete_dx + bars_forces @ bars_dx
+        return n, m_x, m_y
+
+    def within_strain_limits(self, eps_0: np.ndarray | float, kappa_x: np.ndarray | float, kappa_y: np.ndarray | float = 0.0) -> np.ndarray:
+        """Check whether strain planes stay within the ultimate strains of the concrete and the reinforcement.
+
+        The outer fibers of the concrete may not exceed the ultimate strain of :attr:`concrete_strains` and no bar may exceed
+        :math:`ε_{ud}` in tension. The compression of a fully compressed cross-section is not limited separately.
+
+        Parameters
+        ----------
+        eps_0 : np.ndarray | float
+            Strains at the centroid of the cross-section [-].
+        kappa_x : np.ndarray | float
+            Curvatures about the x-axis [1/mm].
+        kappa_y : np.ndarray | float
+            Curvatures about the y-axis [1/mm]. Default is 0.
+
+        Returns
+        -------
+        np.ndarray
+            For every strain plane whether the strains are within the limits, False for planes with a NaN strain.
+        """
+        eps_0, kappa_x, kappa_y = (np.asarray(value, dtype=float)[..., np.newaxis] for value in np.broadcast_arrays(eps_0, kappa_x, kappa_y))
+        x_c, y_c = self.centroid
+        outline_strain = eps_0 + kappa_x * (self.outline[:, 1] - y_c) + kappa_y * (self.outline[:, 0] - x_c)
+        bars_strain = eps_0 + kappa_x * (self.rebar_set.y - y_c) + kappa_y * (self.rebar_set.x - x_c)
+        tolerance = 1e-12
+        concrete_ok = outline_strain.max(axis=-1) <= self.concrete_strains[1] + tolerance
+        bars_ok = np.all(bars_strain >= -self._steel["eps_ud"] - tolerance, axis=-1)
+        return concrete_ok & bars_ok
+
+    def equilibrium_strain(
+        self,
+        normal_force: np.ndarray | float,
+        kappa_x: np.ndarray | float,
+        kappa_y: np.ndarray | float = 0.0,
+        tolerance: DIMENSIONLESS = 1e-9,
+        max_iterations: int = 100,
+    ) -> np.ndarray:
+        """Strains at the centroid for which the stresses are in equilibrium with the normal force, for many curvatures at once.
+
+        The normal force of a strain plane with a fixed curvature increases monotonically with the strain at the centroid. The
+        equations of all curvatures are solved together by a Newton iteration, safeguarded by a bracket of the root: steps that
+        leave the bracket or converge slowly, for example on a tangent without stiffness (plastic fibers), fall back to the false
+        position of the bracket.
+
+        Parameters
+        ----------
+        normal_force : np.ndarray | float
+            Normal forces, positive in compression [N].
+        kappa_x : np.ndarray | float
+            Curvatures about the x-axis [1/mm].
+        kappa_y : np.ndarray | float
+            Curvatures about the y-axis [1/mm]. Default is 0.
+        tolerance : DIMENSIONLESS
+            Tolerance of the normal force, relative to the range between the resistances to tension and compression [-].
+            Default is 1e-9.
+        max_iterations : int
+            Maximum number of iterations. Default is 100.
+
+        Returns
+        -------
+        np.ndarray
+            The strains at the centroid [-], NaN where the cross-section cannot resist the normal force at the curvature.
+        """
+        target, kappa_x, kappa_y = (np.asarray(value, dtype=float) for value in np.broadcast_arrays(normal_force, kappa_x, kappa_y))
+        x_c, y_c = self.centroid
+        points = np.vstack([self.outline, np.column_stack([self.rebar_set.x, self.rebar_set.y])]) - [x_c, y_c]
+        variation = np.abs(kappa_x) * np.abs(points[:, 1]).max() + np.abs(kappa_y) * np.abs(points[:, 0]).max()
+
+        # beyond these strains all fibers are in the plastic branch, or past the strain limits of the reinforcement
+        eps_steel = float(self._steel["eps_ud"].max()) if len(self.rebar_set) else 0.0
+        lower = -max(eps_steel, self.concrete_strains[0]) - variation
+        upper = max(eps_steel, self.concrete_strains[1]) + variation
+        n_lower, n_upper = self.forces(lower, kappa_x, kappa_y)[0], self.forces(upper, kappa_x, kappa_y)[0]
+        solvable = (n_lower <= target) & (target <= n_upper)
+        limit = tolerance * np.max(n_upper - n_lower, initial=0.0)
+
+        step = 1e-9
+        r_lower, r_upper = n_lower - target, n_upper - target
+        eps_0, last_step = np.zeros_like(target), upper - lower
+        for _ in range(max_iterations):
+            # the normal force and its derivative (by a forward difference) in one evaluation of all fibers
+            n, n_step = self.forces(np.stack([eps_0, eps_0 + step]), kappa_x, kappa_y)[0]
+            residual = n - target
+            if np.all(~solvable | (np.abs(residual) <= limit)):
+                break
+            # shrink the bracket; halving the residual at the end that is kept (Illinois) prevents one-sided false positions
+            below, above = residual < 0, residual > 0
+            r_upper = np.where(below & (residual * r_lower > 0), 0.5 * r_upper, r_upper)
+            r_lower = np.where(above & (residual * r_upper > 0), 0.5 * r_lower, r_lower)
+            lower, r_lower = np.where(below, eps_0, lower), np.where(below, residual, r_lower)
+            upper, r_upper = np.where(above, eps_0, upper), np.where(above, residual, r_upper)
+
+            stiffness = (n_step - n) / step
+            with np.errstate(divide="ignore", invalid="ignore"):
+                newton = eps_0 - residual / stiffness
+                false_position = lower - r_lower * (upper - lower) / (r_upper - r_lower)
+            # a Newton step is only taken inside the bracket and if it converges faster than the previous step
+            use_newton = (stiffness > 0) & (newton > lower) & (newton < upper) & (np.abs(2 * residual) <= np.abs(last_step * stiffness))
+            fallback = np.where(np.isfinite(false_position), false_position, 0.5 * (lower + upper))
+            new_eps_0 = np.where(use_newton, newton, fallback)
+            eps_0, last_step = new_eps_0, new_eps_0 - eps_0
+        return np.where(solvable, eps_0, np.nan)
+
+    def ultimate_strain_planes(self, angle: RAD, n_planes: int = 200) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Strain planes at the ultimate limit state, compressing the side of the cross-section in the given direction.
+
+        Every plane has a different depth of the neutral axis and reaches the strain limit of the concrete
+        (:math:`ε_{cu2}`, or :math:`ε_{c2}` when fully compressed, see :attr:`concrete_strains`) or of the reinforcement
+        (:math:`ε_{ud} = 0.9 ε_{uk}`), according to NEN-EN 1992-1-1 figure 6.1. The planes run from uniform compression to uniform tension.
+
+        Parameters
+        ----------
+        angle : RAD
+            Direction of the compressed side, measured from the x-axis, for example :math:`π/2` for compression at the upper
+            side [rad].
+        n_planes : int
+            Number of strain planes between uniform compression and uniform tension. Default is 200.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The strains at the centroid [-] and the curvatures about the x- and y-axis [1/mm] of the strain planes.
+        """
+        eps_c2, eps_cu2 = self.concrete_strains
+        direction = np.array([np.cos(angle), np.sin(angle)])
+        x_c, y_c = self.centroid
+
+        # coordinate in the direction of the compressed side, relative to the centroid
+        outline_u = (self.outline - [x_c, y_c]) @ direction
+        bars_u = (np.column_stack([self.rebar_set.x, self.rebar_set.y]) - [x_c, y_c]) @ direction
+        top, height = outline_u.max(), outline_u.max() - outline_u.min()
+
+        # depths of the neutral axis below the compressed outer fiber, denser within the cross-section
+        s = np.linspace(1.0, -1.0, n_planes)[1:-1, np.newaxis]
+        depth = height * (0.5 + 0.5 * np.tan(0.5 * np.pi * s))
+        neutral_axis = top - depth
+
+        # the largest curvature for which none of the strain limits is exceeded
+        with np.errstate(divide="ignore"):
+            concrete_limit = np.where(depth > 0, eps_cu2 / depth, np.inf)
+            compressed_limit = np.where(depth > height, eps_c2 / (depth - (1 - eps_c2 / eps_cu2) * height), np.inf)
+            bars_limit = np.where(bars_u < neutral_axis, self._steel["eps_ud"] / (neutral_axis - bars_u), np.inf)
+        kappa = np.min(np.column_stack([concrete_limit, compressed_limit, bars_limit]), axis=1)
+        kappa[np.isinf(kappa)] = 0.0
+        eps_0 = -kappa * neutral_axis[:, 0]
+
+        eps_tension = -self._steel["eps_ud"].min() if len(self.rebar_set) else 0.0
+        eps_0 = np.concatenate([[eps_c2], eps_0, [eps_tension]])
+        kappa = np.concatenate([[0.0], kappa, [0.0]])
+        return eps_0, kappa * direction[1], kappa * direction[0]
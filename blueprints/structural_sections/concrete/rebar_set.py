@@ -0,0 +1,360 @@
+"""Array-backed set of reinforcement bars in a cross-section."""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import overload
+
+import numpy as np
+import shapely
+from shapely import Point, Polygon
+
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.type_alias import KG_M, MM, MM2, MM3, MM4
+from blueprints.unit_conversion import MM2_TO_M2
+
+
+@lru_cache(maxsize=256)
+def eroded_geometry(geometry: Polygon, distance: float) -> Polygon:
+    """The geometry eroded (inward buffered) by the given distance, prepared for repeated predicates.
+
+    The centre of a circle with a radius equal to the distance is inside (or on the boundary of) the eroded geometry, if and
+    only if the circle is fully inside the geometry. The eroded geometries are cached by geometry and distance.
+
+    Parameters
+    ----------
+    geometry : Polygon
+        The geometry to erode.
+    distance : float
+        The distance to erode the geometry by [mm].
+
+    Returns
+    -------
+    Polygon
+        The eroded geometry, which is empty if nothing is left of the geometry.
+    """
+    eroded = geometry.buffer(-distance)
+    shapely.prepare(eroded)
+    return eroded
+
+
+@dataclass(frozen=True, eq=False)
+class RebarSet:
+    """Set of reinforcement bars stored as contiguous arrays (struct of arrays).
+
+    The properties of the set are calculated vectorized on the arrays. :class:`Rebar` objects are only created on demand, by
+    indexing or iterating the set.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        x-coordinates of the centers of the bars in the cross-section [mm].
+    y : np.ndarray
+        y-coordinates of the centers of the bars in the cross-section [mm].
+    diameter : np.ndarray
+        Diameters of the bars [mm].
+    relative_start_position : np.ndarray
+        Relative positions of the starts of the bars in the longitudinal direction of the host element [-].
+    relative_end_position : np.ndarray
+        Relative positions of the ends of the bars in the longitudinal direction of the host element [-].
+    material_index : np.ndarray
+        Index of the material of every bar in ``materials``.
+    materials : tuple[ReinforcementSteelMaterial, ...]
+        The unique materials of the bars.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    diameter: np.ndarray
+    relative_start_position: np.ndarray
+    relative_end_position: np.ndarray
+    material_index: np.ndarray
+    materials: tuple[ReinforcementSteelMaterial, ...]
+    _densities: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Convert the columns to read-only arrays and validate them."""
+        columns = {
+            "x": (self.x, float),
+            "y": (self.y, float),
+            "diameter": (self.diameter, float),
+            "relative_start_position": (self.relative_start_position, float),
+            "relative_end_position": (self.relative_end_position, float),
+            "material_index": (self.material_index, np.intp),
+        }
+        arrays = {name: np.array(values, dtype=dtype).ravel() for name, (values, dtype) in columns.items()}
+        if len({array.size for array in arrays.values()}) > 1:
+            msg = "All columns of a rebar set must have the same length."
+            raise ValueError(msg)
+        if np.any(arrays["diameter"] <= 0):
+            msg = f"Diameter must be a positive value, but got {arrays['diameter'].min()}"
+            raise ValueError(msg)
+        for name in ["relative_start_position", "relative_end_position"]:
+            if np.any((arrays[name] < 0.0) | (arrays[name] > 1.0)):
+                msg = f"{name.capitalize().replace('_', ' ')} of the rebars must be between 0.0 and 1.0"
+                raise ValueError(msg)
+        if np.any((arrays["material_index"] < 0) | (arrays["material_index"] >= len(self.materials))):
+            msg = "Material index of the rebars must refer to one of the materials of the rebar set."
+            raise ValueError(msg)
+        for name, array in arrays.items():
+            array.flags.writeable = False
+            object.__setattr__(self, name, array)
+        object.__setattr__(self, "materials", tuple(self.materials))
+        object.__setattr__(self, "_densities", np.array([material.density for material in self.materials], dtype=float))
+
+    @classmethod
+    def from_rebars(cls, rebars: Iterable[Rebar]) -> "RebarSet":
+        """Create a rebar set from rebar objects.
+
+        Parameters
+        ----------
+        rebars : Iterable[Rebar]
+            The rebars.
+
+        Returns
+        -------
+        RebarSet
+            The rebar set, with the rebars in the given order.
+        """
+        rebars = list(rebars)
+        materials: dict[ReinforcementSteelMaterial, int] = {}
+        return cls(
+            x=np.array([rebar.x for rebar in rebars], dtype=float),
+            y=np.array([rebar.y for rebar in rebars], dtype=float),
+            diameter=np.array([rebar.diameter for rebar in rebars], dtype=float),
+            relative_start_position=np.array([rebar.relative_start_position for rebar in rebars], dtype=float),
+            relative_end_position=np.array([rebar.relative_end_position for rebar in rebars], dtype=float),
+            material_index=np.array([materials.setdefault(rebar.material, len(materials)) for rebar in rebars], dtype=np.intp),
+            materials=tuple(materials),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        x: np.ndarray,
+        y: np.ndarray,
+        diameter: np.ndarray | MM,
+        material: ReinforcementSteelMaterial,
+        relative_start_position: float = 0.0,
+        relative_end_position: float = 1.0,
+    ) -> "RebarSet":
+        """Create a rebar set of bars of a single material from coordinate arrays, without creating rebar objects.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            x-coordinates of the centers of the bars [mm].
+        y : np.ndarray
+            y-coordinates of the centers of the bars [mm].
+        diameter : np.ndarray | MM
+            Diameters of the bars, or the diameter of all bars [mm].
+        material : ReinforcementSteelMaterial
+            Material of all bars.
+        relative_start_position : float
+            Relative position of the start of all bars in the longitudinal direction of the host element [-]. Default is 0.
+        relative_end_position : float
+            Relative position of the end of all bars in the longitudinal direction of the host element [-]. Default is 1.
+
+        Returns
+        -------
+        RebarSet
+            The rebar set, with the bars in the given order.
+        """
+        x, y, diameter = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(diameter, dtype=float))
+        return cls(
+            x=x,
+            y=y,
+            diameter=diameter,
+            relative_start_position=np.full(x.shape, relative_start_position),
+            relative_end_position=np.full(x.shape, relative_end_position),
+            material_index=np.zeros(x.shape, dtype=np.intp),
+            materials=(material,),
+        )
+
+    @classmethod
+    def concatenate(cls, rebar_sets: Iterable["RebarSet"]) -> "RebarSet":
+        """Join rebar sets into one set, merging their materials.
+
+        Parameters
+        ----------
+        rebar_sets : Iterable[RebarSet]
+            The rebar sets.
+
+        Returns
+        -------
+        RebarSet
+            The rebar set with the rebars of all sets, in the given order.
+        """
+        rebar_sets = list(rebar_sets)
+        if not rebar_sets:
+            return cls.from_rebars([])
+        materials: dict[ReinforcementSteelMaterial, int] = {}
+        material_indices = [
+            np.array([materials.setdefault(material, len(materials)) for material in rebar_set.materials], dtype=np.intp)[rebar_set.material_index]
+            for rebar_set in rebar_sets
+        ]
+        return cls(
+            x=np.concatenate([rebar_set.x for rebar_set in rebar_sets]),
+            y=np.concatenate([rebar_set.y for rebar_set in rebar_sets]),
+            diameter=np.concatenate([rebar_set.diameter for rebar_set in rebar_sets]),
+            relative_start_position=np.concatenate([rebar_set.relative_start_position for rebar_set in rebar_sets]),
+            relative_end_position=np.concatenate([rebar_set.relative_end_position for rebar_set in rebar_sets]),
+            material_index=np.concatenate(material_indices),
+            materials=tuple(materials),
+        )
+
+    def __len__(self) -> int:
+        """The number of rebars in the set."""
+        return self.x.size
+
+    @overload
+    def __getitem__(self, index: int) -> Rebar: ...
+
+    @overload
+    def __getitem__(self, index: slice | np.ndarray) -> "RebarSet": ...
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> "Rebar | RebarSet":
+        """A rebar object for an integer index, or a subset of the rebars for a slice, index array or boolean mask."""
+        if isinstance(index, int | np.integer):
+            return Rebar(
+                diameter=float(self.diameter[index]),
+                x=float(self.x[index]),
+                y=float(self.y[index]),
+                material=self.materials[self.material_index[index]],
+                relative_start_position=float(self.relative_start_position[index]),
+                relative_end_position=float(self.relative_end_position[index]),
+            )
+        return RebarSet(
+            x=self.x[index],
+            y=self.y[index],
+            diameter=self.diameter[index],
+            relative_start_position=self.relative_start_position[index],
+            relative_end_position=self.relative_end_position[index],
+            material_index=self.material_index[index],
+            materials=self.materials,
+        )
+
+    def __iter__(self) -> Iterator[Rebar]:
+        """Iterate over the rebars, creating a rebar object per bar."""
+        return (self[index] for index in range(len(self)))
+
+    def within(self, geometry: Polygon) -> np.ndarray:
+        """Check which rebars are fully inside the given geometry.
+
+        The centres of the rebars are tested against the geometry eroded by their radius, in one vectorized predicate per unique
+        diameter.
+
+        Parameters
+        ----------
+        geometry : Polygon
+            The geometry, for example of the cross-section.
+
+        Returns
+        -------
+        np.ndarray
+            For every rebar whether it is fully inside the geometry (touching the boundary is allowed).
+        """
+        inside = np.zeros(len(self), dtype=bool)
+        diameters, inverse = np.unique(self.diameter, return_inverse=True)
+        for i, diameter in enumerate(diameters):
+            mask = inverse == i
+            inside[mask] = shapely.intersects_xy(eroded_geometry(geometry, float(diameter) / 2), self.x[mask], self.y[mask])
+        return inside
+
+    @property
+    def areas(self) -> np.ndarray:
+        """Cross-sectional areas of the rebars [mm²]."""
+        return 0.25 * np.pi * self.diameter**2
+
+    @property
+    def area(self) -> MM2:
+        """Total cross-sectional area of the rebars [mm²]."""
+        return float(self.areas.sum())
+
+    @property
+    def weights_per_meter(self) -> np.ndarray:
+        """Unit weights of the rebars per meter [kg/m]."""
+        return self._densities[self.material_index] * self.areas * MM2_TO_M2
+
+    @property
+    def weight_per_meter(self) -> KG_M:
+        """Total unit weight of the rebars per meter [kg/m]."""
+        return float(self.weights_per_meter.sum())
+
+    @property
+    def present_materials(self) -> list[ReinforcementSteelMaterial]:
+        """The materials that are used by at least one of the rebars."""
+        return [self.materials[index] for index in np.unique(self.material_index)]
+
+    @property
+    def first_moment_x(self) -> MM3:
+        """First moment of area of the rebars about the x-axis [mm³]."""
+        return float(self.areas @ self.y)
+
+    @property
+    def first_moment_y(self) -> MM3:
+        """First moment of area of the rebars about the y-axis [mm³]."""
+        return float(self.areas @ self.x)
+
+    @property
+    def centroid(self) -> Point:
+        """Centroid of the areas of the rebars.
+
+        Raises
+        ------
+        ValueError
+            If the rebar set is empty.
+        """
+        if not len(self):
+            msg = "The centroid of an empty rebar set is undefined."
+            raise ValueError(msg)
+        return Point(self.first_moment_y / self.area, self.first_moment_x / self.area)
+
+    def area_moments(self, weights: np.ndarray | float = 1.0) -> np.ndarray:
+        """Weighted area moments of the rebars about the origin, including the own second moments of area of the bars.
+
+        Parameters
+        ----------
+        weights : np.ndarray | float
+            Weight of the area of every rebar, for example the modular ratio of its material [-]. Default is 1.
+
+        Returns
+        -------
+        np.ndarray
+            The area moments of the rebars, in the order of
+            :data:`blueprints.structural_sections.section_properties.AREA_MOMENTS`.
+        """
+        areas = self.areas * weights
+        own_inertia = np.pi * self.diameter**4 / 64 * weights
+        return np.array(
+            [
+                areas.sum(),
+                areas @ self.y,
+                areas @ self.x,
+                areas @ self.y**2 + own_inertia.sum(),
+                areas @ self.x**2 + own_inertia.sum(),
+                areas @ (self.x * self.y),
+            ]
+        )
+
+    def moments_of_inertia(self, x: MM = 0.0, y: MM = 0.0) -> tuple[MM4, MM4, MM4]:
+        """Moments of inertia of the rebars about the axes through the given point, including the own inertia of the bars.
+
+        Parameters
+        ----------
+        x : MM
+            x-coordinate of the origin of the axes [mm]. Default is 0.
+        y : MM
+            y-coordinate of the origin of the axes [mm]. Default is 0.
+
+        Returns
+        -------
+        tuple[MM4, MM4, MM4]
+            The moment of inertia about the x-axis, about the y-axis and the product of inertia [mm⁴].
+        """
+        areas = self.areas
+        dx = self.x - x
+        dy = self.y - y
+        own_inertia = np.pi * self.diameter**4 / 64
+        return float(areas @ dy**2 + own_inertia.sum()), float(areas @ dx**2 + own_inertia.sum()), float(areas @ (dx * dy))
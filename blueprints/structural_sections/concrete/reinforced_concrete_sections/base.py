@@ -2,22 +2,40 @@
 
 from abc import ABC
 from functools import partial
-from typing import Callable
+from typing import Callable, Literal
 
-from shapely import LineString
+import numpy as np
+from shapely import LineString, Polygon
 
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
     ReinforcementConfiguration,
 )
 from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
 from blueprints.structural_sections.cross_section_shapes import CrossSection
-from blueprints.type_alias import KG_M, KG_M3, M3_M, MM2_M
+from blueprints.structural_sections.section_properties import SectionProperties, polygon_area_moments, polygon_section_properties
+from blueprints.type_alias import KG_M, KG_M3, M3_M, MM2_M, MPA
 from blueprints.unit_conversion import M_TO_MM, MM3_TO_M3
 
 
+def _check_rebars_inside(rebar_set: RebarSet, geometry: Polygon) -> None:
+    """Check that all rebars of the set are fully inside the geometry of the cross-section.
+
+    Raises
+    ------
+    ValueError
+        If a rebar is not (fully) inside the cross-section.
+    """
+    outside = np.flatnonzero(~rebar_set.within(geometry))
+    if outside.size:
+        rebar = rebar_set[int(outside[0])]
+        msg = f"Rebar (diameter={rebar.diameter}, x={rebar.x}, y={rebar.y}) is not (fully) inside the cross-section."
+        raise ValueError(msg)
+
+
 class ReinforcedCrossSection(ABC):
     """Base class of all reinforced cross-sections."""
 
@@ -40,34 +58,64 @@ class ReinforcedCrossSection(ABC):
         self._reinforcement_configurations: list[tuple[LineString | Callable[..., LineString], ReinforcementConfiguration]] = []
         self._single_longitudinal_rebars: list[Rebar] = []
         self._stirrups: list[StirrupConfiguration] = []
+        self._rebar_set: RebarSet | None = None
+        self._rebar_set_key: tuple[int, int, int] | None = None
+        self._section_properties: dict[tuple[str, MPA | None], SectionProperties] = {}
+
+    @property
+    def rebar_set(self) -> RebarSet:
+        """Array form of all longitudinal rebars, for vectorized calculations.
+
+        The layout of the rebars is resolved on first access and cached. The cache is invalidated when rebars, reinforcement
+        configurations or stirrups (which shift the reference lines of the configurations) are added to the cross-section.
+        """
+        # the cache is also keyed by the number of inputs, so that inputs appended to the lists directly are picked up as well
+        key = (len(self._single_longitudinal_rebars), len(self._reinforcement_configurations), len(self._stirrups))
+        if self._rebar_set is None or self._rebar_set_key != key:
+            self._rebar_set = self._resolve_rebar_set()
+            self._rebar_set_key = key
+            self._section_properties.clear()
+        return self._rebar_set
 
     @property
     def longitudinal_rebars(self) -> list[Rebar]:
-        """Return a list of all longitudinal rebars."""
-        rebars: list[Rebar] = []
+        """Return a list of all longitudinal rebars, created from the (cached) rebar set."""
+        return list(self.rebar_set)
 
+    def _invalidate_longitudinal_rebars(self) -> None:
+        """Remove the cached layout of the longitudinal rebars, so that it is resolved again on next access."""
+        self._rebar_set = None
+        self._rebar_set_key = None
+        self._section_properties.clear()
+
+    def _resolve_rebar_set(self) -> RebarSet:
+        """Resolve the layout of all longitudinal rebars from the single rebars and the reinforcement configurations.
+
+        Raises
+        ------
+        ValueError
+            If a rebar is not (fully) inside the cross-section.
+        """
         # add the single longitudinal rebars
-        rebars.extend(self._single_longitudinal_rebars)
+        rebar_sets = [RebarSet.from_rebars(self._single_longitudinal_rebars)]
 
-        # add the rebars from the reinforcement configurations
+        # add the rebars from the reinforcement configurations, placed as arrays without creating rebar objects
         for line, configuration in self._reinforcement_configurations:
             if callable(line):
                 # partial function with additional arguments where the line should be called to get the LineString
                 # the implementation will be made at that level and inserted here to produce the rebars needed.
                 # this keeps this ABC class clean and allows for a lot of flexibility in the implementation of the line.
                 # this has been done to be able to add any shape of line to the cross-section (e.g. a circle or any other in the future).
-                rebars.extend(configuration.to_rebars(line=line()))
+                rebar_sets.append(configuration.to_rebar_set(line=line()))
             else:
-                rebars.extend(configuration.to_rebars(line=line))
+                rebar_sets.append(configuration.to_rebar_set(line=line))
 
-        # check if all rebars are inside the cross-section.
+        # check if all rebars are inside the cross-section, with a single vectorized check per rebar diameter.
         # needed for the case where custom configurations are added to the RCS
-        for rebar in rebars:
-            if not self.cross_section.geometry.contains(other=rebar.geometry):
-                msg = f"Rebar (diameter={rebar.diameter}, x={rebar.x}, y={rebar.y}) is not (fully) inside the cross-section."
-                raise ValueError(msg)
+        rebar_set = RebarSet.concatenate(rebar_sets)
+        _check_rebars_inside(rebar_set, self.cross_section.geometry)
 
-        return rebars
+        return rebar_set
 
     @property
     def stirrups(self) -> list[StirrupConfiguration]:
@@ -77,7 +125,7 @@ class ReinforcedCrossSection(ABC):
     @property
     def reinforcement_weight_longitudinal_bars(self) -> KG_M:
         """Total mass of the longitudinal reinforcement in the cross-section per meter length [kg/m]."""
-        return sum(rebar.weight_per_meter for rebar in self.longitudinal_rebars)
+        return self.rebar_set.weight_per_meter
 
     @property
     def reinforcement_weight_stirrups(self) -> KG_M:
@@ -92,7 +140,7 @@ class ReinforcedCrossSection(ABC):
     @property
     def reinforcement_area_longitudinal_bars(self) -> MM2_M:
         """Total area of the longitudinal reinforcement in the cross-section per meter length [mm²/m]."""
-        return sum(rebar.area for rebar in self.longitudinal_rebars)
+        return self.rebar_set.area
 
     @property
     def concrete_volume(self) -> M3_M:
@@ -105,9 +153,47 @@ class ReinforcedCrossSection(ABC):
         """Total mass of the cross-section per meter length (concrete_checks+reinforcement) [kg/m³]."""
         return self.reinforcement_weight / self.concrete_volume
 
+    @property
+    def gross_section_properties(self) -> SectionProperties:
+        """Section properties of the concrete cross-section, without taking the rebars into account."""
+        return polygon_section_properties(self.cross_section.geometry)
+
+    @property
+    def net_section_properties(self) -> SectionProperties:
+        """Section properties of the concrete cross-section minus the area of the longitudinal rebars."""
+        return self._rebar_section_properties("net")
+
+    @property
+    def transformed_section_properties(self) -> SectionProperties:
+        """Section properties of the cross-section with the longitudinal rebars transformed to concrete.
+
+        The area of every rebar replaces the concrete at its position, multiplied by the modular ratio :math:`E_s/E_c` of its material.
+        """
+        return self._rebar_section_properties("transformed")
+
+    def _rebar_section_properties(self, variant: Literal["net", "transformed"]) -> SectionProperties:
+        """Section properties of the cross-section taking the rebars into account, cached until the rebar layout changes.
+
+        The transformed section properties are also cached by the modulus of elasticity of the concrete, so that they follow a
+        change of the concrete material.
+        """
+        rebar_set = self.rebar_set
+        e_c = self.concrete_material.e_c
+        key = (variant, e_c if variant == "transformed" else None)
+        if key not in self._section_properties:
+            if variant == "net":
+                weights: np.ndarray | float = -1.0
+            else:
+                e_s = np.array([material.e_s for material in rebar_set.materials], dtype=float)
+                weights = e_s[rebar_set.material_index] / e_c - 1.0
+            geometry = self.cross_section.geometry
+            moments = polygon_area_moments(geometry) + rebar_set.area_moments(weights)
+            self._section_properties[key] = SectionProperties.from_area_moments(moments, geometry.bounds)
+        return self._section_properties[key]
+
     def get_present_steel_materials(self) -> list[ReinforcementSteelMaterial]:
         """Return a list of all present steel materials in the cross-section."""
-        materials = [rebar.material for rebar in self.longitudinal_rebars]
+        materials = self.rebar_set.present_materials
         materials.extend(stirrup.material for stirrup in self._stirrups)
         return list(set(materials))
 
@@ -133,12 +219,11 @@ class ReinforcedCrossSection(ABC):
             Newly created Rebar
         """
         # check if given diameter/coordinates are fully inside the cross-section
-        if not rebar.geometry.within(self.cross_section.geometry):
-            msg = f"Rebar (diameter={rebar.diameter}, x={rebar.x}, y={rebar.y}) is not (fully) inside the cross-section."
-            raise ValueError(msg)
+        _check_rebars_inside(RebarSet.from_rebars([rebar]), self.cross_section.geometry)
 
         # add the rebar to the list of longitudinal rebars
         self._single_longitudinal_rebars.append(rebar)
+        self._invalidate_longitudinal_rebars()
 
         return rebar
 
@@ -168,6 +253,7 @@ class ReinforcedCrossSection(ABC):
 
         # add the stirrup to the list
         self._stirrups.append(stirrup)
+        self._invalidate_longitudinal_rebars()
 
         return stirrup
 
@@ -201,3 +287,4 @@ class ReinforcedCrossSection(ABC):
 
         # add the reinforcement configuration to the list
         self._reinforcement_configurations.append((line, configuration))
+        self._invalidate_longitudinal_rebars()
@@ -0,0 +1,159 @@
+"""N-M interaction diagrams of reinforced concrete cross-sections for the ultimate limit state."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from blueprints.structural_sections.concrete.fiber_section import STEEL_MATERIAL_FACTOR, FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.type_alias import DIMENSIONLESS
+from blueprints.unit_conversion import N_TO_KN, NMM_TO_KNM
+
+
+@dataclass(frozen=True, eq=False)
+class InteractionDiagram:
+    """N-M interaction diagram of a reinforced concrete cross-section, for bending about the x-axis.
+
+    The diagram is a closed polygon of the combinations of normal force and moment that the cross-section resists at the
+    ultimate limit state. The unity check of a load is the ratio of the load and the resistance in the same direction
+    (proportional loading from the origin), which requires the diagram to be star-shaped around the origin.
+
+    Parameters
+    ----------
+    n : np.ndarray
+        Normal forces of the vertices of the diagram, positive in compression [kN].
+    m : np.ndarray
+        Moments of the vertices of the diagram, positive for compression at the upper side [kNm].
+    """
+
+    n: np.ndarray
+    m: np.ndarray
+    _scale: np.ndarray = field(init=False, repr=False)
+    _angles: np.ndarray = field(init=False, repr=False)
+    _vertices: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Sort the vertices around the origin for the unity checks."""
+        n, m = np.asarray(self.n, dtype=float), np.asarray(self.m, dtype=float)
+        if n.shape != m.shape or n.ndim != 1 or n.size < 3:
+            msg = "An interaction diagram needs normal forces and moments of the same length of at least 3 vertices."
+            raise ValueError(msg)
+        object.__setattr__(self, "n", n)
+        object.__setattr__(self, "m", m)
+
+        # the unity checks are calculated on the scaled vertices, sorted by their angle around the origin. Of the vertices with
+        # (almost) the same angle only the outer one is part of the boundary.
+        scale = np.array([np.abs(n).max() or 1.0, np.abs(m).max() or 1.0])
+        vertices = np.column_stack([n, m]) / scale
+        angles = np.round(np.arctan2(vertices[:, 1], vertices[:, 0]), 12)
+        order = np.lexsort((-np.hypot(vertices[:, 0], vertices[:, 1]), angles))
+        _, first = np.unique(angles[order], return_index=True)
+        object.__setattr__(self, "_scale", scale)
+        object.__setattr__(self, "_angles", angles[order][first])
+        object.__setattr__(self, "_vertices", vertices[order][first])
+
+    @classmethod
+    def from_cross_section(
+        cls,
+        cross_section: ReinforcedCrossSection,
+        n_planes: int = 200,
+        n_layers: int = 100,
+        steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR,
+    ) -> "InteractionDiagram":
+        """Generate the interaction diagram of a reinforced cross-section by a sweep of ultimate strain planes.
+
+        The concrete is discretized into horizontal layers. The stresses of all strain planes are integrated over all layers and
+        bars at once, see :class:`FiberSection`.
+
+        Parameters
+        ----------
+        cross_section : ReinforcedCrossSection
+            The reinforced cross-section, for example a :class:`RectangularReinforcedCrossSection`.
+        n_planes : int
+            Number of strain planes for each sign of the moment. Default is 200.
+        n_layers : int
+            Number of concrete layers over the height of the cross-section. Default is 100.
+        steel_material_factor : DIMENSIONLESS
+            [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+
+        Returns
+        -------
+        InteractionDiagram
+            The interaction diagram, with the vertices running from compression to tension for positive moments and back for
+            negative moments.
+        """
+        fiber_section = FiberSection.from_cross_section(cross_section, n_x=1, n_y=n_layers, steel_material_factor=steel_material_factor)
+        return cls.from_fiber_section(fiber_section, n_planes=n_planes)
+
+    @classmethod
+    def from_fiber_section(cls, fiber_section: FiberSection, n_planes: int = 200) -> "InteractionDiagram":
+        """Generate the interaction diagram of a discretized cross-section by a sweep of ultimate strain planes.
+
+        Use this for a cross-section of any shape discretized by :meth:`FiberSection.from_triangulation`.
+
+        Parameters
+        ----------
+        fiber_section : FiberSection
+            The discretized reinforced cross-section.
+        n_planes : int
+            Number of strain planes for each sign of the moment. Default is 200.
+
+        Returns
+        -------
+        InteractionDiagram
+            The interaction diagram, with the vertices running from compression to tension for positive moments and back for
+            negative moments.
+        """
+        positive = fiber_section.ultimate_strain_planes(angle=np.pi / 2, n_planes=n_planes)
+        negative = fiber_section.ultimate_strain_planes(angle=-np.pi / 2, n_planes=n_planes)
+        eps_0, kappa_x, kappa_y = (np.concatenate([a, b[::-1]]) for a, b in zip(positive, negative))
+        n, m_x, _ = fiber_section.forces(eps_0, kappa_x, kappa_y)
+        return cls(n=n * N_TO_KN, m=m_x * NMM_TO_KNM)
+
+    def unity_check(self, n: np.ndarray | float, m: np.ndarray | float) -> np.ndarray:
+        """Unity checks of loads, the ratio of the load and the resistance in the direction of the load.
+
+        Parameters
+        ----------
+        n : np.ndarray | float
+            Normal forces of the loads, positive in compression [kN].
+        m : np.ndarray | float
+            Moments of the loads, positive for compression at the upper side [kNm].
+
+        Returns
+        -------
+        np.ndarray
+            The unity checks of the loads [-], infinite for loads in a direction without resistance.
+        """
+        n, m = np.broadcast_arrays(np.asarray(n, dtype=float), np.asarray(m, dtype=float))
+        loads = np.column_stack([n.ravel(), m.ravel()]) / self._scale
+        angles = np.arctan2(loads[:, 1], loads[:, 0])
+
+        # the edge of the diagram crossed by the ray from the origin through the load
+        end = np.searchsorted(self._angles, angles) % len(self._angles)
+        start_vertex, end_vertex = self._vertices[end - 1], self._vertices[end]
+        edge = end_vertex - start_vertex
+        denominator = loads[:, 0] * edge[:, 1] - loads[:, 1] * edge[:, 0]
+        numerator = start_vertex[:, 0] * edge[:, 1] - start_vertex[:, 1] * edge[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # the load lies at a fraction 1 / unity check of the ray from the origin to the boundary
+            unity_checks = np.where(numerator > 0, denominator / numerator, np.inf)
+        unity_checks[~loads.any(axis=1)] = 0.0
+        return unity_checks.reshape(n.shape)
+
+    def contains(self, n: np.ndarray | float, m: np.ndarray | float) -> np.ndarray:
+        """Check whether loads are inside the interaction diagram (unity check at most 1).
+
+        Parameters
+        ----------
+        n : np.ndarray | float
+            Normal forces of the loads, positive in compression [kN].
+        m : np.ndarray | float
+            Moments of the loads, positive for compression at the upper side [kNm].
+
+        Returns
+        -------
+        np.ndarray
+            For every load whether the cross-section resists it.
+        """
+        return self.unity_check(n, m) <= 1.0
@@ -0,0 +1,375 @@
+"""N-Mx-My interaction surfaces of reinforced concrete cross-sections for biaxial bending at the ultimate limit state."""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+
+from blueprints.structural_sections.concrete.fiber_section import STEEL_MATERIAL_FACTOR, FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.type_alias import DIMENSIONLESS
+from blueprints.unit_conversion import N_TO_KN, NMM_TO_KNM
+
+# number of bins of the latitude and longitude of the directions from the origin, for looking up the triangles crossed by a ray
+_LATITUDE_BINS = 64
+_LONGITUDE_BINS = 128
+
+# tolerance of the barycentric coordinates of the intersection of a ray and a triangle, for rays through edges and vertices
+_BARYCENTRIC_TOLERANCE = 1e-9
+
+# number of levels of the normal force at which the resistances to uniaxial bending are calculated
+_RESISTANCE_LEVELS = 129
+
+# maximum number of ray-triangle tests evaluated at once, limiting the size of the intermediate arrays
+_CHUNK_SIZE = 1_000_000
+
+
+def _latitude_longitude(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Latitude (from the normal force axis) and longitude (in the plane of the moments) of directions (n, m_x, m_y) [rad]."""
+    latitude = np.arctan2(points[..., 0], np.hypot(points[..., 1], points[..., 2]))
+    longitude = np.arctan2(points[..., 2], points[..., 1])
+    return latitude, longitude
+
+
+def _ray_distances(directions: np.ndarray, triangles: np.ndarray, origins: np.ndarray | float = 0.0) -> np.ndarray:
+    """Distances along rays to triangles (Möller-Trumbore), infinite where a ray misses its triangle.
+
+    Parameters
+    ----------
+    directions : np.ndarray
+        Directions of the rays, shape (..., 3).
+    triangles : np.ndarray
+        Vertices of the triangles, shape (..., 3, 3), broadcast against the rays.
+    origins : np.ndarray | float
+        Origins of the rays, shape (..., 3). Default is the origin.
+
+    Returns
+    -------
+    np.ndarray
+        The multiples of the directions that lie on the triangles.
+    """
+    vertex = triangles[..., 0, :]
+    edge_1, edge_2 = triangles[..., 1, :] - vertex, triangles[..., 2, :] - vertex
+    relative = origins - vertex
+    p = np.cross(directions, edge_2)
+    q = np.cross(relative, edge_1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1.0 / np.einsum("...i,...i", edge_1, p)
+        u = np.einsum("...i,...i", relative, p) * inverse
+        v = np.einsum("...i,...i", directions, q) * inverse
+        t = np.einsum("...i,...i", edge_2, q) * inverse
+        # collapsed triangles give infinite or NaN barycentric coordinates, which are compared without warnings
+        hit = (u >= -_BARYCENTRIC_TOLERANCE) & (v >= -_BARYCENTRIC_TOLERANCE) & (u + v <= 1 + _BARYCENTRIC_TOLERANCE) & (t > 0)
+    return np.where(hit & np.isfinite(t), t, np.inf)
+
+
+@dataclass(frozen=True, eq=False)
+class InteractionSurface:
+    """N-Mx-My interaction surface of a reinforced concrete cross-section, stored as a closed triangulated surface.
+
+    The unity check of a load is the ratio of the load and the resistance in the same direction (proportional loading from
+    the origin). All loads are checked at once: the triangles that a ray from the origin may cross are looked up in a table of
+    the directions of the triangles, which is built once for the surface.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertices (n, m_x, m_y) of the surface, with the normal force positive in compression [kN] and the moments about the x- and
+        y-axis [kNm], shape (n_vertices, 3).
+    triangles : np.ndarray
+        Indices of the vertices of the triangles of the surface, shape (n_triangles, 3).
+    """
+
+    vertices: np.ndarray
+    triangles: np.ndarray
+    _scale: np.ndarray = field(init=False, repr=False)
+    _corners: np.ndarray = field(init=False, repr=False)
+    _normals: np.ndarray = field(init=False, repr=False)
+    _distances: np.ndarray = field(init=False, repr=False)
+    _lookup: np.ndarray = field(init=False, repr=False)
+    _bin_sizes: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the table of the triangles that rays in every bin of directions may cross."""
+        vertices, triangles = np.asarray(self.vertices, dtype=float), np.asarray(self.triangles, dtype=int)
+        if vertices.ndim != 2 or vertices.shape[1] != 3 or triangles.ndim != 2 or triangles.shape[1] != 3 or len(triangles) < 4:
+            msg = "An interaction surface needs vertices (n, m_x, m_y) and at least 4 triangles of 3 vertex indices."
+            raise ValueError(msg)
+        object.__setattr__(self, "vertices", vertices)
+        object.__setattr__(self, "triangles", triangles)
+
+        scale = np.abs(vertices).max(axis=0)
+        scale[scale == 0] = 1.0
+        corners = vertices[triangles] / scale
+        object.__setattr__(self, "_scale", scale)
+        object.__setattr__(self, "_corners", corners)
+
+        # with the rays starting at the origin, the determinant and the barycentric coordinates u and v of the Möller-Trumbore
+        # test are the dot products of the direction of the ray with three vectors of the triangle, and the distance along the
+        # ray is a constant of the triangle divided by the determinant
+        vertex, edge_1, edge_2 = corners[:, 0], corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+        normals = np.stack([np.cross(edge_2, edge_1), np.cross(vertex, edge_2), np.cross(edge_1, vertex)], axis=1)
+        object.__setattr__(self, "_normals", normals)
+        object.__setattr__(self, "_distances", np.einsum("ij,ij->i", edge_2, normals[:, 2]))
+        lookup = self._build_lookup(corners)
+        object.__setattr__(self, "_lookup", lookup)
+        object.__setattr__(self, "_bin_sizes", (lookup >= 0).sum(axis=1))
+
+    @staticmethod
+    def _build_lookup(corners: np.ndarray) -> np.ndarray:
+        """Table of the triangles of every bin of latitude and longitude, padded with -1, shape (n_bins, max_triangles_per_bin)."""
+        # the directions of an edge form a great-circle arc, which bulges towards a pole: its latitude is extreme at the point of
+        # the great circle closest to that pole, the normal force axis projected on the plane of the great circle, if that point
+        # lies on the arc. Edges through the origin have no plane and keep the latitudes of their ends.
+        latitude, longitude = _latitude_longitude(corners)
+        start, end = corners, np.roll(corners, -1, axis=1)
+        plane = np.cross(start, end)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plane = plane / np.linalg.norm(plane, axis=-1, keepdims=True)
+            closest = np.array([1.0, 0.0, 0.0]) - plane[..., :1] * plane
+            after_start = np.einsum("...i,...i", np.cross(start, closest), plane)
+            before_end = np.einsum("...i,...i", np.cross(closest, end), plane)
+            bulge, _ = _latitude_longitude(closest)
+            north = np.where((after_start >= 0) & (before_end >= 0), bulge, -np.inf)
+            south = np.where((after_start <= 0) & (before_end <= 0), -bulge, np.inf)
+        lat_min = np.minimum(latitude.min(axis=1), south.min(axis=1))
+        lat_max = np.maximum(latitude.max(axis=1), north.max(axis=1))
+        lat_step, lon_step = np.pi / _LATITUDE_BINS, 2 * np.pi / _LONGITUDE_BINS
+        lat_first = np.clip(np.floor((lat_min + np.pi / 2) / lat_step).astype(int), 0, _LATITUDE_BINS - 1)
+        lat_last = np.clip(np.floor((lat_max + np.pi / 2) / lat_step).astype(int), 0, _LATITUDE_BINS - 1)
+
+        # the longitudes covered by a triangle are the complement of the largest gap between the longitudes of its corners, as the
+        # edges project on the plane of the moments as straight lines
+        longitude = np.sort(longitude, axis=1)
+        gaps = np.diff(np.concatenate([longitude, longitude[:, :1] + 2 * np.pi], axis=1), axis=1)
+        largest = gaps.argmax(axis=1)
+        rows = np.arange(len(corners))
+        lon_start = longitude[rows, (largest + 1) % longitude.shape[1]]
+        lon_span = 2 * np.pi - gaps[rows, largest]
+
+        # triangles around the normal force axis cover all longitudes up to the pole
+        around_compression, around_tension = np.isfinite(_ray_distances(np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]])[:, np.newaxis], corners))
+        around_axis = around_compression | around_tension
+        lon_first = np.floor((lon_start + np.pi) / lon_step).astype(int)
+        lon_last = np.floor((lon_start + lon_span + np.pi) / lon_step).astype(int)
+        lon_count = np.where(around_axis, _LONGITUDE_BINS, np.minimum(lon_last - lon_first + 1, _LONGITUDE_BINS))
+        lat_first = np.where(around_tension, 0, lat_first)
+        lat_last = np.where(around_compression, _LATITUDE_BINS - 1, lat_last)
+
+        # all pairs of a bin and a triangle covering it, grouped by bin
+        lat_count = lat_last - lat_first + 1
+        counts = lat_count * lon_count
+        triangle = np.repeat(rows, counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        lat_bin = lat_first[triangle] + offset // lon_count[triangle]
+        lon_bin = (lon_first[triangle] + offset % lon_count[triangle]) % _LONGITUDE_BINS
+        bins = lat_bin * _LONGITUDE_BINS + lon_bin
+        order = np.argsort(bins, kind="stable")
+        bins, triangle = bins[order], triangle[order]
+        per_bin = np.bincount(bins, minlength=_LATITUDE_BINS * _LONGITUDE_BINS)
+        position = np.arange(len(bins)) - np.repeat(np.cumsum(per_bin) - per_bin, per_bin)
+        lookup = np.full((_LATITUDE_BINS * _LONGITUDE_BINS, per_bin.max()), -1, dtype=int)
+        lookup[bins, position] = triangle
+        return lookup
+
+    @classmethod
+    def from_cross_section(
+        cls,
+        cross_section: ReinforcedCrossSection,
+        n_angles: int = 72,
+        n_planes: int = 100,
+        n_fibers: int = 30,
+        steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR,
+    ) -> "InteractionSurface":
+        """Generate the interaction surface of a reinforced cross-section by rotating the neutral axis.
+
+        For every direction of the neutral axis the ultimate strain planes run from uniform compression to uniform tension,
+        see :meth:`FiberSection.ultimate_strain_planes`. The stresses of all planes of all directions are integrated at once.
+        The planes of neighbouring directions form the triangles of the surface.
+
+        Parameters
+        ----------
+        cross_section : ReinforcedCrossSection
+            The reinforced cross-section, for example a :class:`RectangularReinforcedCrossSection`.
+        n_angles : int
+            Number of directions of the neutral axis. Default is 72. A multiple of 4 contains the uniaxial directions.
+        n_planes : int
+            Number of strain planes for every direction. Default is 100.
+        n_fibers : int
+            Number of concrete fibers over both the width and the height of the cross-section. Default is 30.
+        steel_material_factor : DIMENSIONLESS
+            [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+
+        Returns
+        -------
+        InteractionSurface
+            The interaction surface.
+        """
+        fiber_section = FiberSection.from_cross_section(cross_section, n_x=n_fibers, n_y=n_fibers, steel_material_factor=steel_material_factor)
+        return cls.from_fiber_section(fiber_section, n_angles=n_angles, n_planes=n_planes)
+
+    @classmethod
+    def from_fiber_section(cls, fiber_section: FiberSection, n_angles: int = 72, n_planes: int = 100) -> "InteractionSurface":
+        """Generate the interaction surface of a discretized cross-section by rotating the neutral axis.
+
+        Use this for a cross-section of any shape discretized by :meth:`FiberSection.from_triangulation`.
+
+        Parameters
+        ----------
+        fiber_section : FiberSection
+            The discretized reinforced cross-section.
+        n_angles : int
+            Number of directions of the neutral axis. Default is 72. A multiple of 4 contains the uniaxial directions.
+        n_planes : int
+            Number of strain planes for every direction. Default is 100.
+
+        Returns
+        -------
+        InteractionSurface
+            The interaction surface.
+        """
+        angles = np.linspace(0.0, 2 * np.pi, n_angles, endpoint=False)
+        planes = [fiber_section.ultimate_strain_planes(angle=angle, n_planes=n_planes) for angle in angles]
+        eps_0, kappa_x, kappa_y = (np.stack(values) for values in zip(*planes))
+        n, m_x, m_y = fiber_section.forces(eps_0, kappa_x, kappa_y)
+        points = np.stack([n * N_TO_KN, m_x * NMM_TO_KNM, m_y * NMM_TO_KNM], axis=-1)
+
+        # the uniform compression and tension of the first and last plane are shared by all directions
+        rings = points[:, 1:-1].reshape(-1, 3)
+        vertices = np.vstack([points[0, 0], rings, points[0, -1]])
+        n_ring, last = n_planes - 2, len(vertices) - 1
+        index = 1 + np.arange(n_angles)[:, np.newaxis] * n_ring + np.arange(n_ring)
+        following = np.roll(index, -1, axis=0)
+        quads_first, quads_second = index[:, :-1].ravel(), following[:, :-1].ravel()
+        quads_third, quads_fourth = following[:, 1:].ravel(), index[:, 1:].ravel()
+        triangles = np.vstack(
+            [
+                np.column_stack([np.zeros(n_angles, dtype=int), following[:, 0], index[:, 0]]),
+                np.column_stack([quads_first, quads_second, quads_third]),
+                np.column_stack([quads_first, quads_third, quads_fourth]),
+                np.column_stack([index[:, -1], following[:, -1], np.full(n_angles, last)]),
+            ]
+        )
+
+        # planes that yield all fibers give the same forces; their vertices are merged and the collapsed triangles removed
+        scale = np.abs(vertices).max(axis=0)
+        _, first, inverse = np.unique(np.round(vertices / np.where(scale > 0, scale, 1.0), 9), axis=0, return_index=True, return_inverse=True)
+        triangles = inverse.ravel()[triangles]
+        distinct = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 2] != triangles[:, 0])
+        return cls(vertices=vertices[first], triangles=triangles[distinct])
+
+    def unity_check(self, n: np.ndarray | float, m_x: np.ndarray | float, m_y: np.ndarray | float) -> np.ndarray:
+        """Unity checks of loads, the ratio of the load and the resistance in the direction of the load.
+
+        Parameters
+        ----------
+        n : np.ndarray | float
+            Normal forces of the loads, positive in compression [kN].
+        m_x : np.ndarray | float
+            Moments of the loads about the x-axis [kNm].
+        m_y : np.ndarray | float
+            Moments of the loads about the y-axis [kNm].
+
+        Returns
+        -------
+        np.ndarray
+            The unity checks of the loads [-], infinite for loads in a direction without resistance.
+        """
+        n, m_x, m_y = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (n, m_x, m_y)))
+        loads = np.stack([n.ravel(), m_x.ravel(), m_y.ravel()], axis=-1) / self._scale
+        latitude, longitude = _latitude_longitude(loads)
+        lat_bin = np.clip(np.floor((latitude + np.pi / 2) / (np.pi / _LATITUDE_BINS)).astype(int), 0, _LATITUDE_BINS - 1)
+        lon_bin = np.floor((longitude + np.pi) / (2 * np.pi / _LONGITUDE_BINS)).astype(int) % _LONGITUDE_BINS
+        bins = lat_bin * _LONGITUDE_BINS + lon_bin
+
+        # the first crossing of the surface along the ray from the origin through the load. The loads are grouped by the number
+        # of triangles of their bin, so that every load is only tested against the triangles of its own bin.
+        distances = np.full(len(loads), np.inf)
+        sizes = self._bin_sizes[bins]
+        order = np.argsort(sizes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(sizes[order])) + 1
+        for group in np.split(order, boundaries) if len(order) else []:
+            size = int(sizes[group[0]])
+            for part in np.array_split(group, -(-len(group) * size // _CHUNK_SIZE)) if size else []:
+                triangles = self._lookup[bins[part], :size]
+                determinant, u, v = np.moveaxis(np.einsum("lkij,lj->lki", self._normals[triangles], loads[part]), -1, 0)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    u, v, t = u / determinant, v / determinant, self._distances[triangles] / determinant
+                hit = (u >= -_BARYCENTRIC_TOLERANCE) & (v >= -_BARYCENTRIC_TOLERANCE) & (u + v <= 1 + _BARYCENTRIC_TOLERANCE) & (t > 0)
+                distances[part] = np.where(hit, t, np.inf).min(axis=1)
+
+        # the bins hold every triangle that the rays through them can cross, so only loads whose ray misses the triangles of its bin
+        # by rounding, at the boundary of a bin or a triangle, are checked against all triangles
+        missed = np.flatnonzero(np.isinf(distances) & loads.any(axis=1))
+        chunk = max(1, _CHUNK_SIZE // len(self._corners))
+        for start in range(0, len(missed), chunk):
+            part = missed[start : start + chunk]
+            distances[part] = _ray_distances(loads[part, np.newaxis], self._corners[np.newaxis]).min(axis=1)
+
+        with np.errstate(divide="ignore"):
+            unity_checks = 1.0 / distances
+        unity_checks[~loads.any(axis=1)] = 0.0
+        return unity_checks.reshape(n.shape)
+
+    @cached_property
+    def _uniaxial_resistances(self) -> tuple[np.ndarray, np.ndarray]:
+        """Levels of the normal force and the resistances to uniaxial bending in the directions +m_x, -m_x, +m_y and -m_y."""
+        n_min, n_max = self.vertices[:, 0].min(), self.vertices[:, 0].max()
+        levels = np.linspace(n_min, n_max, _RESISTANCE_LEVELS)
+        origins = np.zeros((_RESISTANCE_LEVELS, 1, 1, 3))
+        origins[..., 0] = levels[:, np.newaxis, np.newaxis] / self._scale[0]
+        directions = np.array([[0.0, 1.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, -1.0]])[:, np.newaxis]
+
+        # the last crossing of the surface along each direction, within the section of the surface at the normal force
+        distances = _ray_distances(directions, self._corners, origins)
+        distances = np.where(np.isfinite(distances), distances, 0.0).max(axis=-1)
+        resistances = distances * self._scale[[1, 1, 2, 2]]
+        resistances[[0, -1]] = 0.0
+        return levels, resistances
+
+    def moment_resistances(
+        self, n: np.ndarray | float, m_x: np.ndarray | float = 1.0, m_y: np.ndarray | float = 1.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Resistances to uniaxial bending about the x- and the y-axis at the normal force of loads, for example for formula 5.39.
+
+        The resistances are interpolated between levels of the normal force at which the surface is cut once.
+
+        Parameters
+        ----------
+        n : np.ndarray | float
+            Normal forces of the loads, positive in compression [kN].
+        m_x : np.ndarray | float
+            Moments of the loads about the x-axis, of which only the sign is used [kNm]. Default is positive.
+        m_y : np.ndarray | float
+            Moments of the loads about the y-axis, of which only the sign is used [kNm]. Default is positive.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The resistances to bending about the x-axis and about the y-axis in the direction of the moments of the loads, as
+            absolute values [kNm]. Zero for normal forces outside the surface.
+        """
+        n, m_x, m_y = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (n, m_x, m_y)))
+        levels, resistances = self._uniaxial_resistances
+        m_rdx = np.where(m_x >= 0, *(np.interp(n, levels, resistances[:, i], left=0.0, right=0.0) for i in (0, 1)))
+        m_rdy = np.where(m_y >= 0, *(np.interp(n, levels, resistances[:, i], left=0.0, right=0.0) for i in (2, 3)))
+        return m_rdx, m_rdy
+
+    def contains(self, n: np.ndarray | float, m_x: np.ndarray | float, m_y: np.ndarray | float) -> np.ndarray:
+        """Check whether loads are inside the interaction surface (unity check at most 1).
+
+        Parameters
+        ----------
+        n : np.ndarray | float
+            Normal forces of the loads, positive in compression [kN].
+        m_x : np.ndarray | float
+            Moments of the loads about the x-axis [kNm].
+        m_y : np.ndarray | float
+            Moments of the loads about the y-axis [kNm].
+
+        Returns
+        -------
+        np.ndarray
+            For every load whether the cross-section resists it.
+        """
+        return self.unity_check(n, m_x, m_y) <= 1.0
@@ -0,0 +1,144 @@
+"""Moment-curvature diagrams of reinforced concrete cross-sections under a constant normal force."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from blueprints.structural_sections.concrete.fiber_section import STEEL_MATERIAL_FACTOR, FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.type_alias import DIMENSIONLESS, KN
+from blueprints.unit_conversion import KN_TO_N, NMM_TO_KNM
+
+
+@dataclass(frozen=True, eq=False)
+class MomentCurvatureDiagram:
+    """Moment-curvature diagrams of a reinforced concrete cross-section, for bending about the x-axis.
+
+    Every row of the diagram belongs to one level of the normal force. The moments of curvatures beyond the ultimate strains
+    of the concrete or the reinforcement, or without equilibrium with the normal force, are NaN.
+
+    Parameters
+    ----------
+    normal_force : np.ndarray
+        Normal forces of the diagrams, positive in compression [kN].
+    curvature : np.ndarray
+        Curvatures about the x-axis, positive for compression at the upper side [1/mm].
+    eps_0 : np.ndarray
+        Strains at the centroid of the cross-section for every normal force (rows) and curvature (columns) [-].
+    moment : np.ndarray
+        Moments about the x-axis for every normal force (rows) and curvature (columns) [kNm].
+    """
+
+    normal_force: np.ndarray
+    curvature: np.ndarray
+    eps_0: np.ndarray
+    moment: np.ndarray
+
+    @classmethod
+    def from_cross_section(
+        cls,
+        cross_section: ReinforcedCrossSection,
+        normal_force: np.ndarray | KN = 0.0,
+        curvature: np.ndarray | None = None,
+        n_steps: int = 100,
+        n_layers: int = 100,
+        steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR,
+    ) -> "MomentCurvatureDiagram":
+        """Calculate the moment-curvature diagrams of a reinforced cross-section for one or more normal forces.
+
+        The strain at the centroid is solved for all normal forces and curvatures at once, see
+        :meth:`FiberSection.equilibrium_strain`. The stress-strain diagrams are the design diagrams of the materials; use a
+        ``material_factor`` of the concrete and a ``steel_material_factor`` of 1.0 for the mean behaviour of the cross-section.
+
+        Parameters
+        ----------
+        cross_section : ReinforcedCrossSection
+            The reinforced cross-section, for example a :class:`RectangularReinforcedCrossSection`.
+        normal_force : np.ndarray | KN
+            Normal force or normal forces, positive in compression [kN]. Default is 0.
+        curvature : np.ndarray | None
+            Curvatures about the x-axis [1/mm]. Default is ``n_steps`` curvatures from zero to the largest ultimate curvature
+            of the normal forces.
+        n_steps : int
+            Number of curvatures if no curvatures are given. Default is 100.
+        n_layers : int
+            Number of concrete layers over the height of the cross-section. Default is 100.
+        steel_material_factor : DIMENSIONLESS
+            [:math:`γ_s`] Partial factor of the reinforcement steel [-]. Default is 1.15.
+
+        Returns
+        -------
+        MomentCurvatureDiagram
+            The moment-curvature diagrams, one row for every normal force.
+        """
+        fiber_section = FiberSection.from_cross_section(cross_section, n_x=1, n_y=n_layers, steel_material_factor=steel_material_factor)
+        return cls.from_fiber_section(fiber_section, normal_force=normal_force, curvature=curvature, n_steps=n_steps)
+
+    @classmethod
+    def from_fiber_section(
+        cls,
+        fiber_section: FiberSection,
+        normal_force: np.ndarray | KN = 0.0,
+        curvature: np.ndarray | None = None,
+        n_steps: int = 100,
+    ) -> "MomentCurvatureDiagram":
+        """Calculate the moment-curvature diagrams of a discretized cross-section for one or more normal forces.
+
+        Use this for a cross-section of any shape discretized by :meth:`FiberSection.from_triangulation`.
+
+        Parameters
+        ----------
+        fiber_section : FiberSection
+            The discretized reinforced cross-section.
+        normal_force : np.ndarray | KN
+            Normal force or normal forces, positive in compression [kN]. Default is 0.
+        curvature : np.ndarray | None
+            Curvatures about the x-axis [1/mm]. Default is ``n_steps`` curvatures from zero to the largest ultimate curvature
+            of the normal forces.
+        n_steps : int
+            Number of curvatures if no curvatures are given. Default is 100.
+
+        Returns
+        -------
+        MomentCurvatureDiagram
+            The moment-curvature diagrams, one row for every normal force.
+        """
+        normal_force = np.atleast_1d(np.asarray(normal_force, dtype=float))
+        if curvature is None:
+            # the ultimate curvature of every normal force, interpolated between the ultimate strain planes
+            eps_u, kappa_u, _ = fiber_section.ultimate_strain_planes(angle=np.pi / 2)
+            n_u = fiber_section.forces(eps_u, kappa_u)[0]
+            order = np.argsort(n_u)
+            max_curvature = np.interp(normal_force * KN_TO_N, n_u[order], kappa_u[order]).max()
+            curvature = np.linspace(0.0, max_curvature, n_steps)
+        curvature = np.asarray(curvature, dtype=float)
+
+        kappa_x = curvature[np.newaxis, :]
+        eps_0 = fiber_section.equilibrium_strain(normal_force[:, np.newaxis] * KN_TO_N, kappa_x)
+        _, m_x, _ = fiber_section.forces(eps_0, kappa_x)
+        moment = np.where(fiber_section.within_strain_limits(eps_0, kappa_x), m_x * NMM_TO_KNM, np.nan)
+        return cls(normal_force=normal_force, curvature=curvature, eps_0=eps_0, moment=moment)
+
+    @property
+    def ultimate_curvature(self) -> np.ndarray:
+        """The largest curvature within the strain limits of every normal force [1/mm], NaN if there is none.
+
+        Returns
+        -------
+        np.ndarray
+            The ultimate curvatures, one for every normal force.
+        """
+        valid = ~np.isnan(self.moment)
+        return np.where(valid.any(axis=1), np.where(valid, np.abs(self.curvature), -np.inf).max(axis=1), np.nan)
+
+    @property
+    def resisting_moment(self) -> np.ndarray:
+        """The largest moment within the strain limits of every normal force [kNm], NaN if there is none.
+
+        Returns
+        -------
+        np.ndarray
+            The resisting moments, one for every normal force.
+        """
+        valid = ~np.isnan(self.moment)
+        return np.where(valid.any(axis=1), np.where(valid, self.moment, -np.inf).max(axis=1), np.nan)
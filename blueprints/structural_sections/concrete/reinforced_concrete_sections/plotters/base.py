@@ -0,0 +1,93 @@
+"""Drawing elements shared by the plotters and renderers of reinforced rectangular cross-sections, without plotting libraries."""
+
+# ruff: noqa: F821
+from typing import TypeVar
+
+from blueprints.structural_sections.concrete.rebar import Rebar
+
+T = TypeVar("T", bound="RectangularReinforcedCrossSection")  # type: ignore[name-defined]
+
+RCS_CROSS_SECTION_COLOR = (0.827, 0.827, 0.827)
+STIRRUP_COLOR = (0.412, 0.412, 0.412)
+REBAR_COLOR = (0.717, 0.255, 0.055)
+
+
+class RectangularCrossSectionDrawing:
+    """Base of the drawings of Reinforced Rectangular Cross-Sections (RRCS), building the legend text."""
+
+    def __init__(
+        self,
+        cross_section: T,
+    ) -> None:
+        """Initialize the drawing.
+
+        Parameters
+        ----------
+        cross_section: RectangularReinforcedCrossSection
+            Reinforced cross-section to draw.
+        """
+        self.cross_section = cross_section
+
+    def legend_text(self) -> str:
+        """Creates the legend text.
+
+        Returns
+        -------
+        str
+            Legend text.
+        """
+        # start building legend
+        main_steel_material_used = self.cross_section.get_present_steel_materials()[0].name
+        legend_text = f"{self.cross_section.concrete_material.concrete_class.value} - {main_steel_material_used}"
+
+        legend_text += self._add_stirrups_to_legend()
+        legend_text += self._add_longitudinal_rebars_to_legend()
+        legend_text += self._add_rebar_configurations_to_legend()
+        legend_text += self._add_single_longitudinal_rebars_to_legend()
+        legend_text += self._add_covers_info_to_legend()
+
+        return legend_text
+
+    def _add_stirrups_to_legend(self) -> str:
+        """Adds stirrups to the legend text."""
+        stirrups_text = ""
+        if self.cross_section.stirrups:
+            stirrups_text += f"\nStirrups ({sum(stirrup.as_w for stirrup in self.cross_section.stirrups):.0f} mm²/m):"
+            for stirrup in self.cross_section.stirrups:
+                stirrups_text += (
+                    f"\n  ⌀{stirrup.diameter}-{stirrup.distance} mm (b:{stirrup.ctc_distance_legs:.0f} mm) ({stirrup.as_w:.0f} " f"mm²/m)"
+                )
+        return stirrups_text
+
+    def _add_longitudinal_rebars_to_legend(self) -> str:
+        """Add longitudinal rebars to the legend text."""
+        longitudinal_rebars = ""
+        if len(self.cross_section.rebar_set):
+            longitudinal_rebars += f"\nReinforcement ({self.cross_section.rebar_set.area:.0f} mm²/m): "
+        return longitudinal_rebars
+
+    def _add_single_longitudinal_rebars_to_legend(self) -> str:
+        """Add single longitudinal rebars to legend text."""
+        single_longitudinal_text = ""
+        if self.cross_section._single_longitudinal_rebars:  # noqa: SLF001
+            rebar_diameters: dict[float, list[Rebar]] = {}
+            for rebar in self.cross_section._single_longitudinal_rebars:  # noqa: SLF001
+                rebar_diameters.setdefault(rebar.diameter, []).append(rebar)
+            for diameter, rebars in rebar_diameters.items():
+                single_longitudinal_text += f"\n  {len(rebars)}⌀{round(diameter, 2)} ({int(sum(rebar.area for rebar in rebars))} mm²/m)"
+        return single_longitudinal_text
+
+    def _add_rebar_configurations_to_legend(self) -> str:
+        """Add rebar configurations to legend text (quantity in line)."""
+        rebar_configurations_text = ""
+        if self.cross_section._reinforcement_configurations:  # noqa: SLF001
+            for _, configuration in self.cross_section._reinforcement_configurations:  # noqa: SLF001
+                rebar_configurations_text += f"\n  {configuration!s} ({int(configuration.area)} mm²/m)"
+        return rebar_configurations_text
+
+    def _add_covers_info_to_legend(self) -> str:
+        """Add covers info to legend text."""
+        covers_text = ""
+        if self.cross_section.stirrups or len(self.cross_section.rebar_set):
+            covers_text += "\n" + self.cross_section.covers.get_covers_info()
+        return covers_text
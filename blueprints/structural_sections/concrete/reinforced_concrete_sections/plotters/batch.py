@@ -0,0 +1,155 @@
+"""Batch drawing of reinforced rectangular cross-sections into a multi-page PDF or into PNG files.
+
+The drawings are rendered on a single reused figure with the Agg canvas, without pyplot and its global state, using the drawing
+logic of :class:`RectangularCrossSectionPlotter`.
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.rectangular import RectangularCrossSectionPlotter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+_FILE_NAME_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+def draw_cross_sections(
+    cross_sections: Mapping[str, "RectangularReinforcedCrossSection"],
+    output: str | Path,
+    figsize: tuple[float, float] = (15.0, 8.0),
+    dpi: float = 100.0,
+    max_workers: int = 1,
+    **draw_options,
+) -> list[Path]:
+    """Draw cross-sections, one per page of a multi-page PDF file or one per PNG file.
+
+    Examples
+    --------
+    >>> draw_cross_sections({"B1": beam_1, "B2": beam_2}, "beams.pdf")
+    [PosixPath('beams.pdf')]
+    >>> draw_cross_sections({"B1": beam_1, "B2": beam_2}, "drawings")
+    [PosixPath('drawings/B1.png'), PosixPath('drawings/B2.png')]
+
+    Parameters
+    ----------
+    cross_sections : Mapping[str, RectangularReinforcedCrossSection]
+        The cross-sections by name. The name is the title of the drawing and, for PNG files, the name of the file.
+    output : str | Path
+        A PDF file, or a directory for the PNG files. Missing directories are created.
+    figsize : tuple[float, float]
+        Size of the pages [inch]. Default is (15, 8).
+    dpi : float
+        Resolution of the PNG files [dots per inch]. Default is 100.
+    max_workers : int
+        Number of worker processes, each drawing a contiguous part of the cross-sections on its own figure. With more than one
+        worker, a PDF is written in parts, ``<name>-1.pdf``, ``<name>-2.pdf`` and so on, in the order of the cross-sections.
+        Default is 1, which draws in the current process.
+    **draw_options : Any
+        Options of :meth:`RectangularCrossSectionPlotter.draw`, for example ``include_legend=False``.
+
+    Returns
+    -------
+    list[Path]
+        The written files.
+
+    Raises
+    ------
+    ValueError
+        If the output is a file that is not a PDF, or if the names of different cross-sections give the same name of a PNG file.
+    """
+    output = Path(output)
+    if output.suffix and output.suffix.lower() != ".pdf":
+        msg = f"The output must be a PDF file or a directory for PNG files, got '{output}'."
+        raise ValueError(msg)
+    pages = list(cross_sections.items())
+    if not output.suffix:
+        _check_unique_file_names(cross_sections)
+    if max_workers <= 1 or len(pages) <= 1:
+        return _draw_pages(pages, output, figsize, dpi, draw_options)
+
+    n_parts = min(max_workers, len(pages))
+    bounds = [len(pages) * part // n_parts for part in range(n_parts + 1)]
+    parts = [pages[start:end] for start, end in zip(bounds, bounds[1:])]
+    outputs = [output.with_name(f"{output.stem}-{part}{output.suffix}") if output.suffix else output for part in range(1, n_parts + 1)]
+    with ProcessPoolExecutor(max_workers=n_parts) as executor:
+        written = executor.map(_draw_pages, parts, outputs, repeat(figsize), repeat(dpi), repeat(draw_options))
+        return [path for paths in written for path in paths]
+
+
+def _draw_pages(
+    pages: Sequence[tuple[str, "RectangularReinforcedCrossSection"]],
+    output: Path,
+    figsize: tuple[float, float],
+    dpi: float,
+    draw_options: dict[str, Any],
+) -> list[Path]:
+    """Draw cross-sections on a single figure into a PDF file or PNG files, see :func:`draw_cross_sections`."""
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    # the drawings have no axis, hidden once as the ticks of the axis are costly to lay out on every page
+    axes.xaxis.set_visible(False)
+    axes.yaxis.set_visible(False)
+
+    if output.suffix:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with PdfPages(output) as pdf:
+            for title, cross_section in pages:
+                _draw(figure, axes, title, cross_section, draw_options)
+                pdf.savefig(figure)
+        return [output]
+
+    output.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for title, cross_section in pages:
+        _draw(figure, axes, title, cross_section, draw_options)
+        path = output / _png_file_name(title)
+        figure.savefig(path)
+        paths.append(path)
+    return paths
+
+
+def _png_file_name(title: str) -> str:
+    """Return the name of the PNG file of a cross-section, with the characters that are unsafe in file names replaced."""
+    return f"{_FILE_NAME_UNSAFE.sub('_', title)}.png"
+
+
+def _check_unique_file_names(cross_sections: Mapping[str, "RectangularReinforcedCrossSection"]) -> None:
+    """Check that no two cross-sections are drawn to the same PNG file, which would overwrite the earlier drawing.
+
+    Raises
+    ------
+    ValueError
+        If the names of different cross-sections give the same name of a PNG file.
+    """
+    titles: dict[str, str] = {}
+    for title in cross_sections:
+        file_name = _png_file_name(title)
+        if file_name in titles:
+            msg = f"The cross-sections '{titles[file_name]}' and '{title}' would both be drawn to '{file_name}'."
+            raise ValueError(msg)
+        titles[file_name] = title
+
+
+def _draw(figure: Figure, axes: Axes, title: str, cross_section: "RectangularReinforcedCrossSection", draw_options: dict[str, Any]) -> None:
+    """Draw a cross-section on the axes of the reused figure, after removing the drawing of the previous cross-section."""
+    for artist in [*axes.patches, *axes.texts, *axes.lines]:
+        artist.remove()
+    legend = axes.get_legend()
+    if legend is not None:
+        legend.remove()
+    axes.relim()
+    plotter = RectangularCrossSectionPlotter(cross_section=cross_section)
+    plotter.fig, plotter.axes = figure, [axes]
+    plotter.draw(**{"title": title} | draw_options)
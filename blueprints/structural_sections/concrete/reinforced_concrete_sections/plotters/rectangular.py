@@ -8,16 +8,17 @@ from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
 from shapely import Point
 
-from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.base import (
+    RCS_CROSS_SECTION_COLOR,
+    REBAR_COLOR,
+    STIRRUP_COLOR,
+    RectangularCrossSectionDrawing,
+)
 
 T = TypeVar("T", bound="RectangularReinforcedCrossSection")  # type: ignore[name-defined]
 
-RCS_CROSS_SECTION_COLOR = (0.827, 0.827, 0.827)
-STIRRUP_COLOR = (0.412, 0.412, 0.412)
-REBAR_COLOR = (0.717, 0.255, 0.055)
 
-
-class RectangularCrossSectionPlotter:
+class RectangularCrossSectionPlotter(RectangularCrossSectionDrawing):
     """Plotter for Reinforced Rectangular Cross-Sections (RRCS)."""
 
     def __init__(
@@ -31,7 +32,7 @@ class RectangularCrossSectionPlotter:
         cross_section: RectangularReinforcedCrossSection
             Reinforced cross-section to plot.
         """
-        self.cross_section = cross_section
+        super().__init__(cross_section=cross_section)
         self.fig: plt.Figure | None = None
         self.axes: list[Axes] = []
 
@@ -91,6 +92,76 @@ class RectangularCrossSectionPlotter:
             Matplotlib figure.
         """
         self._start_plot(figsize=figsize)
+        self.draw(
+            title=title,
+            font_size_title=font_size_title,
+            font_size_legend=font_size_legend,
+            include_legend=include_legend,
+            font_size_dimension=font_size_dimension,
+            custom_text_legend=custom_text_legend,
+            custom_text_width=custom_text_width,
+            custom_text_height=custom_text_height,
+            offset_line_width=offset_line_width,
+            offset_line_height=offset_line_height,
+            center_line_style=center_line_style,
+            axes_i=axes_i,
+        )
+        if show:
+            plt.show()  # pragma: no cover
+        assert self.fig is not None
+        return self.fig
+
+    def draw(
+        self,
+        title: str | None = None,
+        font_size_title: float = 18.0,
+        font_size_legend: float = 10.0,
+        include_legend: bool = True,
+        font_size_dimension: float = 12.0,
+        custom_text_legend: str | None = None,
+        custom_text_width: str | None = None,
+        custom_text_height: str | None = None,
+        offset_line_width: float = 1.25,
+        offset_line_height: float = 1.2,
+        center_line_style: dict[str, float | str] | None = None,
+        axes_i: int = 0,
+    ) -> Axes:
+        """Draws the cross-section on the axes of the plotter, without creating a figure.
+
+        Used by :meth:`plot`, and by batch renderers that assign their own (reused) figure and axes to ``fig`` and ``axes``.
+
+        Parameters
+        ----------
+        title: str
+            Title of the plot.
+        font_size_title: float
+            Font size of the title.
+        font_size_legend: float
+            Font size of the legend.
+        include_legend: bool
+            Include legend in the plot.
+        font_size_dimension: float
+            Font size of the dimensions.
+        custom_text_legend: str
+            Custom text for the legend.
+        custom_text_width: str
+            Custom text for the width dimension. Replaces the width of the cross-section with the custom text.
+        custom_text_height: str
+            Custom text for the height dimension. Replaces the height of the cross-section with the custom text.
+        offset_line_width: float
+            Offset of the width line.
+        offset_line_height: float
+            Offset of the height line.
+        center_line_style: dict[str, float | str] | None
+            Style of the center lines. Check matplotlib documentation for more information (Annotation-arrowprops).
+        axes_i: int
+            Index of the axes to plot on. Default is 0.
+
+        Returns
+        -------
+        Axes
+            The axes with the drawing of the cross-section.
+        """
         self._add_rectangle(axes_i=axes_i)
         self._add_center_lines(axes_i=axes_i, style=center_line_style)
         self._add_dimension_lines(
@@ -118,10 +189,7 @@ class RectangularCrossSectionPlotter:
                 font_size_legend=font_size_legend,
                 custom_legend_text=custom_text_legend,
             )
-        if show:
-            plt.show()  # pragma: no cover
-        assert self.fig is not None
-        return self.fig
+        return self.axes[axes_i]
 
     def _start_plot(self, figsize: tuple[float, float] = (15.0, 8.0)) -> tuple[float, float]:
         """Starts the plot by initialising a matplotlib plot window of the given size.
@@ -320,70 +388,6 @@ class RectangularCrossSectionPlotter:
                 )
             )
 
-    def legend_text(self) -> str:
-        """Creates the legend text.
-
-        Returns
-        -------
-        str
-            Legend text.
-        """
-        # start building legend
-        main_steel_material_used = self.cross_section.get_present_steel_materials()[0].name
-        legend_text = f"{self.cross_section.concrete_material.concrete_class.value} - {main_steel_material_used}"
-
-        legend_text += self._add_stirrups_to_legend()
-        legend_text += self._add_longitudinal_rebars_to_legend()
-        legend_text += self._add_rebar_configurations_to_legend()
-        legend_text += self._add_single_longitudinal_rebars_to_legend()
-        legend_text += self._add_covers_info_to_legend()
-
-        return legend_text
-
-    def _add_stirrups_to_legend(self) -> str:
-        """Adds stirrups to the legend text."""
-        stirrups_text = ""
-        if self.cross_section.stirrups:
-            stirrups_text += f"\nStirrups ({sum(stirrup.as_w for stirrup in self.cross_section.stirrups):.0f} mm²/m):"
-            for stirrup in self.cross_section.stirrups:
-                stirrups_text += (
-                    f"\n  ⌀{stirrup.diameter}-{stirrup.distance} mm (b:{stirrup.ctc_distance_legs:.0f} mm) ({stirrup.as_w:.0f} " f"mm²/m)"
-                )
-        return stirrups_text
-
-    def _add_longitudinal_rebars_to_legend(self) -> str:
-        """Add longitudinal rebars to the legend text."""
-        longitudinal_rebars = ""
-        if self.cross_section.longitudinal_rebars:
-            longitudinal_rebars += f"\nReinforcement ({sum(rebar.area for rebar in self.cross_section.longitudinal_rebars):.0f} mm²/m): "
-        return longitudinal_rebars
-
-    def _add_single_longitudinal_rebars_to_legend(self) -> str:
-        """Add single longitudinal rebars to legend text."""
-        single_longitudinal_text = ""
-        if self.cross_section._single_longitudinal_rebars:  # noqa: SLF001
-            rebar_diameters: dict[float, list[Rebar]] = {}
-            for rebar in self.cross_section._single_longitudinal_rebars:  # noqa: SLF001
-                rebar_diameters.setdefault(rebar.diameter, []).append(rebar)
-            for diameter, rebars in rebar_diameters.items():
-                single_longitudinal_text += f"\n  {len(rebars)}⌀{round(diameter, 2)} ({int(sum(rebar.area for rebar in rebars))} mm²/m)"
-        return single_longitudinal_text
-
-    def _add_rebar_configurations_to_legend(self) -> str:
-        """Add rebar configurations to legend text (quantity in line)."""
-        rebar_configurations_text = ""
-        if self.cross_section._reinforcement_configurations:  # noqa: SLF001
-            for _, configuration in self.cross_section._reinforcement_configurations:  # noqa: SLF001
-                rebar_configurations_text += f"\n  {configuration!s} ({int(configuration.area)} mm²/m)"
-        return rebar_configurations_text
-
-    def _add_covers_info_to_legend(self) -> str:
-        """Add covers info to legend text."""
-        covers_text = ""
-        if self.cross_section.stirrups or self.cross_section.longitudinal_rebars:
-            covers_text += "\n" + self.cross_section.covers.get_covers_info()
-        return covers_text
-
     def _add_legend(
         self,
         axes_i: int = 0,
@@ -0,0 +1,197 @@
+"""SVG renderer for Reinforced Rectangular Cross-Sections, writing the markup directly without matplotlib."""
+
+# ruff: noqa: PLR0913
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.base import (
+    RCS_CROSS_SECTION_COLOR,
+    REBAR_COLOR,
+    STIRRUP_COLOR,
+    RectangularCrossSectionDrawing,
+)
+
+PX_PER_PT = 4 / 3
+"""Pixels per point of the font sizes, as in CSS."""
+
+CHARACTER_WIDTH = 0.6
+"""Estimated width of a character relative to the font size, to fit the texts in the view box without measuring them."""
+
+LINE_HEIGHT = 1.2
+"""Height of a line of the legend relative to the font size."""
+
+MARGIN = 8.0
+"""Margin around the drawing [px]."""
+
+
+def _color(rgb: tuple[float, float, float]) -> str:
+    """Return the hexadecimal notation of a color with components between 0 and 1."""
+    return "#" + "".join(f"{round(component * 255):02x}" for component in rgb)
+
+
+class RectangularCrossSectionSvgRenderer(RectangularCrossSectionDrawing):
+    """Renderer of Reinforced Rectangular Cross-Sections (RRCS) to SVG markup, equivalent to the plot of
+    :class:`RectangularCrossSectionPlotter`.
+
+    The markup is written directly from the geometry of the cross-section, so rendering does not import matplotlib. The cross-section
+    is drawn at a fixed scale in pixels; the font sizes are in points, as in the plot.
+
+    Examples
+    --------
+    >>> svg = RectangularCrossSectionSvgRenderer(cross_section).render(title="Beam B1")
+    >>> RectangularCrossSectionSvgRenderer(cross_section).save("beam.svg", include_legend=False)
+    """
+
+    def render(
+        self,
+        title: str | None = None,
+        size: float = 400.0,
+        font_size_title: float = 18.0,
+        font_size_legend: float = 10.0,
+        include_legend: bool = True,
+        font_size_dimension: float = 12.0,
+        custom_text_legend: str | None = None,
+        custom_text_width: str | None = None,
+        custom_text_height: str | None = None,
+        offset_line_width: float = 1.25,
+        offset_line_height: float = 1.2,
+    ) -> str:
+        """Renders the cross-section to SVG markup.
+
+        Parameters
+        ----------
+        title: str
+            Title of the drawing.
+        size: float
+            Size of the largest dimension of the cross-section [px]. Default is 400.
+        font_size_title: float
+            Font size of the title [pt].
+        font_size_legend: float
+            Font size of the legend [pt].
+        include_legend: bool
+            Include legend in the drawing.
+        font_size_dimension: float
+            Font size of the dimensions [pt].
+        custom_text_legend: str
+            Custom text for the legend.
+        custom_text_width: str
+            Custom text for the width dimension. Replaces the width of the cross-section with the custom text.
+        custom_text_height: str
+            Custom text for the height dimension. Replaces the height of the cross-section with the custom text.
+        offset_line_width: float
+            Offset of the width line.
+        offset_line_height: float
+            Offset of the height line.
+
+        Returns
+        -------
+        str
+            SVG markup of the drawing.
+        """
+        cs = self.cross_section
+        scale = size / max(cs.width, cs.height)
+        half_width, half_height = cs.width / 2 * scale, cs.height / 2 * scale
+        font_title, font_legend, font_dimension = (font_size * PX_PER_PT for font_size in (font_size_title, font_size_legend, font_size_dimension))
+        font_axis = 10.0 * PX_PER_PT
+
+        # the y-axis of SVG points down, so the y-coordinates of the cross-section are negated
+        elements = [
+            f'<rect x="{-half_width:.2f}" y="{-half_height:.2f}" width="{2 * half_width:.2f}" height="{2 * half_height:.2f}" '
+            f'fill="{_color(RCS_CROSS_SECTION_COLOR)}" stroke="black"/>'
+        ]
+
+        # center lines, with the labels of the axes at their ends
+        center_x, center_y = half_width * 1.05, half_height * 1.05
+        elements.append(
+            f'<path d="M0 {center_y:.2f}V{-center_y:.2f}M{center_x:.2f} 0H{-center_x:.2f}" stroke="gray" stroke-width="1.07" '
+            'stroke-dasharray="6.8 1.7 1.07 1.7" fill="none"/>'
+        )
+        elements.append(f'<text x="0" y="{-center_y - 2:.2f}" font-size="{font_axis:.2f}" text-anchor="middle">z</text>')
+        elements.append(f'<text x="{-center_x - 2:.2f}" y="0" font-size="{font_axis:.2f}" text-anchor="end" dominant-baseline="central">y</text>')
+
+        # dimension lines
+        width_line = half_height * offset_line_width
+        height_line = -half_width * offset_line_height
+        elements.append(
+            f'<path d="M{-half_width:.2f} {width_line:.2f}H{half_width:.2f}M{height_line:.2f} {half_height:.2f}V{-half_height:.2f}" '
+            'stroke="black" fill="none" marker-start="url(#arrow)" marker-end="url(#arrow)"/>'
+        )
+        elements.append(
+            f'<text x="0" y="{width_line - 3:.2f}" font-size="{font_dimension:.2f}" text-anchor="middle">'
+            f"{escape(custom_text_width or f'{cs.width:.0f} mm')}</text>"
+        )
+        elements.append(
+            f'<text x="{height_line - 3:.2f}" y="0" font-size="{font_dimension:.2f}" text-anchor="middle" '
+            f'transform="rotate(-90 {height_line - 3:.2f} 0)">{escape(custom_text_height or f"{cs.height:.0f} mm")}</text>'
+        )
+
+        # stirrups, along their center lines with the width of their diameter
+        height_stirrups = cs.height - cs.covers.upper - cs.covers.lower
+        for stirrup in cs.stirrups:
+            min_x, min_y = stirrup.geometry.exterior.coords[0]
+            elements.append(
+                f'<rect x="{min_x * scale:.2f}" y="{-(min_y + height_stirrups - stirrup.diameter) * scale:.2f}" '
+                f'width="{stirrup.ctc_distance_legs * scale:.2f}" height="{(height_stirrups - stirrup.diameter) * scale:.2f}" '
+                f'fill="none" stroke="{_color(STIRRUP_COLOR)}" stroke-width="{stirrup.diameter * scale:.2f}"/>'
+            )
+
+        # longitudinal rebars
+        rebar_set = cs.rebar_set
+        if len(rebar_set):
+            circles = "".join(
+                f'<circle cx="{x * scale:.2f}" cy="{-y * scale:.2f}" r="{diameter / 2 * scale:.2f}"/>'
+                for x, y, diameter in zip(rebar_set.x.tolist(), rebar_set.y.tolist(), rebar_set.diameter.tolist())
+            )
+            elements.append(f'<g fill="{_color(REBAR_COLOR)}">{circles}</g>')
+
+        # view box, from the extents of the drawing with estimated extents of the texts
+        left = min(-center_x - 2 - CHARACTER_WIDTH * font_axis, height_line - 3 - font_dimension, -half_width)
+        right = center_x
+        top = -center_y - 2 - font_axis
+        bottom = max(width_line + 5, half_height)
+
+        # legend, left aligned next to the cross-section with its last line at the bottom of the cross-section
+        if include_legend:
+            lines = (custom_text_legend or self.legend_text()).split("\n")
+            line_height = LINE_HEIGHT * font_legend
+            first_line = half_height - (len(lines) - 1) * line_height
+            spans = "".join(
+                f'<tspan x="{center_x:.2f}" y="{first_line + i * line_height:.2f}">{escape(line)}</tspan>' for i, line in enumerate(lines)
+            )
+            elements.append(f'<text font-size="{font_legend:.2f}" xml:space="preserve">{spans}</text>')
+            right = max(right, center_x + CHARACTER_WIDTH * font_legend * max(len(line) for line in lines))
+            top = min(top, first_line - font_legend)
+
+        if title:
+            top -= LINE_HEIGHT * font_title
+            elements.append(
+                f'<text x="{(left + right) / 2:.2f}" y="{top + font_title:.2f}" font-size="{font_title:.2f}" text-anchor="middle">'
+                f"{escape(title)}</text>"
+            )
+
+        left, top, right, bottom = left - MARGIN, top - MARGIN, right + MARGIN, bottom + MARGIN
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{right - left:.0f}" height="{bottom - top:.0f}" '
+            f'viewBox="{left:.2f} {top:.2f} {right - left:.2f} {bottom - top:.2f}" font-family="DejaVu Sans, sans-serif">'
+            '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="8" markerHeight="8" '
+            'orient="auto-start-reverse"><path d="M0 0L10 5L0 10" fill="none" stroke="black"/></marker></defs>' + "".join(elements) + "</svg>"
+        )
+
+    def save(self, path: str | Path, **options) -> Path:
+        """Renders the cross-section and writes the SVG markup to a file.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path of the SVG file.
+        **options
+            Options of :meth:`render`.
+
+        Returns
+        -------
+        Path
+            Path of the written file.
+        """
+        path = Path(path)
+        path.write_text(self.render(**options), encoding="utf-8")
+        return path
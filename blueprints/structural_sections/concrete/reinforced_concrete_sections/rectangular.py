@@ -1,21 +1,27 @@
 """Rectangular reinforced cross-section."""
 
 # ruff: noqa: PLR0913
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from matplotlib import pyplot as plt
 from shapely import LineString, Point, Polygon
 
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.structural_sections.concrete.covers import CoversRectangular
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
-from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.rectangular import RectangularCrossSectionPlotter
-from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import ReinforcementByQuantity
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByDistance,
+    ReinforcementByQuantity,
+)
 from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
 from blueprints.structural_sections.cross_section_shapes import RectangularCrossSection
 from blueprints.type_alias import DIMENSIONLESS, MM, RATIO
 
+if TYPE_CHECKING:  # pragma: no cover
+    from matplotlib import pyplot as plt
+
+    from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.rectangular import RectangularCrossSectionPlotter
+
 
 class RectangularReinforcedCrossSection(ReinforcedCrossSection):
     """Representation of a reinforced rectangular concrete cross-section like a beam.
@@ -50,7 +56,23 @@ class RectangularReinforcedCrossSection(ReinforcedCrossSection):
         self.width = width
         self.height = height
         self.covers = covers
-        self.plotter = RectangularCrossSectionPlotter(cross_section=self)
+        self._plotter: RectangularCrossSectionPlotter | None = None
+
+    @property
+    def plotter(self) -> "RectangularCrossSectionPlotter":
+        """Plotter of the cross-section, created on first use so that matplotlib is only imported when plotting."""
+        if self._plotter is None:
+            from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.rectangular import (
+                RectangularCrossSectionPlotter,
+            )
+
+            self._plotter = RectangularCrossSectionPlotter(cross_section=self)
+        return self._plotter
+
+    @plotter.setter
+    def plotter(self, plotter: "RectangularCrossSectionPlotter") -> None:
+        """Replace the plotter of the cross-section, for example by a custom plotter."""
+        self._plotter = plotter
 
     def add_stirrup_along_edges(
         self,
@@ -319,7 +341,50 @@ class RectangularReinforcedCrossSection(ReinforcedCrossSection):
             diameter=diameter,
         )
 
-    def plot(self, *args, **kwargs) -> plt.Figure:
+    def add_longitudinal_reinforcement_by_distance(
+        self,
+        center_to_center: MM,
+        diameter: MM,
+        material: ReinforcementSteelMaterial,
+        edge: Literal["upper", "right", "lower", "left"],
+        cover: MM | None = None,
+        corner_offset: MM = 0.0,
+    ) -> None:
+        """Add longitudinal reinforcement to the cross-section based on the center-to-center distance of rebars and a given edge of the
+        cross-section.
+
+         for example: ⌀12-150 on upper edge, ⌀16-200 on lower edge, etc.
+
+        Parameters
+        ----------
+        center_to_center: MM
+            Maximum center-to-center distance between rebars [mm].
+        diameter: MM
+            Diameter of the rebars [mm].
+        material : ReinforcementSteelMaterial
+            Representation of the properties of reinforcement steel suitable for use with NEN-EN 1992-1-1.
+        edge: Literal["upper", "right", "lower", "left"]
+            Edge of the cross-section where the rebars are placed.
+        cover: MM, optional
+            Cover of the rebars [mm]. If not provided, the default cover on the given edge of the cross-section is used.
+        corner_offset: MM, optional
+            The offset of the first and last rebars from the corners of the cross-section towards the center of the cross-section [mm]. If not
+            provided, the rebars are to be placed at the corners taking into account the present covers and stirrups inside the cross-section.
+        """
+        return self.add_reinforcement_configuration(
+            line=self._get_reference_line,
+            configuration=ReinforcementByDistance(
+                diameter=diameter,
+                material=material,
+                center_to_center=center_to_center,
+            ),
+            edge=edge,
+            cover=cover,
+            corner_offset=corner_offset,
+            diameter=diameter,
+        )
+
+    def plot(self, *args, **kwargs) -> "plt.Figure":
         """Plot the cross-section. Making use of the standard plotter.
 
         If you want to use a custom plotter, use the .plotter attribute to plot the cross-section.
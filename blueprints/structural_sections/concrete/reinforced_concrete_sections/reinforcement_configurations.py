@@ -4,14 +4,22 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 import numpy as np
+import shapely
 from shapely import LineString
 
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
 from blueprints.type_alias import DIMENSIONLESS, MM, MM2, MM2_M
 from blueprints.unit_conversion import M_TO_MM
 
 
+def _points_along(line: LineString, distances: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Coordinates of the points at the given distances along the line, interpolated in a single vectorized call."""
+    coordinates = shapely.get_coordinates(shapely.line_interpolate_point(line, distances))
+    return coordinates[:, 0], coordinates[:, 1]
+
+
 @dataclass(frozen=True)
 class ReinforcementConfiguration(ABC):
     """Base class of all reinforcement configurations.
@@ -55,6 +63,25 @@ class ReinforcementConfiguration(ABC):
             List of Rebar objects.
         """
 
+    def to_rebar_set(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to an array-backed set of rebars.
+
+        Configurations that place their rebars vectorized override this method. By default, the rebars of :meth:`to_rebars` are
+        collected into a set.
+
+        Parameters
+        ----------
+        line : LineString
+            Representing the path of the reinforcement in the section.
+            Start of the line defines the first rebar of the configuration, end of the line defines the last rebar.
+
+        Returns
+        -------
+        RebarSet
+            The rebars of the configuration.
+        """
+        return RebarSet.from_rebars(self.to_rebars(line=line))
+
 
 @dataclass(kw_only=True, frozen=True)
 class ReinforcementByDistance(ReinforcementConfiguration):
@@ -105,9 +132,25 @@ class ReinforcementByDistance(ReinforcementConfiguration):
         List[Rebar]
             List of Rebar objects.
         """
-        # max(int(n), 1) is used to ensure that at least one rebar is placed
-        rebars = []
+        return list(self.to_rebar_set(line=line))
+
+    def to_rebar_set(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to an array-backed set of rebars.
+
+        The rebars are placed symmetrically on the line at the center-to-center distance, with a representative diameter that gives
+        the area of the configuration over the length of the line.
+
+        Parameters
+        ----------
+        line : LineString
+            Representing the path of the reinforcement in the section.
+            Start of the line defines the first rebar of the configuration, end of the line defines the last rebar.
 
+        Returns
+        -------
+        RebarSet
+            The rebars of the configuration.
+        """
         # define the number of rebars based on the length of the line, minimum 1
         n_rebars = line.length / self.center_to_center
         n_rebars_applied = max(int(n_rebars), 1)
@@ -120,17 +163,8 @@ class ReinforcementByDistance(ReinforcementConfiguration):
         reinforcement_area = 0.25 * np.pi * self.diameter**2 * n_rebars
         repr_diameter = np.sqrt(reinforcement_area / (0.25 * np.pi * n_rebars_applied))
 
-        for distance in distances:
-            point = line.interpolate(distance)
-            rebars.append(
-                Rebar(
-                    diameter=repr_diameter,
-                    x=point.x,
-                    y=point.y,
-                    material=self.material,
-                )
-            )
-        return rebars
+        x, y = _points_along(line, distances)
+        return RebarSet.from_arrays(x=x, y=y, diameter=repr_diameter, material=self.material)
 
     def __repr__(self) -> str:
         """Representation of the reinforcement configuration."""
@@ -191,19 +225,24 @@ class ReinforcementByQuantity(ReinforcementConfiguration):
         List[Rebar]
             List of Rebar objects.
         """
-        rebars = []
-        for index in range(self.n):
-            distance = index * line.length / (self.n - 1)
-            point = line.interpolate(distance)
-            rebars.append(
-                Rebar(
-                    diameter=self.diameter,
-                    x=point.x,
-                    y=point.y,
-                    material=ReinforcementSteelMaterial(),
-                )
-            )
-        return rebars
+        return list(self.to_rebar_set(line=line))
+
+    def to_rebar_set(self, line: LineString) -> RebarSet:
+        """Convert the reinforcement configuration to an array-backed set of rebars, evenly distributed from start to end of the line.
+
+        Parameters
+        ----------
+        line : LineString
+            Representing the path of the reinforcement in the section.
+            Start of the line defines the first rebar of the configuration, end of the line defines the last rebar.
+
+        Returns
+        -------
+        RebarSet
+            The rebars of the configuration.
+        """
+        x, y = _points_along(line, np.linspace(start=0.0, stop=line.length, num=self.n))
+        return RebarSet.from_arrays(x=x, y=y, diameter=self.diameter, material=ReinforcementSteelMaterial())
 
     def __repr__(self) -> str:
         """Representation of the reinforcement by quantity."""
@@ -0,0 +1,408 @@
+"""Optimization of the longitudinal reinforcement layout of an edge of rectangular reinforced cross-sections.
+
+The optimizer enumerates the candidate layouts of an edge (a number of bars and a diameter, or a diameter and a center-to-center
+distance), prunes them on the minimum reinforcement area (formula 9.1N for beams, 9.12N for columns) and on the minimum clear
+spacing of the bars (NEN-EN 1992-1-1 art.8.2(2)), and returns the lightest remaining layout of every cross-section. An optional
+check, for example of the moment resistance, is evaluated on the remaining layouts from light to heavy, in a process pool if
+requested.
+
+The geometry of an edge is shared by all candidates and cached between cross-sections of the same dimensions, covers and stirrups,
+so the pruning of thousands of candidates per cross-section is a handful of array operations.
+"""
+
+import copy
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Literal, TypeVar
+
+import numpy as np
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n import (
+    Form9Dot1nMinimumTensileReinforcementBeam,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_12n import (
+    Form9Dot12nMinimumLongitudinalReinforcementColumns,
+)
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.fiber_section import STEEL_MATERIAL_FACTOR
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByDistance,
+    ReinforcementByQuantity,
+)
+from blueprints.type_alias import DIMENSIONLESS, KG_M, KN, MM, MM2
+from blueprints.unit_conversion import MM2_TO_M2
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+Edge = Literal["upper", "right", "lower", "left"]
+LayoutCheck = Callable[[RectangularReinforcedCrossSection], bool]
+
+STANDARD_DIAMETERS: tuple[MM, ...] = (8.0, 10.0, 12.0, 16.0, 20.0, 25.0, 32.0)
+STANDARD_CENTER_TO_CENTER_DISTANCES: tuple[MM, ...] = tuple(float(distance) for distance in range(50, 301, 25))
+MINIMUM_CLEAR_SPACING: MM = 20.0
+
+
+@dataclass(frozen=True)
+class EdgeGeometry:
+    """Geometry of an edge of a rectangular reinforced cross-section, shared by all candidate layouts of that edge.
+
+    The reference line of bars with diameter ⌀ is ⌀ shorter than the reference line of bars with a zero diameter, and lies ⌀/2
+    further from the edge.
+
+    Parameters
+    ----------
+    length : MM
+        Length of the reference line of bars with a zero diameter [mm].
+    depth : MM
+        Distance from the opposite face of the cross-section to the reference line of bars with a zero diameter [mm].
+    width : MM
+        Width of the cross-section along the edge [mm].
+    concrete_area : MM2
+        Area of the concrete cross-section [mm²].
+    """
+
+    length: MM
+    depth: MM
+    width: MM
+    concrete_area: MM2
+
+    @classmethod
+    def from_cross_section(cls, cross_section: RectangularReinforcedCrossSection, edge: Edge) -> "EdgeGeometry":
+        """Geometry of an edge of a cross-section, cached by the dimensions, covers and stirrups of the cross-section.
+
+        Parameters
+        ----------
+        cross_section : RectangularReinforcedCrossSection
+            The reinforced cross-section.
+        edge : Literal["upper", "right", "lower", "left"]
+            Edge of the cross-section.
+
+        Returns
+        -------
+        EdgeGeometry
+            The geometry of the edge, equal to the reference lines of
+            :meth:`RectangularReinforcedCrossSection.add_longitudinal_reinforcement_by_quantity`.
+        """
+        stirrup_diameter = max((stirrup.diameter for stirrup in cross_section.stirrups), default=0.0)
+        return _edge_geometry(cross_section.width, cross_section.height, cross_section.covers, stirrup_diameter, edge)
+
+
+@lru_cache(maxsize=1024)
+def _edge_geometry(width: MM, height: MM, covers: CoversRectangular, stirrup_diameter: MM, edge: Edge) -> EdgeGeometry:
+    """Geometry of an edge of a rectangular cross-section, see :meth:`EdgeGeometry.from_cross_section`."""
+    match edge:
+        case "upper" | "lower":
+            length = width - covers.left - covers.right - 2 * stirrup_diameter
+            depth = height - getattr(covers, edge) - stirrup_diameter
+            along = width
+        case "left" | "right":
+            length = height - covers.upper - covers.lower - 2 * stirrup_diameter
+            depth = width - getattr(covers, edge) - stirrup_diameter
+            along = height
+        case _:
+            msg = f"Edge '{edge}' is not supported. Supported edges are 'upper', 'right', 'lower', and 'left'."
+            raise ValueError(msg)
+    return EdgeGeometry(length=length, depth=depth, width=along, concrete_area=width * height)
+
+
+@dataclass(frozen=True)
+class LayoutCandidate:
+    """Candidate layout of the longitudinal reinforcement of an edge of a rectangular cross-section.
+
+    Parameters
+    ----------
+    edge : Literal["upper", "right", "lower", "left"]
+        Edge of the cross-section where the rebars are placed.
+    configuration : ReinforcementByQuantity | ReinforcementByDistance
+        The reinforcement configuration of the edge.
+    area : MM2
+        Area of the reinforcement of the edge [mm²].
+    clear_spacing : MM
+        Clear distance between the bars, infinite for a single bar [mm].
+    minimum_area : MM2
+        Minimum area of the reinforcement of the edge [mm²].
+    """
+
+    edge: Edge
+    configuration: ReinforcementByQuantity | ReinforcementByDistance
+    area: MM2
+    clear_spacing: MM
+    minimum_area: MM2
+
+    @property
+    def weight_per_meter(self) -> KG_M:
+        """Mass of the reinforcement of the edge per meter length [kg/m]."""
+        return self.area * MM2_TO_M2 * self.configuration.material.density
+
+    def apply(self, cross_section: RectangularReinforcedCrossSection) -> RectangularReinforcedCrossSection:
+        """Copy of a cross-section with the layout added.
+
+        Parameters
+        ----------
+        cross_section : RectangularReinforcedCrossSection
+            The reinforced cross-section, which is not changed.
+
+        Returns
+        -------
+        RectangularReinforcedCrossSection
+            A copy of the cross-section including the layout.
+        """
+        cross_section = copy.deepcopy(cross_section)
+        configuration = self.configuration
+        if isinstance(configuration, ReinforcementByQuantity):
+            cross_section.add_longitudinal_reinforcement_by_quantity(
+                n=configuration.n, diameter=configuration.diameter, material=configuration.material, edge=self.edge
+            )
+        else:
+            cross_section.add_longitudinal_reinforcement_by_distance(
+                center_to_center=configuration.center_to_center, diameter=configuration.diameter, material=configuration.material, edge=self.edge
+            )
+        return cross_section
+
+    def __str__(self) -> str:
+        """String representation of the layout."""
+        return f"{self.configuration} ({self.edge})"
+
+
+def _check_layout(check: LayoutCheck | None, cross_section: RectangularReinforcedCrossSection, candidate: LayoutCandidate) -> bool:
+    """Evaluate a check of a cross-section with a candidate layout, at module level so that it can run in a worker process."""
+    if check is None:
+        return True
+    return bool(check(candidate.apply(cross_section)))
+
+
+@dataclass(frozen=True)
+class ReinforcementLayoutOptimizer:
+    """Optimizer of the longitudinal reinforcement of an edge of rectangular reinforced cross-sections.
+
+    Parameters
+    ----------
+    edge : Literal["upper", "right", "lower", "left"]
+        Edge of the cross-sections where the rebars are placed. Default is "lower".
+    material : ReinforcementSteelMaterial
+        Material of the rebars. Default is B500B.
+    configuration : Literal["quantity", "distance"]
+        Enumerate layouts by a number of bars (:class:`ReinforcementByQuantity`) or by a center-to-center distance
+        (:class:`ReinforcementByDistance`). Default is "quantity".
+    diameters : tuple[MM, ...]
+        Diameters of the candidate layouts [mm]. Default is 8, 10, 12, 16, 20, 25 and 32 mm.
+    max_bars : int
+        Largest number of bars of the candidate layouts by quantity. Default is 40.
+    center_to_center_distances : tuple[MM, ...]
+        Center-to-center distances of the candidate layouts by distance [mm]. Default is 50 mm to 300 mm in steps of 25 mm.
+    k_1 : DIMENSIONLESS
+        [:math:`k_1`] Factor of the bar diameter for the minimum clear spacing [-]. Default is 1.
+    k_2 : MM
+        [:math:`k_2`] Addition to the aggregate size for the minimum clear spacing [mm]. Default is 5 mm.
+    steel_material_factor : DIMENSIONLESS
+        [:math:`γ_s`] Partial factor of the reinforcement steel for :math:`f_{yd}` of formula 9.12N [-]. Default is 1.15.
+    """
+
+    edge: Edge = "lower"
+    material: ReinforcementSteelMaterial = field(default_factory=ReinforcementSteelMaterial)
+    configuration: Literal["quantity", "distance"] = "quantity"
+    diameters: tuple[MM, ...] = STANDARD_DIAMETERS
+    max_bars: int = 40
+    center_to_center_distances: tuple[MM, ...] = STANDARD_CENTER_TO_CENTER_DISTANCES
+    k_1: DIMENSIONLESS = 1.0
+    k_2: MM = 5.0
+    steel_material_factor: DIMENSIONLESS = STEEL_MATERIAL_FACTOR
+
+    def __post_init__(self) -> None:
+        """Validate the settings of the candidate layouts."""
+        if self.configuration not in ("quantity", "distance"):
+            msg = f"Configuration '{self.configuration}' is not supported. Supported configurations are 'quantity' and 'distance'."
+            raise ValueError(msg)
+        minimum_number_of_bars = 2
+        if self.max_bars < minimum_number_of_bars:
+            msg = f"The largest number of bars must be at least {minimum_number_of_bars}, got {self.max_bars}"
+            raise ValueError(msg)
+
+    def candidates(
+        self,
+        cross_section: RectangularReinforcedCrossSection,
+        required_area: MM2 = 0.0,
+        n_ed: KN | None = None,
+    ) -> list[LayoutCandidate]:
+        """Candidate layouts of the edge of a cross-section that satisfy the minimum area and clear spacing, from light to heavy.
+
+        The minimum area of a beam follows from formula 9.1N for the edge in tension. The minimum area of a column (when a normal
+        force is given) follows from formula 9.12N for the total longitudinal reinforcement, less the reinforcement already present in
+        the cross-section.
+
+        Parameters
+        ----------
+        cross_section : RectangularReinforcedCrossSection
+            The reinforced cross-section, which is not changed.
+        required_area : MM2
+            Required area of the reinforcement of the edge, for example from the design for the ultimate limit state [mm²].
+            Default is 0.
+        n_ed : KN | None
+            [:math:`N_{Ed}`] Design value of the compressive normal force of a column [kN]. Default is None for a beam.
+
+        Returns
+        -------
+        list[LayoutCandidate]
+            The feasible layouts, sorted by weight, then by number of bars and then by decreasing clear spacing.
+        """
+        return self._candidates(*self._requirements(cross_section, required_area, n_ed))
+
+    def _requirements(self, cross_section: RectangularReinforcedCrossSection, required_area: MM2, n_ed: KN | None) -> tuple:
+        """Arguments of :meth:`_candidates` of a cross-section, equal for cross-sections that share their candidates."""
+        geometry = EdgeGeometry.from_cross_section(cross_section, self.edge)
+        present_area = cross_section.reinforcement_area_longitudinal_bars if n_ed is not None else 0.0
+        concrete = cross_section.concrete_material
+        return geometry, concrete.f_ctm, concrete.aggregate_size, required_area, n_ed, present_area
+
+    def _candidates(
+        self,
+        geometry: EdgeGeometry,
+        f_ctm: float,
+        aggregate_size: MM,
+        required_area: MM2,
+        n_ed: KN | None,
+        present_area: MM2,
+    ) -> list[LayoutCandidate]:
+        """Feasible candidate layouts of an edge, see :meth:`candidates`."""
+        diameters = np.asarray(self.diameters, dtype=float)[:, np.newaxis]
+        length = geometry.length - diameters
+        bar_area = 0.25 * np.pi * diameters**2
+        if self.configuration == "quantity":
+            counts = np.arange(2, self.max_bars + 1)[np.newaxis, :]
+            area = bar_area * counts
+            clear_spacing = length / (counts - 1) - diameters
+            # the bars are placed at the reference line, so it cannot be shorter than the layout of the bars
+            clear_spacing = np.where(length > 0, clear_spacing, -np.inf)
+        else:
+            center_to_center = np.asarray(self.center_to_center_distances, dtype=float)[np.newaxis, :]
+            counts = np.maximum(np.floor(np.maximum(length, 0) / center_to_center), 1)
+            area = bar_area * np.maximum(length, 0) / center_to_center
+            # the placed bars have the diameter that gives the same area with the whole number of bars
+            placed_diameters = np.sqrt(area / (0.25 * np.pi * counts))
+            clear_spacing = np.where(counts > 1, center_to_center - placed_diameters, np.inf)
+            clear_spacing = np.where(length > 0, clear_spacing, -np.inf)
+
+        if n_ed is None:
+            effective_depth = np.maximum(geometry.depth - diameters / 2, 0.0)
+            f_yk = self.material.f_yk
+            minimum_area = Form9Dot1nMinimumTensileReinforcementBeam.batch(f_ctm=f_ctm, f_yk=f_yk, b_t=geometry.width, d=effective_depth)
+        else:
+            f_yd = self.material.f_yk / self.steel_material_factor
+            total = Form9Dot12nMinimumLongitudinalReinforcementColumns.batch(n_ed=abs(n_ed), f_yd=f_yd, a_c=geometry.concrete_area)
+            minimum_area = np.maximum(total - present_area, 0.0) * np.ones_like(diameters)
+        minimum_area = np.broadcast_to(minimum_area, diameters.shape)
+
+        # minimum clear spacing of NEN-EN 1992-1-1 art.8.2(2)
+        minimum_clear_spacing = np.maximum(self.k_1 * diameters, max(aggregate_size + self.k_2, MINIMUM_CLEAR_SPACING))
+        feasible = (area >= np.maximum(minimum_area, required_area)) & (clear_spacing >= minimum_clear_spacing)
+
+        rows, columns = np.nonzero(feasible)
+        order = np.lexsort((-clear_spacing[rows, columns], np.broadcast_to(counts, area.shape)[rows, columns], area[rows, columns]))
+        rows, columns = rows[order], columns[order]
+        return [
+            LayoutCandidate(
+                edge=self.edge,
+                configuration=self._configuration(row, column),
+                area=float(area[row, column]),
+                clear_spacing=float(clear_spacing[row, column]),
+                minimum_area=float(minimum_area[row, 0]),
+            )
+            for row, column in zip(rows.tolist(), columns.tolist())
+        ]
+
+    def _configuration(self, row: int, column: int) -> ReinforcementByQuantity | ReinforcementByDistance:
+        """Reinforcement configuration of a candidate layout, by its position in the grid of candidates."""
+        diameter = self.diameters[row]
+        if self.configuration == "quantity":
+            return ReinforcementByQuantity(diameter=diameter, material=self.material, n=column + 2)
+        return ReinforcementByDistance(diameter=diameter, material=self.material, center_to_center=self.center_to_center_distances[column])
+
+    def optimize(
+        self,
+        cross_sections: Mapping[K, RectangularReinforcedCrossSection],
+        required_area: Mapping[K, MM2] | MM2 = 0.0,
+        n_ed: Mapping[K, KN] | KN | None = None,
+        check: Mapping[K, LayoutCheck] | LayoutCheck | None = None,
+        max_workers: int = 1,
+    ) -> dict[K, LayoutCandidate | None]:
+        """Lightest feasible layout of the edge of every cross-section.
+
+        The candidates of cross-sections with the same edge geometry, concrete and requirements are enumerated once. The check is
+        evaluated on the candidates from light to heavy and stops at the first candidate that passes. With more than one worker,
+        the candidates of all cross-sections are evaluated in a process pool, in rounds of about one candidate per worker; the check
+        and the cross-sections must then be picklable, for example a module-level function or a :func:`functools.partial` of one.
+
+        Parameters
+        ----------
+        cross_sections : Mapping[K, RectangularReinforcedCrossSection]
+            The reinforced cross-sections by a key, for example the name of the element. The cross-sections are not changed.
+        required_area : Mapping[K, MM2] | MM2
+            Required area of the reinforcement of the edge by cross-section, or of all cross-sections [mm²]. Default is 0.
+        n_ed : Mapping[K, KN] | KN | None
+            [:math:`N_{Ed}`] Compressive normal force of columns by cross-section, or of all cross-sections [kN]. Cross-sections
+            without a normal force are beams. Default is None.
+        check : Mapping[K, LayoutCheck] | LayoutCheck | None
+            Check of a cross-section with a candidate layout, returning whether it passes, by cross-section or for all cross-sections.
+            Cross-sections without a check, and all cross-sections when the check is None (default), get the lightest candidate.
+        max_workers : int
+            Number of worker processes for the checks. Default is 1, which evaluates the checks in the current process.
+
+        Returns
+        -------
+        dict[K, LayoutCandidate | None]
+            The lightest feasible layout by cross-section, None when no candidate is feasible.
+        """
+        enumerated: dict[tuple, list[LayoutCandidate]] = {}
+        candidates: dict[K, list[LayoutCandidate]] = {}
+        for key, cross_section in cross_sections.items():
+            arguments = self._requirements(cross_section, _by_key(required_area, key, 0.0), _by_key(n_ed, key, None))
+            if arguments not in enumerated:
+                enumerated[arguments] = self._candidates(*arguments)
+            candidates[key] = enumerated[arguments]
+
+        if check is None:
+            return {key: next(iter(layouts), None) for key, layouts in candidates.items()}
+        return self._evaluate_checks(cross_sections, candidates, check, max_workers)
+
+    @staticmethod
+    def _evaluate_checks(
+        cross_sections: Mapping[K, RectangularReinforcedCrossSection],
+        candidates: Mapping[K, list[LayoutCandidate]],
+        check: Mapping[K, LayoutCheck] | LayoutCheck,
+        max_workers: int,
+    ) -> dict[K, LayoutCandidate | None]:
+        """Evaluate the checks of the candidates in rounds from light to heavy, until a candidate of every cross-section passes."""
+        result: dict[K, LayoutCandidate | None] = dict.fromkeys(candidates)
+        evaluated = dict.fromkeys(candidates, 0)
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        try:
+            while evaluated:
+                # spread about one candidate per worker over the cross-sections that are not resolved yet
+                per_section = max(1, -(-max_workers // len(evaluated)))
+                tasks = [(key, candidate) for key, start in evaluated.items() for candidate in candidates[key][start : start + per_section]]
+                arguments = ([_by_key(check, key, None) for key, _ in tasks], [cross_sections[key] for key, _ in tasks], [c for _, c in tasks])
+                passed: Iterable[bool] = executor.map(_check_layout, *arguments) if executor is not None else map(_check_layout, *arguments)
+
+                for (key, candidate), ok in zip(tasks, passed):
+                    if ok and result[key] is None:
+                        result[key] = candidate
+                for key in list(evaluated):
+                    evaluated[key] += per_section
+                    if result[key] is not None or evaluated[key] >= len(candidates[key]):
+                        del evaluated[key]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return result
+
+
+def _by_key(value: Mapping[K, T] | T, key: K, default: T) -> T:
+    """Value of a cross-section from a mapping by cross-section, or the same value for all cross-sections."""
+    if isinstance(value, Mapping):
+        return value.get(key, default)
+    return value
@@ -7,6 +7,7 @@ from shapely.geometry.polygon import orient
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
 from blueprints.type_alias import DIMENSIONLESS, KG_M3, MM, MM2, MM2_M, RATIO
 from blueprints.unit_conversion import M_TO_MM, MM3_TO_M3
+from blueprints.utils.id_counter import IdCounter
 
 STIRRUP_COLOR = (0.412, 0.412, 0.412)
 
@@ -43,7 +44,7 @@ class StirrupConfiguration:
         is 1 (end).
     """
 
-    counter = 1
+    _ids = IdCounter()
 
     def __init__(  # noqa: PLR0913
         self,
@@ -71,7 +72,7 @@ class StirrupConfiguration:
         self.anchorage_length = anchorage_length
         self._mandrel_diameter_factor = mandrel_diameter_factor
         self.based_on_cover = based_on_cover
-        self._id = StirrupConfiguration.counter
+        self._id = StirrupConfiguration._ids.next()
         self._validation_relative_position(relative_position=relative_start_position)
         self._validation_relative_position(relative_position=relative_end_position)
         self._relative_start_position = relative_start_position
@@ -79,7 +80,11 @@ class StirrupConfiguration:
         self.n_vertices_used = n_vertices_used
         self._cover_used = cover_used
         self._amount_of_legs = 2
-        StirrupConfiguration.counter += 1
+
+    @property
+    def id(self) -> int:
+        """Unique ID of the stirrup configuration, also when configurations are created concurrently in threads or processes."""
+        return self._id
 
     @property
     def mandrel_diameter_factor(self) -> DIMENSIONLESS:
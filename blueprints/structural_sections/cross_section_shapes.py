@@ -2,6 +2,7 @@
 
 import math
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Protocol
 
 from shapely import Point, Polygon
@@ -46,10 +47,10 @@ class CircularCrossSection:
         """
         return self.diameter / 2.0
 
-    @property
+    @cached_property
     def geometry(self) -> Polygon:
         """
-        Shapely Polygon representing the circular cross-section.
+        Shapely Polygon representing the circular cross-section, created on first access.
 
         Returns
         -------
@@ -129,11 +130,11 @@ class RectangularCrossSection:
     x: MM = 0
     y: MM = 0
 
-    @property
+    @cached_property
     def geometry(self) -> Polygon:
         """
-        Shapely Polygon representing the rectangular cross-section. Defines the coordinates of the rectangle based on width, height, x,
-        and y. Counter-clockwise order.
+        Shapely Polygon representing the rectangular cross-section, created on first access. Defines the coordinates of the rectangle
+        based on width, height, x, and y. Counter-clockwise order.
 
         Returns
         -------
@@ -163,7 +164,7 @@ class RectangularCrossSection:
         MM2
             The area of the rectangle.
         """
-        return self.geometry.area
+        return self.width * self.height
 
     @property
     def perimeter(self) -> MM:
@@ -175,7 +176,7 @@ class RectangularCrossSection:
         MM
             The perimeter of the rectangle.
         """
-        return self.geometry.length
+        return 2 * (self.width + self.height)
 
     @property
     def centroid(self) -> Point:
@@ -187,7 +188,7 @@ class RectangularCrossSection:
         Point
             The centroid of the rectangle.
         """
-        return self.geometry.centroid
+        return Point(self.x, self.y)
 
     @property
     def vertices(self) -> list[Point]:
@@ -202,6 +203,188 @@ class RectangularCrossSection:
         return [Point(x, y) for x, y in self.geometry.exterior.coords]
 
 
+@dataclass(frozen=True)
+class PolygonCrossSection:
+    """
+    Class to represent a cross-section of any polygonal shape, possibly with holes, for example a T-, L-, I- or hollow section.
+
+    Parameters
+    ----------
+    polygon : Polygon
+        The shapely Polygon of the cross-section, with the holes as its interiors [mm].
+    """
+
+    polygon: Polygon
+
+    def __post_init__(self) -> None:
+        """Post-initialization to validate the polygon."""
+        if not self.polygon.is_valid or self.polygon.area <= 0:
+            msg = f"Polygon must be a valid polygon with a positive area, but got {self.polygon.wkt}"
+            raise ValueError(msg)
+
+    @classmethod
+    def t_shape(cls, width_flange: MM, thickness_flange: MM, width_web: MM, height: MM) -> "PolygonCrossSection":
+        """
+        T-shaped cross-section, with the flange at the upper side. The center of the bounding box is at the origin.
+
+        Parameters
+        ----------
+        width_flange : MM
+            The width of the flange [mm].
+        thickness_flange : MM
+            The thickness of the flange [mm].
+        width_web : MM
+            The width of the web [mm].
+        height : MM
+            The total height of the cross-section [mm].
+
+        Returns
+        -------
+        PolygonCrossSection
+            The T-shaped cross-section.
+        """
+        top, bottom, flange, web = height / 2, -height / 2, width_flange / 2, width_web / 2
+        underside = top - thickness_flange
+        right = [(web, bottom), (web, underside), (flange, underside), (flange, top)]
+        return cls(Polygon([(-x, y) for x, y in reversed(right)] + right))
+
+    @classmethod
+    def l_shape(cls, width: MM, height: MM, thickness_flange: MM, thickness_web: MM) -> "PolygonCrossSection":
+        """
+        L-shaped cross-section, with the web at the left side and the flange at the lower side. The center of the bounding box is
+        at the origin.
+
+        Parameters
+        ----------
+        width : MM
+            The total width of the cross-section [mm].
+        height : MM
+            The total height of the cross-section [mm].
+        thickness_flange : MM
+            The thickness of the (horizontal) flange [mm].
+        thickness_web : MM
+            The thickness of the (vertical) web [mm].
+
+        Returns
+        -------
+        PolygonCrossSection
+            The L-shaped cross-section.
+        """
+        left, right, bottom, top = -width / 2, width / 2, -height / 2, height / 2
+        inner_x, inner_y = left + thickness_web, bottom + thickness_flange
+        return cls(Polygon([(left, bottom), (right, bottom), (right, inner_y), (inner_x, inner_y), (inner_x, top), (left, top)]))
+
+    @classmethod
+    def i_shape(cls, width: MM, height: MM, thickness_flanges: MM, thickness_web: MM) -> "PolygonCrossSection":
+        """
+        Symmetric I-shaped cross-section. The center of the bounding box is at the origin.
+
+        Parameters
+        ----------
+        width : MM
+            The width of the flanges [mm].
+        height : MM
+            The total height of the cross-section [mm].
+        thickness_flanges : MM
+            The thickness of the flanges [mm].
+        thickness_web : MM
+            The thickness of the web [mm].
+
+        Returns
+        -------
+        PolygonCrossSection
+            The I-shaped cross-section.
+        """
+        x_flange, x_web = width / 2, thickness_web / 2
+        y_outer, y_inner = height / 2, height / 2 - thickness_flanges
+        lower = [(-x_flange, -y_outer), (x_flange, -y_outer), (x_flange, -y_inner), (x_web, -y_inner)]
+        upper = [(x_web, y_inner), (x_flange, y_inner), (x_flange, y_outer), (-x_flange, y_outer), (-x_flange, y_inner), (-x_web, y_inner)]
+        return cls(Polygon([*lower, *upper, (-x_web, -y_inner), (-x_flange, -y_inner)]))
+
+    @classmethod
+    def hollow_rectangle(cls, width: MM, height: MM, thickness: MM) -> "PolygonCrossSection":
+        """
+        Hollow rectangular (box) cross-section with walls of the same thickness. The center is at the origin.
+
+        Parameters
+        ----------
+        width : MM
+            The outer width of the cross-section [mm].
+        height : MM
+            The outer height of the cross-section [mm].
+        thickness : MM
+            The thickness of the walls [mm].
+
+        Returns
+        -------
+        PolygonCrossSection
+            The hollow cross-section.
+        """
+        outer = RectangularCrossSection(width=width, height=height).geometry.exterior.coords
+        inner = RectangularCrossSection(width=width - 2 * thickness, height=height - 2 * thickness).geometry.exterior.coords
+        return cls(Polygon(outer, holes=[inner]))
+
+    @property
+    def geometry(self) -> Polygon:
+        """
+        Shapely Polygon representing the cross-section.
+
+        Returns
+        -------
+        Polygon
+            The shapely Polygon of the cross-section.
+        """
+        return self.polygon
+
+    @property
+    def area(self) -> MM2:
+        """
+        Calculate the area of the cross-section, without the holes.
+
+        Returns
+        -------
+        MM2
+            The area of the cross-section.
+        """
+        return self.polygon.area
+
+    @property
+    def perimeter(self) -> MM:
+        """
+        Calculate the perimeter of the cross-section, including the perimeters of the holes.
+
+        Returns
+        -------
+        MM
+            The perimeter of the cross-section.
+        """
+        return self.polygon.length
+
+    @property
+    def centroid(self) -> Point:
+        """
+        Get the centroid of the cross-section.
+
+        Returns
+        -------
+        Point
+            The centroid of the cross-section.
+        """
+        return self.polygon.centroid
+
+    @property
+    def vertices(self) -> list[Point]:
+        """
+        Vertices of the outer boundary of the cross-section.
+
+        Returns
+        -------
+        list[Point]
+            The vertices of the cross-section.
+        """
+        return [Point(x, y) for x, y in self.polygon.exterior.coords]
+
+
 class CrossSection(Protocol):
     """Protocol for a cross-section."""
 
@@ -0,0 +1,182 @@
+"""Analytic section properties of cross-sections, calculated from the vertices of their polygons with Green's theorem."""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from shapely import Polygon
+
+from blueprints.type_alias import MM, MM2, MM3, MM4
+
+# order of the area moments about the origin, as returned by ring_area_moments and polygon_area_moments
+AREA_MOMENTS = ("area", "first_moment_x", "first_moment_y", "second_moment_xx", "second_moment_yy", "product_moment_xy")
+
+
+def ring_area_moments(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Area moments about the origin of the area enclosed by a ring of vertices, using the shoelace (Green's) formulas.
+
+    The moments are positive for a counter-clockwise ring and negative for a clockwise ring.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        x-coordinates of the vertices of the ring [mm]. The ring may or may not repeat the first vertex at the end.
+    y : np.ndarray
+        y-coordinates of the vertices of the ring [mm].
+
+    Returns
+    -------
+    np.ndarray
+        The area [mm²], the first moments about the x- and y-axis [mm³], the second moments about the x- and y-axis and the
+        product moment [mm⁴], see ``AREA_MOMENTS``.
+    """
+    x0, y0 = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    cross = x0 * y1 - x1 * y0
+    return np.array(
+        [
+            cross.sum() / 2,
+            ((y0 + y1) @ cross) / 6,
+            ((x0 + x1) @ cross) / 6,
+            ((y0**2 + y0 * y1 + y1**2) @ cross) / 12,
+            ((x0**2 + x0 * x1 + x1**2) @ cross) / 12,
+            ((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) @ cross) / 24,
+        ]
+    )
+
+
+def _counter_clockwise_ring_area_moments(coords: object) -> np.ndarray:
+    """Area moments of a ring of shapely coordinates, counter-clockwise regardless of the orientation of the ring."""
+    xy = np.asarray(coords, dtype=float)
+    moments = ring_area_moments(xy[:, 0], xy[:, 1])
+    return -moments if moments[0] < 0 else moments
+
+
+def polygon_area_moments(polygon: Polygon) -> np.ndarray:
+    """Area moments about the origin of a polygon, subtracting its holes.
+
+    Parameters
+    ----------
+    polygon : Polygon
+        The polygon, with its rings in any orientation.
+
+    Returns
+    -------
+    np.ndarray
+        The area moments of the polygon, see ``AREA_MOMENTS``.
+    """
+    moments = _counter_clockwise_ring_area_moments(polygon.exterior.coords)
+    for interior in polygon.interiors:
+        moments -= _counter_clockwise_ring_area_moments(interior.coords)
+    return moments
+
+
+@dataclass(frozen=True)
+class SectionProperties:
+    """Section properties of a cross-section, with the second moments of area about the centroidal axes.
+
+    Parameters
+    ----------
+    area : MM2
+        Area of the cross-section [mm²].
+    centroid_x : MM
+        x-coordinate of the centroid [mm].
+    centroid_y : MM
+        y-coordinate of the centroid [mm].
+    i_xx : MM4
+        Second moment of area about the centroidal axis parallel to the x-axis [mm⁴].
+    i_yy : MM4
+        Second moment of area about the centroidal axis parallel to the y-axis [mm⁴].
+    i_xy : MM4
+        Product moment of area about the centroidal axes [mm⁴].
+    bounds : tuple[MM, MM, MM, MM]
+        Bounds (min x, min y, max x, max y) of the outer fibres of the cross-section [mm].
+    """
+
+    area: MM2
+    centroid_x: MM
+    centroid_y: MM
+    i_xx: MM4
+    i_yy: MM4
+    i_xy: MM4
+    bounds: tuple[MM, MM, MM, MM]
+
+    @classmethod
+    def from_area_moments(cls, moments: np.ndarray, bounds: tuple[MM, MM, MM, MM]) -> "SectionProperties":
+        """Create the section properties from the area moments about the origin.
+
+        Parameters
+        ----------
+        moments : np.ndarray
+            The area moments about the origin, see ``AREA_MOMENTS``.
+        bounds : tuple[MM, MM, MM, MM]
+            Bounds (min x, min y, max x, max y) of the outer fibres of the cross-section [mm].
+
+        Raises
+        ------
+        ValueError
+            If the area is not positive.
+        """
+        area, first_moment_x, first_moment_y, second_moment_xx, second_moment_yy, product_moment_xy = (float(moment) for moment in moments)
+        if area <= 0:
+            msg = f"The area of a cross-section must be positive, but got {area}"
+            raise ValueError(msg)
+        centroid_x = first_moment_y / area
+        centroid_y = first_moment_x / area
+        return cls(
+            area=area,
+            centroid_x=centroid_x,
+            centroid_y=centroid_y,
+            i_xx=second_moment_xx - area * centroid_y**2,
+            i_yy=second_moment_yy - area * centroid_x**2,
+            i_xy=product_moment_xy - area * centroid_x * centroid_y,
+            bounds=(float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3])),
+        )
+
+    @property
+    def section_modulus_x_upper(self) -> MM3:
+        """Elastic section modulus about the centroidal x-axis, for the upper outer fibre [mm³]."""
+        return self.i_xx / (self.bounds[3] - self.centroid_y)
+
+    @property
+    def section_modulus_x_lower(self) -> MM3:
+        """Elastic section modulus about the centroidal x-axis, for the lower outer fibre [mm³]."""
+        return self.i_xx / (self.centroid_y - self.bounds[1])
+
+    @property
+    def section_modulus_y_right(self) -> MM3:
+        """Elastic section modulus about the centroidal y-axis, for the right outer fibre [mm³]."""
+        return self.i_yy / (self.bounds[2] - self.centroid_x)
+
+    @property
+    def section_modulus_y_left(self) -> MM3:
+        """Elastic section modulus about the centroidal y-axis, for the left outer fibre [mm³]."""
+        return self.i_yy / (self.centroid_x - self.bounds[0])
+
+    @property
+    def radius_of_gyration_x(self) -> MM:
+        """Radius of gyration about the centroidal x-axis [mm]."""
+        return math.sqrt(self.i_xx / self.area)
+
+    @property
+    def radius_of_gyration_y(self) -> MM:
+        """Radius of gyration about the centroidal y-axis [mm]."""
+        return math.sqrt(self.i_yy / self.area)
+
+
+@lru_cache(maxsize=256)
+def polygon_section_properties(polygon: Polygon) -> SectionProperties:
+    """Section properties of a polygon, cached by polygon.
+
+    Parameters
+    ----------
+    polygon : Polygon
+        The polygon of the cross-section.
+
+    Returns
+    -------
+    SectionProperties
+        The section properties of the polygon.
+    """
+    return SectionProperties.from_area_moments(polygon_area_moments(polygon), polygon.bounds)
@@ -0,0 +1,73 @@
+"""Thread-safe counters of object IDs that are unique across processes."""
+
+import os
+import sys
+import threading
+import weakref
+
+PROCESS_ID_SHIFT = 32
+"""Bits of the IDs of a child process reserved for its own count; the higher bits hold the process ID."""
+
+_counters: "weakref.WeakSet[IdCounter]" = weakref.WeakSet()
+
+
+class IdCounter:
+    """Thread-safe counter of the IDs of objects, unique across the processes of a process tree.
+
+    The main process counts up from the start value, so its IDs are small consecutive integers. A child process, forked or
+    spawned (for example a worker of a process pool), counts in its own range: its IDs are offset by its process ID shifted by
+    :data:`PROCESS_ID_SHIFT` bits, so they do not collide with the IDs of the main process or of other running child processes.
+
+    Parameters
+    ----------
+    start : int
+        The first ID of the counter. Default is 1.
+
+    Examples
+    --------
+    >>> ids = IdCounter()
+    >>> ids.next(), ids.next()
+    (1, 2)
+    """
+
+    def __init__(self, start: int = 1) -> None:
+        """Initialize the counter."""
+        self._start = start
+        self._reset(child=_is_child_process())
+        _counters.add(self)
+
+    def _reset(self, child: bool) -> None:
+        """Start counting from the start value, in the range of the current process."""
+        # a new lock, as a fork copies the lock in the state of the moment of the fork, possibly held by another thread
+        self._lock = threading.Lock()
+        self._next = self._start
+        self._offset = os.getpid() << PROCESS_ID_SHIFT if child else 0
+
+    def next(self) -> int:
+        """Return the next ID.
+
+        Returns
+        -------
+        int
+            An ID that the counter did not return before, in any process of the process tree.
+        """
+        with self._lock:
+            value = self._next
+            self._next += 1
+        return self._offset + value
+
+
+def _is_child_process() -> bool:
+    """Whether the current process is a child process of multiprocessing, without importing multiprocessing."""
+    multiprocessing = sys.modules.get("multiprocessing")
+    return multiprocessing is not None and multiprocessing.parent_process() is not None
+
+
+def _reset_counters_in_child() -> None:
+    """Move all counters of a forked child process into the range of the child."""
+    for counter in list(_counters):
+        counter._reset(child=True)  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_counters_in_child)
@@ -1,5 +1,10 @@
 """Module for validation actions inside of Blueprints."""
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
 
 class LessOrEqualToZeroError(Exception):
     """Raised when a value is less than or equal to zero."""
@@ -36,13 +41,39 @@ class ListsNotSameLengthError(Exception):
         super().__init__(message)
 
 
-def raise_if_less_or_equal_to_zero(**kwargs: float) -> None:
+def _first_invalid_value(value: "float | np.ndarray", invalid: "bool | np.ndarray") -> float | None:
+    """Return the (first) value that violates a validation, or None if the validation is satisfied.
+
+    Parameters
+    ----------
+    value : float | np.ndarray
+        The value(s) that have been validated.
+    invalid : bool | np.ndarray
+        The outcome of the violated condition for the given value(s), element-wise in case of arrays.
+
+    Returns
+    -------
+    float | None
+        The first value for which the condition is violated, None if there is no such value.
+    """
+    if isinstance(value, int | float):
+        return value if invalid else None
+    # numpy is only imported when arrays are validated, it is already loaded at that point
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        return value.flat[np.argmax(invalid)] if np.any(invalid) else None
+    return value if invalid else None
+
+
+def raise_if_less_or_equal_to_zero(**kwargs: "float | np.ndarray") -> None:
     """Raise a LessOrEqualToZeroError if any of the given keyword arguments are less than or equal to zero.
 
     Parameters
     ----------
-    **kwargs : dict[str, float]
+    **kwargs : dict[str, float | np.ndarray]
         A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        Arrays are validated element-wise, the first invalid element is reported.
 
     Raises
     ------
@@ -51,17 +82,18 @@ def raise_if_less_or_equal_to_zero(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value <= 0:
-            raise LessOrEqualToZeroError(value_name=key, value=value)
+        if (invalid_value := _first_invalid_value(value, value <= 0)) is not None:
+            raise LessOrEqualToZeroError(value_name=key, value=invalid_value)
 
 
-def raise_if_negative(**kwargs: float) -> None:
+def raise_if_negative(**kwargs: "float | np.ndarray") -> None:
     """Raise a NegativeValueError if any of the given keyword arguments are negative.
 
     Parameters
     ----------
-    **kwargs : dict[str, float]
+    **kwargs : dict[str, float | np.ndarray]
         A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        Arrays are validated element-wise, the first invalid element is reported.
 
     Raises
     ------
@@ -70,17 +102,18 @@ def raise_if_negative(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value < 0:
-            raise NegativeValueError(value_name=key, value=value)
+        if (invalid_value := _first_invalid_value(value, value < 0)) is not None:
+            raise NegativeValueError(value_name=key, value=invalid_value)
 
 
-def raise_if_greater_than_90(**kwargs: float) -> None:
+def raise_if_greater_than_90(**kwargs: "float | np.ndarray") -> None:
     """Raise a GreaterThan90Error if any of the given keyword arguments are greater than 90.
 
     Parameters
     ----------
-    **kwargs : dict[str, float]
+    **kwargs : dict[str, float | np.ndarray]
         A dictionary of keyword arguments where keys are parameter names, and values are the values to validate.
+        Arrays are validated element-wise, the first invalid element is reported.
 
     Raises
     ------
@@ -89,8 +122,8 @@ def raise_if_greater_than_90(**kwargs: float) -> None:
 
     """
     for key, value in kwargs.items():
-        if value > 90:
-            raise GreaterThan90Error(value_name=key, value=value)
+        if (invalid_value := _first_invalid_value(value, value > 90)) is not None:
+            raise GreaterThan90Error(value_name=key, value=invalid_value)
 
 
 def raise_if_lists_differ_in_length(**kwargs: list) -> None:
@@ -15,6 +15,9 @@ from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_
     Table4Dot1ExposureClasses,
 )
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_3 import Table4Dot3ConcreteStructuralClass
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
 from blueprints.codes.eurocode.structural_class import ConcreteStructuralClassBase
 from blueprints.materials.concrete import ConcreteMaterial
 from blueprints.type_alias import MM
@@ -260,3 +263,43 @@ class TestNominalConcreteCover:
         )
 
         assert str(nominal_concrete_cover) == "Nominal concrete cover according to art. 4.4.1 = 110.0 mm"
+
+    def test_sub_calculations_are_evaluated_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the value and latex representation reuse the sub-calculations of the instance."""
+        evaluate = Table4Dot4nMinimumCoverDurabilityReinforcementSteel._evaluate  # noqa: SLF001
+        calls = []
+
+        def counting_evaluate(*args, **kwargs) -> MM:
+            calls.append(args or kwargs)
+            return evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(Table4Dot4nMinimumCoverDurabilityReinforcementSteel, "_evaluate", staticmethod(counting_evaluate))
+        nominal_concrete_cover = NominalConcreteCover(
+            reinforcement_diameter=25,
+            nominal_max_aggregate_size=32,
+            constants=NominalConcreteCoverConstants2011C2(),
+            structural_class=structural_class,
+            carbonation=Carbonation.XC1,
+        )
+        nominal_concrete_cover.value()
+        nominal_concrete_cover.latex()
+
+        assert len(calls) == 1
+        assert nominal_concrete_cover.c_nom() is nominal_concrete_cover.c_nom()
+
+    def test_from_records(self) -> None:
+        """Test that the covers created from records equal the individually created covers and share identical sub-results."""
+        records = [
+            {"reinforcement_diameter": 12, "structural_class": 4, "carbonation": "XC3"},
+            {"reinforcement_diameter": 16, "structural_class": 4, "carbonation": "XC3"},
+            {"reinforcement_diameter": 16, "structural_class": 5, "carbonation": "XC3", "chloride": "XD1"},
+        ]
+        shared = {"nominal_max_aggregate_size": 32, "constants": NominalConcreteCoverConstants2011C2()}
+
+        covers = NominalConcreteCover.from_records(records, **shared)
+
+        assert covers == [NominalConcreteCover(**record, **shared) for record in records]
+        assert [cover.value() for cover in covers] == [NominalConcreteCover(**record, **shared).value() for record in records]
+        assert covers[0].c_min_dur() is covers[1].c_min_dur()
+        assert covers[1].c_min_dur() is not covers[2].c_min_dur()
+        assert covers[0].c_min_b() is not covers[1].c_min_b()
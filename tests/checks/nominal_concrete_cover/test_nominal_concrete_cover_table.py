@@ -0,0 +1,95 @@
+"""Testing the batch calculation of nominal concrete cover tables of NEN-EN 1992-1-1."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.nominal_concrete_cover.constants.constants_nen_en_1992_1_1_c2_2011 import NominalConcreteCoverConstants2011C2
+from blueprints.checks.nominal_concrete_cover.definitions import AbrasionClass, CastingSurface
+from blueprints.checks.nominal_concrete_cover.nominal_concrete_cover import NominalConcreteCover
+from blueprints.checks.nominal_concrete_cover.nominal_concrete_cover_table import nominal_concrete_cover_table
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import Carbonation, Chloride
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_2 import Table4Dot2MinimumCoverWithRegardToBond
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
+    Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+)
+
+CONSTANTS = NominalConcreteCoverConstants2011C2()
+GRID = {
+    "reinforcement_diameter": [8, 16, 32, 40],
+    "nominal_max_aggregate_size": [16, 40],
+    "structural_class": [1, 4, 6],
+    "carbonation": ["XC1", Carbonation.XC4],
+    "chloride": ["NA", "XD1", Chloride.XD3],
+    "chloride_seawater": ["NA", "XS2"],
+    "delta_c_dur_gamma": [0, 5],
+    "casting_surface": list(CastingSurface),
+    "uneven_surface": [False, True],
+    "abrasion_class": [AbrasionClass.NA, AbrasionClass.XM2],
+}
+
+
+class TestNominalConcreteCoverTable:
+    """Validation for the batch calculation of nominal concrete cover tables."""
+
+    def test_matches_nominal_concrete_cover(self) -> None:
+        """Test that every row of the table equals the nominal concrete cover of its parameters."""
+        table = nominal_concrete_cover_table(CONSTANTS, **GRID)
+
+        assert len(table) == np.prod([len(options) for options in GRID.values()])
+        for row in table.sample(n=250, random_state=1992).to_dict("records"):
+            results = {name: row.pop(name) for name in ["c_min_b", "c_min_dur", "c_min", "c_nom", "value"]}
+            cover = NominalConcreteCover(constants=CONSTANTS, **row)
+            assert results["c_min_b"] == pytest.approx(cover.c_min_b())
+            assert results["c_min_dur"] == pytest.approx(cover.c_min_dur())
+            assert results["c_min"] == pytest.approx(cover.c_min())
+            assert results["c_nom"] == pytest.approx(cover.c_nom())
+            assert results["value"] == pytest.approx(cover.value())
+
+    def test_single_values_and_defaults(self) -> None:
+        """Test that single values are used for all rows and missing optional parameters get their default value."""
+        table = nominal_concrete_cover_table(CONSTANTS, reinforcement_diameter=[12, 16], nominal_max_aggregate_size=16, structural_class=4)
+
+        assert len(table) == 2
+        assert (table["carbonation"] == Carbonation.NA).all()
+        assert (table["casting_surface"] == CastingSurface.PERMANENTLY_EXPOSED).all()
+        assert table["value"].tolist() == [NominalConcreteCover(diameter, 16, CONSTANTS, 4).value() for diameter in [12, 16]]
+
+    def test_table_4_4n_is_looked_up(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that table 4.4N is looked up by array indexing instead of being evaluated per row."""
+        calls = []
+        evaluate = Table4Dot4nMinimumCoverDurabilityReinforcementSteel._evaluate  # noqa: SLF001
+
+        def counting_evaluate(*args, **kwargs) -> float:
+            calls.append(args)
+            return evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(Table4Dot4nMinimumCoverDurabilityReinforcementSteel, "_evaluate", staticmethod(counting_evaluate))
+        nominal_concrete_cover_table(CONSTANTS, **GRID)
+
+        assert calls == []
+
+    def test_invalid_structural_class(self) -> None:
+        """Test that an invalid structural class raises the same errors as table 4.4N."""
+        with pytest.raises(TypeError):
+            nominal_concrete_cover_table(CONSTANTS, reinforcement_diameter=12, nominal_max_aggregate_size=16, structural_class="S4")
+        with pytest.raises(ValueError, match="between 1 and 6"):
+            nominal_concrete_cover_table(CONSTANTS, reinforcement_diameter=12, nominal_max_aggregate_size=16, structural_class=[4, 7])
+
+    def test_unknown_parameter(self) -> None:
+        """Test that an unknown parameter raises a ValueError."""
+        with pytest.raises(ValueError, match="Unknown parameter"):
+            nominal_concrete_cover_table(CONSTANTS, reinforcement_diameter=12, nominal_max_aggregate_size=16, structural_class=4, diameter=12)
+
+    def test_missing_parameter(self) -> None:
+        """Test that a missing required parameter raises a ValueError."""
+        with pytest.raises(ValueError, match="Missing required parameter"):
+            nominal_concrete_cover_table(CONSTANTS, reinforcement_diameter=12, nominal_max_aggregate_size=16)
+
+
+def test_table_4_2_batch_with_boolean_array() -> None:
+    """Test that table 4.2 accepts a boolean array in batch evaluation."""
+    result = Table4Dot2MinimumCoverWithRegardToBond.batch(
+        diameter=np.array([12.0, 12.0]), nominal_max_aggregate_size_greater_than_32_mm=np.array([False, True])
+    )
+
+    np.testing.assert_allclose(result, [12.0, 17.0])
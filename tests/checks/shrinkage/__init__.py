@@ -0,0 +1 @@
+"""Contains tests for the shrinkage of concrete elements over time."""
@@ -0,0 +1,119 @@
+"""Testing the vectorized shrinkage of concrete elements over time of NEN-EN 1992-1-1."""
+
+import numpy as np
+import pytest
+
+from blueprints.checks.shrinkage.shrinkage_time_series import shrinkage_time_series
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_8 import Form3Dot8TotalShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_9 import Form3Dot9DryingShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_10 import (
+    Form3Dot10CoefficientAgeConcreteDryingShrinkage,
+    SubForm3Dot10FictionalCrossSection,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_11 import Form3Dot11AutogeneShrinkage
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_12 import Form3Dot12AutogeneShrinkageInfinity
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_3_materials.formula_3_13 import Form3Dot13CoefficientTimeAutogeneShrinkage
+from blueprints.materials.concrete import CementClass, ConcreteMaterial, ConcreteStrengthClass
+
+AGES = np.array([0, 1, 3, 7, 10, 28, 90, 365, 3650, 36500])
+ELEMENTS = {
+    "t_s": np.array([3, 7, 14]),
+    "a_c": np.array([300 * 500, 400 * 400, 1000 * 250]),
+    "u": np.array([1600, 1600, 2500]),
+    "f_ck": np.array([20, 30, 50]),
+    "relative_humidity": np.array([50, 70, 90]),
+}
+
+
+class TestShrinkageTimeSeries:
+    """Validation for the vectorized shrinkage of concrete elements over time."""
+
+    def test_matches_formulas(self) -> None:
+        """Test that the shrinkage of every element at every age equals the shrinkage of the scalar formulas."""
+        series = shrinkage_time_series(t=AGES, cement_class=[CementClass.S, CementClass.N, CementClass.R], **ELEMENTS)
+
+        assert series.total.shape == series.drying.shape == series.autogenous.shape == series.t.shape == (3, len(AGES))
+        for element in range(3):
+            t_s, a_c, u, f_ck, _ = (values[element] for values in ELEMENTS.values())
+            h_0 = SubForm3Dot10FictionalCrossSection(a_c=a_c, u=u)
+            assert series.h_0[element, 0] == pytest.approx(h_0)
+            epsilon_ca_inf = Form3Dot12AutogeneShrinkageInfinity(f_ck=f_ck)
+            for i, t in enumerate(AGES):
+                beta_ds = Form3Dot10CoefficientAgeConcreteDryingShrinkage(t=t, t_s=t_s, h_0=h_0) if t > t_s else 0
+                drying = Form3Dot9DryingShrinkage(beta_ds_tt_s=beta_ds, k_h=series.k_h[element, 0], epsilon_cd_0=series.epsilon_cd_0[element, 0])
+                autogenous = Form3Dot11AutogeneShrinkage(beta_as_t=Form3Dot13CoefficientTimeAutogeneShrinkage(t=t), epsilon_ca_inf=epsilon_ca_inf)
+                assert series.drying[element, i] == pytest.approx(drying, rel=1e-12, abs=1e-18)
+                assert series.autogenous[element, i] == pytest.approx(autogenous, rel=1e-12, abs=1e-18)
+                assert series.total[element, i] == pytest.approx(Form3Dot8TotalShrinkage(epsilon_cd=drying, epsilon_ca=autogenous), rel=1e-12)
+
+    def test_cement_class_of_concrete_material(self) -> None:
+        """Test that the cement class of a concrete material can be given, for all elements and per element."""
+        materials = [ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, cement_class=cement) for cement in CementClass]
+        properties = {"t": AGES, "t_s": 7, "a_c": 1e5, "u": 1e3, "f_ck": 30, "relative_humidity": 70}
+
+        single = shrinkage_time_series(**properties, cement_class=materials[0].cement_class)
+        per_element = shrinkage_time_series(**properties, cement_class=[material.cement_class for material in materials])
+
+        assert single.total.shape == (len(AGES),)
+        assert per_element.total.shape == (len(CementClass), len(AGES))
+        assert per_element.total[0] == pytest.approx(single.total)
+        assert len(np.unique(per_element.epsilon_cd_0)) == len(CementClass)
+
+    @pytest.mark.parametrize(
+        ("f_ck", "relative_humidity", "expected"),
+        [
+            (20, 20, 0.62e-3),
+            (20, 60, 0.49e-3),
+            (40, 80, 0.24e-3),
+            (60, 40, 0.36e-3),
+            (90, 100, 0.0),
+        ],
+    )
+    def test_nominal_drying_shrinkage_table_3_2(self, f_ck: float, relative_humidity: float, expected: float) -> None:
+        """Test the nominal drying shrinkage of cement class N against the values of table 3.2."""
+        series = shrinkage_time_series(t=100, t_s=7, a_c=1e5, u=1e3, f_ck=f_ck, relative_humidity=relative_humidity)
+
+        assert series.epsilon_cd_0 == pytest.approx(expected, abs=0.005e-3)
+
+    @pytest.mark.parametrize(("h_0", "expected"), [(50, 1.0), (100, 1.0), (150, 0.925), (200, 0.85), (400, 0.725), (500, 0.7), (1000, 0.7)])
+    def test_coefficient_k_h_table_3_3(self, h_0: float, expected: float) -> None:
+        """Test the coefficient kh, interpolated in table 3.3."""
+        series = shrinkage_time_series(t=100, t_s=7, a_c=h_0 * 500, u=1000, f_ck=30, relative_humidity=70)
+
+        assert series.k_h == pytest.approx(expected)
+
+    def test_no_drying_before_start(self) -> None:
+        """Test that there is no drying shrinkage up to the start of the drying shrinkage."""
+        series = shrinkage_time_series(t=AGES, **ELEMENTS)
+
+        before_start = ELEMENTS["t_s"][:, np.newaxis] >= AGES
+        assert np.all(series.drying[before_start] == 0)
+        assert np.all(series.drying[~before_start] > 0)
+        assert np.all(np.diff(series.total, axis=-1) >= 0)
+
+    def test_broadcasting(self) -> None:
+        """Test the shapes of the results of scalar elements, a grid of elements and elements with their own ages."""
+        single = shrinkage_time_series(t=AGES, t_s=7, a_c=1e5, u=1e3, f_ck=30, relative_humidity=70)
+        grid = shrinkage_time_series(t=AGES, t_s=7, a_c=np.array([1e5, 2e5])[:, np.newaxis], u=1e3, f_ck=np.array([20, 30, 40]), relative_humidity=70)
+        own_ages = shrinkage_time_series(t=np.stack([AGES, AGES + 100]), t_s=7, a_c=np.array([1e5, 1e5]), u=1e3, f_ck=30, relative_humidity=70)
+
+        assert single.total.shape == (len(AGES),)
+        assert grid.total.shape == (2, 3, len(AGES))
+        assert grid.total[1, 2] == pytest.approx(shrinkage_time_series(t=AGES, t_s=7, a_c=2e5, u=1e3, f_ck=40, relative_humidity=70).total)
+        assert own_ages.total[1, 0] == pytest.approx(shrinkage_time_series(t=100, t_s=7, a_c=1e5, u=1e3, f_ck=30, relative_humidity=70).total)
+
+    @pytest.mark.parametrize(
+        "parameters",
+        [
+            {"t": [-1, 10]},
+            {"t_s": -1},
+            {"a_c": 0},
+            {"u": -100},
+            {"f_ck": -10},
+            {"relative_humidity": 101},
+        ],
+    )
+    def test_raise_error_when_invalid_values_are_given(self, parameters: dict) -> None:
+        """Test invalid values."""
+        with pytest.raises(ValueError):
+            shrinkage_time_series(**{"t": AGES, "t_s": 7, "a_c": 1e5, "u": 1e3, "f_ck": 30, "relative_humidity": 70} | parameters)
@@ -0,0 +1 @@
+"""Contains tests for the bulk unity checks of load combinations."""
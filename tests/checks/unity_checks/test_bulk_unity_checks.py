@@ -0,0 +1,190 @@
+"""Testing the streaming bulk unity checks of load combinations."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from blueprints.checks.unity_checks.bulk_unity_checks import FormulaCheck, InteractionCheck, bulk_unity_checks, read_chunks
+from blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_2 import Form6Dot2UtilizationRatio
+from blueprints.codes.eurocode.nen_en_1993_1_1_c2_a1_2016.chapter_6_ultimate_limit_state.formula_6_5 import Form6Dot5UnityCheckTensileStrength
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+N_T_RD = {"B1": 500.0, "B2": 800.0}
+
+
+@pytest.fixture(scope="module")
+def diagram() -> InteractionDiagram:
+    """Return the interaction diagram of a rectangular cross-section with 3⌀20 at the lower side."""
+    cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return InteractionDiagram.from_cross_section(cs)
+
+
+@pytest.fixture
+def forces() -> pd.DataFrame:
+    """Return internal forces of 4 elements for 250 load combinations, with tension positive."""
+    rng = np.random.default_rng(0)
+    elements = np.repeat(["B1", "B2", "C1", "C2"], 250)
+    return pd.DataFrame(
+        {
+            "element": elements,
+            "combination": np.tile([f"LC{i}" for i in range(250)], 4),
+            "N": rng.uniform(-600, 600, elements.size),
+            "M": rng.uniform(-200, 200, elements.size),
+        }
+    )
+
+
+@pytest.fixture
+def checks(diagram: InteractionDiagram) -> list[FormulaCheck | InteractionCheck]:
+    """Return a tension check of the elements B1 and B2 and an N-M check of the elements C1 and C2."""
+    tension = FormulaCheck("tension", Form6Dot5UnityCheckTensileStrength, loads={"n_ed": "N"}, elements={k: {"n_t_rd": v} for k, v in N_T_RD.items()})
+    return [tension, InteractionCheck("N-M", elements={"C1": diagram, "C2": diagram}, loads=("N", "M"))]
+
+
+def expected_governing(forces: pd.DataFrame, diagram: InteractionDiagram) -> pd.DataFrame:
+    """Calculate the governing unity checks row by row."""
+    records = []
+    for element, rows in forces.groupby("element"):
+        if element in N_T_RD:
+            unity_checks = [Form6Dot5UnityCheckTensileStrength(n_ed=abs(n), n_t_rd=N_T_RD[element]) for n in rows["N"]]
+            check = "tension"
+        else:
+            unity_checks = [float(diagram.unity_check(-n, m)) for n, m in zip(rows["N"], rows["M"])]
+            check = "N-M"
+        governing = int(np.argmax(unity_checks))
+        records.append({"element": element, "check": check, "combination": rows["combination"].iloc[governing], "unity_check": max(unity_checks)})
+    return pd.DataFrame(records)
+
+
+class TestBulkUnityChecks:
+    """Tests for the bulk_unity_checks function."""
+
+    @pytest.mark.parametrize("chunk_size", [1000, 333, 7])
+    def test_governing_unity_checks(
+        self, forces: pd.DataFrame, checks: list[FormulaCheck | InteractionCheck], diagram: InteractionDiagram, chunk_size: int
+    ) -> None:
+        """Test that the governing unity checks do not depend on the chunks, and equal those of the checks row by row."""
+        chunks = [forces.iloc[start : start + chunk_size] for start in range(0, len(forces), chunk_size)]
+        report = bulk_unity_checks(chunks, checks)
+
+        pd.testing.assert_frame_equal(report.governing, expected_governing(forces, diagram), check_dtype=False)
+        assert report.rows == 1000
+        assert report.rows_per_second > 0
+
+    def test_csv_file(self, forces: pd.DataFrame, checks: list[FormulaCheck | InteractionCheck], diagram: InteractionDiagram, tmp_path: Path) -> None:
+        """Test reading a CSV file in chunks and writing the unity checks of every row."""
+        forces.assign(V=1.0).to_csv(tmp_path / "forces.csv", index=False)
+        progress: list[int] = []
+        report = bulk_unity_checks(
+            tmp_path / "forces.csv", checks, output=tmp_path / "results.csv", chunk_size=300, progress=lambda rows, _: progress.append(rows)
+        )
+        results = pd.read_csv(tmp_path / "results.csv")
+
+        assert progress == [300, 600, 900, 1000]
+        assert list(results.columns) == ["element", "combination", "tension", "N-M", "unity_check"]
+        assert len(results) == 1000
+        pd.testing.assert_frame_equal(report.governing, expected_governing(forces, diagram), check_dtype=False)
+        np.testing.assert_allclose(results.groupby("element")["unity_check"].max().to_numpy(), report.governing["unity_check"].to_numpy())
+
+    def test_min_unity_check(self, forces: pd.DataFrame, checks: list[FormulaCheck | InteractionCheck], tmp_path: Path) -> None:
+        """Test that only the rows with a governing unity check of at least the minimum are written."""
+        bulk_unity_checks([forces], checks, output=tmp_path / "results.csv", min_unity_check=0.8)
+        results = pd.read_csv(tmp_path / "results.csv")
+
+        assert 0 < len(results) < 1000
+        assert (results["unity_check"] >= 0.8).all()
+
+    def test_formula_with_moments(self, forces: pd.DataFrame) -> None:
+        """Test a formula with several internal forces and elements without a check."""
+        check = FormulaCheck(
+            "N-My-Mz",
+            Form6Dot2UtilizationRatio,
+            loads={"n_ed": "N", "m_y_ed": "M", "m_z_ed": "M"},
+            elements={"B1": {"n_rd": 1000.0, "m_y_rd": 400.0, "m_z_rd": 200.0}},
+        )
+        with pytest.warns(UserWarning, match="3 element"):
+            report = bulk_unity_checks([forces], [check])
+        rows = forces[forces["element"] == "B1"]
+
+        assert report.governing["element"].tolist() == ["B1"]
+        assert report.governing["unity_check"].iloc[0] == pytest.approx((rows["N"].abs() / 1000 + rows["M"].abs() * (1 / 400 + 1 / 200)).max())
+
+    def test_integer_elements(self, forces: pd.DataFrame, diagram: InteractionDiagram, tmp_path: Path) -> None:
+        """Test that the integer elements of a CSV file match the elements of the checks keyed by strings."""
+        numbers = {"B1": 1, "B2": 2, "C1": 3, "C2": 4}
+        forces.assign(element=forces["element"].map(numbers)).to_csv(tmp_path / "forces.csv", index=False)
+        resistances = {str(numbers[element]): {"n_t_rd": n_t_rd} for element, n_t_rd in N_T_RD.items()}
+        tension = FormulaCheck("tension", Form6Dot5UnityCheckTensileStrength, loads={"n_ed": "N"}, elements=resistances)
+        bending = InteractionCheck("N-M", elements={"3": diagram, "4": diagram}, loads=("N", "M"))
+        report = bulk_unity_checks(tmp_path / "forces.csv", [tension, bending], chunk_size=300)
+
+        expected = expected_governing(forces, diagram)
+        assert report.governing["element"].tolist() == [1, 2, 3, 4]
+        assert report.governing["combination"].tolist() == expected["combination"].tolist()
+        np.testing.assert_allclose(report.governing["unity_check"], expected["unity_check"])
+
+    def test_unchecked_elements(self, forces: pd.DataFrame, diagram: InteractionDiagram) -> None:
+        """Test that elements of the source that no check covers give a warning instead of silently being skipped."""
+        check = InteractionCheck("N-M", elements={"column 1": diagram, "column 2": diagram}, loads=("N", "M"))
+        with pytest.warns(UserWarning, match="4 element\\(s\\) of the source are not covered by any check, for example 'B1', 'B2', 'C1', 'C2'"):
+            report = bulk_unity_checks([forces], [check])
+
+        assert report.rows == 1000
+        assert report.governing.empty
+
+    def test_no_rows(self, checks: list[FormulaCheck | InteractionCheck]) -> None:
+        """Test that a source without rows gives an empty report."""
+        report = bulk_unity_checks([], checks)
+        assert report.rows == 0
+        assert report.governing.empty
+
+
+class TestFormulaCheck:
+    """Tests for the FormulaCheck class."""
+
+    def test_from_sections(self) -> None:
+        """Test that the parameters are calculated once for every distinct section."""
+        calls = []
+        section, other = {"area": 1000.0}, {"area": 2000.0}
+
+        def parameters(section: dict[str, float]) -> dict[str, float]:
+            calls.append(section)
+            return {"n_t_rd": section["area"] * 0.355}
+
+        check = FormulaCheck.from_sections(
+            "tension", Form6Dot5UnityCheckTensileStrength, {"n_ed": "N"}, {"B1": section, "B2": section, "B3": other}, parameters
+        )
+        assert calls == [section, other]
+        assert check.elements == {"B1": {"n_t_rd": 355.0}, "B2": {"n_t_rd": 355.0}, "B3": {"n_t_rd": 710.0}}
+
+
+class TestReadChunks:
+    """Tests for the read_chunks function."""
+
+    def test_unsupported_file(self, tmp_path: Path) -> None:
+        """Test that a file that is neither CSV nor Parquet raises a ValueError."""
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            next(read_chunks(tmp_path / "forces.xlsx"))
+
+    def test_parquet_requires_pyarrow(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that reading a Parquet file without pyarrow raises an ImportError."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        with pytest.raises(ImportError, match="pyarrow"):
+            next(read_chunks(tmp_path / "forces.parquet"))
+
+    def test_parquet_file(self, forces: pd.DataFrame, tmp_path: Path) -> None:
+        """Test reading a Parquet file in chunks."""
+        pytest.importorskip("pyarrow")
+        forces.to_parquet(tmp_path / "forces.parquet")
+        chunks = list(read_chunks(tmp_path / "forces.parquet", columns=["element", "N"], chunk_size=300))
+
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), forces[["element", "N"]])
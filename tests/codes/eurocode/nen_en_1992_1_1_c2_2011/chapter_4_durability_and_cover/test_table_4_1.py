@@ -2,8 +2,12 @@
 according to Table 4.1 from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and cover to reinforcement.
 """
 
+import itertools
+
+import numpy as np
 import pytest
 
+from blueprints.codes.eurocode.exposure_classes import exposure_severities, most_severe_exposure
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
     Carbonation,
     Chemical,
@@ -149,3 +153,50 @@ class TestTable4Dot1ExposureClasses:
             _ = Table4Dot1ExposureClasses.from_exposure_list(["XC1", "XD1", "XD2", "XF1", "XA1"])
 
         assert str(excinfo.value) == "Duplication Error: There are multiple instances of 'Chloride' class."
+
+    def test_code(self) -> None:
+        """Test the integer code of a combination of exposure classes."""
+        exposure_classes = Table4Dot1ExposureClasses.from_exposure_list(["XC3", "XS2", "XA1"])
+
+        assert exposure_classes.code == 3 | 2 << 6 | 1 << 12
+        assert Table4Dot1ExposureClasses.from_exposure_list([]).code == 0
+
+    def test_from_code(self) -> None:
+        """Test that every combination of exposure classes is restored from its code."""
+        for combination in itertools.product(Carbonation, Chloride, ChlorideSeawater, FreezeThaw, Chemical):
+            exposure_classes = Table4Dot1ExposureClasses(*combination)
+            restored = Table4Dot1ExposureClasses.from_code(exposure_classes.code)
+            assert tuple(restored) == combination
+            assert restored == exposure_classes
+            assert hash(restored) == hash(exposure_classes)
+
+    def test_equality_and_hash(self) -> None:
+        """Test that combinations of exposure classes are compared and hashed by their code."""
+        first = Table4Dot1ExposureClasses.from_exposure_list(["XC1", "XD1"])
+        second = Table4Dot1ExposureClasses.from_exposure_list(["XD1", "XC1"])
+        third = Table4Dot1ExposureClasses.from_exposure_list(["XC1", "XD2"])
+
+        assert first == second
+        assert first != third
+        assert len({first, second, third}) == 2
+
+    def test_exposure_severities(self) -> None:
+        """Test the vectorized decoding of the severity ordinals of the exposure classes."""
+        codes = [Table4Dot1ExposureClasses.from_exposure_list(exposures).code for exposures in (["XC4", "XF2"], ["XD3", "XA3"])]
+
+        np.testing.assert_array_equal(exposure_severities(codes), [[4, 0, 0, 2, 0], [0, 3, 0, 0, 3]])
+
+    def test_most_severe_exposure(self) -> None:
+        """Test the vectorized reduction to the most severe exposure classes."""
+        exposures = [[["XC1", "XD2"], ["XC3"]], [["XS1", "XF1"], ["XC2", "XS3"]]]
+        codes = np.array([[Table4Dot1ExposureClasses.from_exposure_list(element).code for element in group] for group in exposures])
+
+        assert Table4Dot1ExposureClasses.from_code(most_severe_exposure(codes)) == Table4Dot1ExposureClasses.from_exposure_list(
+            ["XC3", "XD2", "XS3", "XF1"]
+        )
+        per_group = [Table4Dot1ExposureClasses.from_code(code) for code in most_severe_exposure(codes, axis=-1)]
+        assert per_group == [
+            Table4Dot1ExposureClasses.from_exposure_list(["XC3", "XD2"]),
+            Table4Dot1ExposureClasses.from_exposure_list(["XC2", "XS3", "XF1"]),
+        ]
+        np.testing.assert_array_equal(most_severe_exposure(codes, axis=0), most_severe_exposure(codes.T, axis=1))
@@ -4,6 +4,7 @@ according to Table 4.3 from NEN-EN 1992-1-1+C2:2011: Chapter 4 - Durability and
 
 import pytest
 
+import blueprints.codes.eurocode.structural_class
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
     Carbonation,
     Chemical,
@@ -199,3 +200,57 @@ class TestTable4Dot3ConcreteStructuralClass:
         )
 
         assert hasattr(new_instance, "explanation")
+
+    def test_explanation_is_built_on_demand(self) -> None:
+        """Test if the explanation is only built when it is requested."""
+        new_instance = Table4Dot3ConcreteStructuralClass(
+            exposure_classes=DUMMY_EXPOSURE_CLASSES,
+            design_working_life=100,
+            concrete_material=ConcreteMaterial(ConcreteStrengthClass("C40/50")),
+            plate_geometry=True,
+            quality_control=False,
+        )
+
+        assert "_explanation" not in vars(new_instance)
+        assert new_instance.explanation == (
+            "Default structural class (S4) + 2 classes (100 years) - 1 class (concrete grade >= C40/50) - 1 class (plate geometry)"
+            " + 0 class (no quality control)"
+        )
+        assert "_explanation" in vars(new_instance)
+
+    def test_calculation_is_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test if elements with the same inputs share the calculation of the structural class."""
+        monkeypatch.setattr(blueprints.codes.eurocode.structural_class, "_structural_class_cache", {})
+        calls = []
+        delta_concrete_grade = ConcreteStructuralClassCalculator._structural_class_delta_concrete_grade  # noqa: SLF001
+
+        def counting_delta_concrete_grade(calculator: ConcreteStructuralClassCalculator) -> None:
+            calls.append(calculator)
+            delta_concrete_grade(calculator)
+
+        monkeypatch.setattr(ConcreteStructuralClassCalculator, "_structural_class_delta_concrete_grade", counting_delta_concrete_grade)
+        structural_classes = [
+            Table4Dot3ConcreteStructuralClass(["XC3", "XD1"], design_working_life, ConcreteMaterial(ConcreteStrengthClass(grade)), False, True)
+            for design_working_life in [50, 60, 100]
+            for grade in ["C30/37", "C40/50", "C40/50"]
+        ]
+
+        assert structural_classes == [3, 2, 2, 3, 2, 2, 5, 4, 4]
+        assert len(calls) == 4
+
+    def test_from_records(self) -> None:
+        """Test if the structural classes of many elements equal the structural classes of the individual elements."""
+        records = [
+            {"exposure_classes": ["XC3", "XD1"], "plate_geometry": True, "concrete_material": ConcreteMaterial(ConcreteStrengthClass("C40/50"))},
+            {"exposure_classes": DUMMY_EXPOSURE_CLASSES, "plate_geometry": False},
+            {"exposure_classes": ["XC3", "XD1"], "plate_geometry": False, "design_working_life": 100},
+        ]
+        shared = {"design_working_life": 50, "concrete_material": ConcreteMaterial(ConcreteStrengthClass("C30/37")), "quality_control": False}
+
+        structural_classes = Table4Dot3ConcreteStructuralClass.from_records(records, **shared)
+
+        expected = [Table4Dot3ConcreteStructuralClass(**(shared | record)) for record in records]
+        assert structural_classes == expected
+        assert [structural_class.explanation for structural_class in structural_classes] == [
+            structural_class.explanation for structural_class in expected
+        ]
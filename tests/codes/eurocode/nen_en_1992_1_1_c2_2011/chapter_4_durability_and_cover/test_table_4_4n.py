@@ -1,5 +1,8 @@
 """Testing formula 4.4N of NEN-EN 1992-1-1+C2:2011."""
 
+import itertools
+
+import numpy as np
 import pytest
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
@@ -17,6 +20,8 @@ from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_
 )
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import (
     Table4Dot4nMinimumCoverDurabilityReinforcementSteel,
+    exposure_class_row,
+    exposure_class_rows,
 )
 from blueprints.type_alias import MM
 
@@ -128,3 +133,38 @@ class TestTable4Dot4nMinimumCoverDurabilityReinforcementSteel:
         }
 
         assert actual[representation] == expected_result, f"{representation} representation failed."
+
+    def test_lookup_matches_evaluation(self) -> None:
+        """Test that the array lookup gives the same results as the evaluation of table 4.4N for all exposure and structural classes."""
+        combinations = list(itertools.product(Carbonation, Chloride, ChlorideSeawater, range(1, 7)))
+        exposure_classes = [
+            Table4Dot1ExposureClasses(carbonation, chloride, chloride_seawater, FreezeThaw.NA, Chemical.NA)
+            for carbonation, chloride, chloride_seawater, _ in combinations
+        ]
+        structural_classes = np.array([structural_class for *_, structural_class in combinations])
+
+        result = Table4Dot4nMinimumCoverDurabilityReinforcementSteel.lookup(
+            [exposure_class_row(classes) for classes in exposure_classes], structural_classes
+        )
+
+        expected = [
+            Table4Dot4nMinimumCoverDurabilityReinforcementSteel(classes, int(structural_class))
+            for classes, structural_class in zip(exposure_classes, structural_classes)
+        ]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_lookup_invalid_structural_class(self) -> None:
+        """Test that the array lookup raises a ValueError for a structural class that is not between 1 and 6."""
+        with pytest.raises(ValueError):
+            Table4Dot4nMinimumCoverDurabilityReinforcementSteel.lookup([0, 1], [4, 7])
+
+    def test_exposure_class_rows(self) -> None:
+        """Test that the vectorized exposure class rows equal the exposure class rows of the individual exposure classes."""
+        exposure_classes = [
+            Table4Dot1ExposureClasses(*combination)
+            for combination in itertools.product(Carbonation, Chloride, ChlorideSeawater, FreezeThaw, Chemical)
+        ]
+
+        rows = exposure_class_rows([classes.code for classes in exposure_classes])
+
+        np.testing.assert_array_equal(rows, [exposure_class_row(classes) for classes in exposure_classes])
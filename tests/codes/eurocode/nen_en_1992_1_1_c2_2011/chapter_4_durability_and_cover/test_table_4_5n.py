@@ -1,5 +1,8 @@
 """Testing formula 4.5N of NEN-EN 1992-1-1+C2:2011."""
 
+import itertools
+
+import numpy as np
 import pytest
 
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
@@ -15,6 +18,7 @@ from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_
     ConcreteStrengthClass,
     Table4Dot3ConcreteStructuralClass,
 )
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_4n import exposure_class_row
 from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_5n import (
     Table4Dot5nMinimumCoverDurabilityPrestressingSteel,
 )
@@ -120,3 +124,34 @@ class TestTable4Dot5nMinimumCoverDurabilityPrestressingSteel:
         }
 
         assert actual[representation] == expected_result, f"{representation} representation failed."
+
+    def test_lookup_matches_evaluation(self) -> None:
+        """Test that the array lookup gives the same results as the evaluation of table 4.5N for all exposure and structural classes."""
+        combinations = list(itertools.product(Carbonation, Chloride, ChlorideSeawater, range(1, 7)))
+        exposure_classes = [
+            Table4Dot1ExposureClasses(carbonation, chloride, chloride_seawater, FreezeThaw.NA, Chemical.NA)
+            for carbonation, chloride, chloride_seawater, _ in combinations
+        ]
+        structural_classes = np.array([structural_class for *_, structural_class in combinations])
+
+        result = Table4Dot5nMinimumCoverDurabilityPrestressingSteel.lookup(
+            [exposure_class_row(classes) for classes in exposure_classes], structural_classes
+        )
+
+        expected = [
+            Table4Dot5nMinimumCoverDurabilityPrestressingSteel(classes, int(structural_class))
+            for classes, structural_class in zip(exposure_classes, structural_classes)
+        ]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_lookup_invalid_structural_class(self) -> None:
+        """Test that the array lookup raises a ValueError for a structural class that is not between 1 and 6."""
+        with pytest.raises(ValueError):
+            Table4Dot5nMinimumCoverDurabilityPrestressingSteel.lookup([0, 1], [4, 7])
+
+    def test_evaluation_invalid_structural_class_value(self) -> None:
+        """Test if the evaluation raises ValueError when the structural class is not between 1 and 6."""
+        exposure_classes = Table4Dot1ExposureClasses(Carbonation.XC2, Chloride.XD1, ChlorideSeawater.XS3, FreezeThaw.XF4, Chemical.XA1)
+
+        with pytest.raises(ValueError):
+            Table4Dot5nMinimumCoverDurabilityPrestressingSteel(exposure_classes, 7)  # type: ignore[arg-type]
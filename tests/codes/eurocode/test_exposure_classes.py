@@ -153,6 +153,27 @@ class TestExposure:
         assert DummyExposureSubclass.DUMMY1 <= DummyExposureSubclass.DUMMY1
         assert DummyExposureSubclass.DUMMY3 <= DummyExposureSubclass.DUMMY3
 
+    def test_hash(self) -> None:
+        """Check if the exposure classes are hashable and can be used as dictionary keys."""
+        assert hash(DummyExposureSubclass.DUMMY1) == hash(DummyExposureSubclass.DUMMY1)
+        assert {DummyExposureSubclass.DUMMY1: 1, DummyExposureSubclass.DUMMY2: 2}[DummyExposureSubclass.DUMMY2] == 2
+
+    def test_hash_of_different_types(self) -> None:
+        """Check if exposure classes of different types with the same name can be used as keys of the same dictionary."""
+        assert hash(DummyCarbonation.NA) != hash(DummyChloride.NA)
+        assert {DummyCarbonation.NA: 1, DummyChloride.NA: 2}[DummyChloride.NA] == 2
+
+    def test_severity(self) -> None:
+        """Check if the severity ordinal is the last digit of the value, or 0 if not applicable."""
+        assert [member.severity for member in DummyExposureSubclass] == [1, 2, 3]
+        assert DummyCarbonation.NA.severity == 0
+
+    def test_from_severity(self) -> None:
+        """Check if the exposure class is found by its severity ordinal."""
+        assert DummyExposureSubclass.from_severity(2) is DummyExposureSubclass.DUMMY2
+        with pytest.raises(ValueError):
+            DummyExposureSubclass.from_severity(4)
+
     def test_options(self) -> None:
         """Check if the options method returns all the possible options within an exposure class."""
         assert DummyExposureSubclass.options() == ["Dummy1", "Dummy2", "Dummy3"]
@@ -300,6 +321,18 @@ class TestExposureClasses:
         )
         assert exposureclasses.no_risk is False
 
+    def test_code(self) -> None:
+        """Check if the code holds the severity ordinals of the exposure classes."""
+        exposure_classes = ExposureClassesBase(
+            carbonation=DummyCarbonation("XC1"),
+            chloride=DummyChloride("Not applicable"),
+            chloride_seawater=DummyChlorideSeawater("XS1"),
+            freeze=DummyFreezeThaw("Not applicable"),
+            chemical=DummyChemical("XA1"),
+        )
+        assert exposure_classes.code == 0b001_000_001_000_001
+        assert list(exposure_classes) == [DummyCarbonation.XC1, DummyChloride.NA, DummyChlorideSeawater.XS1, DummyFreezeThaw.NA, DummyChemical.XA1]
+
 
 def test_comparing_different_types_raises_error() -> None:
     """Check if comparing different exposure class types, raises TypeError."""
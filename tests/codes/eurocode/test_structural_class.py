@@ -8,6 +8,7 @@ from blueprints.codes.eurocode.exposure_classes import ExposureClassesBase as Ex
 from blueprints.codes.eurocode.structural_class import (
     AbstractConcreteStructuralClassCalculator,
     ConcreteStructuralClassBase,
+    format_explanation,
 )
 from blueprints.materials.concrete import ConcreteMaterial
 from tests.codes.eurocode.test_exposure_classes import DummyCarbonation, DummyChemical, DummyChloride, DummyChlorideSeawater, DummyFreezeThaw
@@ -196,3 +197,25 @@ class TestAbstractConcreteStructuralClassCalculator:
         calculator.calculate_structural_class()
         assert calculator.structural_class == 2
         assert calculator.explanation == "Default structural class (S1) + 1 class (Quality control)"
+
+    def test_recalculate_structural_class(self, calculator: MockConcreteStructuralClassCalculator) -> None:
+        """Test case to check that changing an input and recalculating starts from the default structural class."""
+        calculator.calculate_structural_class()
+        calculator.quality_control = False
+        calculator.calculate_structural_class()
+        assert calculator.structural_class == 1
+        assert calculator.explanation == "Default structural class (S1)"
+
+    def test_updates(self, calculator: MockConcreteStructuralClassCalculator) -> None:
+        """Test case to check the updates of the structural class."""
+        with pytest.raises(ValueError):
+            calculator.updates
+        calculator.calculate_structural_class()
+        assert calculator.updates == [(1, "Quality control")]
+
+
+def test_format_explanation() -> None:
+    """Test case to check the explanation built from the updates of a structural class."""
+    assert format_explanation("Default structural class (S4)", [(2, "100 years"), (-1, "plate geometry"), (0, "no quality control")]) == (
+        "Default structural class (S4) + 2 classes (100 years) - 1 class (plate geometry) + 0 class (no quality control)"
+    )
@@ -0,0 +1,128 @@
+"""Module for testing the CalculationGraph class."""
+
+from collections import Counter
+
+import pytest
+
+from blueprints.codes.calculation_graph import CalculationGraph
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    Form8Dot2UltimateBondStress,
+    SubForm8Dot2CoefficientBarDiameter,
+    SubForm8Dot2CoefficientQualityOfBond,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_3 import (
+    Form8Dot3RequiredAnchorageLength,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4 import (
+    Form8Dot4DesignAnchorageLength,
+)
+from blueprints.codes.formula import Formula
+
+
+@pytest.fixture
+def evaluations(monkeypatch: pytest.MonkeyPatch) -> Counter:
+    """Count the evaluations of the formulas of the anchorage length chain."""
+    counter: Counter = Counter()
+    for formula in (SubForm8Dot2CoefficientQualityOfBond, SubForm8Dot2CoefficientBarDiameter, Form8Dot2UltimateBondStress):
+        evaluate = formula._evaluate  # noqa: SLF001
+
+        def counting_evaluate(*args, _formula: type[Formula] = formula, _evaluate=evaluate, **kwargs) -> float:  # noqa: ANN001
+            counter[_formula.__name__] += 1
+            return _evaluate(*args, **kwargs)
+
+        monkeypatch.setattr(formula, "_evaluate", staticmethod(counting_evaluate))
+    return counter
+
+
+@pytest.fixture
+def graph() -> CalculationGraph:
+    """Calculation graph of the required and design anchorage length, sharing the ultimate bond stress."""
+    graph = CalculationGraph()
+    graph.set_inputs(bond_quality="good", diameter=12, f_ctd=1.2, sigma_sd=435, alpha=0.9, l_b_min=100)
+    graph.add_node("eta_1", SubForm8Dot2CoefficientQualityOfBond)
+    graph.add_node("eta_2", SubForm8Dot2CoefficientBarDiameter)
+    graph.add_node("f_bd", Form8Dot2UltimateBondStress)
+    graph.add_node("l_b_rqd", Form8Dot3RequiredAnchorageLength)
+    graph.add_node("l_b_rqd_half_stress", Form8Dot3RequiredAnchorageLength, sigma_sd="sigma_sd_half")
+    graph.set_inputs(sigma_sd_half=217.5)
+    graph.add_node(
+        "l_bd",
+        Form8Dot4DesignAnchorageLength,
+        alpha_1="alpha",
+        alpha_2="alpha",
+        alpha_3="alpha",
+        alpha_4="alpha",
+        alpha_5="alpha",
+    )
+    return graph
+
+
+class TestCalculationGraph:
+    """Validation for the CalculationGraph class."""
+
+    def test_evaluation(self, graph: CalculationGraph) -> None:
+        """Test that the results of the nodes equal the results of the formulas evaluated by hand."""
+        eta_1 = SubForm8Dot2CoefficientQualityOfBond(bond_quality="good")
+        eta_2 = SubForm8Dot2CoefficientBarDiameter(diameter=12)
+        f_bd = Form8Dot2UltimateBondStress(eta_1=eta_1, eta_2=eta_2, f_ctd=1.2)
+        l_b_rqd = Form8Dot3RequiredAnchorageLength(diameter=12, sigma_sd=435, f_bd=f_bd)
+        l_bd = Form8Dot4DesignAnchorageLength(alpha_1=0.9, alpha_2=0.9, alpha_3=0.9, alpha_4=0.9, alpha_5=0.9, l_b_rqd=l_b_rqd, l_b_min=100)
+
+        results = graph.evaluate()
+
+        assert results["l_b_rqd"] == pytest.approx(l_b_rqd)
+        assert results["l_b_rqd_half_stress"] == pytest.approx(l_b_rqd / 2)
+        assert results["l_bd"] == pytest.approx(l_bd)
+        assert isinstance(results["l_bd"], Form8Dot4DesignAnchorageLength)
+        assert results["l_bd"].min_product_alpha_2_3_5 is None
+        assert graph["diameter"] == 12
+
+    def test_shared_nodes_are_evaluated_once(self, graph: CalculationGraph, evaluations: Counter) -> None:
+        """Test that the ultimate bond stress is evaluated once although it feeds two nodes."""
+        graph.evaluate()
+        graph.evaluate()
+        assert evaluations == {"SubForm8Dot2CoefficientQualityOfBond": 1, "SubForm8Dot2CoefficientBarDiameter": 1, "Form8Dot2UltimateBondStress": 1}
+
+    def test_only_downstream_nodes_are_recomputed(self, graph: CalculationGraph, evaluations: Counter) -> None:
+        """Test that changing an input only recomputes the nodes downstream of it."""
+        graph.evaluate()
+        graph.set_inputs(diameter=16)
+        results = graph.evaluate()
+
+        assert evaluations == {"SubForm8Dot2CoefficientQualityOfBond": 1, "SubForm8Dot2CoefficientBarDiameter": 2, "Form8Dot2UltimateBondStress": 2}
+        assert results["l_b_rqd"] == pytest.approx(16 * 435 / (4 * 2.7))
+
+    def test_replace_node(self, graph: CalculationGraph) -> None:
+        """Test that replacing a node invalidates the nodes downstream of it."""
+        graph.evaluate()
+        graph.add_node("l_b_rqd", Form8Dot3RequiredAnchorageLength, sigma_sd="sigma_sd_half")
+        assert graph["l_bd"] == pytest.approx(graph["l_b_rqd_half_stress"] * 0.9**5)
+
+    def test_raise_error_for_unknown_parameter(self, graph: CalculationGraph) -> None:
+        """Test that an error is raised when wiring a parameter the formula does not have."""
+        with pytest.raises(ValueError, match="has no parameter"):
+            graph.add_node("eta_2", SubForm8Dot2CoefficientBarDiameter, diameters="diameter")
+
+    def test_raise_error_for_name_clash(self, graph: CalculationGraph) -> None:
+        """Test that inputs and nodes cannot share a name."""
+        with pytest.raises(ValueError, match="already used by a formula node"):
+            graph.set_inputs(f_bd=2.7)
+        with pytest.raises(ValueError, match="already used by an input"):
+            graph.add_node("diameter", SubForm8Dot2CoefficientBarDiameter)
+
+    def test_raise_error_for_missing_input(self) -> None:
+        """Test that an error is raised when a parameter is fed by nothing."""
+        graph = CalculationGraph()
+        graph.add_node("eta_2", SubForm8Dot2CoefficientBarDiameter)
+        with pytest.raises(KeyError, match="to feed parameter .diameter. of SubForm8Dot2CoefficientBarDiameter"):
+            graph.evaluate()
+        with pytest.raises(KeyError, match="No input or formula node"):
+            graph["eta_1"]
+
+    def test_raise_error_for_cycle(self) -> None:
+        """Test that an error is raised when the graph contains a cycle."""
+        graph = CalculationGraph()
+        graph.add_node("diameter", SubForm8Dot2CoefficientBarDiameter, diameter="eta_2")
+        graph.add_node("eta_2", SubForm8Dot2CoefficientBarDiameter)
+        with pytest.raises(ValueError, match="Cycle in the calculation graph: eta_2 -> diameter -> eta_2"):
+            graph["eta_2"]
@@ -1,8 +1,11 @@
 """Module for testing the Formula class."""
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from blueprints.codes.formula import Formula
+from blueprints.validations import NegativeValueError, raise_if_negative
 
 
 class FormulaTest(Formula):
@@ -30,6 +33,34 @@ class FormulaTest(Formula):
         return first + second
 
 
+class BranchingFormulaTest(Formula):
+    """Dummy formula with scalar-only branching for testing purposes."""
+
+    label = "Dummy branching testing formula"
+    source_document = "Dummy testing document"
+
+    def __init__(
+        self,
+        value: float,
+        limit: float = 10,
+    ) -> None:
+        """Dummy formula with scalar-only branching for testing purposes."""
+        super().__init__()
+        self.value = value
+        self.limit = limit
+
+    @staticmethod
+    def _evaluate(
+        value: float,
+        limit: float = 10,
+    ) -> float:
+        """Dummy formula with scalar-only branching for testing purposes."""
+        raise_if_negative(value=value)
+        if value > limit:
+            return limit
+        return value
+
+
 def test_raise_error_when_changing_value_after_initialization() -> None:
     """Test that an error is raised when changing a value after initialization."""
     # example values
@@ -48,3 +79,73 @@ def test_raise_not_implemented_error_detailed_result() -> None:
     dummy_testing_formula = FormulaTest(first=first, second=second)
     with pytest.raises(NotImplementedError):
         _ = dummy_testing_formula.detailed_result
+
+
+def test_formula_instances_have_no_dict() -> None:
+    """Test that the attributes of a formula are stored in slots derived from the parameters of _evaluate."""
+    dummy_testing_formula = FormulaTest(first=1, second=2)
+    assert not hasattr(dummy_testing_formula, "__dict__")
+    assert FormulaTest.__slots__ == ("first", "second")
+
+
+def test_raise_error_when_adding_attribute_not_in_evaluate() -> None:
+    """Test that no attributes other than the parameters of _evaluate can be added to a formula."""
+    dummy_testing_formula = FormulaTest(first=1, second=2)
+    with pytest.raises(AttributeError):
+        dummy_testing_formula.third = 3  # type: ignore[attr-defined]
+
+
+def test_trusted_equals_regular_construction() -> None:
+    """Test that the trusted construction gives the same object as the regular construction, including default values."""
+    trusted = BranchingFormulaTest.trusted(value=12)
+    regular = BranchingFormulaTest(value=12)
+    assert type(trusted) is BranchingFormulaTest
+    assert trusted == regular == 10
+    assert (trusted.value, trusted.limit) == (regular.value, regular.limit)
+
+
+def test_trusted_keeps_attributes_read_only() -> None:
+    """Test that an object created with the trusted construction is read-only as well."""
+    trusted = FormulaTest.trusted(first=1, second=2)
+    with pytest.raises(AttributeError):
+        trusted.first = 3
+
+
+def test_trusted_raises_error_for_invalid_value() -> None:
+    """Test that the trusted construction still evaluates the validations of the formula."""
+    with pytest.raises(NegativeValueError):
+        BranchingFormulaTest.trusted(value=-1)
+
+
+def test_batch_broadcasts_inputs() -> None:
+    """Test that the batch evaluation broadcasts the inputs against each other."""
+    result = FormulaTest.batch(first=np.array([[1.0], [2.0]]), second=np.array([10.0, 20.0, 30.0]))
+    expected = np.array([[11.0, 21.0, 31.0], [12.0, 22.0, 32.0]])
+    np.testing.assert_allclose(result, expected)
+
+
+def test_batch_with_dataframe() -> None:
+    """Test that the batch evaluation takes the inputs from the columns of a DataFrame, keyword arguments take precedence."""
+    dataframe = pd.DataFrame({"first": [1.0, 2.0], "second": [3.0, 4.0], "unused": ["a", "b"]})
+    np.testing.assert_allclose(FormulaTest.batch(dataframe), [4.0, 6.0])
+    np.testing.assert_allclose(FormulaTest.batch(dataframe, second=0.0), [1.0, 2.0])
+
+
+def test_batch_falls_back_to_scalar_evaluation() -> None:
+    """Test that formulas with scalar-only branching are evaluated element by element."""
+    values = np.array([1.0, 15.0, 8.0, 25.0])
+    result = BranchingFormulaTest.batch(value=values)
+    expected = [BranchingFormulaTest(value=value) for value in values]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_batch_raises_error_for_invalid_value() -> None:
+    """Test that the validations of the formula are applied to all elements of the batch."""
+    with pytest.raises(NegativeValueError):
+        BranchingFormulaTest.batch(value=np.array([1.0, -15.0, 8.0]))
+
+
+def test_batch_raises_error_for_missing_parameter() -> None:
+    """Test that an error is raised when a required parameter is not given."""
+    with pytest.raises(TypeError):
+        FormulaTest.batch(first=np.array([1.0, 2.0]))
@@ -0,0 +1,118 @@
+"""Parity tests between the batch evaluation and the scalar evaluation of all formulas in Blueprints.
+
+The cases are generated from the formula registry: every formula gets random values for the parameters of its ``_evaluate``
+method, of which the sets of values that the formula accepts (the scalar construction does not raise) are compared.
+"""
+
+import inspect
+import warnings
+
+import numpy as np
+import pytest
+
+from blueprints.codes import formula_registry
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_4_durability_and_cover.table_4_1 import (
+    Carbonation,
+    Chemical,
+    Chloride,
+    ChlorideSeawater,
+    FreezeThaw,
+    Table4Dot1ExposureClasses,
+)
+from blueprints.codes.formula import Formula
+
+N_ROWS = 200
+MIN_VALID_ROWS = 20
+RNG = np.random.default_rng(seed=1992)
+
+
+def numbers(rng: np.random.Generator) -> np.ndarray:
+    """Random numbers of all magnitudes between 0.01 and 1000, one in ten of them negative."""
+    return rng.choice([-1.0, 1.0], N_ROWS, p=[0.1, 0.9]) * 10 ** rng.uniform(-2, 3, N_ROWS)
+
+
+def choice(options: list, rng: np.random.Generator = RNG) -> np.ndarray:
+    """Random input values picked from the given options."""
+    return rng.choice(np.array(options, dtype=object), N_ROWS)
+
+
+EXPOSURE_CLASSES = [
+    Table4Dot1ExposureClasses(Carbonation.XC2, Chloride.XD1, ChlorideSeawater.XS3, FreezeThaw.XF4, Chemical.XA1),
+    Table4Dot1ExposureClasses(Carbonation.XC4, Chloride.NA, ChlorideSeawater.NA, FreezeThaw.XF4, Chemical.XA1),
+    Table4Dot1ExposureClasses(Carbonation.NA, Chloride.NA, ChlorideSeawater.NA, FreezeThaw.NA, Chemical.NA),
+]
+STRUCTURAL_CLASSES = [1, 2, 3, 4, 5, 6]
+
+# the values of the parameters of which the annotation does not describe the valid values, by formula
+INPUTS = {
+    "SubForm3Dot2CoefficientTypeOfCementS": {"cement_class": choice(["R", "N", "S", "r"])},
+    "Table4Dot4nMinimumCoverDurabilityReinforcementSteel": {
+        "exposure_classes": choice(EXPOSURE_CLASSES),
+        "structural_class": choice(STRUCTURAL_CLASSES),
+    },
+    "Table4Dot5nMinimumCoverDurabilityPrestressingSteel": {
+        "exposure_classes": choice(EXPOSURE_CLASSES),
+        "structural_class": choice(STRUCTURAL_CLASSES),
+    },
+    "SubForm8Dot15EtaP1": {"type_of_wire": choice(["indented", "3_7_wire_strands"])},
+    "SubForm8Dot16Alpha1": {"release_type": choice(["gradual", "sudden"])},
+    "SubForm8Dot16Alpha2": {"type_of_wire": choice(["circular", "3_7_wire_strands"])},
+    "SubForm8Dot2CoefficientQualityOfBond": {"bond_quality": choice(["good", "other", "Good"])},
+}
+
+# formulas of which a set of input values is not a row of values, so that they cannot be evaluated in batch
+NOT_BATCHED = {
+    "Form5Dot7EffectiveFlangeWidth": "the effective widths are a variable number of positional arguments",
+    "FormADot1DamageDuringDesignLife": "the numbers of cycles are lists",
+}
+
+
+def generated_inputs(formula: type[Formula]) -> dict[str, np.ndarray]:
+    """Random values for the parameters of the formula, from their annotations or :data:`INPUTS`.
+
+    The values of every formula are drawn from their own generator, so that they do not depend on the selection of the tests.
+    """
+    rng = np.random.default_rng(seed=[1992, *formula.__name__.encode()])
+    inputs = dict(INPUTS.get(formula.__name__, {}))
+    for name, parameter in inspect.signature(formula._evaluate).parameters.items():  # noqa: SLF001
+        if name in inputs:
+            continue
+        if parameter.annotation is float:
+            inputs[name] = numbers(rng)
+        elif parameter.annotation is int:
+            inputs[name] = rng.integers(1, 20, N_ROWS)
+        elif parameter.annotation is bool:
+            inputs[name] = choice([True, False], rng)
+        elif parameter.default is inspect.Parameter.empty:
+            pytest.fail(f"No random values for the parameter {name!r} of {formula.__name__}, add them to INPUTS.")
+    return inputs
+
+
+def scalar_evaluation(formula: type[Formula], row: dict) -> float | None:
+    """The result of constructing the formula, or None if the formula does not accept the values."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return float(formula(**row))
+    # the validations of the formulas raise their own exceptions, besides ValueError and TypeError
+    except Exception:
+        return None
+
+
+@pytest.mark.parametrize(
+    "name",
+    [pytest.param(name, marks=pytest.mark.skip(reason=NOT_BATCHED[name])) if name in NOT_BATCHED else name for name in formula_registry],
+)
+def test_batch_matches_scalar_evaluation(name: str) -> None:
+    """Test that the batch evaluation of a formula gives the same results as constructing the formula for each set of inputs."""
+    formula = formula_registry[name]
+    inputs = generated_inputs(formula)
+    rows = [{parameter: values[i].item() if values.dtype != object else values[i] for parameter, values in inputs.items()} for i in range(N_ROWS)]
+    results = [scalar_evaluation(formula, row) for row in rows]
+    valid = np.array([result is not None for result in results])
+    assert valid.sum() >= MIN_VALID_ROWS, f"Only {valid.sum()} of the random sets of values are valid for {name}, add inputs to INPUTS."
+
+    result = formula.batch(**{parameter: values[valid] for parameter, values in inputs.items()})
+
+    assert result.shape == (valid.sum(),)
+    np.testing.assert_allclose(result, [expected for expected in results if expected is not None], rtol=1e-12)
@@ -0,0 +1,92 @@
+"""Module for testing the formula registry."""
+
+import pkgutil
+import subprocess
+import sys
+import types
+
+import pytest
+
+from blueprints.codes import formula_registry
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_2 import (
+    Form8Dot2UltimateBondStress,
+    SubForm8Dot2CoefficientBarDiameter,
+    SubForm8Dot2CoefficientQualityOfBond,
+)
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_8_detailing_of_reinforcement_and_prestressing_tendons.formula_8_4 import (
+    Form8Dot4DesignAnchorageLength,
+)
+from blueprints.codes.formula_index import FORMULA_INDEX
+from blueprints.codes.formula_registry import FORMULA_INDEX_PATH, FormulaRegistry, build_formula_index, render_formula_index
+
+
+class TestFormulaRegistry:
+    """Validation for the FormulaRegistry class."""
+
+    def test_index_is_up_to_date(self) -> None:
+        """Test that the checked-in index matches the formulas in Blueprints.
+
+        Regenerate the index with blueprints.codes.formula_registry.write_formula_index() when this test fails.
+        """
+        index = build_formula_index()
+        assert index == FORMULA_INDEX
+        assert render_formula_index(index) == FORMULA_INDEX_PATH.read_text(encoding="utf-8")
+
+    def test_build_index_raises_error_for_duplicate_names(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that formula classes of the same name in different modules raise an error instead of replacing each other."""
+        modules = []
+        for name in ["blueprints.codes.duplicate_a", "blueprints.codes.duplicate_b"]:
+            module = types.ModuleType(name)
+            module.Form8Dot4DesignAnchorageLength = type(Form8Dot4DesignAnchorageLength)(  # type: ignore[attr-defined]
+                "Form8Dot4DesignAnchorageLength", (Form8Dot4DesignAnchorageLength,), {"__module__": name}
+            )
+            monkeypatch.setitem(sys.modules, name, module)
+            modules.append(pkgutil.ModuleInfo(None, name, ispkg=False))  # type: ignore[arg-type]
+        monkeypatch.setattr(pkgutil, "walk_packages", lambda *_args: modules)
+
+        with pytest.raises(
+            ValueError, match="Form8Dot4DesignAnchorageLength is defined in both blueprints.codes.duplicate_a and blueprints.codes.duplicate_b"
+        ):
+            build_formula_index()
+
+    def test_lookup_by_class_name(self) -> None:
+        """Test the lookup of a formula by its class name."""
+        assert formula_registry["Form8Dot4DesignAnchorageLength"] is Form8Dot4DesignAnchorageLength
+        assert "Form8Dot4DesignAnchorageLength" in formula_registry
+        assert len(formula_registry) == len(FORMULA_INDEX)
+
+    def test_lookup_by_label(self) -> None:
+        """Test the lookup of a formula and its sub-formulas by source document and label."""
+        assert formula_registry.by_label("NEN-EN 1992-1-1+C2:2011", "8.2") == (
+            Form8Dot2UltimateBondStress,
+            SubForm8Dot2CoefficientQualityOfBond,
+            SubForm8Dot2CoefficientBarDiameter,
+        )
+        assert formula_registry.by_label("NEN-EN 1992-1-1+C2:2011", "8.4") == (Form8Dot4DesignAnchorageLength,)
+
+    def test_source_documents(self) -> None:
+        """Test that the source documents of all codes are registered."""
+        assert "NEN-EN 1992-1-1+C2:2011" in formula_registry.source_documents()
+        assert "NEN-EN 1993-5:2008" in formula_registry.source_documents()
+
+    def test_raise_error_for_unknown_formula(self) -> None:
+        """Test that an error is raised for an unknown class name or label."""
+        with pytest.raises(KeyError, match="No formula named 'Form0Dot0'"):
+            formula_registry["Form0Dot0"]
+        with pytest.raises(KeyError, match="No formula '0.0' of 'NEN-EN 1992-1-1\\+C2:2011'"):
+            formula_registry.by_label("NEN-EN 1992-1-1+C2:2011", "0.0")
+
+    def test_registry_without_formulas(self) -> None:
+        """Test that a registry can be created from a custom index."""
+        assert list(FormulaRegistry({})) == []
+
+    def test_lookup_imports_only_target_module(self) -> None:
+        """Test that looking up a formula imports only the module of that formula (and its dependencies)."""
+        code = (
+            "import sys\n"
+            "from blueprints.codes import formula_registry\n"
+            "formula_registry['Form5Dot8RelativeWebSlenderness']\n"
+            "print(sorted(name for name in sys.modules if name.startswith('blueprints.codes.eurocode.') and name.count('.') == 5))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "['blueprints.codes.eurocode.nen_en_1993_5_2008.chapter_5_ultimate_limit_states.formula_5_8']"
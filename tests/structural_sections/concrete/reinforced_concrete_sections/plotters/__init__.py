@@ -0,0 +1 @@
+"""Tests for the plotters of reinforced concrete sections."""
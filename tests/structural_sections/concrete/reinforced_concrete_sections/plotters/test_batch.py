@@ -0,0 +1,96 @@
+"""Tests for the batch drawing of reinforced rectangular cross-sections."""
+
+import re
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.batch import draw_cross_sections
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+@pytest.fixture
+def cross_sections() -> dict[str, RectangularReinforcedCrossSection]:
+    """Return three rectangular reinforced cross-sections by name."""
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+    steel = ReinforcementSteelMaterial()
+    sections = {}
+    for name, (width, height, n) in {"B1": (300, 500, 3), "B2": (400, 600, 4), "C 1/2": (400, 400, 5)}.items():
+        cs = RectangularReinforcedCrossSection(width=width, height=height, concrete_material=concrete)
+        cs.add_stirrup_along_edges(diameter=8, distance=150, material=steel)
+        cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=16, edge="lower", material=steel)
+        sections[name] = cs
+    return sections
+
+
+def pdf_pages(path: Path) -> int:
+    """Return the number of pages of a PDF file written by matplotlib."""
+    return len(re.findall(rb"/Type /Page\b(?!s)", path.read_bytes()))
+
+
+class TestDrawCrossSections:
+    """Tests for the draw_cross_sections function."""
+
+    def test_pdf(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that a PDF file with a page per cross-section is written."""
+        output = tmp_path / "drawings" / "beams.pdf"
+        assert draw_cross_sections(cross_sections, output) == [output]
+        assert pdf_pages(output) == 3
+
+    def test_png(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that a PNG file per cross-section is written, named after the cross-section."""
+        paths = draw_cross_sections(cross_sections, tmp_path, dpi=20, include_legend=False)
+        assert [path.name for path in paths] == ["B1.png", "B2.png", "C_1_2.png"]
+        assert all(path.read_bytes().startswith(b"\x89PNG") for path in paths)
+        assert plt.imread(paths[0]).shape[:2] == (160, 300)
+
+    def test_png_equals_plot(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that the drawings on the reused figure equal the plots of the cross-sections."""
+        paths = draw_cross_sections(cross_sections, tmp_path / "batch", dpi=20)
+        for path, (title, cs) in zip(paths, cross_sections.items()):
+            figure = cs.plot(title=title)
+            figure.savefig(tmp_path / "plot.png", dpi=20)
+            plt.close(figure)
+            np.testing.assert_array_equal(plt.imread(path), plt.imread(tmp_path / "plot.png"))
+
+    def test_parallel_pdf(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that a PDF file is written in parts with multiple workers."""
+        paths = draw_cross_sections(cross_sections, tmp_path / "beams.pdf", max_workers=2)
+        assert [path.name for path in paths] == ["beams-1.pdf", "beams-2.pdf"]
+        assert [pdf_pages(path) for path in paths] == [1, 2]
+
+    def test_parallel_png(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that the PNG files with multiple workers equal the PNG files of a single process."""
+        paths = draw_cross_sections(cross_sections, tmp_path / "parallel", dpi=20, max_workers=2)
+        expected = draw_cross_sections(cross_sections, tmp_path / "serial", dpi=20)
+        assert [path.name for path in paths] == [path.name for path in expected]
+        assert [path.read_bytes() for path in paths] == [path.read_bytes() for path in expected]
+
+    def test_invalid_output(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that an output file that is not a PDF raises an error."""
+        with pytest.raises(ValueError, match="must be a PDF file"):
+            draw_cross_sections(cross_sections, tmp_path / "beams.png")
+
+    def test_png_file_name_collision(self, cross_sections: dict[str, RectangularReinforcedCrossSection], tmp_path: Path) -> None:
+        """Test that cross-sections of which the names give the same PNG file raise an error instead of overwriting each other."""
+        cross_sections["C_1_2"] = cross_sections["B1"]
+        with pytest.raises(ValueError, match="'C 1/2' and 'C_1_2' would both be drawn to 'C_1_2.png'"):
+            draw_cross_sections(cross_sections, tmp_path, max_workers=2)
+        assert not list(tmp_path.iterdir())
+
+        paths = draw_cross_sections(cross_sections, tmp_path / "sections.pdf")
+        assert pdf_pages(paths[0]) == len(cross_sections)
+
+    def test_draw(self, cross_sections: dict[str, RectangularReinforcedCrossSection]) -> None:
+        """Test that the plotter draws on its axes without showing the figure."""
+        plotter = cross_sections["B1"].plotter
+        plotter._start_plot()  # noqa: SLF001
+        axes = plotter.draw(title="B1")
+        assert isinstance(axes, Axes)
+        assert axes.get_title() == "B1"
+        plt.close(plotter.fig)
@@ -0,0 +1,107 @@
+"""Tests for the SVG renderer of reinforced rectangular cross-sections."""
+
+import subprocess
+import sys
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.svg import RectangularCrossSectionSvgRenderer
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+@pytest.fixture
+def cross_section() -> RectangularReinforcedCrossSection:
+    """Return a rectangular reinforced cross-section with two stirrups, two reinforcement configurations and a single rebar."""
+    steel = ReinforcementSteelMaterial()
+    cs = RectangularReinforcedCrossSection(
+        width=400,
+        height=600,
+        covers=CoversRectangular(upper=45, right=30, lower=35, left=50),
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+    )
+    cs.add_stirrup_along_edges(diameter=8, distance=150, material=steel)
+    cs.add_stirrup_along_edges(diameter=10, distance=300, material=steel)
+    cs.add_longitudinal_reinforcement_by_quantity(n=5, diameter=20, material=steel, edge="lower")
+    cs.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=steel, edge="upper")
+    cs.add_longitudinal_rebar(Rebar(diameter=16, x=0, y=0, material=steel))
+    return cs
+
+
+def texts(svg: ET.Element) -> list[str]:
+    """Return the texts of the text elements and their spans."""
+    return [element.text for element in svg.iter() if element.tag in (f"{SVG}text", f"{SVG}tspan") and element.text]
+
+
+class TestRectangularCrossSectionSvgRenderer:
+    """Tests for the RectangularCrossSectionSvgRenderer class."""
+
+    def test_render(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the drawing holds the concrete, the stirrups, the rebars, the dimensions, the title and the legend."""
+        renderer = RectangularCrossSectionSvgRenderer(cross_section)
+        svg = ET.fromstring(renderer.render(title="Beam B1", size=300))
+        rectangles = svg.findall(f"{SVG}rect")
+        assert [float(rectangle.get("width", 0)) for rectangle in rectangles[:1]] == [200]
+        assert [float(rectangle.get("stroke-width", 0)) for rectangle in rectangles[1:]] == [4, 5]
+        circles = svg.findall(f"{SVG}g/{SVG}circle")
+        assert len(circles) == 8
+        assert [(float(circles[0].get("cx", 0)), float(circles[0].get("cy", 0)), float(circles[0].get("r", 0)))] == [
+            pytest.approx((rebar.x / 2, -rebar.y / 2, rebar.radius / 2), abs=0.01) for rebar in cross_section.longitudinal_rebars[:1]
+        ]
+        assert texts(svg)[:4] == ["z", "y", "400 mm", "600 mm"]
+        assert texts(svg)[4:-1] == renderer.legend_text().split("\n")
+        assert texts(svg)[-1] == "Beam B1"
+
+    def test_legend_text(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the legend equals the legend of the matplotlib plotter."""
+        assert RectangularCrossSectionSvgRenderer(cross_section).legend_text() == cross_section.plotter.legend_text()
+
+    def test_custom_texts(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that custom texts replace the dimensions and the legend, and that the texts are escaped."""
+        markup = RectangularCrossSectionSvgRenderer(cross_section).render(
+            title="<B1 & B2>", custom_text_width="b", custom_text_height="h", custom_text_legend="legend"
+        )
+        assert texts(ET.fromstring(markup)) == ["z", "y", "b", "h", "legend", "<B1 & B2>"]
+        assert "&lt;B1 &amp; B2&gt;" in markup
+
+    def test_without_legend(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the legend can be left out, which makes the drawing narrower."""
+        renderer = RectangularCrossSectionSvgRenderer(cross_section)
+        with_legend = ET.fromstring(renderer.render())
+        without_legend = ET.fromstring(renderer.render(include_legend=False))
+        assert texts(without_legend) == ["z", "y", "400 mm", "600 mm"]
+        assert float(without_legend.get("width", 0)) < float(with_legend.get("width", 0))
+
+    def test_without_reinforcement(self) -> None:
+        """Test the drawing of a cross-section without reinforcement."""
+        cs = RectangularReinforcedCrossSection(width=300, height=300, concrete_material=ConcreteMaterial())
+        svg = ET.fromstring(RectangularCrossSectionSvgRenderer(cs).render(include_legend=False))
+        assert len(svg.findall(f"{SVG}rect")) == 1
+        assert svg.findall(f"{SVG}g") == []
+
+    def test_save(self, cross_section: RectangularReinforcedCrossSection, tmp_path: Path) -> None:
+        """Test that the drawing is written to a file."""
+        path = RectangularCrossSectionSvgRenderer(cross_section).save(tmp_path / "beam.svg", title="B1")
+        assert path.read_text(encoding="utf-8") == RectangularCrossSectionSvgRenderer(cross_section).render(title="B1")
+
+    def test_matplotlib_is_not_imported(self) -> None:
+        """Test that rendering does not import matplotlib."""
+        code = (
+            "import sys\n"
+            "from blueprints.materials.concrete import ConcreteMaterial\n"
+            "from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial\n"
+            "from blueprints.structural_sections.concrete.reinforced_concrete_sections.plotters.svg import RectangularCrossSectionSvgRenderer\n"
+            "from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection\n"
+            "cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial())\n"
+            "cs.add_stirrup_along_edges(diameter=8, distance=150, material=ReinforcementSteelMaterial())\n"
+            "RectangularCrossSectionSvgRenderer(cs).render()\n"
+            "print('matplotlib' in sys.modules)\n"
+        )
+        assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "False"
@@ -0,0 +1,51 @@
+"""Stress tests for the concurrent construction of reinforced cross-sections in threads and processes."""
+
+import math
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from shapely import Point
+
+from blueprints.geometry.line import Line
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+SECTIONS = 50
+
+
+def build_sections(width: float) -> list[tuple[list[int], int, float]]:
+    """Build cross-sections with two stirrup configurations and a line each, and return their IDs and reinforcement area."""
+    steel = ReinforcementSteelMaterial()
+    results = []
+    for _ in range(SECTIONS):
+        concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+        cs = RectangularReinforcedCrossSection(width=width, height=500, concrete_material=concrete)
+        cs.add_stirrup_along_edges(diameter=8, distance=150, material=steel)
+        cs.add_stirrup_in_center(width=100, diameter=8, distance=150, material=steel)
+        cs.add_longitudinal_reinforcement_by_quantity(n=4, diameter=16, material=steel, edge="lower")
+        line = Line(Point(0, 0, 0), Point(width, 0, 0))
+        results.append(([stirrup.id for stirrup in cs.stirrups], line.id, cs.reinforcement_area_longitudinal_bars))
+    return results
+
+
+@pytest.mark.parametrize("method", ["threads", "fork", "spawn"])
+def test_concurrent_construction(method: str) -> None:
+    """Test that cross-sections built concurrently have unique stirrup and line IDs, and equal reinforcement."""
+    executor: Executor
+    if method == "threads":
+        executor = ThreadPoolExecutor(max_workers=8)
+    elif method in multiprocessing.get_all_start_methods():
+        executor = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context(method))
+    else:
+        pytest.skip(f"Start method '{method}' is not available.")
+    with executor:
+        results = [result for batch in executor.map(build_sections, [300.0, 400.0] * 8) for result in batch]
+
+    stirrup_ids = [id_ for ids, _, _ in results for id_ in ids]
+    line_ids = [line_id for _, line_id, _ in results]
+    assert len(results) == 16 * SECTIONS
+    assert len(set(stirrup_ids)) == len(stirrup_ids)
+    assert len(set(line_ids)) == len(line_ids)
+    assert {round(area, 6) for _, _, area in results} == {round(4 * 0.25 * math.pi * 16**2, 6)}
@@ -3,7 +3,7 @@
 import pytest
 from shapely import Polygon
 
-from blueprints.structural_sections.cross_section_shapes import CircularCrossSection, RectangularCrossSection
+from blueprints.structural_sections.cross_section_shapes import CircularCrossSection, PolygonCrossSection, RectangularCrossSection
 
 
 class TestCircularCrossSection:
@@ -75,3 +75,36 @@ class TestRectangularCrossSection:
         assert len(vertices) == 5
         assert (first_vertex.x, first_vertex.y) == pytest.approx(expected=(-50.0, -100.00), rel=1e-6)
         assert (last_vertex.x, last_vertex.y) == pytest.approx(expected=(-50.0, -100.00), rel=1e-6)
+
+
+class TestPolygonCrossSection:
+    """Tests for the PolygonCrossSection class."""
+
+    @pytest.mark.parametrize(
+        ("cross_section", "area", "perimeter", "centroid_y"),
+        [
+            (PolygonCrossSection.t_shape(width_flange=800, thickness_flange=150, width_web=300, height=600), 255000.0, 2800.0, 66.176471),
+            (PolygonCrossSection.l_shape(width=500, height=400, thickness_flange=150, thickness_web=200), 125000.0, 1800.0, -45.0),
+            (PolygonCrossSection.i_shape(width=400, height=800, thickness_flanges=120, thickness_web=150), 180000.0, 2900.0, 0.0),
+            (PolygonCrossSection.hollow_rectangle(width=600, height=800, thickness=120), 278400.0, 4640.0, 0.0),
+        ],
+    )
+    def test_shapes(self, cross_section: PolygonCrossSection, area: float, perimeter: float, centroid_y: float) -> None:
+        """Test the area, the perimeter (including the holes), the centroid and the centered bounding box of the shapes."""
+        assert cross_section.area == pytest.approx(expected=area, rel=1e-6)
+        assert cross_section.perimeter == pytest.approx(expected=perimeter, rel=1e-6)
+        assert cross_section.centroid.y == pytest.approx(expected=centroid_y, abs=1e-6)
+        min_x, min_y, max_x, max_y = cross_section.geometry.bounds
+        assert (min_x + max_x, min_y + max_y) == (0.0, 0.0)
+
+    def test_vertices(self) -> None:
+        """Test that the vertices are the vertices of the outer boundary."""
+        cross_section = PolygonCrossSection.hollow_rectangle(width=600, height=800, thickness=120)
+        assert len(cross_section.vertices) == 5
+        assert (cross_section.vertices[0].x, cross_section.vertices[0].y) == (-300.0, -400.0)
+
+    @pytest.mark.parametrize("polygon", [Polygon(), Polygon([(0, 0), (100, 100), (100, 0), (0, 100)])])
+    def test_invalid_polygon(self, polygon: Polygon) -> None:
+        """Test that an empty or self-intersecting polygon raises a ValueError."""
+        with pytest.raises(ValueError, match="valid polygon"):
+            PolygonCrossSection(polygon)
@@ -0,0 +1,88 @@
+"""Tests for the N-M interaction diagrams of reinforced concrete cross-sections."""
+
+import numpy as np
+import pytest
+import shapely
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.cross_section_shapes import PolygonCrossSection
+
+
+@pytest.fixture
+def interaction_diagram() -> InteractionDiagram:
+    """Return the interaction diagram of a rectangular cross-section with 3⌀20 at the lower side."""
+    cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return InteractionDiagram.from_cross_section(cs)
+
+
+class TestInteractionDiagram:
+    """Tests for the InteractionDiagram class."""
+
+    def test_axial_resistances(self, interaction_diagram: InteractionDiagram) -> None:
+        """Test the resistances to pure tension and the bounds of the resistance to compression."""
+        area = 3 * np.pi * 10**2
+        assert interaction_diagram.n.min() == pytest.approx(-500 / 1.15 * area / 1000)
+        assert 20 * (300 * 500 - area) / 1000 < interaction_diagram.n.max() <= (20 * (300 * 500 - area) + 500 / 1.15 * area) / 1000
+
+    @pytest.mark.parametrize(
+        ("diagram_type", "alpha", "beta"),
+        [(DiagramType.PARABOLIC, 17 / 21, 99 / 238), (DiagramType.BILINEAR, 3 / 4, 7 / 18)],
+    )
+    def test_pure_bending(self, diagram_type: DiagramType, alpha: float, beta: float) -> None:
+        """Test the resistance to pure bending against the equivalent stress block of the diagram of the concrete."""
+        concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=diagram_type)
+        cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=concrete)
+        cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+        interaction_diagram = InteractionDiagram.from_cross_section(cs)
+
+        area, d = 3 * np.pi * 10**2, 440
+        x_u = 500 / 1.15 * area / (alpha * 300 * 20)
+        m_rd = 500 / 1.15 * area * (d - beta * x_u) / 1e6
+        assert 1 / interaction_diagram.unity_check(0.0, 1.0) == pytest.approx(m_rd, rel=5e-3)
+
+    def test_hollow_section(self) -> None:
+        """Test the diagram of a symmetrically reinforced hollow section, integrated over a triangulation of the concrete."""
+        cs = ReinforcedCrossSection(
+            cross_section=PolygonCrossSection.hollow_rectangle(width=600, height=800, thickness=150),
+            concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+        )
+        for x in (-220, 0, 220):
+            for y in (-320, 320):
+                cs.add_longitudinal_rebar(Rebar(diameter=25, x=x, y=y, material=ReinforcementSteelMaterial()))
+        interaction_diagram = InteractionDiagram.from_fiber_section(FiberSection.from_triangulation(cs))
+        area = 6 * np.pi * 12.5**2
+
+        assert interaction_diagram.n.min() == pytest.approx(-500 / 1.15 * area / 1000)
+        assert 20 * (cs.cross_section.area - area) / 1000 < interaction_diagram.n.max()
+        # symmetric up to the integration error, as the triangulation of the concrete is not symmetric
+        assert interaction_diagram.m.max() == pytest.approx(-interaction_diagram.m.min(), rel=1e-3)
+
+    def test_unity_checks(self, interaction_diagram: InteractionDiagram) -> None:
+        """Test that the unity checks agree with a point-in-polygon test of the diagram."""
+        rng = np.random.default_rng(0)
+        n, m = rng.uniform(-600, 3600, 5000), rng.uniform(-300, 300, 5000)
+        unity_checks = interaction_diagram.unity_check(n, m)
+        polygon = shapely.Polygon(np.column_stack([interaction_diagram.n, interaction_diagram.m]))
+
+        boundary = np.isclose(unity_checks, 1.0, rtol=1e-6)
+        np.testing.assert_array_equal((unity_checks <= 1.0)[~boundary], shapely.contains_xy(polygon, n, m)[~boundary])
+        np.testing.assert_array_equal(interaction_diagram.contains(n, m), unity_checks <= 1.0)
+        assert interaction_diagram.unity_check(np.zeros((2, 3)), 0.0).shape == (2, 3)
+        np.testing.assert_array_equal(interaction_diagram.unity_check(0.0, 0.0), 0.0)
+
+    def test_proportional_loading(self, interaction_diagram: InteractionDiagram) -> None:
+        """Test that the unity check is proportional to the load."""
+        assert interaction_diagram.unity_check(1000.0, 150.0) == pytest.approx(2 * interaction_diagram.unity_check(500.0, 75.0))
+
+    @pytest.mark.parametrize(("n", "m"), [([0.0, 1.0], [0.0, 1.0, 2.0]), ([[0.0, 1.0, 2.0]], [[0.0, 1.0, 2.0]]), ([0.0, 1.0], [0.0, 1.0])])
+    def test_invalid_vertices(self, n: list, m: list) -> None:
+        """Test that vertices of a different length, of more dimensions or fewer than 3 vertices raise a ValueError."""
+        with pytest.raises(ValueError):
+            InteractionDiagram(n=np.array(n), m=np.array(m))
@@ -0,0 +1,138 @@
+"""Tests for the N-Mx-My interaction surfaces of reinforced concrete cross-sections."""
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_5_structural_analysis.formula_5_39 import Form5Dot39SimplifiedCriterionBiaxialBending
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections import interaction_surface
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_surface import InteractionSurface, _ray_distances
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+@pytest.fixture(scope="module")
+def cross_section() -> RectangularReinforcedCrossSection:
+    """Return a square column with 3⌀20 at every side."""
+    cs = RectangularReinforcedCrossSection(width=400, height=400, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="upper")
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    cs.add_longitudinal_rebar(Rebar(diameter=20, x=-140, y=0, material=ReinforcementSteelMaterial()))
+    cs.add_longitudinal_rebar(Rebar(diameter=20, x=140, y=0, material=ReinforcementSteelMaterial()))
+    return cs
+
+
+@pytest.fixture(scope="module")
+def surface(cross_section: RectangularReinforcedCrossSection) -> InteractionSurface:
+    """Return the interaction surface of the square column."""
+    return InteractionSurface.from_cross_section(cross_section)
+
+
+@pytest.fixture(scope="module")
+def loads() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return random loads around the interaction surface."""
+    rng = np.random.default_rng(0)
+    return rng.uniform(-1000, 5000, 20000), rng.uniform(-300, 300, 20000), rng.uniform(-300, 300, 20000)
+
+
+class TestInteractionSurface:
+    """Tests for the InteractionSurface class."""
+
+    def test_closed_surface(self, surface: InteractionSurface) -> None:
+        """Test that the triangles form a closed surface without collapsed triangles: every edge is shared by two triangles."""
+        edges = np.sort(surface.triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        assert np.all(counts == 2)
+
+    def test_unity_checks_against_all_triangles(self, surface: InteractionSurface, loads: tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        """Test that the unity checks with the lookup of the triangles equal those of testing all triangles."""
+        n, m_x, m_y = loads
+        unity_checks = surface.unity_check(n, m_x, m_y)
+        directions = np.column_stack([n, m_x, m_y])[:500] / surface._scale  # noqa: SLF001
+        expected = 1 / _ray_distances(directions[:, np.newaxis], surface._corners[np.newaxis]).min(axis=1)  # noqa: SLF001
+
+        assert np.isfinite(unity_checks).all()
+        np.testing.assert_allclose(unity_checks[:500], expected, rtol=1e-12)
+        np.testing.assert_array_equal(surface.contains(n, m_x, m_y), unity_checks <= 1.0)
+
+    def test_uniaxial_bending(self, cross_section: RectangularReinforcedCrossSection, surface: InteractionSurface) -> None:
+        """Test that the surface agrees with the interaction diagram for bending about the x-axis and is symmetric."""
+        interaction_diagram = InteractionDiagram.from_cross_section(cross_section)
+        n, m = np.linspace(-400, 4000, 23), np.linspace(-250, 250, 23)
+
+        np.testing.assert_allclose(surface.unity_check(n, m, 0.0), interaction_diagram.unity_check(n, m), rtol=1e-2)
+        np.testing.assert_allclose(surface.unity_check(n, m, 0.0), surface.unity_check(n, 0.0, m), rtol=1e-2)
+
+    def test_triangulated_section(self, cross_section: RectangularReinforcedCrossSection, surface: InteractionSurface) -> None:
+        """Test that the surface of the Gauss points of a triangulation agrees with the surface of the grid of fibers."""
+        triangulated = InteractionSurface.from_fiber_section(FiberSection.from_triangulation(cross_section))
+        n, m_x, m_y = np.linspace(-400, 4000, 23), np.linspace(-250, 250, 23), np.linspace(200, -200, 23)
+        np.testing.assert_allclose(triangulated.unity_check(n, m_x, m_y), surface.unity_check(n, m_x, m_y), rtol=2e-2)
+
+    def test_proportional_loading(self, surface: InteractionSurface) -> None:
+        """Test that the unity check is proportional to the load and zero without load."""
+        assert surface.unity_check(2000.0, 100.0, 80.0) == pytest.approx(2 * surface.unity_check(1000.0, 50.0, 40.0))
+        assert surface.unity_check(np.zeros((2, 3)), 0.0, 0.0).shape == (2, 3)
+        np.testing.assert_array_equal(surface.unity_check(0.0, 0.0, 0.0), 0.0)
+        assert surface.unity_check(np.array([]), 0.0, 0.0).shape == (0,)
+
+    def test_moment_resistances(self, cross_section: RectangularReinforcedCrossSection, surface: InteractionSurface) -> None:
+        """Test the resistances to uniaxial bending at the normal force of loads, as used by formula 5.39."""
+        interaction_diagram = InteractionDiagram.from_cross_section(cross_section)
+        m_rdx, m_rdy = surface.moment_resistances(np.array([0.0, 1e5]), m_x=np.array([-1.0, 1.0]))
+
+        assert m_rdx[0] == pytest.approx(1 / interaction_diagram.unity_check(0.0, -1.0), rel=1e-2)
+        assert m_rdy[0] == pytest.approx(m_rdx[0], rel=1e-2)
+        np.testing.assert_array_equal([m_rdx[1], m_rdy[1]], 0.0)
+
+        m_rdx, m_rdy = surface.moment_resistances(1000.0)
+        assert bool(Form5Dot39SimplifiedCriterionBiaxialBending(m_edz=0.5 * m_rdy, m_rdz=m_rdy, m_edy=0.5 * m_rdx, m_rdy=m_rdx, a=1.5))
+        assert surface.unity_check(1000.0, 0.5 * m_rdx, 0.5 * m_rdy) < 1.0
+
+    def test_lookup_without_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the rays of loads around the tension pole are found in their bin, without testing all triangles.
+
+        The long triangles around the pole of a beam with reinforcement at one side bulge in latitude between their corners.
+        """
+        cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+        cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+        surface = InteractionSurface.from_cross_section(cs)
+        rng = np.random.default_rng(0)
+        n_min, m_x, m_y = surface.vertices.min(axis=0)
+        loads = rng.uniform(n_min, 0.0, 20000), rng.uniform(0.1 * m_x, -0.1 * m_x, 20000), rng.uniform(0.1 * m_y, -0.1 * m_y, 20000)
+
+        fallback_rays = []
+
+        def counting_ray_distances(directions: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+            fallback_rays.append(len(directions))
+            return _ray_distances(directions, triangles)
+
+        monkeypatch.setattr(interaction_surface, "_ray_distances", counting_ray_distances)
+        unity_checks = surface.unity_check(*loads)
+        monkeypatch.undo()
+
+        assert sum(fallback_rays) == 0
+        directions = np.column_stack(loads)[:500] / surface._scale  # noqa: SLF001
+        expected = 1 / _ray_distances(directions[:, np.newaxis], surface._corners[np.newaxis]).min(axis=1)  # noqa: SLF001
+        np.testing.assert_allclose(unity_checks[:500], expected, rtol=1e-12)
+
+    @pytest.mark.filterwarnings("error")
+    def test_collapsed_triangles_without_warnings(self) -> None:
+        """Test that rays to collapsed triangles miss them without floating point warnings."""
+        rng = np.random.default_rng(0)
+        start, step = rng.normal(size=(200, 3)), rng.normal(size=(200, 3))
+        triangles = np.stack([start, start + step, start + 2 * step], axis=1)
+
+        np.testing.assert_array_equal(_ray_distances(rng.normal(size=(200, 3)), triangles), np.inf)
+
+    @pytest.mark.parametrize(
+        ("vertices", "triangles"),
+        [(np.zeros((4, 2)), np.zeros((4, 3))), (np.zeros((4, 3)), np.zeros((4, 2))), (np.zeros((4, 3)), np.zeros((3, 3)))],
+    )
+    def test_invalid_surface(self, vertices: np.ndarray, triangles: np.ndarray) -> None:
+        """Test that vertices or triangles of the wrong shape raise a ValueError."""
+        with pytest.raises(ValueError):
+            InteractionSurface(vertices=vertices, triangles=triangles)
@@ -0,0 +1,81 @@
+"""Tests for the moment-curvature diagrams of reinforced concrete cross-sections."""
+
+import numpy as np
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.fiber_section import FiberSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.moment_curvature import MomentCurvatureDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+
+
+@pytest.fixture
+def cross_section() -> RectangularReinforcedCrossSection:
+    """Return a rectangular cross-section with 3⌀20 at the lower side."""
+    cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return cs
+
+
+class TestMomentCurvatureDiagram:
+    """Tests for the MomentCurvatureDiagram class."""
+
+    def test_cracked_elastic_stiffness(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the stiffness of small curvatures without normal force against the cracked, elastic cross-section."""
+        curvature = np.array([0.0, 1e-7])
+        diagram = MomentCurvatureDiagram.from_cross_section(cross_section, curvature=curvature)
+
+        # depth of the compression zone and second moment of area of the cracked cross-section with E_c = f_cd / ε_c3
+        e_c, area, d = 20 / 0.00175, 3 * np.pi * 10**2, 440
+        ratio = 200000 / e_c
+        x = ratio * area / 300 * (np.sqrt(1 + 2 * 300 * d / (ratio * area)) - 1)
+        i_cr = 300 * x**3 / 3 + ratio * area * (d - x) ** 2
+        assert diagram.moment.shape == (1, 2)
+        assert diagram.moment[0, 0] == pytest.approx(0.0, abs=1e-9)
+        assert diagram.moment[0, 1] == pytest.approx(e_c * i_cr * 1e-7 / 1e6, rel=1e-3)
+
+    def test_normal_force_levels(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the diagrams of several normal forces reach the resistances of the interaction diagram."""
+        normal_force = np.array([-200.0, 0.0, 500.0, 1500.0])
+        diagram = MomentCurvatureDiagram.from_cross_section(cross_section, normal_force=normal_force, n_steps=200)
+        interaction_diagram = InteractionDiagram.from_cross_section(cross_section)
+        resistances = diagram.resisting_moment * interaction_diagram.unity_check(normal_force, diagram.resisting_moment)
+
+        assert diagram.moment.shape == (4, 200)
+        assert diagram.ultimate_curvature.shape == (4,)
+        np.testing.assert_allclose(diagram.resisting_moment, resistances, rtol=2e-2)
+        assert np.all(np.diff(diagram.ultimate_curvature) < 0)
+
+    def test_beyond_ultimate_curvature(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the moments beyond the ultimate curvature, or without equilibrium, are NaN."""
+        diagram = MomentCurvatureDiagram.from_cross_section(cross_section, normal_force=np.array([0.0, 1e5]), curvature=np.linspace(0, 2e-4, 50))
+
+        assert np.isnan(diagram.moment[0, -1])
+        assert np.isnan(diagram.moment[1]).all()
+        assert np.isnan(diagram.ultimate_curvature[1])
+        assert np.isnan(diagram.resisting_moment[1])
+        assert diagram.ultimate_curvature[0] == pytest.approx(diagram.curvature[~np.isnan(diagram.moment[0])].max())
+
+    def test_triangulated_section(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the diagrams of the Gauss points of a triangulation agree with those of the concrete layers."""
+        normal_force, curvature = np.array([0.0, 1000.0]), np.linspace(0.0, 2e-5, 9)
+        layers = MomentCurvatureDiagram.from_cross_section(cross_section, normal_force=normal_force, curvature=curvature)
+        triangulated = MomentCurvatureDiagram.from_fiber_section(
+            FiberSection.from_triangulation(cross_section, n_subdivisions=16), normal_force=normal_force, curvature=curvature
+        )
+        np.testing.assert_allclose(triangulated.moment, layers.moment, rtol=1e-2, atol=1e-9)
+
+    def test_steel_governs_ultimate_curvature(self) -> None:
+        """Test that the strain of the reinforcement at the ultimate curvature of a lightly reinforced cross-section is εud = 0.9 εuk."""
+        cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37))
+        cs.add_longitudinal_reinforcement_by_quantity(n=2, diameter=12, material=ReinforcementSteelMaterial(), edge="lower")
+        diagram = MomentCurvatureDiagram.from_cross_section(cs)
+
+        ultimate = np.flatnonzero(diagram.curvature == diagram.ultimate_curvature[0])[0]
+        eps_0, kappa = diagram.eps_0[0, ultimate], diagram.curvature[ultimate]
+        eps_ud = 0.9 * ReinforcementSteelMaterial().eps_uk / 1000
+        assert eps_ud == pytest.approx(0.045)
+        assert eps_0 + kappa * cs.rebar_set.y.min() == pytest.approx(-eps_ud, rel=1e-3)
+        assert eps_0 + kappa * 250 < 0.0035
@@ -2,16 +2,21 @@
 
 from typing import Literal
 
+import numpy as np
 import pytest
 from matplotlib import pyplot as plt
 from shapely import LineString, Polygon
+from shapely.geometry.base import BaseGeometry
 
 from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
 from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
 from blueprints.structural_sections.concrete.covers import CoversRectangular
 from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
 from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
-from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import ReinforcementByQuantity
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_configurations import (
+    ReinforcementByQuantity,
+)
 from blueprints.structural_sections.concrete.stirrups import StirrupConfiguration
 
 
@@ -130,6 +135,20 @@ class TestRectangularReinforcedCrossSection:
                 edge="wrong",  # type: ignore[arg-type]
             )
 
+    def test_add_longitudinal_reinforcement_by_distance(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the add_longitudinal_reinforcement_by_distance method."""
+        rectangular_reinforced_cross_section.add_longitudinal_reinforcement_by_distance(
+            center_to_center=150,
+            diameter=16,
+            material=rectangular_reinforced_cross_section.get_present_steel_materials()[0],
+            edge="lower",
+        )
+        # 5 bars on the reference line of 1000 - 30 - 50 - 2 * 12 - 16 = 880 mm, with the area of 880 / 150 bars
+        assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == 15
+        assert rectangular_reinforced_cross_section.reinforcement_area_longitudinal_bars == pytest.approx(
+            0.25 * np.pi * (5 * 14**2 + 4 * 40**2 + 12**2 + 16**2 * 880 / 150)
+        )
+
     def test_plot(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
         """Test the plot method."""
         plot = rectangular_reinforced_cross_section.plot(show=False, center_line_style={"linewidth": 0.85})
@@ -213,3 +232,114 @@ class TestRectangularReinforcedCrossSection:
         rectangular_reinforced_cross_section._single_longitudinal_rebars.append(rebar)  # noqa: SLF001
         with pytest.raises(ValueError):
             _ = rectangular_reinforced_cross_section.longitudinal_rebars
+
+    def test_longitudinal_rebars_are_cached(
+        self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeated reads of the rebars and derived properties do not resolve the layout again."""
+        calls = []
+        to_rebar_set = ReinforcementByQuantity.to_rebar_set
+        within = RebarSet.within
+
+        def counting_to_rebar_set(configuration: ReinforcementByQuantity, line: LineString) -> RebarSet:
+            calls.append("to_rebar_set")
+            return to_rebar_set(configuration, line)
+
+        def counting_within(rebar_set: RebarSet, geometry: BaseGeometry) -> np.ndarray:
+            calls.append("within")
+            return within(rebar_set, geometry)
+
+        monkeypatch.setattr(ReinforcementByQuantity, "to_rebar_set", counting_to_rebar_set)
+        monkeypatch.setattr(RebarSet, "within", counting_within)
+
+        # the first, uncached read resolves the layout, which shows that the spies are live
+        rectangular_reinforced_cross_section._invalidate_longitudinal_rebars()  # noqa: SLF001
+        _ = rectangular_reinforced_cross_section.longitudinal_rebars
+        assert "to_rebar_set" in calls
+        assert "within" in calls
+
+        calls.clear()
+        for _ in range(3):
+            _ = rectangular_reinforced_cross_section.longitudinal_rebars
+            _ = rectangular_reinforced_cross_section.rebar_set
+            _ = rectangular_reinforced_cross_section.reinforcement_weight
+            _ = rectangular_reinforced_cross_section.reinforcement_area_longitudinal_bars
+            _ = rectangular_reinforced_cross_section.get_present_steel_materials()
+
+        assert calls == []
+
+    def test_longitudinal_rebars_cache_invalidated_by_stirrups(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that adding a stirrup configuration shifts the cached rebars of the reference lines."""
+        upper_y = max(rebar.y for rebar in rectangular_reinforced_cross_section.longitudinal_rebars)
+        rectangular_reinforced_cross_section.add_stirrup_along_edges(
+            diameter=16,
+            distance=150,
+            material=rectangular_reinforced_cross_section.get_present_steel_materials()[0],
+        )
+        assert max(rebar.y for rebar in rectangular_reinforced_cross_section.longitudinal_rebars) == pytest.approx(upper_y - 4)
+
+    def test_longitudinal_rebars_cache_invalidated_by_rebars(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that adding rebars and reinforcement configurations invalidates the cached rebars."""
+        rebars = rectangular_reinforced_cross_section.longitudinal_rebars
+        rebar = rectangular_reinforced_cross_section.add_longitudinal_rebar(rebar=Rebar(diameter=12, x=250, y=-100, material=rebars[0].material))
+        rectangular_reinforced_cross_section.add_reinforcement_configuration(
+            line=LineString([(-300, 200), (300, 200)]),
+            configuration=ReinforcementByQuantity(diameter=12, n=3, material=rebars[0].material),
+        )
+        assert rebar in rectangular_reinforced_cross_section.longitudinal_rebars
+        assert len(rectangular_reinforced_cross_section.longitudinal_rebars) == len(rebars) + 4
+
+    def test_rebar_set(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the rebar set holds the longitudinal rebars as arrays."""
+        rebar_set = rectangular_reinforced_cross_section.rebar_set
+        assert list(rebar_set) == rectangular_reinforced_cross_section.longitudinal_rebars
+        assert rebar_set.area == pytest.approx(rectangular_reinforced_cross_section.reinforcement_area_longitudinal_bars)
+        assert rectangular_reinforced_cross_section.rebar_set is rebar_set
+
+    def test_gross_section_properties(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the section properties of the concrete cross-section."""
+        properties = rectangular_reinforced_cross_section.gross_section_properties
+        assert properties.area == pytest.approx(1000 * 800)
+        assert properties.i_xx == pytest.approx(1000 * 800**3 / 12)
+        assert properties.i_yy == pytest.approx(800 * 1000**3 / 12)
+
+    def test_net_and_transformed_section_properties(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the rebars are subtracted from and transformed into the concrete cross-section."""
+        cs = rectangular_reinforced_cross_section
+        rebars = cs.longitudinal_rebars
+        area = sum(rebar.area for rebar in rebars)
+        i_xx = sum(rebar.area * rebar.y**2 + np.pi * rebar.diameter**4 / 64 for rebar in rebars)
+        n = rebars[0].material.e_s / cs.concrete_material.e_c
+
+        net = cs.net_section_properties
+        assert net.area == pytest.approx(1000 * 800 - area)
+        assert net.centroid_y * net.area == pytest.approx(-sum(rebar.area * rebar.y for rebar in rebars))
+        assert net.i_xx + net.area * net.centroid_y**2 == pytest.approx(1000 * 800**3 / 12 - i_xx)
+
+        transformed = cs.transformed_section_properties
+        assert transformed.area == pytest.approx(1000 * 800 + (n - 1) * area)
+        assert transformed.i_xx + transformed.area * transformed.centroid_y**2 == pytest.approx(1000 * 800**3 / 12 + (n - 1) * i_xx)
+        assert transformed.bounds == cs.gross_section_properties.bounds
+
+    def test_section_properties_are_cached(self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the section properties are cached until the rebar layout changes."""
+        cs = rectangular_reinforced_cross_section
+        transformed = cs.transformed_section_properties
+        assert cs.transformed_section_properties is transformed
+        cs.add_longitudinal_rebar(rebar=Rebar(diameter=32, x=0, y=0, material=cs.longitudinal_rebars[0].material))
+        assert cs.transformed_section_properties.area > transformed.area
+
+    def test_transformed_section_properties_follow_concrete_material(
+        self, rectangular_reinforced_cross_section: RectangularReinforcedCrossSection
+    ) -> None:
+        """Test that the cached transformed section properties follow a change of the concrete material, by its modular ratio."""
+        cs = rectangular_reinforced_cross_section
+        cs.concrete_material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C20_25)
+        net, transformed = cs.net_section_properties, cs.transformed_section_properties
+        area = sum(rebar.area for rebar in cs.longitudinal_rebars)
+        e_s = cs.longitudinal_rebars[0].material.e_s
+
+        cs.concrete_material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C90_105)
+        assert cs.net_section_properties is net
+        assert cs.transformed_section_properties.area == pytest.approx(1000 * 800 + (e_s / cs.concrete_material.e_c - 1) * area)
+        assert cs.transformed_section_properties.area < transformed.area
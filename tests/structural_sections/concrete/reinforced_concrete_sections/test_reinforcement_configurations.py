@@ -1,5 +1,6 @@
 """Tests reinforcement configurations."""
 
+import numpy as np
 import pytest
 from shapely import LineString
 
@@ -54,6 +55,15 @@ class TestReinforcementByDistance:
         assert all(rebar.diameter == 12 for rebar in rebars)
         assert all(rebar.material == ReinforcementSteelMaterial() for rebar in rebars)
 
+    def test_to_rebar_set(self, reinforcement_by_distance: ReinforcementByDistance) -> None:
+        """Test that the rebars are placed symmetrically along a bent line, with the area of the configuration."""
+        line = LineString([(0, 0), (500, 0), (500, 450)])
+        rebar_set = reinforcement_by_distance.to_rebar_set(line=line)
+        assert len(rebar_set) == 9
+        np.testing.assert_allclose(rebar_set.x, [75, 175, 275, 375, 475, 500, 500, 500, 500])
+        np.testing.assert_allclose(rebar_set.y, [0, 0, 0, 0, 0, 75, 175, 275, 375])
+        assert rebar_set.area == pytest.approx(reinforcement_by_distance.area * 0.95)
+
 
 class TestReinforcementByQuantity:
     """Tests for the reinforcement by quantity configuration."""
@@ -100,6 +110,14 @@ class TestReinforcementByQuantity:
         assert all(rebar.diameter == 12 for rebar in rebars)
         assert all(rebar.material == ReinforcementSteelMaterial() for rebar in rebars)
 
+    def test_to_rebar_set(self, reinforcement_by_quantity: ReinforcementByQuantity) -> None:
+        """Test that the rebars are evenly distributed along a bent line, from its start to its end."""
+        line = LineString([(0, 0), (600, 0), (600, 300)])
+        rebar_set = reinforcement_by_quantity.to_rebar_set(line=line)
+        np.testing.assert_allclose(rebar_set.x, [0, 100, 200, 300, 400, 500, 600, 600, 600, 600])
+        np.testing.assert_allclose(rebar_set.y, [0, 0, 0, 0, 0, 0, 0, 100, 200, 300])
+        np.testing.assert_array_equal(rebar_set.diameter, 12)
+
     def test__repr__(self, reinforcement_by_quantity: ReinforcementByQuantity) -> None:
         """Test the representation of the reinforcement."""
         representation = repr(reinforcement_by_quantity)
@@ -0,0 +1,139 @@
+"""Tests for the optimization of the longitudinal reinforcement layout of rectangular reinforced cross-sections."""
+
+from functools import partial
+from typing import Literal
+
+import numpy as np
+import pytest
+
+from blueprints.codes.eurocode.nen_en_1992_1_1_c2_2011.chapter_9_detailling_and_specific_rules.formula_9_1n import (
+    Form9Dot1nMinimumTensileReinforcementBeam,
+)
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.covers import CoversRectangular
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.reinforcement_optimizer import (
+    EdgeGeometry,
+    LayoutCandidate,
+    ReinforcementLayoutOptimizer,
+)
+
+
+def beam(width: float = 300, height: float = 500) -> RectangularReinforcedCrossSection:
+    """Return a rectangular cross-section with stirrups ⌀8 and without longitudinal reinforcement."""
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37)
+    cs = RectangularReinforcedCrossSection(width=width, height=height, concrete_material=concrete, covers=CoversRectangular(35, 30, 40, 30))
+    cs.add_stirrup_along_edges(diameter=8, distance=150, material=ReinforcementSteelMaterial())
+    return cs
+
+
+def resists_moment(cross_section: RectangularReinforcedCrossSection, m_ed: float) -> bool:
+    """Check whether a cross-section resists a positive moment in pure bending."""
+    return bool(InteractionDiagram.from_cross_section(cross_section, n_planes=40, n_layers=40).contains(0.0, m_ed))
+
+
+class TestEdgeGeometry:
+    """Tests for the EdgeGeometry class."""
+
+    @pytest.mark.parametrize("edge", ["upper", "right", "lower", "left"])
+    def test_reference_lines(self, edge: Literal["upper", "right", "lower", "left"]) -> None:
+        """Test that the geometry of the edge equals the reference lines of the rebars of the cross-section."""
+        cs = beam()
+        geometry = EdgeGeometry.from_cross_section(cs, edge)
+        for diameter in (10, 25):
+            line = cs._get_reference_line(edge=edge, diameter=diameter)  # noqa: SLF001
+            assert geometry.length - diameter == pytest.approx(line.length)
+            distance = line.centroid.y + 250 if edge == "upper" else 250 - line.centroid.y if edge == "lower" else 150 + abs(line.centroid.x)
+            assert geometry.depth - diameter / 2 == pytest.approx(distance)
+
+    def test_shared(self) -> None:
+        """Test that cross-sections of the same dimensions, covers and stirrups share the geometry."""
+        assert EdgeGeometry.from_cross_section(beam(), "lower") is EdgeGeometry.from_cross_section(beam(), "lower")
+
+    def test_unsupported_edge(self) -> None:
+        """Test that an unsupported edge raises a ValueError."""
+        with pytest.raises(ValueError, match="not supported"):
+            EdgeGeometry.from_cross_section(beam(), "middle")  # type: ignore[arg-type]
+
+
+class TestReinforcementLayoutOptimizer:
+    """Tests for the ReinforcementLayoutOptimizer class."""
+
+    def test_candidates_of_beam(self) -> None:
+        """Test that the candidates are all feasible layouts of a grid enumerated one by one, from light to heavy."""
+        cs, optimizer = beam(), ReinforcementLayoutOptimizer(max_bars=10)
+        expected = []
+        for diameter in optimizer.diameters:
+            length = cs._get_reference_line(edge="lower", diameter=diameter).length  # noqa: SLF001
+            minimum_area = Form9Dot1nMinimumTensileReinforcementBeam(f_ctm=2.9, f_yk=500, b_t=300, d=500 - 40 - 8 - diameter / 2)
+            for n in range(2, 11):
+                area, clear_spacing = n * np.pi / 4 * diameter**2, length / (n - 1) - diameter
+                if area >= minimum_area and clear_spacing >= max(diameter, 16 + 5, 20):
+                    expected.append((area, f"{n}⌀{diameter:.0f}"))
+
+        candidates = optimizer.candidates(cs)
+        assert [str(candidate.configuration) for candidate in candidates] == [name for _, name in sorted(expected)]
+        assert candidates[0].weight_per_meter == pytest.approx(candidates[0].area * 7850e-6)
+
+    def test_candidates_of_column(self) -> None:
+        """Test that the minimum area of a column is that of formula 9.12N, less the reinforcement that is present."""
+        cs = beam(400, 400)
+        cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=16, material=ReinforcementSteelMaterial(), edge="upper")
+        candidates = ReinforcementLayoutOptimizer().candidates(cs, n_ed=3000)
+
+        assert candidates[0].minimum_area == pytest.approx(0.1 * 3000e3 / (500 / 1.15) - 3 * np.pi / 4 * 16**2)
+        assert all(candidate.area >= candidate.minimum_area for candidate in candidates)
+
+    def test_candidates_by_distance(self) -> None:
+        """Test the candidates by center-to-center distance against the area and clear spacing of the placed rebars."""
+        cs = beam(1000, 250)
+        candidates = ReinforcementLayoutOptimizer(configuration="distance").candidates(cs, required_area=1500)
+
+        assert candidates[0].area >= 1500
+        for candidate in candidates[:5]:
+            rebars = candidate.apply(cs).rebar_set
+            assert rebars.area == pytest.approx(candidate.area)
+            assert np.diff(np.sort(rebars.x)).min() - rebars.diameter.max() == pytest.approx(candidate.clear_spacing)
+
+    def test_apply(self) -> None:
+        """Test that a candidate is added to a copy of the cross-section."""
+        cs = beam()
+        candidate = ReinforcementLayoutOptimizer(edge="upper").candidates(cs, required_area=1000)[0]
+        reinforced = candidate.apply(cs)
+
+        assert isinstance(candidate, LayoutCandidate)
+        assert cs.longitudinal_rebars == []
+        assert reinforced.reinforcement_area_longitudinal_bars == pytest.approx(candidate.area)
+        assert reinforced.rebar_set.y.min() > 0
+
+    def test_optimize(self) -> None:
+        """Test the lightest layout of several cross-sections, of which cross-sections with equal requirements share the candidates."""
+        optimizer = ReinforcementLayoutOptimizer()
+        cross_sections = {"B1": beam(), "B2": beam(), "B3": beam(), "C1": beam(400, 400)}
+        layouts = optimizer.optimize(cross_sections, required_area={"B1": 1200, "B2": 1200, "B3": 1e6}, n_ed={"C1": 2500})
+
+        assert layouts["B1"] == layouts["B2"] == optimizer.candidates(beam(), required_area=1200)[0]
+        assert layouts["B3"] is None
+        assert layouts["C1"] == optimizer.candidates(beam(400, 400), n_ed=2500)[0]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_optimize_with_check(self, max_workers: int) -> None:
+        """Test that the lightest layout that passes the check is selected, in the current process and in a process pool."""
+        optimizer = ReinforcementLayoutOptimizer(diameters=(12.0, 16.0, 20.0), max_bars=6)
+        cross_sections = {"B1": beam(), "B2": beam(), "B3": beam()}
+        check = {"B1": partial(resists_moment, m_ed=150.0), "B2": partial(resists_moment, m_ed=250.0)}
+        layouts = optimizer.optimize(cross_sections, check=check, max_workers=max_workers)
+
+        for key, m_ed in [("B1", 150.0), ("B2", 250.0)]:
+            expected = next(candidate for candidate in optimizer.candidates(beam()) if resists_moment(candidate.apply(beam()), m_ed))
+            assert layouts[key] == expected
+        assert layouts["B3"] == optimizer.candidates(beam())[0]
+
+    def test_invalid_settings(self) -> None:
+        """Test that an unsupported configuration or a too small number of bars raises a ValueError."""
+        with pytest.raises(ValueError, match="quantity"):
+            ReinforcementLayoutOptimizer(configuration="mesh")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="at least 2"):
+            ReinforcementLayoutOptimizer(max_bars=1)
@@ -0,0 +1,247 @@
+"""Tests for the fiber discretization of reinforced concrete cross-sections."""
+
+import math
+
+import numpy as np
+import pytest
+
+from blueprints.materials.concrete import ConcreteMaterial, ConcreteStrengthClass, DiagramType
+from blueprints.materials.reinforcement_steel import ReinforcementDiagramType, ReinforcementSteelMaterial
+from blueprints.structural_sections.concrete.fiber_section import (
+    TRIANGLE_GAUSS_RULES,
+    FiberSection,
+    bilinear_concrete_stress,
+    bilinear_steel_stress,
+    parabola_rectangle_stress,
+    triangulate,
+)
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.base import ReinforcedCrossSection
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.interaction_diagram import InteractionDiagram
+from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection
+from blueprints.structural_sections.cross_section_shapes import PolygonCrossSection
+
+
+@pytest.fixture
+def cross_section() -> RectangularReinforcedCrossSection:
+    """Return a rectangular cross-section with 3⌀20 at the lower side and the parabola-rectangle diagram of the concrete."""
+    concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=DiagramType.PARABOLIC)
+    cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=concrete)
+    cs.add_longitudinal_reinforcement_by_quantity(n=3, diameter=20, material=ReinforcementSteelMaterial(), edge="lower")
+    return cs
+
+
+def test_parabola_rectangle_stress() -> None:
+    """Test the stresses of the parabola-rectangle diagram."""
+    stresses = parabola_rectangle_stress(np.array([-0.001, 0.0, 0.001, 0.002, 0.0035]), f_cd=20.0, eps_c2=0.002, n=2.0)
+    np.testing.assert_allclose(stresses, [0.0, 0.0, 15.0, 20.0, 20.0])
+
+
+def test_bilinear_concrete_stress() -> None:
+    """Test the stresses of the bi-linear diagram of concrete."""
+    stresses = bilinear_concrete_stress(np.array([-0.001, 0.0, 0.000875, 0.00175, 0.0035]), f_cd=20.0, eps_c3=0.00175)
+    np.testing.assert_allclose(stresses, [0.0, 0.0, 10.0, 20.0, 20.0])
+
+
+def test_bilinear_steel_stress() -> None:
+    """Test the stresses of the bi-linear diagrams with a horizontal and an inclined top branch."""
+    strains = np.array([-0.01, -0.001, 0.0, 0.001, 0.01])
+    np.testing.assert_allclose(bilinear_steel_stress(strains, e_s=200000.0, f_yd=400.0), [-400.0, -200.0, 0.0, 200.0, 400.0])
+    np.testing.assert_allclose(bilinear_steel_stress(strains, e_s=200000.0, f_yd=400.0, hardening=1000.0)[[0, 4]], [-408.0, 408.0])
+
+
+@pytest.fixture
+def t_section() -> ReinforcedCrossSection:
+    """Return a T-section with 3⌀25 at the lower side of the web."""
+    cs = ReinforcedCrossSection(
+        cross_section=PolygonCrossSection.t_shape(width_flange=800, thickness_flange=150, width_web=300, height=600),
+        concrete_material=ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37),
+    )
+    for x in (-100, 0, 100):
+        cs.add_longitudinal_rebar(Rebar(diameter=25, x=x, y=-250, material=ReinforcementSteelMaterial()))
+    return cs
+
+
+@pytest.mark.parametrize("degree", TRIANGLE_GAUSS_RULES)
+def test_triangle_gauss_rules(degree: int) -> None:
+    """Test that the Gauss rules integrate all monomials up to their degree exactly over the triangle (0, 0), (1, 0), (0, 1)."""
+    barycentric, weights = TRIANGLE_GAUSS_RULES[degree]
+    for p in range(degree + 1):
+        for q in range(degree + 1 - p):
+            exact = math.factorial(p) * math.factorial(q) / math.factorial(p + q + 2)
+            assert 0.5 * weights @ (barycentric[:, 1] ** p * barycentric[:, 2] ** q) == pytest.approx(exact, rel=1e-12)
+
+
+def test_triangulate() -> None:
+    """Test that the cached triangulation covers a polygon with a hole, with similar triangles for the subdivisions."""
+    geometry = PolygonCrossSection.hollow_rectangle(width=600, height=800, thickness=120).geometry
+    triangles = triangulate(geometry)
+    subdivided = triangulate(geometry, n_subdivisions=3)
+    edges = subdivided[:, 1:] - subdivided[:, :1]
+    areas = 0.5 * (edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0])
+
+    assert subdivided.shape == (9 * len(triangles), 3, 2)
+    assert areas.min() > 0
+    assert areas.sum() == pytest.approx(geometry.area)
+    assert not (np.abs(subdivided.mean(axis=1)) < [180, 280]).all(axis=1).any()
+    assert triangulate(geometry, n_subdivisions=3) is subdivided
+    assert not subdivided.flags.writeable
+    with pytest.raises(ValueError, match="at least 1"):
+        triangulate(geometry, n_subdivisions=0)
+
+
+class TestFiberSection:
+    """Tests for the FiberSection class."""
+
+    def test_fibers(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the fibers cover the concrete cross-section."""
+        fiber_section = FiberSection.from_cross_section(cross_section, n_x=4, n_y=50)
+        assert fiber_section.concrete_area.size == 200
+        assert fiber_section.concrete_area.sum() == pytest.approx(300 * 500)
+        assert fiber_section.centroid == pytest.approx((0.0, 0.0))
+
+    def test_forces_of_uniform_strains(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the forces of uniform compression and uniform tension, for several strain planes at once."""
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        concrete, area = cross_section.concrete_material, cross_section.reinforcement_area_longitudinal_bars
+        n, m_x, m_y = fiber_section.forces(np.array([0.0, 0.002, -0.01]), 0.0)
+
+        assert n[0] == pytest.approx(0.0)
+        assert n[1] == pytest.approx(concrete.f_cd * (300 * 500 - area) + 200000 * 0.002 * area)
+        assert n[2] == pytest.approx(-500 / 1.15 * area)
+        assert m_x[2] == pytest.approx(-500 / 1.15 * area * -190)
+        np.testing.assert_allclose(m_y, 0.0, atol=1e-3)
+
+    def test_forces_of_curvature(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that opposite curvatures about the axis of symmetry of the cross-section give opposite moments."""
+        fiber_section = FiberSection.from_cross_section(cross_section, n_x=50, n_y=50)
+        n, m_x, m_y = fiber_section.forces(0.001, 0.0, np.array([1e-5, -1e-5]))
+
+        assert n[0] == pytest.approx(n[1])
+        assert m_x[0] == pytest.approx(m_x[1])
+        assert m_y[0] == pytest.approx(-m_y[1])
+        assert m_y[0] > 0
+
+    def test_ultimate_strain_planes(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the ultimate strain planes reach, but do not exceed, the strain limits."""
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        eps_0, kappa_x, kappa_y = fiber_section.ultimate_strain_planes(angle=np.pi / 2, n_planes=100)
+        top, bars = eps_0 + kappa_x * 250, eps_0[:, np.newaxis] + kappa_x[:, np.newaxis] * (fiber_section.rebar_set.y)
+
+        assert eps_0.size == 100
+        np.testing.assert_allclose(kappa_y, 0.0, atol=1e-12)
+        assert (eps_0[0], eps_0[-1]) == pytest.approx((0.002, -0.045))
+        assert top.max() == pytest.approx(0.0035)
+        assert bars.min() == pytest.approx(-0.045)
+        reached = np.isclose(top, 0.0035) | np.isclose(bars.min(axis=1), -0.045) | np.isclose(eps_0 + kappa_x * (250 - 3 / 7 * 500), 0.002)
+        assert reached.all()
+
+    def test_steel_strain_limit(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the design strain limit of class B steel, 0.9 εuk = 0.9 * 5 %, and the inclined top branch reaching k * f_yd at εuk."""
+        np.testing.assert_allclose(FiberSection.from_cross_section(cross_section).steel_strain_limit, 0.045)
+
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.BILINEAR_INCLINED)
+        cross_section.add_longitudinal_rebar(Rebar(diameter=20, x=0, y=200, material=material))
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        stresses = fiber_section.steel_stress(np.full(len(fiber_section.rebar_set), -0.05))
+        np.testing.assert_allclose(fiber_section.steel_strain_limit, 0.045)
+        np.testing.assert_allclose(stresses[fiber_section.rebar_set.y > 0], -material.ductility_factor_k * material.f_yk / 1.15)
+        np.testing.assert_allclose(stresses[fiber_section.rebar_set.y < 0], -material.f_yk / 1.15)
+
+    def test_bilinear_concrete_diagram(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the bi-linear diagram of the concrete sets the stresses and the pivot of the ultimate strain planes."""
+        cross_section.concrete_material = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=DiagramType.BILINEAR)
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        eps_0, kappa_x, _ = fiber_section.ultimate_strain_planes(angle=np.pi / 2, n_planes=100)
+
+        assert fiber_section.concrete_strains == pytest.approx((0.00175, 0.0035))
+        np.testing.assert_allclose(fiber_section.concrete_stress(np.array([0.000875, 0.002])), [10.0, 20.0])
+        assert (eps_0 + kappa_x * 250).max() == pytest.approx(0.0035)
+        assert eps_0[0] == pytest.approx(0.00175)
+
+    def test_within_strain_limits(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test the strain limits of the outer concrete fiber and of the bars."""
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        eps_ud = fiber_section.steel_strain_limit[0]
+        eps_0 = np.array([0.0035, 0.0036, -eps_ud, -eps_ud - 1e-4, np.nan])
+        np.testing.assert_array_equal(fiber_section.within_strain_limits(eps_0, 0.0), [True, False, True, False, False])
+        assert fiber_section.within_strain_limits(0.0, 0.0035 / 250)
+        assert not fiber_section.within_strain_limits(0.0, 0.0036 / 250)
+
+    def test_equilibrium_strain(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that the strains at the centroid are in equilibrium with the normal forces, for many curvatures at once."""
+        fiber_section = FiberSection.from_cross_section(cross_section)
+        normal_force, kappa_x = np.array([[-300e3], [0.0], [1500e3]]), np.linspace(0.0, 5e-5, 11)
+        eps_0 = fiber_section.equilibrium_strain(normal_force, kappa_x)
+        n, _, _ = fiber_section.forces(eps_0, kappa_x)
+
+        assert eps_0.shape == (3, 11)
+        np.testing.assert_allclose(n, np.broadcast_to(normal_force, n.shape), atol=1e-2)
+        assert np.isnan(fiber_section.equilibrium_strain(np.array([-500e3, 5e6]), 0.0)).all()
+
+    def test_unsupported_concrete_diagram(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that a user-defined stress-strain diagram of the concrete raises a ValueError."""
+        cross_section.concrete_material = ConcreteMaterial(diagram_type=DiagramType.USER)
+        with pytest.raises(ValueError, match="parabola-rectangle"):
+            FiberSection.from_cross_section(cross_section)
+
+    def test_unsupported_steel_diagram(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that a user-defined stress-strain diagram of the reinforcement raises a ValueError."""
+        material = ReinforcementSteelMaterial(diagram_type=ReinforcementDiagramType.USER)
+        cross_section.add_longitudinal_rebar(Rebar(diameter=12, x=0, y=150, material=material))
+        with pytest.raises(ValueError, match="bi-linear"):
+            FiberSection.from_cross_section(cross_section)
+
+    @pytest.mark.parametrize("degree", [2, 5])
+    def test_triangulation(self, cross_section: RectangularReinforcedCrossSection, degree: int) -> None:
+        """Test that the Gauss points integrate the area and the moments of inertia of the concrete exactly."""
+        fiber_section = FiberSection.from_triangulation(cross_section, n_subdivisions=2, degree=degree)
+        weights = fiber_section.concrete_area
+
+        assert weights.size == 2 * 4 * len(TRIANGLE_GAUSS_RULES[degree][1])
+        assert weights.sum() == pytest.approx(300 * 500)
+        assert weights @ fiber_section.concrete_y == pytest.approx(0.0, abs=1e-6)
+        assert weights @ fiber_section.concrete_y**2 == pytest.approx(300 * 500**3 / 12)
+        assert weights @ fiber_section.concrete_x**2 == pytest.approx(500 * 300**3 / 12)
+
+    def test_triangulation_forces(self, t_section: ReinforcedCrossSection) -> None:
+        """Test the forces of a T-section integrated over the triangulation against a fine grid of fibers."""
+        triangulated = FiberSection.from_triangulation(t_section)
+        grid = FiberSection.from_cross_section(t_section, n_x=200, n_y=200)
+        eps_0, kappa_x, kappa_y = grid.ultimate_strain_planes(angle=2.0, n_planes=50)
+        expected, forces = grid.forces(eps_0, kappa_x, kappa_y), triangulated.forces(eps_0, kappa_x, kappa_y)
+
+        assert triangulated.centroid == pytest.approx((0.0, 66.17647))
+        # uniform compression at ε_c3 = 1.75 ‰ of the bi-linear diagram
+        area = t_section.reinforcement_area_longitudinal_bars
+        assert forces[0][0] == pytest.approx(20 * (255000 - area) + 200000 * 0.00175 * area)
+        for force, expected_force in zip(forces, expected):
+            np.testing.assert_allclose(force, expected_force, atol=0.01 * np.abs(expected_force).max())
+
+    @pytest.mark.parametrize("diagram_type", [DiagramType.BILINEAR, DiagramType.PARABOLIC])
+    @pytest.mark.parametrize(("n", "diameter"), [(2, 12), (3, 20), (6, 32)])
+    def test_triangulation_convergence(self, diagram_type: DiagramType, n: int, diameter: int) -> None:
+        """Test that the default triangulation of a rectangle, two triangles, agrees within 1 % with 2000 concrete layers.
+
+        The kinks of the stress-strain diagrams cross the triangles, so the forces converge by the subdivision of the triangles.
+        """
+        concrete = ConcreteMaterial(concrete_class=ConcreteStrengthClass.C30_37, diagram_type=diagram_type)
+        cs = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=concrete)
+        cs.add_longitudinal_reinforcement_by_quantity(n=n, diameter=diameter, material=ReinforcementSteelMaterial(), edge="lower")
+        triangulated, layers = FiberSection.from_triangulation(cs), FiberSection.from_cross_section(cs, n_y=2000)
+        planes = layers.ultimate_strain_planes(angle=np.pi / 2)
+        expected, forces = layers.forces(*planes), triangulated.forces(*planes)
+        for force, expected_force in zip(forces[:2], expected[:2]):
+            np.testing.assert_allclose(force, expected_force, atol=0.01 * np.abs(expected_force).max())
+
+        # loads just inside the interaction diagram of the layers, except the origin
+        reference = InteractionDiagram.from_fiber_section(layers)
+        loads = 0.999 * np.column_stack([reference.n, reference.m])
+        loads = loads[np.hypot(*loads.T) > 1.0]
+        unity_checks = InteractionDiagram.from_fiber_section(triangulated).unity_check(*loads.T)
+        np.testing.assert_allclose(unity_checks, reference.unity_check(*loads.T), rtol=1e-2)
+
+    def test_triangulation_invalid_degree(self, cross_section: RectangularReinforcedCrossSection) -> None:
+        """Test that a degree without a Gauss rule raises a ValueError."""
+        with pytest.raises(ValueError, match="degrees 1, 2, 5"):
+            FiberSection.from_triangulation(cross_section, degree=3)
@@ -0,0 +1,138 @@
+"""Test the rebar set module."""
+
+import math
+
+import numpy as np
+import pytest
+from shapely import Polygon, box
+
+from blueprints.materials.reinforcement_steel import ReinforcementSteelMaterial, ReinforcementSteelQuality
+from blueprints.structural_sections.concrete.rebar import Rebar
+from blueprints.structural_sections.concrete.rebar_set import RebarSet
+
+
+class TestRebarSet:
+    """Tests for the RebarSet class."""
+
+    @pytest.fixture
+    def rebars(self) -> list[Rebar]:
+        """Return a list of rebars of two materials."""
+        b500b = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500B)
+        b500a = ReinforcementSteelMaterial(steel_quality=ReinforcementSteelQuality.B500A)
+        return [
+            Rebar(diameter=12, x=-100, y=200, material=b500b),
+            Rebar(diameter=16, x=100, y=200, material=b500a, relative_start_position=0.2),
+            Rebar(diameter=25, x=-100, y=-200, material=b500b, relative_end_position=0.8),
+            Rebar(diameter=25, x=100, y=-200, material=b500b),
+        ]
+
+    @pytest.fixture
+    def rebar_set(self, rebars: list[Rebar]) -> RebarSet:
+        """Return the rebar set of the rebars."""
+        return RebarSet.from_rebars(rebars)
+
+    def test_from_rebars(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that the rebars are stored as arrays and are recreated on demand."""
+        assert len(rebar_set) == 4
+        assert len(rebar_set.materials) == 2
+        assert rebar_set.material_index.tolist() == [0, 1, 0, 0]
+        assert list(rebar_set) == rebars
+        assert rebar_set[1] == rebars[1]
+
+    def test_from_arrays(self) -> None:
+        """Test that the rebars of a single material are created from coordinate arrays."""
+        material = ReinforcementSteelMaterial()
+        rebar_set = RebarSet.from_arrays(x=np.array([-50.0, 50.0]), y=np.array([100.0, 100.0]), diameter=20, material=material)
+        assert list(rebar_set) == [Rebar(diameter=20, x=-50, y=100, material=material), Rebar(diameter=20, x=50, y=100, material=material)]
+
+    def test_concatenate(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that joined rebar sets keep the order of the rebars and share their materials."""
+        joined = RebarSet.concatenate([rebar_set[2:], RebarSet.from_rebars([]), rebar_set[:2]])
+        assert list(joined) == rebars[2:] + rebars[:2]
+        assert len(joined.materials) == 2
+        assert len(RebarSet.concatenate([])) == 0
+
+    def test_arrays_are_read_only(self, rebar_set: RebarSet) -> None:
+        """Test that the arrays of the rebar set cannot be modified."""
+        with pytest.raises(ValueError):
+            rebar_set.x[0] = 0.0
+
+    def test_subset(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that a boolean mask selects a subset of the rebars."""
+        subset = rebar_set[rebar_set.y > 0]
+        assert isinstance(subset, RebarSet)
+        assert list(subset) == rebars[:2]
+
+    def test_area_and_weight(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that the area and weight equal the sums over the rebars."""
+        assert rebar_set.area == pytest.approx(sum(rebar.area for rebar in rebars))
+        assert rebar_set.weight_per_meter == pytest.approx(sum(rebar.weight_per_meter for rebar in rebars))
+        np.testing.assert_allclose(rebar_set.weights_per_meter, [rebar.weight_per_meter for rebar in rebars])
+
+    def test_present_materials(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that only the materials used by the rebars are present."""
+        assert rebar_set.present_materials == [rebars[0].material, rebars[1].material]
+        assert rebar_set[rebar_set.diameter > 20].present_materials == [rebars[0].material]
+
+    def test_centroid(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test the first moments of area and the centroid."""
+        area = sum(rebar.area for rebar in rebars)
+        assert rebar_set.first_moment_x == pytest.approx(sum(rebar.area * rebar.y for rebar in rebars))
+        assert rebar_set.first_moment_y == pytest.approx(sum(rebar.area * rebar.x for rebar in rebars))
+        assert rebar_set.centroid.x == pytest.approx(sum(rebar.area * rebar.x for rebar in rebars) / area)
+        assert rebar_set.centroid.y == pytest.approx(sum(rebar.area * rebar.y for rebar in rebars) / area)
+
+    def test_centroid_of_empty_set(self) -> None:
+        """Test that the centroid of an empty rebar set raises a ValueError."""
+        with pytest.raises(ValueError):
+            _ = RebarSet.from_rebars([]).centroid
+
+    def test_moments_of_inertia(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test the moments of inertia about the axes through a given point."""
+        i_xx, i_yy, i_xy = rebar_set.moments_of_inertia(x=10, y=-20)
+        own = sum(math.pi * rebar.diameter**4 / 64 for rebar in rebars)
+        assert i_xx == pytest.approx(sum(rebar.area * (rebar.y + 20) ** 2 for rebar in rebars) + own)
+        assert i_yy == pytest.approx(sum(rebar.area * (rebar.x - 10) ** 2 for rebar in rebars) + own)
+        assert i_xy == pytest.approx(sum(rebar.area * (rebar.x - 10) * (rebar.y + 20) for rebar in rebars))
+
+    def test_within(self, rebar_set: RebarSet, rebars: list[Rebar]) -> None:
+        """Test that the vectorized containment check equals checking the geometry of every rebar."""
+        for geometry in [box(-120, -220, 120, 220), box(-115, -215, 115, 215), box(-200, 0, 200, 300)]:
+            expected = [geometry.contains(rebar.geometry) for rebar in rebars]
+            assert rebar_set.within(geometry).tolist() == expected
+
+    def test_within_touching_boundary(self) -> None:
+        """Test that rebars touching the boundary (or a concave corner) of the geometry are inside."""
+        l_shape = Polygon([(0, 0), (300, 0), (300, 100), (100, 100), (100, 300), (0, 300)])
+        rebar_set = RebarSet.from_rebars(
+            [
+                Rebar(diameter=20, x=10, y=10, material=ReinforcementSteelMaterial()),
+                Rebar(diameter=20, x=110, y=90, material=ReinforcementSteelMaterial()),
+                Rebar(diameter=20, x=110, y=110, material=ReinforcementSteelMaterial()),
+                Rebar(diameter=200, x=150, y=150, material=ReinforcementSteelMaterial()),
+            ]
+        )
+        assert rebar_set.within(l_shape).tolist() == [True, True, False, False]
+
+    @pytest.mark.parametrize(
+        "columns",
+        [
+            {"x": [0.0, 1.0]},
+            {"diameter": [0.0]},
+            {"relative_start_position": [-0.1]},
+            {"relative_end_position": [1.1]},
+            {"material_index": [1]},
+        ],
+    )
+    def test_invalid_columns(self, columns: dict[str, list[float]]) -> None:
+        """Test that invalid columns raise a ValueError."""
+        defaults = {
+            "x": [0.0],
+            "y": [0.0],
+            "diameter": [12.0],
+            "relative_start_position": [0.0],
+            "relative_end_position": [1.0],
+            "material_index": [0],
+        }
+        with pytest.raises(ValueError):
+            RebarSet(**{name: np.array(values) for name, values in (defaults | columns).items()}, materials=(ReinforcementSteelMaterial(),))
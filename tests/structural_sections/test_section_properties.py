@@ -0,0 +1,73 @@
+"""Tests for the analytic section properties of cross-sections."""
+
+import numpy as np
+import pytest
+from shapely import Polygon, box
+
+from blueprints.structural_sections.section_properties import (
+    SectionProperties,
+    polygon_area_moments,
+    polygon_section_properties,
+    ring_area_moments,
+)
+
+
+class TestSectionProperties:
+    """Tests for the section properties of polygons."""
+
+    def test_rectangle(self) -> None:
+        """Test the section properties of a rectangle against the closed-form expressions."""
+        properties = polygon_section_properties(box(100, 50, 400, 650))
+
+        assert properties.area == pytest.approx(300 * 600)
+        assert (properties.centroid_x, properties.centroid_y) == pytest.approx((250, 350))
+        assert properties.i_xx == pytest.approx(300 * 600**3 / 12)
+        assert properties.i_yy == pytest.approx(600 * 300**3 / 12)
+        assert properties.i_xy == pytest.approx(0, abs=1e-3)
+        assert properties.section_modulus_x_upper == pytest.approx(300 * 600**2 / 6)
+        assert properties.section_modulus_x_lower == pytest.approx(300 * 600**2 / 6)
+        assert properties.section_modulus_y_right == pytest.approx(600 * 300**2 / 6)
+        assert properties.section_modulus_y_left == pytest.approx(600 * 300**2 / 6)
+        assert properties.radius_of_gyration_x == pytest.approx(600 / np.sqrt(12))
+        assert properties.radius_of_gyration_y == pytest.approx(300 / np.sqrt(12))
+
+    def test_triangle(self) -> None:
+        """Test the section properties of a right triangle, including the product moment of area."""
+        properties = polygon_section_properties(Polygon([(0, 0), (300, 0), (0, 600)]))
+
+        assert properties.area == pytest.approx(300 * 600 / 2)
+        assert (properties.centroid_x, properties.centroid_y) == pytest.approx((100, 200))
+        assert properties.i_xx == pytest.approx(300 * 600**3 / 36)
+        assert properties.i_yy == pytest.approx(600 * 300**3 / 36)
+        assert properties.i_xy == pytest.approx(-(300**2) * 600**2 / 72)
+        assert properties.section_modulus_x_upper == pytest.approx(properties.i_xx / 400)
+        assert properties.section_modulus_x_lower == pytest.approx(properties.i_xx / 200)
+
+    def test_hollow_section(self) -> None:
+        """Test that the holes of a polygon are subtracted, regardless of the orientation of the rings."""
+        outer, inner = box(-200, -300, 200, 300), box(-150, -250, 150, 250, ccw=False)
+        properties = polygon_section_properties(Polygon(outer.exterior.coords, [inner.exterior.coords]))
+
+        assert properties.area == pytest.approx(400 * 600 - 300 * 500)
+        assert properties.i_xx == pytest.approx((400 * 600**3 - 300 * 500**3) / 12)
+        assert properties.i_yy == pytest.approx((600 * 400**3 - 500 * 300**3) / 12)
+
+    def test_ring_orientation(self) -> None:
+        """Test that the moments of a clockwise ring are negative and that the ring may be closed or open."""
+        x, y = np.array([0.0, 0.0, 200.0, 200.0]), np.array([0.0, 100.0, 100.0, 0.0])
+
+        np.testing.assert_allclose(ring_area_moments(x, y), -ring_area_moments(x[::-1], y[::-1]))
+        np.testing.assert_allclose(ring_area_moments(np.append(x, 0.0), np.append(y, 0.0)), ring_area_moments(x, y))
+        np.testing.assert_allclose(polygon_area_moments(Polygon(zip(x, y)))[0], 20000.0)
+
+    def test_circle_converges(self) -> None:
+        """Test that the section properties of a buffered point approximate those of a circle."""
+        properties = polygon_section_properties(Polygon(box(0, 0, 1, 1).centroid.buffer(500, quad_segs=256)))
+
+        assert properties.area == pytest.approx(np.pi * 500**2, rel=1e-4)
+        assert properties.i_xx == pytest.approx(np.pi * 1000**4 / 64, rel=1e-4)
+
+    def test_area_must_be_positive(self) -> None:
+        """Test that section properties with a zero area raise a ValueError."""
+        with pytest.raises(ValueError):
+            SectionProperties.from_area_moments(np.zeros(6), (0.0, 0.0, 0.0, 0.0))
@@ -0,0 +1,43 @@
+"""Regression tests for the third-party packages imported by the Blueprints packages used by headless (batch) workers."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("package", "not_imported"),
+    [
+        ("blueprints.structural_sections", ["matplotlib", "pandas", "plotly"]),
+        ("blueprints.checks", ["matplotlib", "numpy", "pandas", "plotly", "shapely"]),
+        ("blueprints.materials", ["matplotlib", "pandas", "plotly", "shapely"]),
+    ],
+)
+def test_heavy_packages_are_not_imported(package: str, not_imported: list[str]) -> None:
+    """Test that importing all modules of a package, except the plotters, does not import the given third-party packages."""
+    code = (
+        "import importlib, pkgutil, sys\n"
+        f"package = importlib.import_module({package!r})\n"
+        "for module in pkgutil.walk_packages(package.__path__, package.__name__ + '.'):\n"
+        "    if '.plotters' not in module.name:\n"
+        "        importlib.import_module(module.name)\n"
+        f"print(sorted(name for name in {not_imported!r} if name in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+
+def test_plotter_is_imported_on_first_use() -> None:
+    """Test that matplotlib is only imported when the plotter of a reinforced cross-section is used."""
+    code = (
+        "import sys\n"
+        "from blueprints.materials.concrete import ConcreteMaterial\n"
+        "from blueprints.structural_sections.concrete.reinforced_concrete_sections.rectangular import RectangularReinforcedCrossSection\n"
+        "cross_section = RectangularReinforcedCrossSection(width=300, height=500, concrete_material=ConcreteMaterial())\n"
+        "print('matplotlib' in sys.modules)\n"
+        "cross_section.plotter\n"
+        "print('matplotlib' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["False", "True"]
@@ -6,6 +6,7 @@ It includes tests for:
 - raise_if_negative: Ensuring it raises an exception for negative values.
 """
 
+import numpy as np
 import pytest
 
 from blueprints.validations import (
@@ -78,3 +79,24 @@ def test_raise_if_lists_differ_in_length_with_different_lengths() -> None:
     """Test that ListsNotSameLengthError is raised for lists with different length."""
     with pytest.raises(ListsNotSameLengthError):
         raise_if_lists_differ_in_length(a=[1, 2], b=[3, 4], c=[5, 6, 7])
+
+
+def test_raise_if_less_or_equal_to_zero_with_array() -> None:
+    """Test that LessOrEqualToZeroError is raised when any element of an array is less than or equal to zero."""
+    raise_if_less_or_equal_to_zero(a=np.array([1.0, 2.0, 3.0]))
+    with pytest.raises(LessOrEqualToZeroError, match="'a': 0.0"):
+        raise_if_less_or_equal_to_zero(a=np.array([1.0, 0.0, -1.0]))
+
+
+def test_raise_if_negative_with_array() -> None:
+    """Test that NegativeValueError is raised when any element of an array is negative."""
+    raise_if_negative(a=np.array([0.0, 2.0, 3.0]))
+    with pytest.raises(NegativeValueError, match="'a': -2.0"):
+        raise_if_negative(a=np.array([[1.0, 2.0], [-2.0, -3.0]]))
+
+
+def test_raise_if_greater_90_with_array() -> None:
+    """Test that GreaterThan90Error is raised when any element of an array is greater than 90."""
+    raise_if_greater_than_90(a=np.array([-10.0, 90.0]))
+    with pytest.raises(GreaterThan90Error, match="'a': 95.0"):
+        raise_if_greater_than_90(a=np.array([10.0, 95.0]))
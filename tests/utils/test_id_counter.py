@@ -0,0 +1,47 @@
+"""Tests for the thread-safe and process-safe IdCounter class."""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from blueprints.utils.id_counter import PROCESS_ID_SHIFT, IdCounter
+
+COUNTER = IdCounter()
+
+
+def next_ids(n: int) -> tuple[int, list[int]]:
+    """Return the process ID and n IDs of the module-level counter."""
+    return os.getpid(), [COUNTER.next() for _ in range(n)]
+
+
+class TestIdCounter:
+    """Tests for the IdCounter class."""
+
+    def test_consecutive(self) -> None:
+        """Test that the IDs of the main process count up from the start value."""
+        ids = IdCounter(start=10)
+        assert [ids.next() for _ in range(3)] == [10, 11, 12]
+
+    def test_threads(self) -> None:
+        """Test that the IDs of many threads are unique and consecutive."""
+        ids = IdCounter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: [ids.next() for _ in range(2000)], range(16)))
+        assert sorted(id_ for result in results for id_ in result) == list(range(1, 32001))
+
+    @pytest.mark.parametrize("method", ["fork", "spawn"])
+    def test_processes(self, method: str) -> None:
+        """Test that forked and spawned child processes count in the range of their own process ID."""
+        if method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"Start method '{method}' is not available.")
+        before = COUNTER.next()
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context(method)) as executor:
+            results = list(executor.map(next_ids, [100] * 4))
+
+        ids = [id_ for _, result in results for id_ in result]
+        assert len(set(ids)) == len(ids)
+        for pid, result in results:
+            assert all(id_ >> PROCESS_ID_SHIFT == pid for id_ in result)
+        assert COUNTER.next() == before + 1